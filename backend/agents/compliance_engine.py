@@ -2,31 +2,80 @@
 Compliance engine for HR review.
 Deterministic checks against mobility rules.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from datetime import datetime, date
+from types import MappingProxyType
 import json
 import os
+import threading
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON (dicts -> mappingproxy, lists -> tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Fallback minimal rules if file missing
+DEFAULT_RULES: Mapping[str, Any] = _freeze({
+    "maxHousingBudgetByJobLevel": {
+        "L1": 5000,
+        "L2": 7000,
+        "L3": 10000
+    },
+    "minLeadTimeDays": 30,
+    "requiredDocs": ["Passport scans", "Employment letter"],
+    "spouseWorkIntentExtraDocs": ["Spouse resume"]
+})
+
+
+def _reload_on_change() -> bool:
+    """Dev re-reads the rules file when its mtime changes; production parses it once per process."""
+    override = os.getenv("COMPLIANCE_RULES_RELOAD")
+    if override is not None:
+        return override.strip().lower() in ("1", "true", "yes")
+    return not (os.getenv("RENDER") in ("true", "1") or os.getenv("ENV") == "production")
+
+
+# abspath -> (mtime or None when missing, frozen rules)
+_rules_cache: Dict[str, Tuple[Optional[float], Mapping[str, Any]]] = {}
+_rules_lock = threading.Lock()
+
+
+def _rules_mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
 
 
 class ComplianceEngine:
     def __init__(self, rules_path: str = "mobility_rules.json"):
         self.rules_path = rules_path
 
-    def load_rules(self) -> Dict[str, Any]:
-        if os.path.exists(self.rules_path):
-            with open(self.rules_path, "r", encoding="utf-8") as handle:
-                return json.load(handle)
-        # Fallback minimal rules if file missing
-        return {
-            "maxHousingBudgetByJobLevel": {
-                "L1": 5000,
-                "L2": 7000,
-                "L3": 10000
-            },
-            "minLeadTimeDays": 30,
-            "requiredDocs": ["Passport scans", "Employment letter"],
-            "spouseWorkIntentExtraDocs": ["Spouse resume"]
-        }
+    def load_rules(self) -> Mapping[str, Any]:
+        """Parsed rules (read-only), cached per path; re-parsed only when the file changes."""
+        path = os.path.abspath(self.rules_path)
+        cached = _rules_cache.get(path)
+        if cached is not None and not _reload_on_change():
+            return cached[1]
+        mtime = _rules_mtime(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with _rules_lock:
+            cached = _rules_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            if mtime is None:
+                rules = DEFAULT_RULES
+            else:
+                with open(path, "r", encoding="utf-8") as handle:
+                    rules = _freeze(json.load(handle))
+            _rules_cache[path] = (mtime, rules)
+            return rules
 
     def run(self, profile: Dict[str, Any]) -> Dict[str, Any]:
         rules = self.load_rules()
@@ -5,7 +5,7 @@ Produces next_question and completion_state.
 """
 from typing import Dict, Any, Optional, List, Set
 from ..schemas import Question, NextQuestionResponse, RelocationProfile
-from ..question_bank import get_all_questions, get_question_by_id
+from ..question_bank import get_all_questions, get_question_by_id, get_question_index
 from .validator import ProfileValidator
 from .readiness_rater import ReadinessRater
 from .recommendation_engine import RecommendationEngine
@@ -36,8 +36,8 @@ class IntakeOrchestrator:
         all_complete = all(completeness_check.values())
         
         # Calculate progress
-        questions = get_all_questions(skip_question_ids)
-        total_questions = len(questions)
+        index = get_question_index(skip_question_ids)
+        total_questions = len(index)
         answered_count = len(answered_questions)
         progress = {
             "answeredCount": answered_count,
@@ -53,18 +53,16 @@ class IntakeOrchestrator:
                 progress=progress
             )
         
-        # Find next unanswered question
-        for question in questions:
-            if question.id in answered_questions:
-                continue
-            
-            # Check dependencies (if any)
-            if self._check_dependencies(question, profile):
-                return NextQuestionResponse(
-                    question=question,
-                    isComplete=False,
-                    progress=progress
-                )
+        # Find next unanswered question (bank order, dependencies satisfied)
+        question = index.next_unanswered(
+            answered_questions, accept=lambda q: self._check_dependencies(q, profile)
+        )
+        if question is not None:
+            return NextQuestionResponse(
+                question=question,
+                isComplete=False,
+                progress=progress
+            )
         
         # No more questions, mark complete
         return NextQuestionResponse(
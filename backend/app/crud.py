@@ -1,6 +1,7 @@
 import json
 from datetime import datetime, date
 from typing import Any, Dict, List, Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from . import models
@@ -38,6 +39,42 @@ def update_case(db: Session, case: models.Case, draft: Dict[str, Any], derived:
     return case
 
 
+def update_case_if_unchanged(
+    db: Session,
+    case: models.Case,
+    expected_draft_json: str,
+    draft: Dict[str, Any],
+    derived: Dict[str, Any],
+    flags: Dict[str, Any],
+) -> Optional[models.Case]:
+    """
+    Compare-and-set form of update_case: writes only while the stored draft_json is still
+    ``expected_draft_json`` (the draft the caller read). Returns None when another writer got there first.
+    """
+    res = db.execute(
+        update(models.Case)
+        .where(models.Case.id == case.id, models.Case.draft_json == expected_draft_json)
+        .values(
+            draft_json=json.dumps(draft),
+            origin_country=derived.get("origin_country"),
+            origin_city=derived.get("origin_city"),
+            dest_country=derived.get("dest_country"),
+            dest_city=derived.get("dest_city"),
+            purpose=derived.get("purpose"),
+            target_move_date=_parse_date(derived.get("target_move_date")),
+            flags_json=json.dumps(flags),
+            updated_at=datetime.utcnow(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if res.rowcount == 0:
+        db.rollback()
+        return None
+    db.commit()
+    db.refresh(case)
+    return case
+
+
 def _parse_date(value: Any) -> Optional[date]:
     if isinstance(value, date):
         return value
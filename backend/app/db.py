@@ -4,10 +4,12 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from ..db_config import DATABASE_URL, sqlalchemy_engine_kwargs
+from ..db_instrumentation import install_query_instrumentation
 
 log = logging.getLogger(__name__)
 
 engine = create_engine(DATABASE_URL, **sqlalchemy_engine_kwargs(DATABASE_URL))
+install_query_instrumentation(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
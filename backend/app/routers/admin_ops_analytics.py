@@ -9,6 +9,8 @@ from typing import Any, Dict, Optional
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
 
 from ...database import db
+from ...db_instrumentation import get_query_stats_snapshot, reset_query_stats
+from ...services.analytics_service import event_buffer
 from ...services.ops_analytics_service import (
     get_destination_ops_metrics,
     get_notification_ops_metrics,
@@ -17,6 +19,7 @@ from ...services.ops_analytics_service import (
     get_queue_breaches,
     get_reviewer_workload,
     get_sla_overview,
+    refresh_ops_metrics_rollup,
 )
 
 
@@ -89,3 +92,41 @@ def notification_metrics(
 @router.get("/bottlenecks")
 def bottlenecks(user: Dict[str, Any] = Depends(_require_admin)):
     return get_ops_bottlenecks()
+
+
+@router.post("/rollup/refresh")
+def rollup_refresh(
+    lookback_hours: int = Query(48, ge=1, le=24 * 90),
+    user: Dict[str, Any] = Depends(_require_admin),
+):
+    return refresh_ops_metrics_rollup(lookback_hours=lookback_hours)
+
+
+@router.get("/db-query-stats")
+def db_query_stats(
+    top_routes: int = Query(50, ge=1, le=500),
+    user: Dict[str, Any] = Depends(_require_admin),
+):
+    """Per-route query count / DB time histograms, slow-query samples and N+1 detections (this process)."""
+    return get_query_stats_snapshot(top_routes=top_routes)
+
+
+@router.get("/analytics-buffer")
+def analytics_buffer(user: Dict[str, Any] = Depends(_require_admin)):
+    """Buffered analytics sink counters for this process (written, dropped under backpressure, failed)."""
+    return event_buffer.stats()
+
+
+@router.get("/schema-ledger")
+def schema_ledger(user: Dict[str, Any] = Depends(_require_admin)):
+    """This process's startup schema report (applied / skipped steps, timings) and the recorded ledger."""
+    return {
+        "startup": getattr(db, "schema_init_report", None),
+        "ledger": db.list_schema_ledger(),
+    }
+
+
+@router.post("/db-query-stats/reset")
+def db_query_stats_reset(user: Dict[str, Any] = Depends(_require_admin)):
+    reset_query_stats()
+    return {"ok": True}
@@ -21,6 +21,7 @@ from ...services.review_queue_service import (
     get_review_queue_stats,
     list_admin_users_for_assignment,
     list_review_queue_items,
+    recompute_queue_priorities,
     reopen_queue_item,
     resolve_queue_item,
     unassign_queue_item,
@@ -279,3 +280,12 @@ def bulk_status(
 @router.post("/backfill")
 def backfill(user: Dict[str, Any] = Depends(_require_admin)):
     return backfill_queue_from_signals()
+
+
+# --- Priority scheduler ---
+@router.post("/recompute-priorities")
+def recompute_priorities(
+    limit: int = Query(500, ge=1, le=5000),
+    user: Dict[str, Any] = Depends(_require_admin),
+):
+    return recompute_queue_priorities(limit=limit)
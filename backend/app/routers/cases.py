@@ -3,19 +3,28 @@ from __future__ import annotations
 import json
 import logging
 import uuid
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Header, HTTPException, Request, Response
 
 from ..db import SessionLocal
 from .. import crud, schemas
 from ...database import db as main_db
 from ..services.research import run_country_research
 from ..services.requirements_builder import compute_case_requirements
+from ..services.wizard_autosave import (
+    WizardAutosaveCoalescer,
+    derive_case_fields,
+    draft_revision,
+    revision_matches,
+    side_effect_signature,
+)
 
 router = APIRouter(prefix="/api/cases", tags=["cases"])
 logger = logging.getLogger(__name__)
 
+autosave = WizardAutosaveCoalescer(lambda cid, draft, derived: main_db.apply_wizard_patch_side_effects(cid, draft, derived))
+
 
 def _deep_merge_case_drafts(base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
     """Merge PATCH payload into stored draft so partial saves never wipe other wizard sections."""
@@ -39,38 +48,60 @@ def get_case(case_id: str):
 
 
 @router.patch("/{case_id}", response_model=schemas.CaseDTO)
-def patch_case(case_id: str, patch: schemas.CaseDraftDTO):
-    with SessionLocal() as db:
-        incoming = patch.model_dump(mode="json")
+def patch_case(
+    case_id: str,
+    patch: schemas.CaseDraftDTO,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+):
+    """
+    Wizard autosave. The response ETag is the stored draft revision; clients may echo it in
+    If-Match and get 409 when another save landed first. The write itself is conditional on the
+    draft that was read, so a save from another worker or code path landing in between yields 412
+    instead of being overwritten. Unchanged drafts are not rewritten, and side effects run
+    (coalesced) only when route countries or relocationBasics presence change.
+    """
+    incoming = patch.model_dump(mode="json")
+    with autosave.case_lock(case_id), SessionLocal() as db:
         case = crud.get_case(db, case_id)
+        before = None
+        stored_json = None
         if not case:
             case = crud.create_case(db, case_id, incoming)
             draft = incoming
         else:
+            stored_json = case.draft_json
             try:
-                existing = json.loads(case.draft_json or "{}")
+                existing = json.loads(stored_json or "{}")
             except (json.JSONDecodeError, TypeError, ValueError):
                 existing = {}
             if not isinstance(existing, dict):
                 existing = {}
+            current_rev = draft_revision(existing)
+            if not revision_matches(if_match, current_rev):
+                raise HTTPException(
+                    status_code=409,
+                    detail={"message": "Case draft was modified by another save", "revision": current_rev},
+                )
             draft = _deep_merge_case_drafts(existing, incoming)
-        basics = draft.get("relocationBasics", {})
-        derived = {
-            "origin_country": basics.get("originCountry"),
-            "origin_city": basics.get("originCity"),
-            "dest_country": basics.get("destCountry"),
-            "dest_city": basics.get("destCity"),
-            "purpose": basics.get("purpose"),
-            "target_move_date": basics.get("targetMoveDate"),
-        }
-        flags = {
-            "hasDependents": basics.get("hasDependents"),
-        }
-        case = crud.update_case(db, case, draft, derived, flags)
-        try:
-            main_db.apply_wizard_patch_side_effects(case_id, draft, derived)
-        except Exception:
-            logger.exception("apply_wizard_patch_side_effects failed case_id=%s", case_id)
+            if draft_revision(draft) == current_rev:
+                response.headers["ETag"] = f'"{current_rev}"'
+                return _case_dto(case, existing)
+            before = side_effect_signature(existing, derive_case_fields(existing)[0])
+        derived, flags = derive_case_fields(draft)
+        if stored_json is None:
+            case = crud.update_case(db, case, draft, derived, flags)
+        else:
+            updated = crud.update_case_if_unchanged(db, case, stored_json, draft, derived, flags)
+            if updated is None:
+                raise HTTPException(
+                    status_code=412,
+                    detail={"message": "Case draft was modified concurrently; reload and retry"},
+                )
+            case = updated
+        if side_effect_signature(draft, derived) != before:
+            autosave.schedule(case_id, draft, derived)
+        response.headers["ETag"] = f'"{draft_revision(draft)}"'
         return _case_dto(case, draft)
 
 
@@ -0,0 +1,137 @@
+"""Wizard autosave pipeline for PATCH /api/cases/{id}.
+
+The wizard autosaves on (near) every keystroke. This module keeps that cheap:
+
+* per-case locks (a fixed array of lock stripes, so memory does not grow with the number of
+  cases) serialize concurrent patches so deep merges never race each other;
+* the merged draft is content-hashed; the hash doubles as the draft revision (ETag / If-Match)
+  and an unchanged hash skips the write entirely;
+* downstream side effects (relocation_cases route sync, assignment -> awaiting_intake) only run
+  when the inputs they read actually changed, and a burst of such patches from one client is
+  coalesced into a single trailing run per case.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for further patches before running side effects; <= 0 runs them inline.
+COALESCE_WINDOW_SECONDS = float(os.getenv("WIZARD_AUTOSAVE_COALESCE_SECONDS", "1.5"))
+# Lock stripes shared by all cases; two cases on one stripe just serialize with each other.
+CASE_LOCK_STRIPES = 64
+
+BASICS_PRESENCE_KEYS = ("destCountry", "destCity", "originCountry", "originCity")
+
+SideEffectsFn = Callable[[str, Dict[str, Any], Dict[str, Any]], None]
+
+
+def draft_revision(draft: Dict[str, Any]) -> str:
+    """Stable content hash of a draft (key order independent)."""
+    raw = json.dumps(draft, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def revision_matches(if_match: Optional[str], revision: str) -> bool:
+    """True when no precondition was sent, it is ``*``, or it names ``revision`` (quoted or weak ETag ok)."""
+    if not if_match or not if_match.strip():
+        return True
+    for tag in if_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag.strip('"') == revision:
+            return True
+    return False
+
+
+def derive_case_fields(draft: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Columns mirrored onto wizard_cases from relocationBasics, plus flags_json."""
+    basics = draft.get("relocationBasics") or {}
+    derived = {
+        "origin_country": basics.get("originCountry"),
+        "origin_city": basics.get("originCity"),
+        "dest_country": basics.get("destCountry"),
+        "dest_city": basics.get("destCity"),
+        "purpose": basics.get("purpose"),
+        "target_move_date": basics.get("targetMoveDate"),
+    }
+    flags = {
+        "hasDependents": basics.get("hasDependents"),
+    }
+    return derived, flags
+
+
+def side_effect_signature(draft: Dict[str, Any], derived: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], bool]:
+    """Exactly the inputs Database.apply_wizard_patch_side_effects reads: route countries + basics presence."""
+    basics = draft.get("relocationBasics") or {}
+    home = (str(derived.get("origin_country") or "")).strip() or None
+    host = (str(derived.get("dest_country") or "")).strip() or None
+    has_basics = any(str(basics.get(k) or "").strip() for k in BASICS_PRESENCE_KEYS)
+    return home, host, has_basics
+
+
+class WizardAutosaveCoalescer:
+    """Per-case patch serialization plus trailing-edge coalescing of side effects."""
+
+    def __init__(self, apply_side_effects: SideEffectsFn, window_seconds: float = COALESCE_WINDOW_SECONDS) -> None:
+        self._apply = apply_side_effects
+        self.window_seconds = window_seconds
+        self._guard = threading.Lock()
+        self._case_locks: Tuple[threading.Lock, ...] = tuple(threading.Lock() for _ in range(CASE_LOCK_STRIPES))
+        self._pending: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+
+    def case_lock(self, case_id: str) -> threading.Lock:
+        """The lock stripe for ``case_id`` (always the same lock for the same case)."""
+        digest = hashlib.blake2b(str(case_id).encode("utf-8"), digest_size=4).digest()
+        return self._case_locks[int.from_bytes(digest, "big") % len(self._case_locks)]
+
+    def schedule(self, case_id: str, draft: Dict[str, Any], derived: Dict[str, Any]) -> None:
+        """Queue side effects for ``case_id``; only the latest draft within the window is applied."""
+        if self.window_seconds <= 0:
+            self._run(case_id, draft, derived)
+            return
+        with self._guard:
+            self._pending[case_id] = (draft, derived)
+            if case_id in self._timers:
+                return
+            timer = threading.Timer(self.window_seconds, self._flush_case, args=(case_id,))
+            timer.daemon = True
+            self._timers[case_id] = timer
+        timer.start()
+
+    def pending_count(self) -> int:
+        with self._guard:
+            return len(self._pending)
+
+    def flush(self) -> None:
+        """Run every pending side effect now (shutdown / tests)."""
+        with self._guard:
+            case_ids = list(self._pending)
+            timers = [self._timers.pop(cid) for cid in case_ids if cid in self._timers]
+        for t in timers:
+            t.cancel()
+        for cid in case_ids:
+            self._flush_case(cid)
+
+    def _flush_case(self, case_id: str) -> None:
+        with self._guard:
+            self._timers.pop(case_id, None)
+            item = self._pending.pop(case_id, None)
+        if item is None:
+            return
+        self._run(case_id, *item)
+
+    def _run(self, case_id: str, draft: Dict[str, Any], derived: Dict[str, Any]) -> None:
+        try:
+            self._apply(case_id, draft, derived)
+        except Exception:
+            logger.exception("apply_wizard_patch_side_effects failed case_id=%s", case_id)
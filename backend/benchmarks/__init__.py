@@ -0,0 +1 @@
+"""Synthetic multi-tenant benchmark harness for the HR / employee API surface."""
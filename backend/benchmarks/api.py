@@ -0,0 +1,237 @@
+"""
+Endpoint runner, latency / query-count reports and JSON baselines for the HR and employee API.
+
+The runner takes any httpx-style client (FastAPI ``TestClient`` in-process, or ``httpx.Client``
+against a running server seeded on the same database). Per-request query counts come from the
+``Server-Timing`` header added by the HTTP middleware (``db;dur=..;desc="N queries"``), so the
+numbers are the same ones the admin db-query-stats endpoint aggregates.
+"""
+from __future__ import annotations
+
+import json
+import math
+import random
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .seed import SeedManifest
+
+BASELINE_FORMAT_VERSION = 1
+
+_SERVER_TIMING_DB_RE = re.compile(r'db;dur=([0-9.]+);desc="(\d+) queries"')
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmarked endpoint; ``build`` maps (tenant, assignment_id) to (method, path, json body)."""
+
+    name: str
+    role: str  # "hr" | "employee"
+    build: Callable[[Dict[str, Any], str], Tuple[str, str, Optional[Dict[str, Any]]]]
+
+
+DEFAULT_SCENARIOS: Tuple[Scenario, ...] = (
+    Scenario("hr_assignments", "hr", lambda t, a: ("GET", "/api/hr/assignments?limit=25", None)),
+    Scenario("hr_command_center_kpis", "hr", lambda t, a: ("GET", "/api/hr/command-center/kpis", None)),
+    Scenario("hr_command_center_cases", "hr", lambda t, a: ("GET", "/api/hr/command-center/cases?limit=25", None)),
+    Scenario(
+        "hr_command_center_case_detail", "hr", lambda t, a: ("GET", f"/api/hr/command-center/cases/{a}", None)
+    ),
+    Scenario("hr_message_conversations", "hr", lambda t, a: ("GET", "/api/hr/messages/conversations", None)),
+    Scenario(
+        "employee_entitlements", "employee", lambda t, a: ("GET", f"/api/employee/assignments/{a}/entitlements", None)
+    ),
+    Scenario(
+        "recommendations_batch",
+        "employee",
+        lambda t, a: ("POST", "/api/recommendations/batch", {"assignment_id": a, "selected_services": ["housing"]}),
+    ),
+    Scenario("resources_country", "employee", lambda t, a: ("GET", f"/api/resources/country?assignment_id={a}", None)),
+)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile (same definition as numpy's default); 0.0 for no samples."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * (pct / 100.0)
+    lo = math.floor(rank)
+    hi = math.ceil(rank)
+    if lo == hi:
+        return float(ordered[lo])
+    return float(ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo))
+
+
+def parse_server_timing(header: Optional[str]) -> Tuple[Optional[int], Optional[float]]:
+    """(query count, db ms) from a Server-Timing header, or (None, None) when absent."""
+    m = _SERVER_TIMING_DB_RE.search(header or "")
+    if not m:
+        return None, None
+    return int(m.group(2)), float(m.group(1))
+
+
+def summarize_samples(latencies_ms: List[float], query_counts: List[int], errors: int) -> Dict[str, Any]:
+    out: Dict[str, Any] = {
+        "requests": len(latencies_ms),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies_ms, 50), 2),
+        "p95_ms": round(percentile(latencies_ms, 95), 2),
+        "p99_ms": round(percentile(latencies_ms, 99), 2),
+        "max_ms": round(max(latencies_ms), 2) if latencies_ms else 0.0,
+    }
+    if query_counts:
+        out.update(
+            {
+                "queries_p50": percentile(query_counts, 50),
+                "queries_p95": percentile(query_counts, 95),
+                "queries_max": max(query_counts),
+            }
+        )
+    return out
+
+
+def login_tokens(client: Any, manifest: SeedManifest) -> Dict[str, str]:
+    """Email -> bearer token for every seeded HR user and employee (one login each)."""
+    tokens: Dict[str, str] = {}
+    emails = [c.hr_email for c in manifest.companies]
+    for c in manifest.companies:
+        emails.extend(c.employee_emails.values())
+    for email in emails:
+        res = client.post("/api/auth/login", json={"identifier": email, "password": manifest.password})
+        if res.status_code != 200:
+            raise RuntimeError(f"bench login failed for {email}: {res.status_code} {res.text[:200]}")
+        tokens[email] = str(res.json()["token"])
+    return tokens
+
+
+def run_api_benchmark(
+    client: Any,
+    manifest: SeedManifest,
+    *,
+    rounds: int = 20,
+    warmup: int = 2,
+    scenarios: Sequence[Scenario] = DEFAULT_SCENARIOS,
+    seed: int = 1,
+    tokens: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Drive every scenario ``rounds`` times per tenant (random seeded assignment each time) and return
+    a report keyed by scenario name. Warm-up calls are not recorded. Non-2xx responses count as errors
+    and are excluded from the latency percentiles.
+    """
+    rng = random.Random(seed)
+    tokens = tokens if tokens is not None else login_tokens(client, manifest)
+    tenants = [
+        {"company": c, "hr_token": tokens[c.hr_email]} for c in manifest.companies if c.assignment_ids
+    ]
+    results: Dict[str, Dict[str, Any]] = {}
+    started = time.perf_counter()
+    for sc in scenarios:
+        latencies: List[float] = []
+        queries: List[int] = []
+        errors = 0
+        statuses: Dict[str, int] = {}
+        for i in range(warmup + rounds):
+            for tenant in tenants:
+                company = tenant["company"]
+                aid = rng.choice(company.assignment_ids)
+                token = tenant["hr_token"] if sc.role == "hr" else tokens[company.employee_emails[aid]]
+                method, path, body = sc.build({"company_id": company.company_id}, aid)
+                headers = {"Authorization": f"Bearer {token}"}
+                t0 = time.perf_counter()
+                if method == "GET":
+                    res = client.get(path, headers=headers)
+                else:
+                    res = client.request(method, path, headers=headers, json=body)
+                dur_ms = (time.perf_counter() - t0) * 1000
+                if i < warmup:
+                    continue
+                statuses[str(res.status_code)] = statuses.get(str(res.status_code), 0) + 1
+                if res.status_code >= 400:
+                    errors += 1
+                    continue
+                latencies.append(dur_ms)
+                qcount, _ = parse_server_timing(res.headers.get("server-timing"))
+                if qcount is not None:
+                    queries.append(qcount)
+        summary = summarize_samples(latencies, queries, errors)
+        summary["statuses"] = statuses
+        results[sc.name] = summary
+    return {
+        "format_version": BASELINE_FORMAT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "config": {
+            "companies": len(tenants),
+            "assignments_per_company": manifest.config.assignments_per_company,
+            "messages_per_assignment": manifest.config.messages_per_assignment,
+            "milestones_per_assignment": manifest.config.milestones_per_assignment,
+            "policy_versions_per_company": manifest.config.policy_versions_per_company,
+            "rounds": rounds,
+            "warmup": warmup,
+        },
+        "seconds": round(time.perf_counter() - started, 3),
+        "endpoints": results,
+    }
+
+
+def write_baseline(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    latency_tolerance: float = 0.25,
+    min_latency_delta_ms: float = 5.0,
+    query_tolerance: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Regressions of ``report`` against ``baseline``: p95 latency above baseline × (1 + tolerance) and by
+    at least ``min_latency_delta_ms`` (absorbs noise on fast endpoints), p95 query count above baseline
+    + ``query_tolerance``, or an endpoint that now errors. Endpoints missing from either side are skipped.
+    """
+    regressions: List[Dict[str, Any]] = []
+    base_eps = baseline.get("endpoints") or {}
+    for name, cur in (report.get("endpoints") or {}).items():
+        base = base_eps.get(name)
+        if not base:
+            continue
+        b95, c95 = float(base.get("p95_ms") or 0.0), float(cur.get("p95_ms") or 0.0)
+        if c95 > b95 * (1 + latency_tolerance) and c95 - b95 >= min_latency_delta_ms:
+            regressions.append({"endpoint": name, "metric": "p95_ms", "baseline": b95, "current": c95})
+        bq, cq = base.get("queries_p95"), cur.get("queries_p95")
+        if bq is not None and cq is not None and cq > bq + query_tolerance:
+            regressions.append({"endpoint": name, "metric": "queries_p95", "baseline": bq, "current": cq})
+        if int(cur.get("errors") or 0) > int(base.get("errors") or 0):
+            regressions.append(
+                {"endpoint": name, "metric": "errors", "baseline": base.get("errors", 0), "current": cur["errors"]}
+            )
+    return regressions
+
+
+def format_report(report: Dict[str, Any], regressions: Optional[List[Dict[str, Any]]] = None) -> str:
+    lines = [
+        f"{'endpoint':<32}{'n':>6}{'err':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'q p50':>8}{'q p95':>8}"
+    ]
+    for name, r in sorted((report.get("endpoints") or {}).items()):
+        lines.append(
+            f"{name:<32}{r['requests']:>6}{r['errors']:>5}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['p99_ms']:>10.1f}"
+            f"{r.get('queries_p50', float('nan')):>8.1f}{r.get('queries_p95', float('nan')):>8.1f}"
+        )
+    if regressions is not None:
+        if not regressions:
+            lines.append("no regressions against baseline")
+        for reg in regressions:
+            lines.append(f"REGRESSION {reg['endpoint']} {reg['metric']}: {reg['baseline']} -> {reg['current']}")
+    return "\n".join(lines)
@@ -0,0 +1,362 @@
+"""
+Per-stage micro-benchmarks for the policy ingestion / normalization pipeline.
+
+Stages (a corpus runs the ones its inputs allow, in this order):
+
+  intake     policy_document_intake.process_uploaded_document   (bytes corpora)
+  extract    policy_document_clauses.extract_lines_with_pages    (bytes corpora)
+  segment    summary-row clauses, else segment_into_clauses      (corpora with line items)
+  normalize  policy_normalization.normalize_clauses_to_objects
+  group      policy_grouped_policy_model.build_grouped_policy_review_view (LTA grouping heuristics)
+  store      Database.upsert_policy_document_clauses
+  persist    normalization_input validation + run_normalization
+  resolve    policy_resolution.resolve_benefits_matrix_for_version (persist_resolution=False)
+
+Each stage records wall time over ``rounds`` untraced runs, peak Python allocation from one extra
+tracemalloc run, and the number of DB statements (db_instrumentation.capture_queries). Corpora are
+the test fixtures under ``backend/tests/fixtures`` plus a synthetic multi-page DOCX policy.
+"""
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+REPORT_FORMAT_VERSION = 1
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+STAGES = ("intake", "extract", "segment", "normalize", "group", "store", "persist", "resolve")
+
+_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests", "fixtures")
+
+_SYNTHETIC_SECTIONS = (
+    ("Immigration", "Work visa and work permit fees are reimbursed up to USD {amt} per assignment."),
+    ("Temporary accommodation", "Temporary housing allowance up to USD {amt} per month for up to 30 days."),
+    ("Home search", "Home search assistance lump sum up to USD {amt} for long-term assignments."),
+    ("Education", "International school tuition support capped at USD {amt} per child per year."),
+    ("Shipment", "Household goods international shipment reimbursed up to USD {amt}."),
+    ("Tax", "Tax return preparation in the host country is provided for {n} years."),
+    ("Exclusions", "Personal income tax return preparation fees in the home country are not reimbursable."),
+)
+
+
+@dataclass
+class PolicyCorpus:
+    name: str
+    filename: str = "bench-policy.docx"
+    mime_type: str = DOCX_MIME
+    data: Optional[bytes] = None
+    items: Optional[List[Dict[str, Any]]] = None
+    clauses: Optional[List[Dict[str, Any]]] = None
+    doc_updates: Dict[str, Any] = field(default_factory=dict)
+    policy_context: Dict[str, Any] = field(default_factory=dict)
+
+
+def synthetic_policy_docx(pages: int = 200) -> bytes:
+    """A long assignment policy as DOCX: per page one numbered section, clause paragraphs and a table."""
+    from docx import Document  # python-docx (already required for DOCX intake)
+    from docx.enum.text import WD_BREAK
+
+    doc = Document()
+    doc.add_heading("Global Long-Term Assignment Policy (synthetic benchmark)", 0)
+    doc.add_paragraph("Version 4.2 — effective 2026-01-01. Applies to long-term assignments.")
+    for p in range(1, pages + 1):
+        label, template = _SYNTHETIC_SECTIONS[p % len(_SYNTHETIC_SECTIONS)]
+        doc.add_heading(f"{p}. {label} — region {p % 12 + 1}", level=1)
+        for k in range(5):
+            amt = 1000 + (p * 37 + k * 250) % 14000
+            doc.add_paragraph(f"{p}.{k + 1} " + template.format(amt=amt, n=1 + k % 3))
+        doc.add_paragraph(
+            "Eligibility is subject to HR approval, the assignment letter and local legislation. "
+            "Receipts must be submitted within 60 days."
+        )
+        table = doc.add_table(rows=2, cols=3)
+        table.cell(0, 0).text, table.cell(0, 1).text, table.cell(0, 2).text = "Benefit", "Entitlement", "Ref"
+        table.cell(1, 0).text = label
+        table.cell(1, 1).text = template.format(amt=2000 + p, n=2)
+        table.cell(1, 2).text = f"{p}.1"
+        doc.paragraphs[-1].add_run().add_break(WD_BREAK.PAGE)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def fixture_corpora() -> List[PolicyCorpus]:
+    """Corpora built from the regression fixtures used by tests/test_policy_*."""
+    from ..tests.fixtures.policy_processing_e2e_fixtures import (
+        structured_assignment_document_updates,
+        structured_policy_clauses,
+        summary_only_clauses,
+        summary_only_document_updates,
+    )
+
+    with open(os.path.join(_FIXTURES_DIR, "lta_policy_summary_regression.json"), encoding="utf-8") as f:
+        lta = json.load(f)
+    return [
+        PolicyCorpus(
+            "e2e_summary_only", clauses=summary_only_clauses(), doc_updates=summary_only_document_updates()
+        ),
+        PolicyCorpus(
+            "e2e_structured",
+            clauses=structured_policy_clauses(),
+            doc_updates=structured_assignment_document_updates(),
+        ),
+        PolicyCorpus(
+            "lta_summary",
+            items=list(lta["items"]),
+            policy_context=dict(lta["policy_context"]),
+            doc_updates={
+                "processing_status": "classified",
+                "detected_document_type": lta["policy_context"].get("detected_document_type"),
+                "detected_policy_scope": "long_term",
+                "extracted_metadata": lta["policy_context"].get("extracted_metadata") or {},
+                "raw_text": "\n".join(i["text"] for i in lta["items"]),
+            },
+        ),
+    ]
+
+
+def default_corpora(pages: int = 200) -> List[PolicyCorpus]:
+    out = fixture_corpora()
+    if pages > 0:
+        out.append(PolicyCorpus(f"synthetic_{pages}p", filename=f"synthetic-{pages}p.docx", data=synthetic_policy_docx(pages)))
+    return out
+
+
+class _Tenant:
+    """Company + case + assignment the persist / resolve stages write against."""
+
+    def __init__(self, db: Any) -> None:
+        self.company_id = str(uuid.uuid4())
+        db.create_company(self.company_id, f"Bench policy pipeline {self.company_id[:8]}", "SG", "51-200", "", "", "")
+        self.user_id = str(uuid.uuid4())
+        case_id = str(uuid.uuid4())
+        db.create_case(case_id, self.user_id, {"label": "bench-policy-pipeline"}, company_id=self.company_id)
+        self.assignment_id = str(uuid.uuid4())
+        db.create_assignment(
+            self.assignment_id, case_id, self.user_id, None, f"bench-{case_id[:8]}@relopass.test", "assigned"
+        )
+        self.assignment = db.get_assignment_by_id(self.assignment_id) or {}
+
+
+def _run_once(corpus: PolicyCorpus, db: Any, tenant: Optional[_Tenant], record: Callable) -> Dict[str, int]:
+    """One pass over the corpus; ``record(stage, fn)`` runs and measures a stage, returning its result."""
+    from ..services.normalization_input import validate_and_prepare_normalization_input
+    from ..services.policy_clause_signals import clause_signals
+    from ..services.policy_document_clauses import extract_lines_with_pages, segment_into_clauses
+    from ..services.policy_document_intake import process_uploaded_document
+    from ..services.policy_grouped_policy_model import build_grouped_policy_review_view
+    from ..services.policy_normalization import normalize_clauses_to_objects, run_normalization
+    from ..services.policy_resolution import resolve_benefits_matrix_for_version
+    from ..services.policy_summary_row_parser import try_build_clauses_via_summary_rows
+
+    # Every round re-reads the same texts; start cold so segment is not timed on cache hits.
+    clause_signals.cache_clear()
+    counts: Dict[str, int] = {}
+    doc_updates = dict(corpus.doc_updates)
+    items = corpus.items
+    if corpus.data is not None:
+        intake = record("intake", lambda: process_uploaded_document(corpus.data, corpus.mime_type, corpus.filename))
+        doc_updates.update(
+            {
+                "processing_status": intake.get("processing_status"),
+                "detected_document_type": intake.get("detected_document_type"),
+                "detected_policy_scope": intake.get("detected_policy_scope"),
+                "extracted_metadata": intake.get("extracted_metadata") or {},
+                "raw_text": intake.get("raw_text"),
+            }
+        )
+        items, err = record("extract", lambda: extract_lines_with_pages(corpus.data, corpus.mime_type))
+        if err:
+            raise RuntimeError(f"{corpus.name}: extraction failed: {err}")
+    clauses = corpus.clauses
+    if items is not None:
+        ctx = dict(corpus.policy_context or {"id": corpus.name})
+        ctx.setdefault("detected_document_type", doc_updates.get("detected_document_type"))
+
+        def _segment() -> List[Dict[str, Any]]:
+            rows = try_build_clauses_via_summary_rows(items, ctx)
+            return rows if rows is not None else segment_into_clauses(items, doc_updates.get("raw_text"))
+
+        clauses = record("segment", _segment)
+        counts["items"] = len(items)
+    clauses = list(clauses or [])
+    counts["clauses"] = len(clauses)
+
+    mapped = record("normalize", lambda: normalize_clauses_to_objects(clauses, corpus.name))
+    drafts = mapped.get("draft_rule_candidates") or []
+    counts["draft_rule_candidates"] = len(drafts)
+    counts["benefit_rules"] = len(mapped.get("benefit_rules") or [])
+    grouped, _ = record("group", lambda: build_grouped_policy_review_view(clauses, drafts))
+    counts["grouped_items"] = len(grouped)
+
+    if tenant is None:
+        return counts
+    doc_id = str(uuid.uuid4())
+    db.create_policy_document(
+        doc_id, tenant.company_id, tenant.user_id, corpus.filename, corpus.mime_type, f"bench/{doc_id}"
+    )
+    if doc_updates:
+        db.update_policy_document(doc_id, **doc_updates)
+    record("store", lambda: db.upsert_policy_document_clauses(doc_id, clauses))
+    stored = db.list_policy_document_clauses(doc_id)
+    doc = db.get_policy_document(doc_id)
+
+    def _persist() -> Dict[str, Any]:
+        doc_p, clauses_p, _ = validate_and_prepare_normalization_input(doc, stored, doc_id)
+        return run_normalization(db, doc_p, clauses_p, created_by=tenant.user_id)
+
+    try:
+        result = record("persist", _persist)
+    except Exception as exc:  # blocked drafts raise PolicyNormalizationPayloadInvalid / NormalizationInputInvalid
+        log.info("bench policy_pipeline corpus=%s persist blocked: %s", corpus.name, exc)
+        return counts
+    policy_row = db.get_company_policy(str(result["policy_id"])) or {}
+    version_row = db.get_policy_version(str(result["policy_version_id"])) or {}
+    record(
+        "resolve",
+        lambda: resolve_benefits_matrix_for_version(
+            db,
+            tenant.assignment_id,
+            tenant.assignment,
+            None,
+            None,
+            None,
+            company_id=tenant.company_id,
+            policy_row=policy_row,
+            version_row=version_row,
+            persist_resolution=False,
+        ),
+    )
+    return counts
+
+
+def run_policy_pipeline_benchmark(
+    corpora: List[PolicyCorpus],
+    *,
+    db: Any = None,
+    rounds: int = 3,
+    trace_memory: bool = True,
+) -> Dict[str, Any]:
+    """
+    Time every stage for every corpus. ``db=None`` skips the DB stages (store / persist / resolve).
+    Wall times come from ``rounds`` untraced passes; peak memory from one extra tracemalloc pass.
+    """
+    from ..db_instrumentation import capture_queries
+
+    tenant = _Tenant(db) if db is not None else None
+    report: Dict[str, Any] = {
+        "format_version": REPORT_FORMAT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "rounds": rounds,
+        "corpora": {},
+    }
+    for corpus in corpora:
+        walls: Dict[str, List[float]] = {}
+        statements: Dict[str, int] = {}
+        peaks: Dict[str, float] = {}
+
+        def timed(stage: str, fn: Callable[[], Any]) -> Any:
+            with capture_queries(f"bench:{stage}") as q:
+                t0 = time.perf_counter()
+                out = fn()
+                walls.setdefault(stage, []).append((time.perf_counter() - t0) * 1000)
+            statements[stage] = q.count
+            return out
+
+        def traced(stage: str, fn: Callable[[], Any]) -> Any:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            out = fn()
+            peaks[stage] = max(0, tracemalloc.get_traced_memory()[1] - base) / 1024
+            return out
+
+        counts: Dict[str, int] = {}
+        for _ in range(max(1, rounds)):
+            counts = _run_once(corpus, db, tenant, timed)
+        if trace_memory:
+            tracemalloc.start()
+            try:
+                _run_once(corpus, db, tenant, traced)
+            finally:
+                tracemalloc.stop()
+        stages: Dict[str, Dict[str, Any]] = {}
+        for stage in STAGES:
+            if stage not in walls:
+                continue
+            w = walls[stage]
+            stages[stage] = {
+                "wall_ms_p50": round(statistics.median(w), 3),
+                "wall_ms_min": round(min(w), 3),
+                "wall_ms_max": round(max(w), 3),
+                "statements": statements.get(stage, 0),
+            }
+            if stage in peaks:
+                stages[stage]["peak_kib"] = round(peaks[stage], 1)
+        report["corpora"][corpus.name] = {"counts": counts, "stages": stages}
+    return report
+
+
+def compare_policy_pipeline_reports(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    time_tolerance: float = 0.25,
+    min_time_delta_ms: float = 2.0,
+    memory_tolerance: float = 0.25,
+) -> List[Dict[str, Any]]:
+    """
+    Stage regressions against a baseline: median wall time or peak memory above baseline × (1 + tolerance)
+    (time also by at least ``min_time_delta_ms``), or any increase in DB statements.
+    """
+    out: List[Dict[str, Any]] = []
+    for corpus, cur in (report.get("corpora") or {}).items():
+        base_stages = ((baseline.get("corpora") or {}).get(corpus) or {}).get("stages") or {}
+        for stage, c in (cur.get("stages") or {}).items():
+            b = base_stages.get(stage)
+            if not b:
+                continue
+            bw, cw = float(b.get("wall_ms_p50") or 0.0), float(c.get("wall_ms_p50") or 0.0)
+            if cw > bw * (1 + time_tolerance) and cw - bw >= min_time_delta_ms:
+                out.append({"corpus": corpus, "stage": stage, "metric": "wall_ms_p50", "baseline": bw, "current": cw})
+            if int(c.get("statements") or 0) > int(b.get("statements") or 0):
+                out.append(
+                    {
+                        "corpus": corpus,
+                        "stage": stage,
+                        "metric": "statements",
+                        "baseline": b.get("statements"),
+                        "current": c.get("statements"),
+                    }
+                )
+            bm, cm = b.get("peak_kib"), c.get("peak_kib")
+            if bm is not None and cm is not None and cm > float(bm) * (1 + memory_tolerance) and cm - bm >= 64:
+                out.append({"corpus": corpus, "stage": stage, "metric": "peak_kib", "baseline": bm, "current": cm})
+    return out
+
+
+def format_policy_pipeline_report(report: Dict[str, Any], regressions: Optional[List[Dict[str, Any]]] = None) -> str:
+    lines = [f"{'corpus':<22}{'stage':<11}{'p50 ms':>10}{'min ms':>10}{'peak KiB':>11}{'stmts':>7}"]
+    for corpus, r in (report.get("corpora") or {}).items():
+        for stage, s in r["stages"].items():
+            lines.append(
+                f"{corpus:<22}{stage:<11}{s['wall_ms_p50']:>10.2f}{s['wall_ms_min']:>10.2f}"
+                f"{s.get('peak_kib', float('nan')):>11.1f}{s['statements']:>7}"
+            )
+        lines.append(f"{'':<22}counts: " + ", ".join(f"{k}={v}" for k, v in r["counts"].items()))
+    if regressions is not None:
+        if not regressions:
+            lines.append("no regressions against baseline")
+        for reg in regressions:
+            lines.append(
+                f"REGRESSION {reg['corpus']}/{reg['stage']} {reg['metric']}: {reg['baseline']} -> {reg['current']}"
+            )
+    return "\n".join(lines)
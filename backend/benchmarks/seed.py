@@ -0,0 +1,158 @@
+"""
+Synthetic tenant generator: N companies × M assignments × K messages / milestones / policy versions.
+
+Writes through the regular ``Database`` methods so the rows look exactly like app-created ones on
+whichever backend ``DATABASE_URL`` points at (local SQLite or a local Postgres). Every id and email
+carries a run prefix so seeded tenants never collide with real or test data.
+"""
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+BENCH_PASSWORD = "BenchPassw0rd!"
+
+_HOST_COUNTRIES = ("SG", "US", "DE", "NO", "GB", "AE")
+_HOME_COUNTRIES = ("FR", "IN", "US", "NL", "BR")
+_MILESTONE_TYPES = ("visa", "housing", "schooling", "shipment", "tax", "banking", "arrival")
+
+
+@dataclass
+class SeedConfig:
+    companies: int = 3
+    assignments_per_company: int = 20
+    messages_per_assignment: int = 5
+    milestones_per_assignment: int = 4
+    policy_versions_per_company: int = 3
+
+
+@dataclass
+class SeededCompany:
+    company_id: str
+    hr_user_id: str
+    hr_email: str
+    policy_id: str
+    published_version_id: str
+    assignment_ids: List[str] = field(default_factory=list)
+    employee_emails: Dict[str, str] = field(default_factory=dict)  # assignment_id -> employee email
+
+
+@dataclass
+class SeedManifest:
+    run_id: str
+    config: SeedConfig
+    password: str
+    companies: List[SeededCompany] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _password_hash(password: str) -> str:
+    from passlib.context import CryptContext  # same scheme as /api/auth/login
+
+    return CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto").hash(password)
+
+
+def _seed_company(db: Any, cfg: SeedConfig, run_id: str, idx: int, password_hash: str) -> SeededCompany:
+    from ..dev_seed_auth import ensure_dev_seed_auth_user
+
+    company_id = str(uuid.uuid4())
+    db.create_company(company_id, f"Bench {run_id} Co {idx:03d}", "SG", "51-200", "", "", "")
+
+    hr_email = f"bench-{run_id}-c{idx}-hr@relopass.test"
+    hr_uid = ensure_dev_seed_auth_user(
+        db, user_id=str(uuid.uuid4()), email=hr_email, password_hash=password_hash, role="HR", name=f"Bench HR {idx}"
+    )
+    db.ensure_profile_record(hr_uid, hr_email, "HR", f"Bench HR {idx}", company_id)
+    db.create_hr_user(str(uuid.uuid4()), company_id, hr_uid, {"can_manage_policy": True})
+
+    policy_id = str(uuid.uuid4())
+    db.create_company_policy(
+        policy_id, company_id, f"Bench mobility policy {idx}", "1", date.today().isoformat(),
+        f"bench/{run_id}/{idx}.pdf", "application/pdf", hr_uid,
+    )
+    version_ids: List[str] = []
+    for vn in range(1, max(1, cfg.policy_versions_per_company) + 1):
+        vid = str(uuid.uuid4())
+        db.create_policy_version(vid, policy_id, version_number=vn, status="archived", created_by=hr_uid)
+        version_ids.append(vid)
+    db.update_policy_version_status(version_ids[-1], "published")
+
+    company = SeededCompany(
+        company_id=company_id,
+        hr_user_id=hr_uid,
+        hr_email=hr_email,
+        policy_id=policy_id,
+        published_version_id=version_ids[-1],
+    )
+    today = date.today()
+    for a in range(cfg.assignments_per_company):
+        emp_email = f"bench-{run_id}-c{idx}-e{a}@relopass.test"
+        emp_uid = ensure_dev_seed_auth_user(
+            db, user_id=str(uuid.uuid4()), email=emp_email, password_hash=password_hash,
+            role="EMPLOYEE", name=f"Bench Employee {idx}-{a}",
+        )
+        db.ensure_profile_record(emp_uid, emp_email, "EMPLOYEE", f"Bench Employee {idx}-{a}", company_id)
+        host = _HOST_COUNTRIES[(idx + a) % len(_HOST_COUNTRIES)]
+        home = _HOME_COUNTRIES[a % len(_HOME_COUNTRIES)]
+        case_id = str(uuid.uuid4())
+        db.create_case(case_id, hr_uid, {"label": f"bench-{run_id}"}, company_id=company_id)
+        db.upsert_relocation_case(case_id, company_id, None, "active", "intake", host, home)
+        assignment_id = str(uuid.uuid4())
+        db.create_assignment(
+            assignment_id, case_id, hr_uid, emp_uid, emp_email, "assigned",
+            employee_first_name="Bench", employee_last_name=f"{idx}-{a}",
+        )
+        for m in range(cfg.milestones_per_assignment):
+            mtype = _MILESTONE_TYPES[m % len(_MILESTONE_TYPES)]
+            db.upsert_case_milestone(
+                case_id, mtype, f"{mtype.title()} step",
+                target_date=(today + timedelta(days=7 * (m + 1) - (a % 10))).isoformat(),
+                status="done" if m == 0 else "pending",
+                sort_order=m,
+            )
+        for k in range(cfg.messages_per_assignment):
+            hr_sent = k % 2 == 0
+            db.create_message(
+                str(uuid.uuid4()), assignment_id, hr_uid, emp_email,
+                f"Bench thread {idx}-{a}", f"Synthetic message {k}", status="sent",
+                sender_user_id=hr_uid if hr_sent else emp_uid,
+                recipient_user_id=emp_uid if hr_sent else hr_uid,
+            )
+        company.assignment_ids.append(assignment_id)
+        company.employee_emails[assignment_id] = emp_email
+    return company
+
+
+def seed_synthetic_tenants(
+    db: Any,
+    config: Optional[SeedConfig] = None,
+    *,
+    run_id: Optional[str] = None,
+    password: str = BENCH_PASSWORD,
+) -> SeedManifest:
+    """Create the synthetic tenants and return what the runner needs to log in and address them."""
+    cfg = config or SeedConfig()
+    rid = run_id or uuid.uuid4().hex[:8]
+    t0 = time.perf_counter()
+    pwd_hash = _password_hash(password)
+    manifest = SeedManifest(run_id=rid, config=cfg, password=password)
+    for idx in range(cfg.companies):
+        manifest.companies.append(_seed_company(db, cfg, rid, idx, pwd_hash))
+    manifest.seconds = round(time.perf_counter() - t0, 3)
+    log.info(
+        "bench seed run_id=%s companies=%s assignments=%s seconds=%s",
+        rid,
+        cfg.companies,
+        cfg.companies * cfg.assignments_per_company,
+        manifest.seconds,
+    )
+    return manifest
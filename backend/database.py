@@ -2,19 +2,29 @@
 Unified database layer — works with both SQLite and Postgres.
 Uses DATABASE_URL from db_config (single source of truth).
 """
+import base64
+import hashlib
+import itertools
 import json
 import os
 import math
+import re
 import uuid
 import logging
+import threading
 import time
-from typing import Optional, Dict, Any, List, Tuple, Set, Callable
+import types
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple, Set, Callable
 from datetime import datetime
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, column, create_engine, insert, table, text
 from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
 
 from .db_config import DATABASE_URL as _raw_url, sqlalchemy_engine_kwargs
+from .db_instrumentation import install_query_instrumentation
+from .db_integrity_metrics import IntegrityMetrics, integrity_metrics
+from .db_schema_capabilities import SchemaCapabilities, schema_capabilities
 from .identity_normalize import email_normalized_from_identifier, normalize_invite_key
 from .identity_observability import identity_event
 
@@ -32,6 +42,7 @@ log = logging.getLogger(__name__)
 # Engine setup (shared logic with backend/app/db.py)
 # ---------------------------------------------------------------------------
 _engine = create_engine(_raw_url, **sqlalchemy_engine_kwargs(_raw_url))
+install_query_instrumentation(_engine)
 
 _is_sqlite = _raw_url.startswith("sqlite")
 
@@ -46,13 +57,32 @@ if _is_sqlite:
         cur.close()
 
 
+# Set by init_db once case_assignments.resolved_case_id exists (SQLite: created here; Postgres:
+# migration 20260427150000). Until then joins fall back to the CAST/COALESCE predicate.
+_case_assignments_has_resolved_case_id = False
+
+# Same resolution as the resolved_case_id triggers; used for the one-time SQLite backfill.
+_RESOLVED_CASE_ID_SQL = "COALESCE(NULLIF(TRIM(canonical_case_id), ''), case_id)"
+
+# Multi-row INSERT target for analytics batches; 4 binds per row keeps a chunk under SQLite's bind limit.
+_ANALYTICS_EVENTS = table(
+    "analytics_events", column("id"), column("event_name"), column("payload_json"), column("created_at")
+)
+_ANALYTICS_INSERT_CHUNK = 500
+
+
 def _relocation_cases_join_on(table_alias: str = "a", style: str = "standard") -> str:
     """
     Predicate for: LEFT JOIN relocation_cases rc ON <this>
     Supabase/Postgres often types relocation_cases.id as uuid while case_assignments.case_id is text;
     comparing without a cast raises 'operator does not exist: uuid = text'. SQLite uses text ids — no ::text.
+
+    When case_assignments.resolved_case_id is available ("standard" / "canonical_coalesce") the join is
+    plain equality on that column, which is stored with the type of relocation_cases.id and indexed.
     """
     a = table_alias
+    if style != "simple" and _case_assignments_has_resolved_case_id:
+        return f"rc.id = {a}.resolved_case_id"
     if style == "simple":
         rhs = f"{a}.case_id"
     elif style == "canonical_coalesce":
@@ -66,10 +96,85 @@ def _relocation_cases_join_on(table_alias: str = "a", style: str = "standard") -
 
 
 def _eq_text(lhs_sql: str, rhs_sql: str) -> str:
-    """Cross-type-safe equality for ids (Postgres uuid vs text on messages / assignments / prefs). SQLite: CAST is harmless."""
+    """
+    Cross-type-safe equality for ids (Postgres uuid vs text on messages / assignments / prefs).
+    SQLite ids are all TEXT, so plain equality is equivalent there and keeps the indexes usable.
+    """
+    if _is_sqlite:
+        return f"{lhs_sql} = {rhs_sql}"
     return f"CAST({lhs_sql} AS TEXT) = CAST({rhs_sql} AS TEXT)"
 
 
+# Admin index keyset pagination: sort name -> SQL expression, per index. Every page is ordered by
+# (expression, id) and the cursor carries the last row's pair, so page cost is independent of offset.
+_ADMIN_INDEX_SORTS: Dict[str, Dict[str, str]] = {
+    "companies": {
+        "name": "LOWER(c.name)",
+        "created_at": "c.created_at",
+        "hr_users_count": "COALESCE(cnt.hr_users_count, 0)",
+        "employee_count": "COALESCE(cnt.employee_count, 0)",
+        "assignments_count": "COALESCE(cnt.assignments_count, 0)",
+        "policies_count": "COALESCE(cnt.policies_count, 0)",
+    },
+    "people": {
+        "name": "LOWER(COALESCE(p.full_name, p.email, ''))",
+        "email": "LOWER(COALESCE(p.email, ''))",
+        "created_at": "p.created_at",
+    },
+    "assignments": {
+        "updated_at": "a.updated_at",
+        "created_at": "a.created_at",
+    },
+}
+_ADMIN_INDEX_ID_COLUMN = {"companies": "c.id", "people": "p.id", "assignments": "a.id"}
+
+
+def _admin_index_keyset(
+    index: str, sort: str, cursor: Optional[str]
+) -> Tuple[str, str, str, Dict[str, Any]]:
+    """
+    (sort_key_select_sql, keyset_where_sql, order_by_sql, params) for an admin index page.
+    ``sort`` is a key of _ADMIN_INDEX_SORTS[index], prefixed with '-' for descending.
+    Raises ValueError for an unknown sort or a cursor issued for a different sort.
+    """
+    desc = sort.startswith("-")
+    name = sort[1:] if desc else sort
+    expr = _ADMIN_INDEX_SORTS[index].get(name)
+    if not expr:
+        raise ValueError(f"Unsupported sort for {index}: {sort}")
+    id_col = _ADMIN_INDEX_ID_COLUMN[index]
+    direction = "DESC" if desc else "ASC"
+    order_sql = f"ORDER BY {expr} {direction}, {id_col} {direction}"
+    if not cursor:
+        return f"{expr} AS _sort_key", "", order_sql, {}
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+        cursor_sort, key, last_id = payload
+    except Exception as exc:
+        raise ValueError("Invalid cursor") from exc
+    if cursor_sort != sort:
+        raise ValueError("Cursor does not match sort")
+    op = "<" if desc else ">"
+    where_sql = f"AND ({expr} {op} :_ks_key OR ({expr} = :_ks_key AND {id_col} {op} :_ks_id))"
+    return f"{expr} AS _sort_key", where_sql, order_sql, {"_ks_key": key, "_ks_id": last_id}
+
+
+def _admin_index_page(
+    rows: List[Dict[str, Any]], sort: str, limit: Optional[int]
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Trim the look-ahead row fetched with LIMIT limit+1 and return (page, next_cursor)."""
+    has_more = limit is not None and len(rows) > limit
+    page = rows[:limit] if has_more else rows
+    next_cursor = None
+    if has_more and page:
+        last = page[-1]
+        raw = json.dumps([sort, last.get("_sort_key"), last.get("id")], default=str)
+        next_cursor = base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+    for r in page:
+        r.pop("_sort_key", None)
+    return page, next_cursor
+
+
 def _coerce_json_dict(value: Any) -> Dict[str, Any]:
     if value is None:
         return {}
@@ -168,17 +273,8 @@ _profiles_has_status_column = False
 
 
 def _get_company_policies_columns(conn: Any) -> set:
-    """Return set of column names for company_policies (SQLite PRAGMA or Postgres information_schema)."""
-    if _is_sqlite:
-        rows = conn.execute(text("PRAGMA table_info(company_policies)")).fetchall()
-        return {r[1] for r in rows}
-    rows = conn.execute(
-        text(
-            "SELECT column_name FROM information_schema.columns "
-            "WHERE table_schema = 'public' AND table_name = 'company_policies'"
-        )
-    ).fetchall()
-    return {r._mapping["column_name"] for r in rows}
+    """Return set of column names for company_policies (from the engine's schema capability registry)."""
+    return set(schema_capabilities(conn.engine).columns("company_policies"))
 
 
 def _seed_default_policy_template_sqlite(conn: Any) -> None:
@@ -280,6 +376,239 @@ def _auto_id_col() -> str:
     return "SERIAL PRIMARY KEY"
 
 
+_POLICY_CHUNK_SEARCH_STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from has have how i if in is it its me my of on or our "
+    "the their there this to under we what when where which who will with you your".split()
+)
+
+
+def _policy_chunk_search_terms(message: str, *, max_terms: int = 16) -> List[str]:
+    """Lowercased alphanumeric query terms (stopwords dropped, de-duplicated, capped)."""
+    out: List[str] = []
+    for tok in re.findall(r"[a-z0-9]+", (message or "").lower()):
+        if len(tok) < 2 or tok in _POLICY_CHUNK_SEARCH_STOPWORDS or tok in out:
+            continue
+        out.append(tok)
+        if len(out) >= max_terms:
+            break
+    return out
+
+
+def _sqlite_ensure_policy_chunk_fts(conn: Any) -> None:
+    """
+    FTS5 index over policy_document_chunks (external content, kept in sync by triggers) so the
+    assistant can rank chunks with bm25(). Postgres uses a generated tsvector + GIN instead
+    (supabase/migrations/20260427120000_policy_document_chunks_fts.sql). No-op without FTS5.
+
+    policy_document_chunks has a TEXT primary key, so its implicit rowid is not stable (VACUUM may
+    renumber it). The FTS rowid is policy_document_chunk_search_keys.search_rowid, an INTEGER
+    PRIMARY KEY per chunk id, and the FTS content is read through a view joining it to the chunks.
+    An index built on the implicit rowid is dropped and rebuilt.
+    """
+    existing = conn.execute(
+        text("SELECT sql FROM sqlite_master WHERE type='table' AND name='policy_document_chunks_fts'")
+    ).fetchone()
+    if existing and "policy_document_chunks_search_v" in (existing[0] or ""):
+        return
+    if existing:
+        for trg in ("policy_document_chunks_fts_ai", "policy_document_chunks_fts_ad", "policy_document_chunks_fts_au"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {trg}"))
+        conn.execute(text("DROP TABLE policy_document_chunks_fts"))
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS policy_document_chunk_search_keys (
+            search_rowid INTEGER PRIMARY KEY,
+            chunk_id TEXT NOT NULL UNIQUE
+        )
+    """))
+    conn.execute(text("""
+        CREATE VIEW IF NOT EXISTS policy_document_chunks_search_v AS
+        SELECT k.search_rowid, COALESCE(c.section_title, '') AS section_title, c.text_content
+        FROM policy_document_chunk_search_keys k
+        JOIN policy_document_chunks c ON c.id = k.chunk_id
+    """))
+    try:
+        conn.execute(text("""
+            CREATE VIRTUAL TABLE policy_document_chunks_fts USING fts5(
+                section_title, text_content,
+                content='policy_document_chunks_search_v', content_rowid='search_rowid'
+            )
+        """))
+    except Exception as exc:
+        log.warning("policy_document_chunks_fts unavailable (FTS5 missing?): %s", exc)
+        return
+    conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS policy_document_chunks_fts_ai AFTER INSERT ON policy_document_chunks BEGIN
+            INSERT OR IGNORE INTO policy_document_chunk_search_keys(chunk_id) VALUES (new.id);
+            INSERT INTO policy_document_chunks_fts(rowid, section_title, text_content)
+            VALUES (
+                (SELECT search_rowid FROM policy_document_chunk_search_keys WHERE chunk_id = new.id),
+                COALESCE(new.section_title, ''), new.text_content
+            );
+        END
+    """))
+    conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS policy_document_chunks_fts_ad AFTER DELETE ON policy_document_chunks BEGIN
+            INSERT INTO policy_document_chunks_fts(policy_document_chunks_fts, rowid, section_title, text_content)
+            SELECT 'delete', search_rowid, COALESCE(old.section_title, ''), old.text_content
+            FROM policy_document_chunk_search_keys WHERE chunk_id = old.id;
+            DELETE FROM policy_document_chunk_search_keys WHERE chunk_id = old.id;
+        END
+    """))
+    conn.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS policy_document_chunks_fts_au AFTER UPDATE ON policy_document_chunks BEGIN
+            INSERT INTO policy_document_chunks_fts(policy_document_chunks_fts, rowid, section_title, text_content)
+            SELECT 'delete', search_rowid, COALESCE(old.section_title, ''), old.text_content
+            FROM policy_document_chunk_search_keys WHERE chunk_id = old.id;
+            UPDATE policy_document_chunk_search_keys SET chunk_id = new.id WHERE chunk_id = old.id;
+            INSERT INTO policy_document_chunks_fts(rowid, section_title, text_content)
+            VALUES (
+                (SELECT search_rowid FROM policy_document_chunk_search_keys WHERE chunk_id = new.id),
+                COALESCE(new.section_title, ''), new.text_content
+            );
+        END
+    """))
+    # Key and index rows imported before the FTS table existed.
+    conn.execute(text("""
+        INSERT OR IGNORE INTO policy_document_chunk_search_keys(chunk_id)
+        SELECT id FROM policy_document_chunks
+    """))
+    conn.execute(text("INSERT INTO policy_document_chunks_fts(policy_document_chunks_fts) VALUES ('rebuild')"))
+
+
+def _sqlite_ensure_crawl_scheduler_tables(conn: Any) -> None:
+    """
+    Local-dev copy of crawl_schedules / crawl_job_runs (supabase/migrations/20260311000000_crawl_scheduling_
+    freshness.sql plus the lease columns of 20260427170000_crawl_job_run_leases.sql), so the scheduler
+    worker's leases run against SQLite. At most one queued/running job per schedule.
+    """
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS crawl_schedules (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            is_active INTEGER NOT NULL DEFAULT 1,
+            schedule_type TEXT NOT NULL DEFAULT 'cron',
+            schedule_expression TEXT NOT NULL,
+            source_scope_type TEXT NOT NULL,
+            source_scope_ref TEXT,
+            country_code TEXT,
+            city_name TEXT,
+            content_domain TEXT,
+            priority INTEGER NOT NULL DEFAULT 0,
+            max_runtime_seconds INTEGER,
+            retry_policy_json TEXT,
+            last_run_at TEXT,
+            next_run_at TEXT,
+            created_by_user_id TEXT,
+            updated_by_user_id TEXT,
+            created_at TEXT,
+            updated_at TEXT
+        )
+    """))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_crawl_schedules_active_next ON crawl_schedules(is_active, next_run_at)"
+    ))
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS crawl_job_runs (
+            id TEXT PRIMARY KEY,
+            schedule_id TEXT,
+            crawl_run_id TEXT,
+            job_type TEXT NOT NULL,
+            trigger_type TEXT NOT NULL DEFAULT 'manual',
+            status TEXT NOT NULL DEFAULT 'queued',
+            started_at TEXT,
+            finished_at TEXT,
+            requested_by_user_id TEXT,
+            scope_json TEXT,
+            config_snapshot_json TEXT,
+            documents_fetched_count INTEGER,
+            documents_changed_count INTEGER,
+            documents_unchanged_count INTEGER,
+            chunks_created_count INTEGER,
+            staged_resources_count INTEGER,
+            staged_events_count INTEGER,
+            warnings_count INTEGER,
+            errors_count INTEGER,
+            summary_json TEXT,
+            error_summary TEXT,
+            lock_until TEXT,
+            lock_owner TEXT,
+            created_at TEXT
+        )
+    """))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS idx_crawl_job_runs_status ON crawl_job_runs(status)"))
+    conn.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_crawl_job_runs_active_schedule ON crawl_job_runs(schedule_id) "
+        "WHERE schedule_id IS NOT NULL AND status IN ('queued', 'running')"
+    ))
+
+
+# Tables keyed by assignment_id that purge_inactive_cases clears before deleting the assignment.
+_PURGE_ASSIGNMENT_CHILD_TABLES = (
+    "employee_profiles",
+    "employee_answers",
+    "compliance_reports",
+    "compliance_runs",
+    "policy_exceptions",
+    "compliance_actions",
+)
+
+# Schema ledger: one row per applied init_db step (see Database._schema_steps).
+_SCHEMA_LEDGER_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_ledger (
+        step TEXT PRIMARY KEY,
+        position INTEGER NOT NULL,
+        checksum TEXT NOT NULL,
+        applied_at TEXT NOT NULL,
+        duration_ms REAL NOT NULL
+    )
+"""
+# pg_advisory_lock key held while a worker applies schema steps; others wait, then re-read the ledger.
+_SCHEMA_LEDGER_LOCK_KEY = 7_305_044
+# SQLite has no advisory locks; steps are idempotent, so only threads of one process are serialized.
+_schema_ledger_thread_lock = threading.Lock()
+
+
+# Module/class constants (``_RESOLVED_CASE_ID_SQL``, ``_SCHEMA_LEDGER_DDL``): DDL a step reads by name.
+_SCHEMA_CONSTANT_NAME = re.compile(r"^_?[A-Z][A-Z0-9_]*$")
+
+
+def _hash_code_object(code: types.CodeType, digest: Any, names: Set[str]) -> None:
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    names.update(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code_object(const, digest, names)
+        elif isinstance(const, frozenset):
+            digest.update(repr(sorted(map(repr, const))).encode("utf-8"))
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+def _schema_step_checksum(apply: Callable, helpers: Iterable[Callable]) -> str:
+    """
+    sha256 over the bytecode, names and constants (the DDL text) of a schema step and its helpers, plus
+    the values of the upper-case module or class constants they reference, so editing shared DDL held
+    in a constant re-runs the step. Cheaper than hashing inspect.getsource() and insensitive to line
+    moves elsewhere in this file. Mutable lower-case module flags are deliberately left out.
+    """
+    digest = hashlib.sha256()
+    for fn in (apply, *helpers):
+        func = getattr(fn, "__func__", fn)
+        names: Set[str] = set()
+        _hash_code_object(func.__code__, digest, names)
+        owner = getattr(fn, "__self__", None)
+        scopes = (func.__globals__, vars(type(owner)) if owner is not None else {})
+        for name in sorted(n for n in names if _SCHEMA_CONSTANT_NAME.match(n)):
+            for scope in scopes:
+                value = scope.get(name)
+                if isinstance(value, (str, bytes, int, float, tuple, frozenset)):
+                    shown = sorted(map(repr, value)) if isinstance(value, frozenset) else value
+                    digest.update(f"{name}={shown!r}".encode("utf-8"))
+                    break
+    return digest.hexdigest()
+
+
 class Database:
     def __init__(self) -> None:
         self.engine = _engine
@@ -287,6 +616,22 @@ class Database:
         self._readiness_store_cache: Optional[bool] = None
         self.init_db()
 
+    @property
+    def schema(self) -> SchemaCapabilities:
+        """Tables/columns present on this engine, introspected once; see db_schema_capabilities."""
+        return schema_capabilities(self.engine)
+
+    @property
+    def integrity_metrics(self) -> IntegrityMetrics:
+        """TTL-cached data-integrity counts for this engine; see db_integrity_metrics."""
+        return integrity_metrics(self.engine)
+
+    def refresh_schema_capabilities(self) -> None:
+        """Re-read the schema after DDL or migrations, and re-derive the module-level schema flags."""
+        global _case_assignments_has_resolved_case_id
+        self.schema.refresh()
+        _case_assignments_has_resolved_case_id = self.schema.has_column("case_assignments", "resolved_case_id")
+
     def _exec(
         self,
         conn,
@@ -296,16 +641,12 @@ class Database:
         request_id: Optional[str] = None,
     ):
         """
-        Execute a SQL statement with basic timing and optional request correlation.
+        Execute a SQL statement. Timing, per-request counts and slow-query sampling are handled by
+        the cursor listeners in db_instrumentation; op_name / request_id only feed DEBUG logs.
         """
-        start = time.perf_counter()
-        result = conn.execute(text(sql), params)
-        dur_ms = (time.perf_counter() - start) * 1000
-        if request_id:
-            log.info("request_id=%s db_op=%s dur_ms=%.2f", request_id, op_name, dur_ms)
-        else:
-            log.info("db_op=%s dur_ms=%.2f", op_name, dur_ms)
-        return result
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("request_id=%s db_op=%s", request_id, op_name)
+        return conn.execute(text(sql), params)
 
     def _db_healthcheck(self, conn) -> None:
         info = Database.get_db_info()
@@ -321,33 +662,8 @@ class Database:
         """
         if _is_sqlite:
             return
-        need_identity = False
-        need_timeline = False
-        try:
-            with self.engine.connect() as c:
-                r1 = c.execute(
-                    text(
-                        "SELECT 1 FROM information_schema.tables "
-                        "WHERE table_schema = 'public' AND table_name = 'employee_contacts'"
-                    )
-                ).fetchone()
-                r2 = c.execute(
-                    text(
-                        "SELECT 1 FROM information_schema.tables "
-                        "WHERE table_schema = 'public' AND table_name = 'case_milestones'"
-                    )
-                ).fetchone()
-                r3 = c.execute(
-                    text(
-                        "SELECT 1 FROM information_schema.tables "
-                        "WHERE table_schema = 'public' AND table_name = 'milestone_links'"
-                    )
-                ).fetchone()
-            need_identity = not r1
-            need_timeline = not r2 or not r3
-        except Exception as ex:
-            log.warning("postgres schema presence check skipped: %s", ex)
-            return
+        need_identity = not self.schema.has_table("employee_contacts")
+        need_timeline = not self.schema.has_table("case_milestones") or not self.schema.has_table("milestone_links")
         if not need_identity and not need_timeline:
             return
         if need_identity:
@@ -904,30 +1220,267 @@ class Database:
     # ------------------------------------------------------------------
     # Schema creation
     # ------------------------------------------------------------------
-    def init_db(self) -> None:
+    def _ensure_resolved_case_id_join_key(self, conn: Any) -> None:
+        """
+        case_assignments.resolved_case_id: COALESCE(NULLIF(TRIM(canonical_case_id), ''), case_id) stored with
+        the type of relocation_cases.id, so assignment/case joins are indexed equality instead of CAST/COALESCE.
+        SQLite: column, triggers and a one-time backfill here. Postgres: created by the migration.
+        refresh_schema_capabilities() turns the join on once the column exists.
+        """
         if not _is_sqlite:
-            self._maybe_ensure_postgres_missing_schemas()
-            self._maybe_ensure_postgres_case_assignments_employee_link_mode()
-            self._maybe_ensure_policy_versions_normalization_draft_json()
-            self._maybe_ensure_policy_versions_normalization_state()
-            self._maybe_ensure_policy_benefit_rule_hr_overrides()
-            self._maybe_ensure_compensation_allowance_policy_config()
-
-        # In production (Render), avoid runtime DDL. Use Supabase migrations instead.
-        if not _is_sqlite and os.getenv("DISABLE_RUNTIME_DDL", "").lower() in ("1", "true", "yes"):
+            return
+        try:
+            cols = {r[1] for r in conn.execute(text("PRAGMA table_info(case_assignments)")).fetchall()}
+            if "resolved_case_id" not in cols:
+                conn.execute(text("ALTER TABLE case_assignments ADD COLUMN resolved_case_id TEXT"))
+            for name, event in (
+                ("case_assignments_resolved_case_id_ai", "AFTER INSERT"),
+                ("case_assignments_resolved_case_id_au", "AFTER UPDATE OF case_id, canonical_case_id"),
+            ):
+                conn.execute(text(f"""
+                    CREATE TRIGGER IF NOT EXISTS {name} {event} ON case_assignments BEGIN
+                      UPDATE case_assignments
+                      SET resolved_case_id = COALESCE(NULLIF(TRIM(new.canonical_case_id), ''), new.case_id)
+                      WHERE id = new.id;
+                    END
+                """))
+            conn.execute(text(
+                f"UPDATE case_assignments SET resolved_case_id = {_RESOLVED_CASE_ID_SQL} "
+                f"WHERE resolved_case_id IS NULL OR resolved_case_id <> {_RESOLVED_CASE_ID_SQL}"
+            ))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_case_assignments_resolved_case_id "
+                "ON case_assignments(resolved_case_id)"
+            ))
+        except Exception as exc:
+            log.warning("resolved_case_id join key unavailable, using cast joins: %s", exc)
+
+    def init_db(self) -> None:
+        """
+        Apply the pending schema steps (see _schema_steps / schema_ledger), then refresh the schema
+        capability registry and run the idempotent data seeds. A warm start with an up-to-date ledger
+        issues one ledger read instead of the full DDL pass.
+        """
+        runtime_ddl_disabled = not _is_sqlite and os.getenv("DISABLE_RUNTIME_DDL", "").lower() in ("1", "true", "yes")
+        if runtime_ddl_disabled:
+            # In production (Render), avoid runtime DDL. Use Supabase migrations instead.
             with self.engine.connect() as conn:
                 self._db_healthcheck(conn)
-            log.info("Runtime DDL disabled via DISABLE_RUNTIME_DDL. Skipping init_db DDL.")
-            try:
-                self.seed_readiness_templates_if_empty()
-            except Exception as e:
-                log.warning("readiness template seed skipped: %s", e)
-            try:
-                self._backfill_employee_contacts()
-            except Exception as e:
-                log.warning("employee_contacts backfill skipped: %s", e)
+            log.info("Runtime DDL disabled via DISABLE_RUNTIME_DDL. Skipping init_db core DDL.")
+        self.schema_init_report = self._apply_schema_ledger(
+            self._schema_steps(include_core=not runtime_ddl_disabled), create_ledger=not runtime_ddl_disabled
+        )
+        self.refresh_schema_capabilities()
+
+        try:
+            self.seed_readiness_templates_if_empty()
+        except Exception as e:
+            log.warning("readiness template seed skipped: %s", e)
+
+        try:
+            self._backfill_employee_contacts()
+        except Exception as e:
+            log.warning("employee_contacts backfill skipped: %s", e)
+
+    def _schema_steps(self, *, include_core: bool = True) -> List[Tuple[str, Callable[[], None], Tuple[Callable, ...], Tuple[str, ...]]]:
+        """
+        Ordered schema steps: (name, apply, helpers, requires).
+
+        The checksum of a step covers the source of ``apply`` and of the ``helpers`` it calls, so editing
+        the DDL re-runs the step on the next start. ``requires`` ("table" or "table.column") must exist
+        after the step before it is recorded: the Postgres helpers log and continue on failure, and a
+        step that did not take effect has to retry on the next start.
+        """
+        steps: List[Tuple[str, Callable[[], None], Tuple[Callable, ...], Tuple[str, ...]]] = []
+        if not _is_sqlite:
+            steps += [
+                (
+                    "pg_missing_schemas",
+                    self._maybe_ensure_postgres_missing_schemas,
+                    (self._ensure_postgres_canonical_identity_schema, self._ensure_postgres_case_milestones_schema),
+                    ("employee_contacts", "case_milestones", "milestone_links"),
+                ),
+                (
+                    "pg_case_assignments_employee_link_mode",
+                    self._maybe_ensure_postgres_case_assignments_employee_link_mode,
+                    (),
+                    ("case_assignments.employee_link_mode",),
+                ),
+                (
+                    "pg_policy_versions_normalization_draft_json",
+                    self._maybe_ensure_policy_versions_normalization_draft_json,
+                    (),
+                    ("policy_versions.normalization_draft_json",),
+                ),
+                (
+                    "pg_policy_versions_normalization_state",
+                    self._maybe_ensure_policy_versions_normalization_state,
+                    (),
+                    ("policy_versions.normalization_state",),
+                ),
+                (
+                    "pg_policy_benefit_rule_hr_overrides",
+                    self._maybe_ensure_policy_benefit_rule_hr_overrides,
+                    (),
+                    ("policy_benefit_rule_hr_overrides",),
+                ),
+                (
+                    "pg_compensation_allowance_policy_config",
+                    self._maybe_ensure_compensation_allowance_policy_config,
+                    (),
+                    ("policy_configs", "policy_config_versions", "policy_config_benefits"),
+                ),
+            ]
+        if include_core:
+            steps.append(
+                (
+                    "core_schema",
+                    self._ensure_core_schema,
+                    (
+                        self._ensure_users_table_sqlite,
+                        self._create_users_table,
+                        self._ensure_case_milestones_tracker_sqlite,
+                        self._ensure_resolved_case_id_join_key,
+                        _sqlite_ensure_policy_import_columns,
+                        _sqlite_ensure_policy_hardening_columns,
+                        _sqlite_ensure_policy_chunk_fts,
+                        _seed_default_policy_template_sqlite,
+                    ),
+                    ("users", "sessions", "relocation_cases", "case_assignments", "companies", "company_index_counters"),
+                )
+            )
+            if _is_sqlite:
+                steps.append(
+                    (
+                        "sqlite_crawl_scheduler",
+                        self._ensure_crawl_scheduler_schema_sqlite,
+                        (_sqlite_ensure_crawl_scheduler_tables,),
+                        ("crawl_schedules", "crawl_job_runs.lock_owner"),
+                    )
+                )
+        return steps
+
+    def _ensure_crawl_scheduler_schema_sqlite(self) -> None:
+        with self.engine.begin() as conn:
+            _sqlite_ensure_crawl_scheduler_tables(conn)
+
+    @contextmanager
+    def _schema_ledger_lock(self) -> Iterator[None]:
+        """Serialize schema application across workers (Postgres advisory lock; process lock on SQLite)."""
+        if _is_sqlite:
+            with _schema_ledger_thread_lock:
+                yield
             return
+        with self.engine.connect() as lock_conn:
+            lock_conn.execute(text("SELECT pg_advisory_lock(:k)"), {"k": _SCHEMA_LEDGER_LOCK_KEY})
+            try:
+                yield
+            finally:
+                lock_conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": _SCHEMA_LEDGER_LOCK_KEY})
+
+    def _read_schema_ledger(self) -> Optional[Dict[str, str]]:
+        """step -> checksum of the applied steps; None when the ledger table does not exist yet."""
+        try:
+            with self.engine.connect() as conn:
+                rows = conn.execute(text("SELECT step, checksum FROM schema_ledger")).fetchall()
+        except (OperationalError, ProgrammingError):
+            return None
+        return {str(r[0]): str(r[1]) for r in rows}
 
+    def list_schema_ledger(self) -> List[Dict[str, Any]]:
+        """Recorded schema steps in application order (empty before the first init_db)."""
+        try:
+            with self.engine.connect() as conn:
+                rows = conn.execute(
+                    text("SELECT step, position, checksum, applied_at, duration_ms FROM schema_ledger ORDER BY position")
+                ).fetchall()
+        except (OperationalError, ProgrammingError):
+            return []
+        return self._rows_to_list(rows)
+
+    def _apply_schema_ledger(
+        self,
+        steps: List[Tuple[str, Callable[[], None], Tuple[Callable, ...], Tuple[str, ...]]],
+        *,
+        create_ledger: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Run the steps whose ledger checksum is missing or different, in order, under the ledger lock.
+        Returns the timing report that init_db logs and keeps on ``schema_init_report``. With
+        ``create_ledger=False`` (DISABLE_RUNTIME_DDL) a missing schema_ledger table is not created: the
+        steps still run, but nothing is recorded until the migration adds the table.
+        """
+        started = time.perf_counter()
+        checksums = {name: _schema_step_checksum(apply, helpers) for name, apply, helpers, _ in steps}
+        recorded = self._read_schema_ledger() or {}
+        pending = [name for name, *_ in steps if recorded.get(name) != checksums[name]]
+        report: Dict[str, Any] = {
+            "steps": len(steps),
+            "applied": [],
+            "unverified": [],
+            "step_ms": {},
+            "check_ms": round((time.perf_counter() - started) * 1000.0, 1),
+        }
+        if pending:
+            with self._schema_ledger_lock():
+                recorded = self._read_schema_ledger()
+                ledger_available = recorded is not None or create_ledger
+                if recorded is None and create_ledger:
+                    with self.engine.begin() as conn:
+                        conn.execute(text(_SCHEMA_LEDGER_DDL))
+                recorded = recorded or {}
+                for position, (name, apply, _helpers, requires) in enumerate(steps):
+                    if recorded.get(name) == checksums[name]:
+                        continue  # applied by another worker while this one waited for the lock
+                    step_started = time.perf_counter()
+                    apply()
+                    duration_ms = round((time.perf_counter() - step_started) * 1000.0, 1)
+                    report["step_ms"][name] = duration_ms
+                    self.schema.refresh()
+                    missing = [
+                        r for r in requires
+                        if not (self.schema.has_column(*r.split(".", 1)) if "." in r else self.schema.has_table(r))
+                    ]
+                    if missing:
+                        log.warning("schema_ledger: step %s not recorded, still missing %s", name, missing)
+                        report["unverified"].append(name)
+                        continue
+                    report["applied"].append(name)
+                    if not ledger_available:
+                        continue
+                    with self.engine.begin() as conn:
+                        conn.execute(
+                            text(
+                                "INSERT INTO schema_ledger (step, position, checksum, applied_at, duration_ms) "
+                                "VALUES (:step, :pos, :checksum, :at, :ms) "
+                                "ON CONFLICT (step) DO UPDATE SET position = excluded.position, "
+                                "checksum = excluded.checksum, applied_at = excluded.applied_at, "
+                                "duration_ms = excluded.duration_ms"
+                            ),
+                            {
+                                "step": name,
+                                "pos": position,
+                                "checksum": checksums[name],
+                                "at": datetime.utcnow().isoformat(),
+                                "ms": duration_ms,
+                            },
+                        )
+        report["skipped"] = report["steps"] - len(report["applied"]) - len(report["unverified"])
+        report["total_ms"] = round((time.perf_counter() - started) * 1000.0, 1)
+        log.info(
+            "schema_ledger: steps=%s applied=%s unverified=%s skipped=%s check_ms=%s total_ms=%s step_ms=%s",
+            report["steps"],
+            report["applied"],
+            report["unverified"],
+            report["skipped"],
+            report["check_ms"],
+            report["total_ms"],
+            report["step_ms"],
+        )
+        return report
+
+    def _ensure_core_schema(self) -> None:
+        """Legacy tables, columns and indexes (CREATE ... IF NOT EXISTS plus SQLite column migrations)."""
         with self.engine.begin() as conn:
             if _is_sqlite:
                 self._ensure_users_table_sqlite(conn)
@@ -1456,6 +2009,30 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_policy_document_clauses_type
                 ON policy_document_clauses(clause_type)
             """))
+            conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS policy_document_clause_staging (
+                    generation TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    policy_document_id TEXT NOT NULL,
+                    section_label TEXT,
+                    section_path TEXT,
+                    clause_type TEXT NOT NULL DEFAULT 'unknown',
+                    title TEXT,
+                    raw_text TEXT NOT NULL,
+                    normalized_hint_json TEXT,
+                    source_page_start INTEGER,
+                    source_page_end INTEGER,
+                    source_anchor TEXT,
+                    confidence REAL DEFAULT 0.5,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (generation, id)
+                )
+            """))
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_policy_document_clause_staging_doc
+                ON policy_document_clause_staging(policy_document_id)
+            """))
             conn.execute(text("""
                 CREATE TABLE IF NOT EXISTS policy_knowledge_snapshots (
                     id TEXT PRIMARY KEY,
@@ -1498,6 +2075,7 @@ class Database:
             """))
             # Must run before indexes on policy_document_chunks.snapshot_id (upgrade path for older SQLite files).
             _sqlite_ensure_policy_hardening_columns(conn)
+            _sqlite_ensure_policy_chunk_fts(conn)
             conn.execute(text("""
                 CREATE INDEX IF NOT EXISTS idx_policy_document_chunks_doc
                 ON policy_document_chunks(policy_document_id)
@@ -1860,6 +2438,25 @@ class Database:
             conn.execute(text("""
                 CREATE INDEX IF NOT EXISTS idx_resolved_benefits_policy ON resolved_assignment_policy_benefits(resolved_policy_id)
             """))
+            conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS employee_entitlement_read_models (
+                    assignment_id TEXT NOT NULL,
+                    view_name TEXT NOT NULL,
+                    company_id TEXT,
+                    policy_id TEXT NOT NULL,
+                    policy_version_id TEXT NOT NULL,
+                    context_fingerprint TEXT NOT NULL,
+                    payload_json TEXT NOT NULL,
+                    computed_at TEXT NOT NULL,
+                    PRIMARY KEY (assignment_id, view_name)
+                )
+            """))
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_entitlement_read_models_version ON employee_entitlement_read_models(policy_version_id)
+            """))
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_entitlement_read_models_policy ON employee_entitlement_read_models(policy_id)
+            """))
             conn.execute(text("""
                 CREATE TABLE IF NOT EXISTS rp_debug_kv (
                     id TEXT PRIMARY KEY,
@@ -1955,6 +2552,17 @@ class Database:
                 )
             """))
 
+            conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS company_index_counters (
+                    company_id TEXT PRIMARY KEY,
+                    hr_users_count INTEGER NOT NULL DEFAULT 0,
+                    employee_count INTEGER NOT NULL DEFAULT 0,
+                    assignments_count INTEGER NOT NULL DEFAULT 0,
+                    policies_count INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT NOT NULL
+                )
+            """))
+
             # Dynamic dossier (Phase 1)
             conn.execute(text("""
                 CREATE TABLE IF NOT EXISTS dossier_questions (
@@ -2566,6 +3174,7 @@ class Database:
                 conn.execute(text("ALTER TABLE quotes ADD COLUMN IF NOT EXISTS created_by_user_id TEXT"))
                 conn.execute(text("ALTER TABLE case_assignments ADD COLUMN IF NOT EXISTS employee_contact_id TEXT"))
                 conn.execute(text("ALTER TABLE case_assignments ADD COLUMN IF NOT EXISTS employee_link_mode TEXT"))
+            self._ensure_resolved_case_id_join_key(conn)
             try:
                 conn.execute(text("""
                     CREATE TABLE IF NOT EXISTS relocation_tasks (
@@ -2757,20 +3366,9 @@ class Database:
                     pass
             except Exception:
                 pass
-
         log.info("DB schema ensured (legacy tables) — %s",
                  _raw_url.split("@")[-1] if "@" in _raw_url else _raw_url)
 
-        try:
-            self.seed_readiness_templates_if_empty()
-        except Exception as e:
-            log.warning("readiness template seed skipped: %s", e)
-
-        try:
-            self._backfill_employee_contacts()
-        except Exception as e:
-            log.warning("employee_contacts backfill skipped: %s", e)
-
     # ------------------------------------------------------------------
     # Users table migration helpers (SQLite only)
     # ------------------------------------------------------------------
@@ -2899,6 +3497,17 @@ class Database:
             row = conn.execute(text("SELECT * FROM users WHERE id = :id"), {"id": user_id}).fetchone()
         return self._row_to_dict(row)
 
+    def get_users_by_ids(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Bulk get_user_by_id: one IN query, keyed by user id (missing ids omitted)."""
+        ids = list(dict.fromkeys(str(u) for u in user_ids if u))
+        if not ids:
+            return {}
+        placeholders = ",".join([f":u{i}" for i in range(len(ids))])
+        params: Dict[str, Any] = {f"u{i}": ids[i] for i in range(len(ids))}
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(f"SELECT * FROM users WHERE id IN ({placeholders})"), params).fetchall()
+        return {str(d["id"]): d for d in self._rows_to_list(rows)}
+
     # ==================================================================
     # Session operations
     # ==================================================================
@@ -2966,6 +3575,15 @@ class Database:
             ), {"uid": user_id}).fetchall()
         return self._rows_to_list(rows)
 
+    def get_answered_question_ids(self, user_id: str) -> Set[str]:
+        """Question ids the user has answered (ids only; no answer payloads)."""
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text("SELECT DISTINCT question_id FROM answers WHERE user_id = :uid"),
+                {"uid": user_id},
+            ).fetchall()
+        return {str(r[0]) for r in rows}
+
     # ==================================================================
     # HR cases and assignments
     # ==================================================================
@@ -3032,7 +3650,7 @@ class Database:
             if not ec_row:
                 raise ValueError(f"employee_contact_id not found: {ecid_check}")
         elm = (employee_link_mode or "").strip() or None
-        with self.engine.begin() as conn:
+        with self._counted_write(inserts_only=True, assignments_count=[("a.id", [assignment_id])]) as conn:
             self._exec(
                 conn,
                 "INSERT INTO case_assignments "
@@ -4039,6 +4657,23 @@ class Database:
         except Exception as e:
             log.debug("insert_analytics_event failed (table may not exist): %s", e)
 
+    def insert_analytics_events(self, events: Iterable[Tuple[str, Dict[str, Any], str]]) -> int:
+        """
+        Insert (event_name, payload, created_at) rows as multi-row INSERT ... VALUES statements (one per
+        ``_ANALYTICS_INSERT_CHUNK`` rows) in one transaction. Returns rows written.
+        Raises on failure so the analytics buffer can count the batch as failed.
+        """
+        rows = [
+            {"id": str(uuid.uuid4()), "event_name": name, "payload_json": json.dumps(payload, default=str), "created_at": created_at}
+            for name, payload, created_at in events
+        ]
+        if not rows:
+            return 0
+        with self.engine.begin() as conn:
+            for start in range(0, len(rows), _ANALYTICS_INSERT_CHUNK):
+                conn.execute(insert(_ANALYTICS_EVENTS).values(rows[start : start + _ANALYTICS_INSERT_CHUNK]))
+        return len(rows)
+
     def list_analytics_events(
         self,
         event_name: Optional[str] = None,
@@ -5248,8 +5883,29 @@ class Database:
         destination_country: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """List assignments for admin with filters. Joins case_assignments, relocation_cases, profiles, companies."""
+        rows, _ = self._admin_assignments_page(
+            company_id=company_id,
+            employee_user_id=employee_user_id,
+            employee_search=employee_search,
+            status=status,
+            destination_country=destination_country,
+        )
+        return rows
+
+    def _admin_assignments_page(
+        self,
+        company_id: Optional[str] = None,
+        employee_user_id: Optional[str] = None,
+        employee_search: Optional[str] = None,
+        status: Optional[str] = None,
+        destination_country: Optional[str] = None,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "-updated_at",
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         clauses = []
-        params: Dict[str, Any] = {}
+        sort_select, keyset_sql, order_sql, params = _admin_index_keyset("assignments", sort, cursor)
         if company_id:
             clauses.append("(rc.company_id = :company_id OR (rc.company_id IS NULL AND EXISTS (SELECT 1 FROM hr_users hu2 WHERE hu2.profile_id = a.hr_user_id AND hu2.company_id = :company_id)))")
             params["company_id"] = company_id
@@ -5282,6 +5938,10 @@ class Database:
             params["emp_search"] = pattern
 
         where_sql = "AND " + " AND ".join(clauses) if clauses else ""
+        limit_sql = ""
+        if limit is not None:
+            limit_sql = "LIMIT :_limit"
+            params["_limit"] = limit + 1
 
         if _is_sqlite:
             join_on_cases = "rc.id = COALESCE(NULLIF(TRIM(a.canonical_case_id), ''), a.case_id)"
@@ -5304,7 +5964,8 @@ class Database:
                 COALESCE(emp.company_id, emp_p.company_id) AS employee_company_id,
                 ep.profile_json,
                 rap.id AS resolved_policy_id,
-                (SELECT COUNT(*) FROM company_policies cp WHERE cp.company_id = COALESCE(rc.company_id, hu.company_id) AND cp.extraction_status = 'extracted') AS company_policy_count
+                (SELECT COUNT(*) FROM company_policies cp WHERE cp.company_id = COALESCE(rc.company_id, hu.company_id) AND cp.extraction_status = 'extracted') AS company_policy_count,
+                {sort_select}
             FROM case_assignments a
             LEFT JOIN relocation_cases rc ON {join_on_cases}
             LEFT JOIN companies c ON c.id = COALESCE(rc.company_id, (SELECT hu2.company_id FROM hr_users hu2 WHERE hu2.profile_id = a.hr_user_id LIMIT 1))
@@ -5314,17 +5975,17 @@ class Database:
             LEFT JOIN employees emp ON emp.profile_id = a.employee_user_id
             LEFT JOIN employee_profiles ep ON ep.assignment_id = a.id
             LEFT JOIN resolved_assignment_policies rap ON rap.assignment_id = a.id
-            WHERE 1=1 {where_sql}
-            ORDER BY a.updated_at DESC, a.created_at DESC
+            WHERE 1=1 {where_sql} {keyset_sql}
+            {order_sql}
+            {limit_sql}
         """
 
         with self.engine.connect() as conn:
             rows = conn.execute(text(sql), params).fetchall()
 
+        page, next_cursor = _admin_index_page([dict(row._mapping) for row in rows], sort, limit)
         result = []
-        for row in rows:
-            m = row._mapping
-            r = dict(m)
+        for r in page:
             profile_json = r.get("profile_json")
             profile = self._json_load(profile_json) if profile_json else {}
             mp = profile.get("movePlan") or {}
@@ -5347,7 +6008,7 @@ class Database:
                 or (r.get("employee_identifier") and str(r.get("employee_identifier")).strip())
             )
             result.append(r)
-        return result
+        return result, next_cursor
 
     def get_admin_assignment_detail(self, assignment_id: str) -> Optional[Dict[str, Any]]:
         """Full assignment context for admin detail: assignment, case, employee, HR, services, policy."""
@@ -5387,7 +6048,7 @@ class Database:
 
     def admin_reassign_employee_company(self, employee_user_id: str, company_id: str) -> None:
         """Reassign employee profile to a company (profiles.company_id)."""
-        with self.engine.begin() as conn:
+        with self._counted_write(employee_count=[("e.profile_id", [employee_user_id])]) as conn:
             conn.execute(text("UPDATE profiles SET company_id = :cid WHERE id = :id"), {"cid": company_id, "id": employee_user_id})
             conn.execute(text("UPDATE employees SET company_id = :cid WHERE profile_id = :pid"), {"cid": company_id, "pid": employee_user_id})
 
@@ -5396,7 +6057,7 @@ class Database:
         with self.engine.connect() as conn:
             row = conn.execute(text("SELECT case_id FROM case_assignments WHERE id = :aid"), {"aid": assignment_id}).fetchone()
         case_id = row[0] if row and row[0] else None
-        with self.engine.begin() as conn:
+        with self._counted_write(assignments_count=[("a.id", [assignment_id])]) as conn:
             conn.execute(
                 text("UPDATE case_assignments SET hr_user_id = :hr, updated_at = :ua WHERE id = :aid"),
                 {"hr": new_hr_user_id, "ua": datetime.utcnow().isoformat(), "aid": assignment_id},
@@ -5414,7 +6075,7 @@ class Database:
         if not row or not row[0]:
             return
         case_id = row[0]
-        with self.engine.begin() as conn:
+        with self._counted_write(assignments_count=[("rc.id", [case_id])]) as conn:
             conn.execute(
                 text("UPDATE relocation_cases SET company_id = :cid, updated_at = :ua WHERE id = :case_id"),
                 {"cid": company_id, "ua": datetime.utcnow().isoformat(), "case_id": case_id},
@@ -5568,7 +6229,7 @@ class Database:
 
     def admin_link_policy_company(self, policy_id: str, company_id: str) -> None:
         """Reassign a company_policy to a company (for reconciliation)."""
-        with self.engine.begin() as conn:
+        with self._counted_write(policies_count=[("cp.id", [policy_id])]) as conn:
             conn.execute(
                 text("UPDATE company_policies SET company_id = :cid WHERE id = :id"),
                 {"cid": company_id, "id": policy_id},
@@ -6773,13 +7434,15 @@ class Database:
             return None
 
     def delete_assignment(self, assignment_id: str) -> bool:
-        with self.engine.begin() as conn:
+        with self.engine.connect() as conn:
             row = conn.execute(text(
                 "SELECT case_id FROM case_assignments WHERE id = :id"
             ), {"id": assignment_id}).fetchone()
-            if not row:
-                return False
-            case_id = row._mapping["case_id"]
+        if not row:
+            return False
+        case_id = row._mapping["case_id"]
+        # Other assignments on the deleted case fall back to their HR owner's company.
+        with self._counted_write(assignments_count=[("a.id", [assignment_id]), ("a.case_id", [case_id])]) as conn:
             try:
                 conn.execute(
                     text("DELETE FROM assignment_claim_invites WHERE assignment_id = :aid"),
@@ -7155,9 +7818,24 @@ class Database:
             row = conn.execute(text("SELECT * FROM profiles WHERE id = :id"), {"id": user_id}).fetchone()
         return self._row_to_dict(row)
 
+    def get_profile_records_by_ids(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Bulk get_profile_record: one IN query, keyed by profile id (missing ids omitted)."""
+        ids = list(dict.fromkeys(str(u) for u in user_ids if u))
+        if not ids:
+            return {}
+        placeholders = ",".join([f":p{i}" for i in range(len(ids))])
+        params: Dict[str, Any] = {f"p{i}": ids[i] for i in range(len(ids))}
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(f"SELECT * FROM profiles WHERE id IN ({placeholders})"), params).fetchall()
+        return {str(d["id"]): d for d in self._rows_to_list(rows)}
+
     def set_profile_company(self, user_id: str, company_id: str) -> None:
         """Set profile company and keep hr_users/employees in sync."""
-        with self.engine.begin() as conn:
+        with self._counted_write(
+            hr_users_count=[("hu.profile_id", [user_id])],
+            employee_count=[("e.profile_id", [user_id])],
+            assignments_count=[("a.hr_user_id", [user_id])],
+        ) as conn:
             conn.execute(text(
                 "UPDATE profiles SET company_id = :cid WHERE id = :id"
             ), {"cid": company_id, "id": user_id})
@@ -7270,13 +7948,7 @@ class Database:
         else:
             # Postgres: profiles schema may differ between environments; generate columns dynamically.
             with self.engine.begin() as conn:
-                cols = conn.execute(
-                    text(
-                        "SELECT column_name FROM information_schema.columns "
-                        "WHERE table_name = 'profiles'"
-                    )
-                ).fetchall()
-                existing = {r._mapping["column_name"] for r in cols}
+                existing = self.schema.columns("profiles")
                 base_cols = ["id", "email", "full_name", "role", "company_id", "created_at", "updated_at"]
                 insert_cols = [c for c in base_cols if c in existing]
                 params: Dict[str, Any] = {
@@ -7466,6 +8138,7 @@ class Database:
                     {"cid": test_company_id},
                 )
         updated = result.rowcount if hasattr(result, "rowcount") else 0
+        self._touch_company_index_counters()
         log.info(
             "backfill_assignments_to_test_company: company=%s company_id=%s cases_updated=%s",
             company_name,
@@ -7676,6 +8349,7 @@ class Database:
                 {"tid": test_id, "now": datetime.utcnow().isoformat()},
             )
             summary["relocation_cases_linked"] = r.rowcount
+        self._touch_company_index_counters()
         log.info(
             "admin_reconciliation backfill test_company: profiles_linked=%s hr_users_linked=%s cases_linked=%s",
             summary["profiles_linked"],
@@ -7839,6 +8513,7 @@ class Database:
         # Assignments: nothing to change for canonical counts here; linkage via company_id already fixed via cases/hr_users
         # Leave created['case_assignments_repaired'] for future detailed repair logic if needed.
 
+        self._touch_company_index_counters()
         return created
 
     def create_company(
@@ -7897,15 +8572,7 @@ class Database:
         with self.engine.begin() as conn:
             # Production Postgres may not yet have the newer columns (status, plan_tier, hr_seat_limit, employee_seat_limit).
             # Build the INSERT/UPSERT dynamically based on actual columns to avoid UndefinedColumn errors.
-            company_cols = {
-                row._mapping["column_name"]
-                for row in conn.execute(
-                    text(
-                        "SELECT column_name FROM information_schema.columns "
-                        "WHERE table_name = 'companies'"
-                    )
-                ).fetchall()
-            }
+            company_cols = self.schema.columns("companies")
 
             base_cols = [
                 "id",
@@ -8054,20 +8721,9 @@ class Database:
         if status is not None:
             # Some runtimes (like current production) have no companies.status column.
             # We only include this update when the column exists.
-            try:
-                with self.engine.connect() as conn:
-                    row = conn.execute(
-                        text(
-                            "SELECT 1 FROM information_schema.columns "
-                            "WHERE table_name = 'companies' AND column_name = 'status'"
-                        )
-                    ).fetchone()
-                if row:
-                    updates.append("status = :status")
-                    params["status"] = (status or "active").lower()
-            except Exception:
-                # If schema lookup fails, skip status update to avoid breaking writes.
-                pass
+            if self.schema.has_column("companies", "status"):
+                updates.append("status = :status")
+                params["status"] = (status or "active").lower()
         if plan_tier is not None:
             pt = (plan_tier or "low").lower()
             if pt in ("low", "medium", "premium"):
@@ -8096,18 +8752,8 @@ class Database:
         - If companies.status column exists, mark it inactive.
         - Otherwise, hard delete the row.
         """
-        try:
-            with self.engine.connect() as conn:
-                row = conn.execute(
-                    text(
-                        "SELECT 1 FROM information_schema.columns "
-                        "WHERE table_name = 'companies' AND column_name = 'status'"
-                    )
-                ).fetchone()
-            if row:
-                return self.update_company(company_id, status="inactive")
-        except Exception:
-            pass
+        if self.schema.has_column("companies", "status"):
+            return self.update_company(company_id, status="inactive")
         # Fallback: hard delete.
         with self.engine.begin() as conn:
             conn.execute(text("DELETE FROM companies WHERE id = :id"), {"id": company_id})
@@ -8131,7 +8777,7 @@ class Database:
         status: Optional[str],
     ) -> None:
         now = datetime.utcnow().isoformat()
-        with self.engine.begin() as conn:
+        with self._counted_write(employee_count=[("e.id", [employee_id])]) as conn:
             conn.execute(text(
                 "INSERT INTO employees (id, company_id, profile_id, band, assignment_type, relocation_case_id, status, created_at) "
                 "VALUES (:id, :cid, :pid, :band, :atype, :rcid, :status, :created_at) "
@@ -8156,7 +8802,10 @@ class Database:
         permissions: Optional[Dict[str, Any]] = None,
     ) -> None:
         now = datetime.utcnow().isoformat()
-        with self.engine.begin() as conn:
+        # Assignments owned by the profile without a case company count towards its HR company.
+        with self._counted_write(
+            hr_users_count=[("hu.id", [hr_id])], assignments_count=[("a.hr_user_id", [profile_id])]
+        ) as conn:
             conn.execute(text(
                 "INSERT INTO hr_users (id, company_id, profile_id, permissions_json, created_at) "
                 "VALUES (:id, :cid, :pid, :perm, :created_at) "
@@ -8182,7 +8831,9 @@ class Database:
                 {"pid": profile_id},
             ).fetchone()
         if row:
-            with self.engine.begin() as conn:
+            with self._counted_write(
+                hr_users_count=[("hu.profile_id", [profile_id])], assignments_count=[("a.hr_user_id", [profile_id])]
+            ) as conn:
                 conn.execute(
                     text("UPDATE hr_users SET company_id = :cid WHERE profile_id = :pid"),
                     {"cid": company_id, "pid": profile_id},
@@ -8224,7 +8875,7 @@ class Database:
                 {"pid": profile_id},
             ).fetchone()
         if row:
-            with self.engine.begin() as conn:
+            with self._counted_write(employee_count=[("e.profile_id", [profile_id])]) as conn:
                 conn.execute(
                     text("UPDATE employees SET company_id = :cid WHERE profile_id = :pid"),
                     {"cid": company_id, "pid": profile_id},
@@ -8341,7 +8992,7 @@ class Database:
         home_country: Optional[str],
     ) -> None:
         now = datetime.utcnow().isoformat()
-        with self.engine.begin() as conn:
+        with self._counted_write(assignments_count=[("rc.id", [case_id])]) as conn:
             conn.execute(text(
                 "UPDATE relocation_cases SET company_id = :cid, employee_id = :eid, status = :status, "
                 "stage = :stage, host_country = :host, home_country = :home, updated_at = :now "
@@ -9283,69 +9934,137 @@ class Database:
                 "created_at": now,
             })
 
-    def purge_inactive_cases(self, active_statuses: List[str]) -> Dict[str, int]:
-        """Remove inactive case/assignment data and related records."""
-        status_list = [s for s in active_statuses if s]
-        if not status_list:
-            return {"assignments_deleted": 0, "relocation_cases_deleted": 0}
-
-        placeholders = ", ".join([f":s{i}" for i in range(len(status_list))])
-        params = {f"s{i}": status_list[i] for i in range(len(status_list))}
-
-        with self.engine.begin() as conn:
-            # Collect assignments to delete
-            rows = conn.execute(text(
-                f"SELECT id FROM case_assignments WHERE status NOT IN ({placeholders})"
-            ), params).fetchall()
-            assignment_ids = [r._mapping["id"] for r in rows]
-
-            if assignment_ids:
-                id_placeholders = ", ".join([f":a{i}" for i in range(len(assignment_ids))])
-                id_params = {f"a{i}": assignment_ids[i] for i in range(len(assignment_ids))}
+    def purge_inactive_cases(
+        self,
+        active_statuses: List[str],
+        *,
+        batch_size: int = 500,
+        max_batches: Optional[int] = None,
+        dry_run: bool = False,
+        on_batch: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Remove inactive case/assignment data and related records, in bounded batches.
 
-                conn.execute(text(
-                    f"DELETE FROM employee_profiles WHERE assignment_id IN ({id_placeholders})"
-                ), id_params)
-                conn.execute(text(
-                    f"DELETE FROM employee_answers WHERE assignment_id IN ({id_placeholders})"
-                ), id_params)
-                conn.execute(text(
-                    f"DELETE FROM compliance_reports WHERE assignment_id IN ({id_placeholders})"
-                ), id_params)
-                conn.execute(text(
-                    f"DELETE FROM compliance_runs WHERE assignment_id IN ({id_placeholders})"
-                ), id_params)
-                conn.execute(text(
-                    f"DELETE FROM policy_exceptions WHERE assignment_id IN ({id_placeholders})"
-                ), id_params)
-                conn.execute(text(
-                    f"DELETE FROM compliance_actions WHERE assignment_id IN ({id_placeholders})"
-                ), id_params)
+        Each batch takes up to ``batch_size`` inactive assignments (status NOT IN active_statuses),
+        deletes their dependent rows and the assignments themselves, and commits; relocation cases are
+        purged the same way afterwards. An interrupted or ``max_batches``-bounded run leaves only whole
+        batches behind, so calling again resumes (``complete`` is False while work remains).
+        ``on_batch`` receives the running stats after every committed batch.
 
-                conn.execute(text(
-                    f"DELETE FROM assignment_invites WHERE case_id IN (SELECT case_id FROM case_assignments WHERE id IN ({id_placeholders}))"
-                ), id_params)
+        ``dry_run`` deletes nothing and returns per-table counts of the rows a purge would remove.
+        """
+        status_list = [s for s in active_statuses if s]
+        stats: Dict[str, Any] = {
+            "assignments_deleted": 0,
+            "relocation_cases_deleted": 0,
+            "tables": {},
+            "batches": 0,
+            "complete": True,
+            "dry_run": dry_run,
+        }
+        if not status_list:
+            return stats
+        batch_size = max(1, int(batch_size))
+        status_params = {"active_statuses": status_list}
+        inactive_assignments = "SELECT id FROM case_assignments WHERE status NOT IN :active_statuses"
+        inactive_cases = "SELECT id FROM relocation_cases WHERE status NOT IN :active_statuses"
 
-                conn.execute(text(
-                    f"DELETE FROM case_assignments WHERE id IN ({id_placeholders})"
-                ), id_params)
+        def _stmt(sql: str):
+            return text(sql).bindparams(bindparam("active_statuses", expanding=True))
 
-            # Purge relocation_cases not active
-            rows_cases = conn.execute(text(
-                f"SELECT id FROM relocation_cases WHERE status NOT IN ({placeholders})"
-            ), params).fetchall()
-            case_ids = [r._mapping["id"] for r in rows_cases]
-            if case_ids:
-                case_placeholders = ", ".join([f":c{i}" for i in range(len(case_ids))])
-                case_params = {f"c{i}": case_ids[i] for i in range(len(case_ids))}
-                conn.execute(text(
-                    f"DELETE FROM relocation_cases WHERE id IN ({case_placeholders})"
-                ), case_params)
+        if dry_run:
+            with self.engine.connect() as conn:
+                for table in _PURGE_ASSIGNMENT_CHILD_TABLES:
+                    stats["tables"][table] = int(conn.execute(
+                        _stmt(f"SELECT COUNT(*) FROM {table} WHERE assignment_id IN ({inactive_assignments})"),
+                        status_params,
+                    ).scalar() or 0)
+                stats["tables"]["assignment_invites"] = int(conn.execute(
+                    _stmt(
+                        "SELECT COUNT(*) FROM assignment_invites WHERE case_id IN "
+                        f"(SELECT case_id FROM case_assignments WHERE id IN ({inactive_assignments}))"
+                    ),
+                    status_params,
+                ).scalar() or 0)
+                stats["assignments_deleted"] = stats["tables"]["case_assignments"] = int(conn.execute(
+                    _stmt(f"SELECT COUNT(*) FROM ({inactive_assignments}) x"), status_params
+                ).scalar() or 0)
+                stats["relocation_cases_deleted"] = stats["tables"]["relocation_cases"] = int(conn.execute(
+                    _stmt(f"SELECT COUNT(*) FROM ({inactive_cases}) x"), status_params
+                ).scalar() or 0)
+            return stats
+
+        # Postgres: lock the batch so a concurrent status change cannot leave it half purged.
+        lock_sql = "" if _is_sqlite else " FOR UPDATE"
+        ids_param = bindparam("ids", expanding=True)
+
+        def _add(table: str, n: int) -> None:
+            stats["tables"][table] = stats["tables"].get(table, 0) + max(0, n or 0)
+
+        def _run_batch(select_sql: str, delete_children: bool) -> int:
+            with self.engine.begin() as conn:
+                ids = [
+                    r[0]
+                    for r in conn.execute(
+                        _stmt(f"{select_sql} ORDER BY id LIMIT :batch_size{lock_sql}"),
+                        {**status_params, "batch_size": batch_size},
+                    ).fetchall()
+                ]
+                if not ids:
+                    return 0
+                if delete_children:
+                    for table in _PURGE_ASSIGNMENT_CHILD_TABLES:
+                        res = conn.execute(
+                            text(f"DELETE FROM {table} WHERE assignment_id IN :ids").bindparams(ids_param),
+                            {"ids": ids},
+                        )
+                        _add(table, res.rowcount)
+                    res = conn.execute(
+                        text(
+                            "DELETE FROM assignment_invites WHERE case_id IN "
+                            "(SELECT case_id FROM case_assignments WHERE id IN :ids)"
+                        ).bindparams(ids_param),
+                        {"ids": ids},
+                    )
+                    _add("assignment_invites", res.rowcount)
+                    table = "case_assignments"
+                else:
+                    table = "relocation_cases"
+                res = conn.execute(
+                    text(f"DELETE FROM {table} WHERE id IN :ids").bindparams(ids_param), {"ids": ids}
+                )
+                _add(table, res.rowcount)
+                return len(ids)
 
-        return {
-            "assignments_deleted": len(assignment_ids),
-            "relocation_cases_deleted": len(case_ids),
-        }
+        try:
+            for select_sql, delete_children, key in (
+                (inactive_assignments, True, "assignments_deleted"),
+                (inactive_cases, False, "relocation_cases_deleted"),
+            ):
+                while True:
+                    if max_batches is not None and stats["batches"] >= max_batches:
+                        stats["complete"] = False
+                        break
+                    n = _run_batch(select_sql, delete_children)
+                    if not n:
+                        break
+                    stats[key] += n
+                    stats["batches"] += 1
+                    log.info(
+                        "purge_inactive_cases batch=%s assignments_deleted=%s relocation_cases_deleted=%s",
+                        stats["batches"], stats["assignments_deleted"], stats["relocation_cases_deleted"],
+                    )
+                    if on_batch is not None:
+                        on_batch(dict(stats, tables=dict(stats["tables"])))
+                    if n < batch_size:
+                        break
+                if not stats["complete"]:
+                    break
+        finally:
+            if stats["assignments_deleted"] or stats["relocation_cases_deleted"]:
+                self._touch_company_index_counters()
+        return stats
 
     # ==================================================================
     # HR Policies (full policy spec)
@@ -9567,11 +10286,13 @@ class Database:
             )
             conn.execute(text(sql), params)
 
+        counted = [("cp.id", [policy_id])]
         try:
             if connection is not None:
-                _exec(connection)
+                with self._company_counter_deltas(connection, inserts_only=True, policies_count=counted):
+                    _exec(connection)
             else:
-                with self.engine.begin() as conn:
+                with self._counted_write(inserts_only=True, policies_count=counted) as conn:
                     _exec(conn)
         except Exception as exc:
             _lip = last_insert_params or {}
@@ -9886,116 +10607,273 @@ class Database:
         return {"ok": True, "policy_id": policy_id, "version_id": version_id}
 
     # -------------------------------------------------------------------------
-    # Admin read model: normalized indexes and data-integrity
+    # Admin read model: per-company counters, normalized indexes and data-integrity
     # -------------------------------------------------------------------------
 
-    def get_admin_company_index(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
+    # {case_join} is filled per call: init_db decides whether the typed resolved_case_id join is available.
+    _REFRESH_COMPANY_INDEX_COUNTERS_SQL = """
+        INSERT INTO company_index_counters
+        (company_id, hr_users_count, employee_count, assignments_count, policies_count, updated_at)
+        SELECT :cid,
+            (SELECT COUNT(*) FROM hr_users hu WHERE hu.company_id = :cid),
+            (SELECT COUNT(*) FROM employees e WHERE e.company_id = :cid),
+            (SELECT COUNT(*) FROM case_assignments a
+             LEFT JOIN relocation_cases rc ON {case_join}
+             LEFT JOIN hr_users hu ON hu.profile_id = a.hr_user_id
+             WHERE (rc.company_id = :cid OR (rc.company_id IS NULL AND hu.company_id = :cid))),
+            (SELECT COUNT(*) FROM company_policies cp WHERE cp.company_id = :cid),
+            :now
+        ON CONFLICT (company_id) DO UPDATE SET
+        hr_users_count = excluded.hr_users_count, employee_count = excluded.employee_count,
+        assignments_count = excluded.assignments_count, policies_count = excluded.policies_count,
+        updated_at = excluded.updated_at
+    """
+
+    def _refresh_company_index_counters(self, conn: Any, company_ids: Iterable[Optional[str]]) -> int:
+        """Recompute counter rows for the given companies inside the caller's transaction."""
+        ids = sorted({str(c).strip() for c in company_ids if c is not None and str(c).strip()})
+        if not ids:
+            return 0
+        now = datetime.utcnow().isoformat()
+        sql = self._REFRESH_COMPANY_INDEX_COUNTERS_SQL.format(case_join=_relocation_cases_join_on("a"))
+        conn.execute(text(sql), [{"cid": cid, "now": now} for cid in ids])
+        return len(ids)
+
+    # Rows counted by one counter column, grouped by the company they count towards; {scope} ORs the
+    # "<key> IN :kN" filters naming the rows a write touches. Same attribution as the refresh SQL.
+    _COMPANY_COUNTER_CONTRIBUTION_SQL = {
+        "hr_users_count": "SELECT hu.company_id, COUNT(*) FROM hr_users hu WHERE {scope} GROUP BY hu.company_id",
+        "employee_count": "SELECT e.company_id, COUNT(*) FROM employees e WHERE {scope} GROUP BY e.company_id",
+        "assignments_count": """
+            SELECT COALESCE(rc.company_id, hu.company_id), COUNT(*)
+            FROM case_assignments a
+            LEFT JOIN relocation_cases rc ON {case_join}
+            LEFT JOIN hr_users hu ON hu.profile_id = a.hr_user_id
+            WHERE {scope}
+            GROUP BY COALESCE(rc.company_id, hu.company_id)
+        """,
+        "policies_count": "SELECT cp.company_id, COUNT(*) FROM company_policies cp WHERE {scope} GROUP BY cp.company_id",
+    }
+    _COMPANY_COUNTER_COLUMNS = ("hr_users_count", "employee_count", "assignments_count", "policies_count")
+
+    def _company_counter_contributions(
+        self, conn: Any, scopes: Dict[str, List[Tuple[str, Iterable[Optional[str]]]]]
+    ) -> Dict[Tuple[str, str], int]:
+        """(counter column, company_id) -> rows the scoped rows contribute, for each column in ``scopes``."""
+        out: Dict[Tuple[str, str], int] = {}
+        for column, filters in scopes.items():
+            parts: List[str] = []
+            params: Dict[str, Any] = {}
+            for i, (key_sql, values) in enumerate(filters):
+                keys = sorted({str(v) for v in values if v})
+                if keys:
+                    parts.append(f"{key_sql} IN :k{i}")
+                    params[f"k{i}"] = keys
+            if not parts:
+                continue
+            sql = self._COMPANY_COUNTER_CONTRIBUTION_SQL[column].format(
+                scope=" OR ".join(parts), case_join=_relocation_cases_join_on("a")
+            )
+            stmt = text(sql).bindparams(*(bindparam(k, expanding=True) for k in params))
+            for cid, n in conn.execute(stmt, params).fetchall():
+                if cid:
+                    out[(column, str(cid))] = out.get((column, str(cid)), 0) + int(n)
+        return out
+
+    def _apply_company_counter_deltas(
+        self, conn: Any, before: Dict[Tuple[str, str], int], after: Dict[Tuple[str, str], int]
+    ) -> None:
+        """Add after - before to each company's counter row; a company without a row is counted in full once."""
+        deltas: Dict[str, Dict[str, int]] = {}
+        for column, cid in before.keys() | after.keys():
+            delta = after.get((column, cid), 0) - before.get((column, cid), 0)
+            if delta:
+                deltas.setdefault(cid, dict.fromkeys(self._COMPANY_COUNTER_COLUMNS, 0))[column] = delta
+        if not deltas:
+            return
+        now = datetime.utcnow().isoformat()
+        sets = ", ".join(f"{c} = {c} + :{c}" for c in self._COMPANY_COUNTER_COLUMNS)
+        missing = []
+        for cid, row in sorted(deltas.items()):
+            r = conn.execute(
+                text(f"UPDATE company_index_counters SET {sets}, updated_at = :now WHERE company_id = :cid"),
+                {**row, "cid": cid, "now": now},
+            )
+            if r.rowcount == 0:
+                missing.append(cid)
+        self._refresh_company_index_counters(conn, missing)
+
+    @contextmanager
+    def _company_counter_deltas(
+        self, conn: Any, *, inserts_only: bool = False, **scopes: List[Tuple[str, Iterable[Optional[str]]]]
+    ) -> Iterator[None]:
+        """
+        Write-path hook around a write in the caller's transaction: counts what the scoped rows
+        contribute to each company before and after the write and adds the difference to
+        company_index_counters, instead of recounting the companies. ``scopes`` maps a counter column
+        to (key column, values) filters naming every row the write can move, e.g.
+        ``assignments_count=[("a.id", [assignment_id])]``. With ``inserts_only`` the write only inserts
+        the scoped rows, so nothing is read before it. Counter failures are logged, never raised.
+        """
+        before: Optional[Dict[Tuple[str, str], int]] = {} if inserts_only else None
+        if before is None:
+            try:
+                with conn.begin_nested():
+                    before = self._company_counter_contributions(conn, scopes)
+            except Exception as e:
+                log.warning("company_index_counters snapshot failed scopes=%s exc=%s", scopes, e)
+        yield
+        if before is None:
+            return
+        try:
+            with conn.begin_nested():
+                self._apply_company_counter_deltas(conn, before, self._company_counter_contributions(conn, scopes))
+        except Exception as e:
+            log.warning("company_index_counters update failed scopes=%s exc=%s", scopes, e)
+
+    @contextmanager
+    def _counted_write(
+        self, *, inserts_only: bool = False, **scopes: List[Tuple[str, Iterable[Optional[str]]]]
+    ) -> Iterator[Any]:
+        """engine.begin() wrapped in _company_counter_deltas; drops the cached integrity overview after commit."""
+        with self.engine.begin() as conn:
+            with self._company_counter_deltas(conn, inserts_only=inserts_only, **scopes):
+                yield conn
+        self.integrity_metrics.invalidate()
+
+    def _touch_company_index_counters(self) -> None:
+        """
+        Bulk-write hook for backfills and purges that move rows wholesale: recompute every company's
+        counters (row-level writes use _counted_write / _company_counter_deltas instead). Runs after the
+        caller's transaction; failures are logged, never raised. Also drops the cached integrity overview,
+        whose orphan counts move with company membership.
+        """
+        self.integrity_metrics.invalidate()
+        try:
+            self.refresh_company_index_counters()
+        except Exception as e:
+            log.warning("company_index_counters refresh failed exc=%s", e)
+
+    def refresh_company_index_counters(self, company_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Recompute company_index_counters for the given companies, or for every company when None
+        (bulk backfills and reconciliation). Returns the number of companies refreshed.
+        """
+        with self.engine.begin() as conn:
+            if company_ids is None:
+                company_ids = [r[0] for r in conn.execute(text("SELECT id FROM companies")).fetchall()]
+            return self._refresh_company_index_counters(conn, company_ids)
+
+    def get_admin_company_index(
+        self,
+        query: Optional[str] = None,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "name",
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
-        List all companies for admin from the canonical companies table only.
-        Orphan company_ids (referenced elsewhere but not in companies) are logged, not shown.
+        Companies for admin from the canonical companies table only, keyset-paginated when ``limit`` is set.
+        Counts come from company_index_counters; companies on the page without a counter row are
+        computed once and stored. Orphan company_ids (referenced elsewhere but not in companies) are
+        logged on unpaginated calls, not shown. Returns (companies, summary with next_cursor).
         """
+        sort_select, keyset_sql, order_sql, params = _admin_index_keyset("companies", sort, cursor)
         q = (query or "").strip().lower()
+        search_sql = ""
+        if q:
+            search_sql = "AND (LOWER(c.name) LIKE :q OR LOWER(COALESCE(c.legal_name,'')) LIKE :q)"
+            params["q"] = f"%{q}%"
+        limit_sql = ""
+        if limit is not None:
+            limit_sql = "LIMIT :_limit"
+            params["_limit"] = limit + 1
+        sql = f"""
+            SELECT c.*, {sort_select},
+                cnt.company_id AS _counter_company_id,
+                COALESCE(cnt.hr_users_count, 0) AS hr_users_count,
+                COALESCE(cnt.employee_count, 0) AS employee_count,
+                COALESCE(cnt.assignments_count, 0) AS assignments_count,
+                COALESCE(cnt.policies_count, 0) AS policies_count,
+                COALESCE(
+                    NULLIF(TRIM(COALESCE(c.hr_contact, '')), ''),
+                    (SELECT COALESCE(p.full_name, p.email) FROM hr_users hu2
+                     JOIN profiles p ON p.id = hu2.profile_id
+                     WHERE hu2.company_id = c.id
+                     ORDER BY hu2.created_at
+                     LIMIT 1)
+                ) AS primary_contact_name
+            FROM companies c
+            LEFT JOIN company_index_counters cnt ON cnt.company_id = c.id
+            WHERE 1=1 {search_sql} {keyset_sql}
+            {order_sql}
+            {limit_sql}
+        """
+        with self.engine.connect() as conn:
+            rows = [dict(r._mapping) for r in conn.execute(text(sql), params).fetchall()]
+        result, next_cursor = _admin_index_page(rows, sort, limit)
+        missing = [r["id"] for r in result if r.pop("_counter_company_id", None) is None]
+        if missing:
+            try:
+                self.refresh_company_index_counters(missing)
+                with self.engine.connect() as conn:
+                    counter_rows = conn.execute(
+                        text("SELECT * FROM company_index_counters WHERE company_id IN :ids").bindparams(
+                            bindparam("ids", expanding=True)
+                        ),
+                        {"ids": missing},
+                    ).fetchall()
+                by_id = {r._mapping["company_id"]: dict(r._mapping) for r in counter_rows}
+                for r in result:
+                    cnt = by_id.get(r["id"])
+                    if cnt:
+                        for key in ("hr_users_count", "employee_count", "assignments_count", "policies_count"):
+                            r[key] = cnt.get(key) or 0
+            except Exception as e:
+                log.warning("admin_company_index: counter refresh failed: %s", e)
+        for r in result:
+            r["missing_from_companies_table"] = 0
+        if limit is None:
+            self._log_orphan_company_ids()
+        return result, {"count": len(result), "next_cursor": next_cursor}
+
+    def _log_orphan_company_ids(self) -> None:
+        """Log company_ids referenced by other tables but missing from companies (bounded sample)."""
+        orphan_ids: set = set()
         with self.engine.connect() as conn:
-            base_sql = "SELECT * FROM companies WHERE 1=1"
-            params: Dict[str, Any] = {}
-            if q:
-                if _is_sqlite:
-                    base_sql += " AND (LOWER(name) LIKE :q OR LOWER(COALESCE(legal_name,'')) LIKE :q)"
-                else:
-                    base_sql += " AND (LOWER(name) LIKE :q OR LOWER(COALESCE(legal_name,'')) LIKE :q)"
-                params["q"] = f"%{q}%"
-            base_sql += " ORDER BY name ASC"
-            rows = conn.execute(text(base_sql), params).fetchall()
-            result = []
-            for r in rows:
-                d = dict(r._mapping)
-                d["missing_from_companies_table"] = 0
-                result.append(d)
-            seen = {r["id"] for r in result}
-            # Collect orphan company_ids for logging only; do not add them to the visible list.
-            orphan_ids: set = set()
             for table, col in [("hr_users", "company_id"), ("profiles", "company_id"),
-                              ("company_policies", "company_id"), ("relocation_cases", "company_id")]:
+                               ("company_policies", "company_id"), ("relocation_cases", "company_id")]:
                 try:
-                    orphan_sql = text(
-                        f"SELECT DISTINCT {col} AS id FROM {table} WHERE {col} IS NOT NULL AND TRIM({col}) <> ''"
-                    )
-                    if seen:
-                        placeholders = ",".join([f":s{i}" for i in range(len(seen))])
-                        orphan_sql = text(
-                            f"SELECT DISTINCT {col} AS id FROM {table} WHERE {col} IS NOT NULL AND TRIM({col}) <> '' "
-                            f"AND {col} NOT IN ({placeholders})"
-                        )
-                        orphan_params = {f"s{i}": s for i, s in enumerate(seen)}
-                    else:
-                        orphan_params = {}
-                    orows = conn.execute(orphan_sql, orphan_params).fetchall()
+                    orows = conn.execute(text(
+                        f"SELECT DISTINCT t.{col} AS id FROM {table} t "
+                        f"WHERE t.{col} IS NOT NULL AND TRIM(t.{col}) <> '' "
+                        f"AND NOT EXISTS (SELECT 1 FROM companies c WHERE c.id = t.{col}) LIMIT 50"
+                    )).fetchall()
                     for o in orows:
                         cid = (o._mapping.get("id") or "").strip()
-                        if cid and cid not in seen:
+                        if cid:
                             orphan_ids.add(cid)
                 except Exception as e:
                     log.warning("admin_company_index: orphan lookup %s.%s failed: %s", table, col, e)
-            if orphan_ids:
-                log.warning("admin_company_index: orphan company_ids (not in registry): %s", sorted(orphan_ids))
-
-            # Enrich each row with hr_users_count, employee_count, assignments_count, primary_contact_name
-            if result:
-                ids = [r["id"] for r in result]
-                unions = " UNION ALL ".join([f"SELECT :id{i} AS id" for i in range(len(ids))])
-                params_agg = {f"id{i}": ids[i] for i in range(len(ids))}
-                if _is_sqlite:
-                    join_on_cases = "rc.id = COALESCE(NULLIF(TRIM(a.canonical_case_id), ''), a.case_id)"
-                else:
-                    # Postgres: relocation_cases.id is uuid, case_assignments.case_id / canonical_case_id are text UUIDs.
-                    join_on_cases = "rc.id::text = COALESCE(NULLIF(TRIM(a.canonical_case_id), ''), a.case_id)"
-                agg_sql = f"""
-                SELECT v.id,
-                    (SELECT COUNT(*) FROM hr_users hu WHERE hu.company_id = v.id) AS hr_users_count,
-                    (SELECT COUNT(*) FROM employees e WHERE e.company_id = v.id) AS employee_count,
-                    (SELECT COUNT(*) FROM case_assignments a
-                     LEFT JOIN relocation_cases rc ON {join_on_cases}
-                     LEFT JOIN hr_users hu ON hu.profile_id = a.hr_user_id
-                     WHERE (rc.company_id = v.id OR (rc.company_id IS NULL AND hu.company_id = v.id))) AS assignments_count,
-                    COALESCE(
-                        (SELECT TRIM(c.hr_contact) FROM companies c WHERE c.id = v.id AND c.hr_contact IS NOT NULL AND TRIM(c.hr_contact) <> ''),
-                        (SELECT COALESCE(p.full_name, p.email) FROM hr_users hu2
-                         JOIN profiles p ON p.id = hu2.profile_id
-                         WHERE hu2.company_id = v.id
-                         ORDER BY hu2.created_at
-                         LIMIT 1)
-                    ) AS primary_contact_name
-                FROM ({unions}) v
-                """
-                try:
-                    agg_rows = conn.execute(text(agg_sql), params_agg).fetchall()
-                    by_id = {row._mapping["id"]: dict(row._mapping) for row in agg_rows}
-                    for r in result:
-                        agg = by_id.get(r["id"]) or {}
-                        r["hr_users_count"] = agg.get("hr_users_count") or 0
-                        r["employee_count"] = agg.get("employee_count") or 0
-                        r["assignments_count"] = agg.get("assignments_count") or 0
-                        r["primary_contact_name"] = agg.get("primary_contact_name")
-                except Exception as e:
-                    log.warning("admin_company_index: enrich counts failed: %s", e)
-                    for r in result:
-                        r["hr_users_count"] = 0
-                        r["employee_count"] = 0
-                        r["assignments_count"] = 0
-                        r["primary_contact_name"] = None
-        return result
+        if orphan_ids:
+            log.warning("admin_company_index: orphan company_ids (not in registry): %s", sorted(orphan_ids))
 
     def get_admin_people_index(
         self,
         company_id: Optional[str] = None,
         query: Optional[str] = None,
         role: Optional[str] = None,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "name",
     ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
-        List people (profiles) for admin with optional company, role, and text filters.
-        Returns (list with company_name, status), summary with count and orphans_without_company.
+        List people (profiles) for admin with optional company, role, and text filters, keyset-paginated
+        when ``limit`` is set. Returns (list with company_name, status), summary with count, next_cursor
+        and, on the first page, orphans_without_company.
         """
-        params: Dict[str, Any] = {}
+        sort_select, keyset_sql, order_sql, params = _admin_index_keyset("people", sort, cursor)
         clauses = []
         if company_id:
             clauses.append("p.company_id = :cid")
@@ -10020,40 +10898,49 @@ class Database:
                 clauses.append("(p.email ILIKE :q OR p.full_name ILIKE :q)")
             params["q"] = pattern
         # Exclude deactivated (inactive) profiles when status column exists
-        with self.engine.connect() as conn:
-            has_status = False
-            try:
-                if _is_sqlite:
-                    cur = conn.execute(text("PRAGMA table_info(profiles)"))
-                    cols = [r[1] for r in cur.fetchall()]
-                    has_status = "status" in cols
-                else:
-                    r = conn.execute(text(
-                        "SELECT 1 FROM information_schema.columns WHERE table_name = 'profiles' AND column_name = 'status' LIMIT 1"
-                    )).fetchone()
-                    has_status = r is not None
-            except Exception:
-                pass
-            if has_status:
-                clauses.append("(COALESCE(TRIM(LOWER(p.status)), 'active') <> 'inactive')")
+        if self.schema.has_column("profiles", "status"):
+            clauses.append("(COALESCE(TRIM(LOWER(p.status)), 'active') <> 'inactive')")
         where = " AND " + " AND ".join(clauses) if clauses else ""
+        limit_sql = ""
+        if limit is not None:
+            limit_sql = "LIMIT :_limit"
+            params["_limit"] = limit + 1
+        # Link counts are grouped over the page's profiles only, then joined back (no per-row subqueries).
+        direction = "DESC" if sort.startswith("-") else "ASC"
         sql = f"""
-            SELECT p.id, p.role, p.email, p.full_name, p.company_id,
-                   'active' AS status,
-                   p.created_at,
-                   c.name AS company_name,
-                   (SELECT COUNT(*) FROM hr_users hu WHERE hu.profile_id = p.id) AS hr_link_count,
-                   (SELECT COUNT(*) FROM employees e WHERE e.profile_id = p.id) AS employee_link_count
-            FROM profiles p
-            LEFT JOIN companies c ON c.id = p.company_id
-            WHERE 1=1 {where}
-            ORDER BY p.full_name ASC NULLS LAST, p.created_at DESC
+            WITH pg AS (
+                SELECT p.id, p.role, p.email, p.full_name, p.company_id,
+                       'active' AS status,
+                       p.created_at,
+                       c.name AS company_name,
+                       {sort_select}
+                FROM profiles p
+                LEFT JOIN companies c ON c.id = p.company_id
+                WHERE 1=1 {where} {keyset_sql}
+                {order_sql}
+                {limit_sql}
+            )
+            SELECT pg.*,
+                   COALESCE(hl.n, 0) AS hr_link_count,
+                   COALESCE(el.n, 0) AS employee_link_count
+            FROM pg
+            LEFT JOIN (
+                SELECT hu.profile_id, COUNT(*) AS n FROM hr_users hu JOIN pg ON pg.id = hu.profile_id
+                GROUP BY hu.profile_id
+            ) hl ON hl.profile_id = pg.id
+            LEFT JOIN (
+                SELECT e.profile_id, COUNT(*) AS n FROM employees e JOIN pg ON pg.id = e.profile_id
+                GROUP BY e.profile_id
+            ) el ON el.profile_id = pg.id
+            ORDER BY pg._sort_key {direction}, pg.id {direction}
         """
         with self.engine.connect() as conn:
             rows = conn.execute(text(sql), params).fetchall()
-        people = [dict(r._mapping) for r in rows]
+        people, next_cursor = _admin_index_page([dict(r._mapping) for r in rows], sort, limit)
         for row in people:
             row["name"] = row.get("full_name") or row.get("email") or row.get("id")
+        if cursor:
+            return people, {"count": len(people), "next_cursor": next_cursor}
         # Orphans: profiles with role in ('HR','EMPLOYEE','EMPLOYEE_USER') and no company_id
         try:
             orphan_sql = text("""
@@ -10067,7 +10954,7 @@ class Database:
         except Exception as e:
             log.warning("admin_people_index: orphan count failed: %s", e)
             orphans = 0
-        summary = {"count": len(people), "orphans_without_company": orphans}
+        summary = {"count": len(people), "orphans_without_company": orphans, "next_cursor": next_cursor}
         return people, summary
 
     def get_admin_assignments_index(
@@ -10077,18 +10964,28 @@ class Database:
         employee_search: Optional[str] = None,
         status: Optional[str] = None,
         destination_country: Optional[str] = None,
+        *,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        sort: str = "-updated_at",
     ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
-        List assignments for admin (same as list_admin_assignments) plus summary with
-        count, orphans_without_company, orphans_without_person.
+        List assignments for admin (same rows as list_admin_assignments), keyset-paginated when ``limit``
+        is set, plus summary with next_cursor and, on the first page, count, orphans_without_company
+        and orphans_without_person.
         """
-        items = self.list_admin_assignments(
+        items, next_cursor = self._admin_assignments_page(
             company_id=company_id,
             employee_user_id=employee_user_id,
             employee_search=employee_search,
             status=status,
             destination_country=destination_country,
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
         )
+        if cursor:
+            return items, {"next_cursor": next_cursor}
         with self.engine.connect() as conn:
             total = conn.execute(text("SELECT COUNT(*) AS n FROM case_assignments"), {}).fetchone()
             total_count = int(total._mapping["n"]) if total else 0
@@ -10114,6 +11011,7 @@ class Database:
             "count": total_count,
             "orphans_without_company": orphans_no_company,
             "orphans_without_person": orphans_no_person,
+            "next_cursor": next_cursor,
         }
         return items, summary
 
@@ -10155,48 +11053,14 @@ class Database:
         summary = {"count": len(policies), "orphans_without_company": orphans}
         return policies, summary
 
-    def get_data_integrity_overview(self) -> Dict[str, Any]:
+    def get_data_integrity_overview(self, *, refresh: bool = False) -> Dict[str, Any]:
         """
         Admin-safe summary of entity counts and orphan flags for data-integrity dashboard.
+        One aggregate statement, cached for a short TTL; see db_integrity_metrics.
         """
-        out: Dict[str, Any] = {
-            "companies": {"count": 0},
-            "people": {"count": 0, "orphans_without_company": 0},
-            "assignments": {"count": 0, "orphans_without_company": 0, "orphans_without_person": 0},
-            "policies": {"count": 0, "orphans_without_company": 0},
-        }
-        try:
-            with self.engine.connect() as conn:
-                c = conn.execute(text("SELECT COUNT(*) AS n FROM companies"), {}).fetchone()
-                out["companies"]["count"] = int(c._mapping["n"]) if c else 0
-                p = conn.execute(text("SELECT COUNT(*) AS n FROM profiles"), {}).fetchone()
-                out["people"]["count"] = int(p._mapping["n"]) if p else 0
-                _, people_sum = self.get_admin_people_index()
-                out["people"]["orphans_without_company"] = people_sum.get("orphans_without_company", 0)
-                a = conn.execute(text("SELECT COUNT(*) AS n FROM case_assignments"), {}).fetchone()
-                out["assignments"]["count"] = int(a._mapping["n"]) if a else 0
-                no_co = conn.execute(text(f"""
-                    SELECT COUNT(*) AS n FROM case_assignments a
-                    LEFT JOIN relocation_cases rc ON {_relocation_cases_join_on("a", "canonical_coalesce")}
-                    LEFT JOIN hr_users hu ON hu.profile_id = a.hr_user_id
-                    WHERE COALESCE(rc.company_id, hu.company_id) IS NULL
-                """), {}).fetchone()
-                out["assignments"]["orphans_without_company"] = int(no_co._mapping["n"]) if no_co else 0
-                no_emp = conn.execute(text("""
-                    SELECT COUNT(*) AS n FROM case_assignments
-                    WHERE employee_user_id IS NULL OR TRIM(COALESCE(employee_user_id,'')) = ''
-                """), {}).fetchone()
-                out["assignments"]["orphans_without_person"] = int(no_emp._mapping["n"]) if no_emp else 0
-                pol = conn.execute(text("SELECT COUNT(*) AS n FROM company_policies"), {}).fetchone()
-                out["policies"]["count"] = int(pol._mapping["n"]) if pol else 0
-                pol_orphan = conn.execute(text("""
-                    SELECT COUNT(*) AS n FROM company_policies cp
-                    WHERE NOT EXISTS (SELECT 1 FROM companies c WHERE c.id = cp.company_id)
-                """), {}).fetchone()
-                out["policies"]["orphans_without_company"] = int(pol_orphan._mapping["n"]) if pol_orphan else 0
-        except Exception as e:
-            log.warning("get_data_integrity_overview failed: %s", e)
-        return out
+        return self.integrity_metrics.overview(
+            _relocation_cases_join_on("a", "canonical_coalesce"), refresh=refresh
+        )
 
     def get_company_policy(self, policy_id: str) -> Optional[Dict[str, Any]]:
         with self.engine.connect() as conn:
@@ -10529,24 +11393,7 @@ class Database:
 
     def policy_assistant_tables_available(self) -> bool:
         """True when policy assistant import tables exist (migration applied)."""
-        try:
-            with self.engine.connect() as conn:
-                if _is_sqlite:
-                    r = conn.execute(
-                        text(
-                            "SELECT name FROM sqlite_master WHERE type='table' AND name='policy_document_chunks'"
-                        )
-                    ).fetchone()
-                    return r is not None
-                r = conn.execute(
-                    text(
-                        "SELECT 1 FROM information_schema.tables "
-                        "WHERE table_schema = 'public' AND table_name = 'policy_document_chunks'"
-                    )
-                ).fetchone()
-                return r is not None
-        except Exception:
-            return False
+        return self.schema.has_table("policy_document_chunks")
 
     def clear_policy_assistant_pipeline_for_document(self, doc_id: str) -> None:
         """
@@ -10602,6 +11449,64 @@ class Database:
                 },
             )
 
+    _INSERT_POLICY_DOCUMENT_CHUNK_SQL = """
+        INSERT INTO policy_document_chunks
+        (id, policy_document_id, chunk_index, page_number, section_title,
+         text_content, token_count, metadata_json, created_at, snapshot_id)
+        VALUES (:id, :doc, :idx, :pn, :st, :tx, :tc, :mj, :now, :snap)
+    """
+
+    _INSERT_POLICY_FACT_SQL = """
+        INSERT INTO policy_facts
+        (id, snapshot_id, fact_type, category, subcategory, normalized_value_json,
+         applicability_json, ambiguity_flag, confidence_score, source_chunk_id,
+         source_page, source_section, source_quote, created_at)
+        VALUES (:id, :sid, :ft, :cat, :sub, :nv, :ap, :af, :cs, :ch, :pg, :sec, :sq, :now)
+    """
+
+    @staticmethod
+    def _policy_document_chunk_params(
+        doc_id: str,
+        chunk: Dict[str, Any],
+        snapshot_id: Optional[str],
+        now: str,
+    ) -> Dict[str, Any]:
+        meta = chunk.get("metadata_json")
+        return {
+            "id": str(chunk.get("id") or uuid.uuid4()),
+            "doc": doc_id,
+            "idx": int(chunk["chunk_index"]),
+            "pn": chunk.get("page_number"),
+            "st": chunk.get("section_title"),
+            "tx": chunk["text_content"],
+            "tc": chunk.get("token_count"),
+            "mj": json.dumps(meta if meta is not None else {}),
+            "now": now,
+            "snap": snapshot_id,
+        }
+
+    @staticmethod
+    def _policy_fact_params(snapshot_id: str, fact: Dict[str, Any], now: str) -> Dict[str, Any]:
+        nv = fact.get("normalized_value_json")
+        ap = fact.get("applicability_json")
+        ambiguity_flag = bool(fact.get("ambiguity_flag"))
+        return {
+            "id": str(fact.get("id") or uuid.uuid4()),
+            "sid": snapshot_id,
+            "ft": str(fact["fact_type"]),
+            "cat": str(fact.get("category") or ""),
+            "sub": fact.get("subcategory"),
+            "nv": json.dumps(nv if nv is not None else {}),
+            "ap": json.dumps(ap if ap is not None else {}),
+            "af": (1 if ambiguity_flag else 0) if _is_sqlite else ambiguity_flag,
+            "cs": fact.get("confidence_score"),
+            "ch": str(fact.get("source_chunk_id") or ""),
+            "pg": fact.get("source_page"),
+            "sec": fact.get("source_section"),
+            "sq": fact.get("source_quote"),
+            "now": now,
+        }
+
     def insert_policy_document_chunk(
         self,
         doc_id: str,
@@ -10614,33 +11519,62 @@ class Database:
         metadata_json: Optional[Dict[str, Any]] = None,
         snapshot_id: Optional[str] = None,
     ) -> str:
-        cid = str(uuid.uuid4())
+        return self.insert_policy_document_chunks_bulk(
+            doc_id,
+            [
+                {
+                    "chunk_index": chunk_index,
+                    "text_content": text_content,
+                    "page_number": page_number,
+                    "section_title": section_title,
+                    "token_count": token_count,
+                    "metadata_json": metadata_json,
+                }
+            ],
+            snapshot_id=snapshot_id,
+        )[0]
+
+    def insert_policy_document_chunks_bulk(
+        self,
+        doc_id: str,
+        chunks: List[Dict[str, Any]],
+        *,
+        snapshot_id: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Insert all chunks in one transaction (executemany). Each chunk dict carries chunk_index,
+        text_content and optional page_number / section_title / token_count / metadata_json / id.
+        Returns chunk ids in input order.
+        """
+        if not chunks:
+            return []
         now = datetime.utcnow().isoformat()
-        meta = metadata_json if metadata_json is not None else {}
+        params = [self._policy_document_chunk_params(doc_id, c, snapshot_id, now) for c in chunks]
         with self.engine.begin() as conn:
-            conn.execute(
-                text(
-                    """
-                    INSERT INTO policy_document_chunks
-                    (id, policy_document_id, chunk_index, page_number, section_title,
-                     text_content, token_count, metadata_json, created_at, snapshot_id)
-                    VALUES (:id, :doc, :idx, :pn, :st, :tx, :tc, :mj, :now, :snap)
-                    """
-                ),
-                {
-                    "id": cid,
-                    "doc": doc_id,
-                    "idx": chunk_index,
-                    "pn": page_number,
-                    "st": section_title,
-                    "tx": text_content,
-                    "tc": token_count,
-                    "mj": json.dumps(meta),
-                    "now": now,
-                    "snap": snapshot_id,
-                },
-            )
-        return cid
+            conn.execute(text(self._INSERT_POLICY_DOCUMENT_CHUNK_SQL), params)
+        return [p["id"] for p in params]
+
+    def insert_policy_snapshot_contents(
+        self,
+        doc_id: str,
+        snapshot_id: str,
+        chunks: List[Dict[str, Any]],
+        facts: List[Dict[str, Any]],
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Write every chunk and fact of a candidate snapshot in a single transaction, so a failed
+        import never leaves a partially populated snapshot behind. Chunks should carry pre-assigned
+        ids when facts reference them via source_chunk_id. Returns (chunk_ids, fact_ids).
+        """
+        now = datetime.utcnow().isoformat()
+        chunk_params = [self._policy_document_chunk_params(doc_id, c, snapshot_id, now) for c in chunks]
+        fact_params = [self._policy_fact_params(snapshot_id, f, now) for f in facts]
+        with self.engine.begin() as conn:
+            if chunk_params:
+                conn.execute(text(self._INSERT_POLICY_DOCUMENT_CHUNK_SQL), chunk_params)
+            if fact_params:
+                conn.execute(text(self._INSERT_POLICY_FACT_SQL), fact_params)
+        return [p["id"] for p in chunk_params], [p["id"] for p in fact_params]
 
     def list_policy_document_chunks(self, doc_id: str) -> List[Dict[str, Any]]:
         if not self.policy_assistant_tables_available():
@@ -10782,39 +11716,34 @@ class Database:
         source_section: Optional[str] = None,
         source_quote: Optional[str] = None,
     ) -> str:
-        fid = str(uuid.uuid4())
+        return self.insert_policy_facts_bulk(
+            snapshot_id,
+            [
+                {
+                    "fact_type": fact_type,
+                    "category": category,
+                    "subcategory": subcategory,
+                    "normalized_value_json": normalized_value_json,
+                    "applicability_json": applicability_json,
+                    "ambiguity_flag": ambiguity_flag,
+                    "confidence_score": confidence_score,
+                    "source_chunk_id": source_chunk_id,
+                    "source_page": source_page,
+                    "source_section": source_section,
+                    "source_quote": source_quote,
+                }
+            ],
+        )[0]
+
+    def insert_policy_facts_bulk(self, snapshot_id: str, facts: List[Dict[str, Any]]) -> List[str]:
+        """Insert all facts for a snapshot in one transaction (executemany). Returns fact ids in input order."""
+        if not facts:
+            return []
         now = datetime.utcnow().isoformat()
-        nv = normalized_value_json if normalized_value_json is not None else {}
-        ap = applicability_json if applicability_json is not None else {}
+        params = [self._policy_fact_params(snapshot_id, f, now) for f in facts]
         with self.engine.begin() as conn:
-            conn.execute(
-                text(
-                    """
-                    INSERT INTO policy_facts
-                    (id, snapshot_id, fact_type, category, subcategory, normalized_value_json,
-                     applicability_json, ambiguity_flag, confidence_score, source_chunk_id,
-                     source_page, source_section, source_quote, created_at)
-                    VALUES (:id, :sid, :ft, :cat, :sub, :nv, :ap, :af, :cs, :ch, :pg, :sec, :sq, :now)
-                    """
-                ),
-                {
-                    "id": fid,
-                    "sid": snapshot_id,
-                    "ft": fact_type,
-                    "cat": category,
-                    "sub": subcategory,
-                    "nv": json.dumps(nv),
-                    "ap": json.dumps(ap),
-                    "af": (1 if ambiguity_flag else 0) if _is_sqlite else bool(ambiguity_flag),
-                    "cs": confidence_score,
-                    "ch": source_chunk_id,
-                    "pg": source_page,
-                    "sec": source_section,
-                    "sq": source_quote,
-                    "now": now,
-                },
-            )
-        return fid
+            conn.execute(text(self._INSERT_POLICY_FACT_SQL), params)
+        return [p["id"] for p in params]
 
     def count_policy_document_chunks(self, doc_id: str) -> int:
         if not self.policy_assistant_tables_available():
@@ -10884,6 +11813,56 @@ class Database:
             d["metadata_json"] = _coerce_json_dict(d.get("metadata_json"))
         return items
 
+    def search_policy_document_chunks(
+        self,
+        snapshot_id: str,
+        message: str,
+        *,
+        limit: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """
+        Top-k chunks of one snapshot ranked against ``message`` in a single indexed query
+        (SQLite: FTS5 bm25; Postgres: tsvector GIN + ts_rank_cd). Terms are OR-ed; section titles
+        weigh more than body text. Rows carry ``retrieval_score`` (higher is better).
+        """
+        terms = _policy_chunk_search_terms(message)
+        if not snapshot_id or not terms or limit <= 0 or not self.policy_assistant_tables_available():
+            return []
+        params: Dict[str, Any] = {"sid": snapshot_id, "k": int(limit)}
+        if _is_sqlite:
+            params["q"] = " OR ".join(f'"{t}"' for t in terms)
+            sql = """
+                SELECT c.*, -bm25(policy_document_chunks_fts, 2.0, 1.0) AS retrieval_score
+                FROM policy_document_chunks_fts
+                JOIN policy_document_chunk_search_keys k ON k.search_rowid = policy_document_chunks_fts.rowid
+                JOIN policy_document_chunks c ON c.id = k.chunk_id
+                WHERE policy_document_chunks_fts MATCH :q AND c.snapshot_id = :sid
+                ORDER BY bm25(policy_document_chunks_fts, 2.0, 1.0), c.chunk_index
+                LIMIT :k
+            """
+        else:
+            params["q"] = " | ".join(terms)
+            sql = """
+                SELECT c.id, c.policy_document_id, c.chunk_index, c.page_number, c.section_title,
+                       c.text_content, c.token_count, c.metadata_json, c.created_at, c.snapshot_id,
+                       ts_rank_cd(c.search_tsv, q, 32) AS retrieval_score
+                FROM policy_document_chunks c, to_tsquery('english', :q) q
+                WHERE c.snapshot_id = :sid AND c.search_tsv @@ q
+                ORDER BY retrieval_score DESC, c.chunk_index
+                LIMIT :k
+            """
+        try:
+            with self.engine.connect() as conn:
+                rows = conn.execute(text(sql), params).fetchall()
+        except Exception as exc:
+            log.warning("search_policy_document_chunks failed snapshot_id=%s: %s", snapshot_id, exc)
+            return []
+        items = self._rows_to_list(rows)
+        for d in items:
+            d["metadata_json"] = _coerce_json_dict(d.get("metadata_json"))
+            d["retrieval_score"] = float(d.get("retrieval_score") or 0.0)
+        return items
+
     def get_company_policy_assistant_binding(self, company_id: str) -> Optional[Dict[str, Any]]:
         if not self.policy_assistant_tables_available():
             return None
@@ -10981,24 +11960,7 @@ class Database:
         return self.count_policy_facts_for_snapshot(str(snap.get("id")))
 
     def policy_hardening_tables_available(self) -> bool:
-        try:
-            with self.engine.connect() as conn:
-                if _is_sqlite:
-                    r = conn.execute(
-                        text(
-                            "SELECT name FROM sqlite_master WHERE type='table' AND name='policy_extraction_locks'"
-                        )
-                    ).fetchone()
-                    return r is not None
-                r = conn.execute(
-                    text(
-                        "SELECT 1 FROM information_schema.tables "
-                        "WHERE table_schema = 'public' AND table_name = 'policy_extraction_locks'"
-                    )
-                ).fetchone()
-                return r is not None
-        except Exception:
-            return False
+        return self.schema.has_table("policy_extraction_locks")
 
     def get_policy_knowledge_snapshot_by_id(self, snapshot_id: str) -> Optional[Dict[str, Any]]:
         if not self.policy_assistant_tables_available():
@@ -11336,6 +12298,10 @@ class Database:
         """Delete policy_document and its clauses. Returns True if a row was deleted."""
         self.delete_policy_document_clauses(doc_id, request_id=request_id)
         with self.engine.begin() as conn:
+            # Staged rows of an upsert that never finished (Postgres cascades these; SQLite does not).
+            conn.execute(
+                text("DELETE FROM policy_document_clause_staging WHERE policy_document_id = :id"), {"id": doc_id}
+            )
             r = conn.execute(text("DELETE FROM policy_documents WHERE id = :id"), {"id": doc_id})
             return r.rowcount > 0
 
@@ -11348,53 +12314,96 @@ class Database:
             )
             return r.rowcount
 
+    _POLICY_CLAUSE_TYPES = frozenset({
+        "scope", "eligibility", "benefit", "exclusion", "approval_rule",
+        "evidence_rule", "tax_rule", "definition", "lifecycle_rule", "unknown",
+    })
+    _POLICY_DOCUMENT_CLAUSE_COLUMNS = (
+        "id, policy_document_id, section_label, section_path, clause_type, "
+        "title, raw_text, normalized_hint_json, source_page_start, source_page_end, "
+        "source_anchor, confidence, created_at, updated_at"
+    )
+    _STAGE_POLICY_DOCUMENT_CLAUSE_SQL = f"""
+        INSERT INTO policy_document_clause_staging (generation, {_POLICY_DOCUMENT_CLAUSE_COLUMNS})
+        VALUES (:gen, :id, :doc_id, :sl, :sp, :ct, :title, :raw, :hint,
+                :ps, :pe, :anchor, :conf, :now, :now)
+    """
+    _PROMOTE_POLICY_DOCUMENT_CLAUSES_SQL = f"""
+        INSERT INTO policy_document_clauses ({_POLICY_DOCUMENT_CLAUSE_COLUMNS})
+        SELECT {_POLICY_DOCUMENT_CLAUSE_COLUMNS} FROM policy_document_clause_staging
+        WHERE generation = :gen
+    """
+
+    def _policy_document_clause_params(self, doc_id: str, c: Dict[str, Any], now: str) -> Dict[str, Any]:
+        ctype = str(c.get("clause_type") or "unknown")
+        if ctype not in self._POLICY_CLAUSE_TYPES:
+            ctype = "unknown"
+        return {
+            "id": str(uuid.uuid4()),
+            "doc_id": doc_id,
+            "sl": c.get("section_label"),
+            "sp": c.get("section_path"),
+            "ct": ctype,
+            "title": c.get("title"),
+            "raw": c.get("raw_text") or "",
+            "hint": json.dumps(c.get("normalized_hint_json")) if c.get("normalized_hint_json") else None,
+            "ps": c.get("source_page_start"),
+            "pe": c.get("source_page_end"),
+            "anchor": c.get("source_anchor"),
+            "conf": float(c.get("confidence", 0.5)),
+            "now": now,
+        }
+
     def upsert_policy_document_clauses(
         self,
         doc_id: str,
-        clauses: List[Dict[str, Any]],
+        clauses: Iterable[Dict[str, Any]],
         request_id: Optional[str] = None,
+        batch_size: int = 500,
     ) -> int:
-        """Replace clauses for a document. Deletes existing and inserts new."""
-        self.delete_policy_document_clauses(doc_id, request_id=request_id)
-        if not clauses:
-            return 0
+        """
+        Replace clauses for a document. ``clauses`` may be a generator (streaming segmentation): it is
+        read batch_size clauses at a time and each batch is written to policy_document_clause_staging
+        under a fresh generation id in its own short transaction, so neither the clause rows nor the
+        write lock are held while the document is parsed. One final transaction deletes the live
+        clauses and promotes the generation. A failure mid-stream drops the staged rows and leaves the
+        previous clauses untouched.
+        """
         now = datetime.utcnow().isoformat()
-        valid_types = {
-            "scope", "eligibility", "benefit", "exclusion", "approval_rule",
-            "evidence_rule", "tax_rule", "definition", "lifecycle_rule", "unknown",
-        }
-        with self.engine.begin() as conn:
-            for c in clauses:
-                cid = str(uuid.uuid4())
-                ctype = str(c.get("clause_type") or "unknown")
-                if ctype not in valid_types:
-                    ctype = "unknown"
+        generation = str(uuid.uuid4())
+        stream = iter(clauses)
+        total = 0
+        try:
+            while True:
+                params = [
+                    {**self._policy_document_clause_params(doc_id, c, now), "gen": generation}
+                    for c in itertools.islice(stream, max(1, batch_size))
+                ]
+                if not params:
+                    break
+                with self.engine.begin() as conn:
+                    conn.execute(text(self._STAGE_POLICY_DOCUMENT_CLAUSE_SQL), params)
+                total += len(params)
+            with self.engine.begin() as conn:
                 conn.execute(
-                    text("""
-                        INSERT INTO policy_document_clauses
-                        (id, policy_document_id, section_label, section_path, clause_type,
-                         title, raw_text, normalized_hint_json, source_page_start, source_page_end,
-                         source_anchor, confidence, created_at, updated_at)
-                        VALUES (:id, :doc_id, :sl, :sp, :ct, :title, :raw, :hint,
-                                :ps, :pe, :anchor, :conf, :now, :now)
-                    """),
-                    {
-                        "id": cid,
-                        "doc_id": doc_id,
-                        "sl": c.get("section_label"),
-                        "sp": c.get("section_path"),
-                        "ct": ctype,
-                        "title": c.get("title"),
-                        "raw": c.get("raw_text") or "",
-                        "hint": json.dumps(c.get("normalized_hint_json")) if c.get("normalized_hint_json") else None,
-                        "ps": c.get("source_page_start"),
-                        "pe": c.get("source_page_end"),
-                        "anchor": c.get("source_anchor"),
-                        "conf": float(c.get("confidence", 0.5)),
-                        "now": now,
-                    },
+                    text("DELETE FROM policy_document_clauses WHERE policy_document_id = :id"),
+                    {"id": doc_id},
                 )
-        return len(clauses)
+                conn.execute(text(self._PROMOTE_POLICY_DOCUMENT_CLAUSES_SQL), {"gen": generation})
+                conn.execute(
+                    text("DELETE FROM policy_document_clause_staging WHERE generation = :gen"), {"gen": generation}
+                )
+        except BaseException:
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(
+                        text("DELETE FROM policy_document_clause_staging WHERE generation = :gen"),
+                        {"gen": generation},
+                    )
+            except Exception as exc:
+                log.warning("policy clause staging cleanup failed doc_id=%s: %s", doc_id, exc)
+            raise
+        return total
 
     def list_policy_document_clauses(
         self,
@@ -12375,6 +13384,92 @@ class Database:
             self._parse_json_col(d, "resolution_context_json")
         return d
 
+    _UPSERT_EMPLOYEE_ENTITLEMENT_READ_MODEL_SQL = """
+        INSERT INTO employee_entitlement_read_models
+        (assignment_id, view_name, company_id, policy_id, policy_version_id, context_fingerprint,
+         payload_json, computed_at)
+        VALUES (:aid, :view, :coid, :pid, :vid, :fp, :payload, :now)
+        ON CONFLICT (assignment_id, view_name) DO UPDATE SET
+        company_id = excluded.company_id, policy_id = excluded.policy_id,
+        policy_version_id = excluded.policy_version_id, context_fingerprint = excluded.context_fingerprint,
+        payload_json = excluded.payload_json, computed_at = excluded.computed_at
+    """
+
+    def get_employee_entitlement_read_model(
+        self, assignment_id: str, view_name: str, company_ids: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Materialized employee policy view for an assignment, with the policy's currently published
+        version id alongside so callers can detect staleness from this single read. With
+        ``company_ids`` (resolution candidates, in priority order) the row also carries
+        ``resolved_policy_id``: the policy find_first_published_company_policy would select now.
+        """
+        params: Dict[str, Any] = {"aid": assignment_id, "view": view_name}
+        resolved_sql = "NULL"
+        if company_ids:
+            names = [f"c{i}" for i in range(len(company_ids))]
+            params.update({n: str(cid) for n, cid in zip(names, company_ids)})
+            rank = " ".join(f"WHEN :{n} THEN {i}" for i, n in enumerate(names))
+            resolved_sql = f"""(SELECT cp.id FROM company_policies cp
+                     INNER JOIN policy_versions pv
+                         ON pv.policy_id = cp.id AND LOWER(TRIM(pv.status)) = 'published'
+                     WHERE cp.company_id IN ({", ".join(":" + n for n in names)})
+                     ORDER BY CASE cp.company_id {rank} END,
+                         cp.created_at DESC, pv.version_number DESC, pv.created_at DESC
+                     LIMIT 1)"""
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                text(f"""
+                    SELECT m.*,
+                    (SELECT pv.id FROM policy_versions pv
+                     WHERE pv.policy_id = m.policy_id AND pv.status = 'published'
+                     ORDER BY pv.version_number DESC, pv.created_at DESC LIMIT 1) AS current_published_version_id,
+                    {resolved_sql} AS resolved_policy_id
+                    FROM employee_entitlement_read_models m
+                    WHERE m.assignment_id = :aid AND m.view_name = :view
+                """),
+                params,
+            ).fetchone()
+        d = self._row_to_dict(row)
+        if d:
+            self._parse_json_col(d, "payload_json")
+        return d
+
+    def upsert_employee_entitlement_read_model(
+        self,
+        assignment_id: str,
+        view_name: str,
+        *,
+        company_id: Optional[str],
+        policy_id: str,
+        policy_version_id: str,
+        context_fingerprint: str,
+        payload_json: str,
+    ) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(text(self._UPSERT_EMPLOYEE_ENTITLEMENT_READ_MODEL_SQL), {
+                "aid": assignment_id, "view": view_name, "coid": company_id, "pid": str(policy_id),
+                "vid": str(policy_version_id), "fp": context_fingerprint, "payload": payload_json,
+                "now": datetime.utcnow().isoformat(),
+            })
+
+    def delete_employee_entitlement_read_models(
+        self,
+        *,
+        policy_version_id: Optional[str] = None,
+        policy_id: Optional[str] = None,
+    ) -> int:
+        """Drop materialized rows for a policy version (HR edits) or a whole policy (publish). Returns count."""
+        if policy_version_id:
+            sql, params = "DELETE FROM employee_entitlement_read_models WHERE policy_version_id = :id", {"id": str(policy_version_id)}
+        elif policy_id:
+            sql, params = "DELETE FROM employee_entitlement_read_models WHERE policy_id = :id", {"id": str(policy_id)}
+        else:
+            return 0
+        with self.engine.begin() as conn:
+            result = conn.execute(text(sql), params)
+        return result.rowcount or 0
+
     def list_resolved_policy_benefits(self, resolved_policy_id: str) -> List[Dict[str, Any]]:
         with self.engine.connect() as conn:
             rows = conn.execute(
@@ -13379,45 +14474,21 @@ class Database:
             "policy_documents",
             "policy_document_clauses",
         ]
+        schema = schema_capabilities(_engine)
+        present = [t for t in expected if schema.has_table(t)]
+        missing = [t for t in expected if t not in present]
         if _is_sqlite:
-            try:
-                with _engine.connect() as conn:
-                    present = []
-                    missing = []
-                    for t in expected:
-                        r = conn.execute(text(
-                            "SELECT name FROM sqlite_master WHERE type='table' AND name=:n"
-                        ), {"n": t}).fetchone()
-                        (present if r else missing).append(t)
-                    log.info(
-                        "db_tables: present=%s missing=%s (sqlite)",
-                        present, missing,
-                    )
-            except Exception as e:
-                log.warning("db_tables check failed: %s", e)
+            log.info("db_tables: present=%s missing=%s (sqlite)", present, missing)
             return
-        try:
-            with _engine.connect() as conn:
-                placeholders = ",".join([f":t{i}" for i in range(len(expected))])
-                params = {f"t{i}": t for i, t in enumerate(expected)}
-                rows = conn.execute(text(f"""
-                    SELECT table_name FROM information_schema.tables
-                    WHERE table_schema = 'public' AND table_name IN ({placeholders})
-                """), params).fetchall()
-                found = {r[0] for r in rows}
-                present = [t for t in expected if t in found]
-                missing = [t for t in expected if t not in found]
-                log.info(
-                    "db_tables: present=%s missing=%s (postgres). Apply migrations if missing.",
-                    present, missing,
-                )
-                if missing:
-                    log.warning(
-                        "db_tables: Run supabase migrations for: %s. See docs/SUPABASE_MIGRATIONS.md",
-                        missing,
-                    )
-        except Exception as e:
-            log.warning("db_tables check failed: %s", e)
+        log.info(
+            "db_tables: present=%s missing=%s (postgres). Apply migrations if missing.",
+            present, missing,
+        )
+        if missing:
+            log.warning(
+                "db_tables: Run supabase migrations for: %s. See docs/SUPABASE_MIGRATIONS.md",
+                missing,
+            )
 
 
 # Global database instance
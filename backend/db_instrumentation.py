@@ -0,0 +1,246 @@
+"""
+Per-request DB query instrumentation (SQLAlchemy cursor events on the shared engines).
+
+- Counts statements and DB time per request (request_id set by the HTTP middleware).
+- Flags statement shapes repeated within one request as likely N+1.
+- Samples slow statements (normalized SQL, no parameter values) into a bounded ring buffer.
+- Aggregates per-route histograms of query count / DB time for the admin ops endpoint.
+
+The HTTP middleware turns the per-request totals into a ``Server-Timing`` header. Nothing here
+logs per statement; only N+1 detections are logged (once per shape per request).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+
+log = logging.getLogger(__name__)
+
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "8"))
+_SLOW_SAMPLE_MAX = 200
+_N_PLUS_ONE_SAMPLE_MAX = 100
+
+# Histogram upper bounds (inclusive); last bucket is open-ended.
+QUERY_COUNT_BUCKETS: Tuple[int, ...] = (0, 1, 5, 10, 25, 50, 100)
+DB_MS_BUCKETS: Tuple[float, ...] = (1.0, 5.0, 25.0, 100.0, 250.0, 1000.0)
+
+_WS_RE = re.compile(r"\s+")
+_STR_RE = re.compile(r"'(?:[^']|'')*'")
+_NUM_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_RE = re.compile(r"%\([^)]+\)s|:\w+|\$\d+|\?")
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def normalize_sql(statement: str) -> str:
+    """Statement shape: literals and bind params → ?, IN-lists collapsed, whitespace squashed."""
+    s = _WS_RE.sub(" ", statement or "").strip()
+    s = _STR_RE.sub("?", s)
+    s = _PARAM_RE.sub("?", s)
+    s = _NUM_RE.sub("?", s)
+    s = _LIST_RE.sub("(?...)", s)
+    return s[:2000]
+
+
+class RequestQueryStats:
+    """Mutable per-request accumulator; shared with worker threads through the context var."""
+
+    __slots__ = ("request_id", "route", "count", "total_ms", "shapes", "n_plus_one", "_lock")
+
+    def __init__(self, request_id: str, route: str = "") -> None:
+        self.request_id = request_id
+        self.route = route
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes: Dict[str, int] = {}
+        self.n_plus_one: List[str] = []
+        self._lock = threading.Lock()
+
+    def record(self, shape: str, dur_ms: float) -> bool:
+        """Add one statement; True the first time ``shape`` crosses the N+1 threshold."""
+        with self._lock:
+            self.count += 1
+            self.total_ms += dur_ms
+            n = self.shapes.get(shape, 0) + 1
+            self.shapes[shape] = n
+            if n == N_PLUS_ONE_THRESHOLD:
+                self.n_plus_one.append(shape)
+                return True
+        return False
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+_current: ContextVar[Optional[RequestQueryStats]] = ContextVar("db_request_query_stats", default=None)
+
+_agg_lock = threading.Lock()
+_slow_samples: Deque[Dict[str, Any]] = deque(maxlen=_SLOW_SAMPLE_MAX)
+_n_plus_one_samples: Deque[Dict[str, Any]] = deque(maxlen=_N_PLUS_ONE_SAMPLE_MAX)
+_route_stats: Dict[str, Dict[str, Any]] = {}
+_installed_engines: "set[int]" = set()
+
+
+def begin_request(request_id: str, route: str = "") -> Tuple[RequestQueryStats, Any]:
+    stats = RequestQueryStats(request_id, route)
+    return stats, _current.set(stats)
+
+
+def current_request_stats() -> Optional[RequestQueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def capture_queries(label: str = "capture") -> Iterator[RequestQueryStats]:
+    """Count statements issued inside the block (benchmarks, tests); not folded into route stats."""
+    stats, token = begin_request(label, label)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _bucket(value: float, bounds: Tuple[float, ...]) -> str:
+    for b in bounds:
+        if value <= b:
+            return f"le_{b:g}"
+    return f"gt_{bounds[-1]:g}"
+
+
+def end_request(stats: RequestQueryStats, token: Any, route: Optional[str] = None) -> None:
+    """Reset the context var and fold the request into per-route histograms."""
+    try:
+        _current.reset(token)
+    except ValueError:
+        pass
+    key = route or stats.route or "(unmatched)"
+    with _agg_lock:
+        r = _route_stats.get(key)
+        if r is None:
+            r = {
+                "requests": 0,
+                "queries": 0,
+                "db_ms": 0.0,
+                "max_queries": 0,
+                "n_plus_one_requests": 0,
+                "query_count_histogram": {},
+                "db_ms_histogram": {},
+            }
+            _route_stats[key] = r
+        r["requests"] += 1
+        r["queries"] += stats.count
+        r["db_ms"] += stats.total_ms
+        r["max_queries"] = max(r["max_queries"], stats.count)
+        if stats.n_plus_one:
+            r["n_plus_one_requests"] += 1
+        qb = _bucket(stats.count, QUERY_COUNT_BUCKETS)
+        r["query_count_histogram"][qb] = r["query_count_histogram"].get(qb, 0) + 1
+        mb = _bucket(stats.total_ms, DB_MS_BUCKETS)
+        r["db_ms_histogram"][mb] = r["db_ms_histogram"].get(mb, 0) + 1
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    starts = conn.info.get("_query_start")
+    if not starts:
+        return
+    dur_ms = (time.perf_counter() - starts.pop()) * 1000
+    stats = _current.get()
+    if stats is None and dur_ms < SLOW_QUERY_MS:
+        return
+    shape = normalize_sql(statement)
+    if stats is not None and stats.record(shape, dur_ms):
+        log.warning(
+            "db_n_plus_one request_id=%s route=%s repeats>=%s shape=%s",
+            stats.request_id,
+            stats.route,
+            N_PLUS_ONE_THRESHOLD,
+            shape[:300],
+        )
+        with _agg_lock:
+            _n_plus_one_samples.append(
+                {"request_id": stats.request_id, "route": stats.route, "shape": shape, "at": time.time()}
+            )
+    if dur_ms >= SLOW_QUERY_MS:
+        with _agg_lock:
+            _slow_samples.append(
+                {
+                    "shape": shape,
+                    "dur_ms": round(dur_ms, 2),
+                    "request_id": stats.request_id if stats else None,
+                    "route": stats.route if stats else None,
+                    "at": time.time(),
+                }
+            )
+
+
+def _handle_error(exception_context) -> None:
+    """A failed statement never reaches after_cursor_execute: drop its start time so it cannot skew the next one."""
+    conn = exception_context.connection
+    # No execution context: the error came before any statement (e.g. connect), nothing was pushed.
+    if conn is None or getattr(exception_context, "execution_context", None) is None:
+        return
+    starts = conn.info.get("_query_start")
+    if starts:
+        starts.pop()
+
+
+def install_query_instrumentation(engine: Any) -> None:
+    """Idempotently attach cursor listeners to ``engine``."""
+    if id(engine) in _installed_engines:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    _installed_engines.add(id(engine))
+
+
+def get_query_stats_snapshot(*, top_routes: int = 50) -> Dict[str, Any]:
+    """Admin view: per-route histograms (worst average query count first) + recent samples."""
+    with _agg_lock:
+        routes = []
+        for route, r in _route_stats.items():
+            reqs = max(1, r["requests"])
+            routes.append(
+                {
+                    "route": route,
+                    "requests": r["requests"],
+                    "avg_queries": round(r["queries"] / reqs, 2),
+                    "max_queries": r["max_queries"],
+                    "avg_db_ms": round(r["db_ms"] / reqs, 2),
+                    "n_plus_one_requests": r["n_plus_one_requests"],
+                    "query_count_histogram": dict(r["query_count_histogram"]),
+                    "db_ms_histogram": dict(r["db_ms_histogram"]),
+                }
+            )
+        slow = list(_slow_samples)
+        n1 = list(_n_plus_one_samples)
+    routes.sort(key=lambda x: (-x["avg_queries"], x["route"]))
+    return {
+        "config": {
+            "slow_query_ms": SLOW_QUERY_MS,
+            "n_plus_one_threshold": N_PLUS_ONE_THRESHOLD,
+        },
+        "routes": routes[:top_routes],
+        "slow_queries": sorted(slow, key=lambda x: -x["dur_ms"]),
+        "n_plus_one": list(reversed(n1)),
+    }
+
+
+def reset_query_stats() -> None:
+    with _agg_lock:
+        _route_stats.clear()
+        _slow_samples.clear()
+        _n_plus_one_samples.clear()
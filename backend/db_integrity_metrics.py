@@ -0,0 +1,140 @@
+"""
+Entity and orphan counts for the admin data-integrity dashboard, in one aggregate statement.
+
+The overview used to page the whole people index (two correlated subqueries per profile) just to
+read its orphan count, then ran seven more ``COUNT(*)`` round trips. ``IntegrityMetrics`` computes
+every figure in a single statement (one derived table per entity) and keeps the result for a short
+TTL (``INTEGRITY_METRICS_TTL_SECONDS``, default 30; ``0`` disables caching), so repeated dashboard
+loads on large tenants do not rescan the tables. A failed query is logged and not cached.
+
+The assignment -> case join predicate is passed in by the caller (``Database`` owns it and it changes
+once the typed ``resolved_case_id`` key is available).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import text
+
+log = logging.getLogger(__name__)
+
+
+def _ttl_from_env() -> float:
+    try:
+        return max(0.0, float(os.getenv("INTEGRITY_METRICS_TTL_SECONDS", "30")))
+    except ValueError:
+        return 30.0
+
+
+_INTEGRITY_METRICS_SQL = """
+    SELECT co.n AS companies,
+           pe.n AS people, pe.orphans AS people_orphans,
+           asg.n AS assignments, asg.no_person AS assignments_no_person,
+           asc_.no_company AS assignments_no_company,
+           pol.n AS policies, pol.orphans AS policies_orphans
+    FROM (SELECT COUNT(*) AS n FROM companies) co
+    CROSS JOIN (
+        SELECT COUNT(*) AS n,
+               COALESCE(SUM(CASE WHEN (role IN ('HR','EMPLOYEE','EMPLOYEE_USER') OR role IS NULL)
+                                  AND (company_id IS NULL OR TRIM(company_id) = '') THEN 1 ELSE 0 END), 0) AS orphans
+        FROM profiles
+    ) pe
+    CROSS JOIN (
+        SELECT COUNT(*) AS n,
+               COALESCE(SUM(CASE WHEN employee_user_id IS NULL
+                                  OR TRIM(COALESCE(employee_user_id,'')) = '' THEN 1 ELSE 0 END), 0) AS no_person
+        FROM case_assignments
+    ) asg
+    CROSS JOIN (
+        SELECT COUNT(*) AS no_company FROM case_assignments a
+        LEFT JOIN relocation_cases rc ON {case_join}
+        LEFT JOIN hr_users hu ON hu.profile_id = a.hr_user_id
+        WHERE COALESCE(rc.company_id, hu.company_id) IS NULL
+    ) asc_
+    CROSS JOIN (
+        SELECT COUNT(*) AS n,
+               COALESCE(SUM(CASE WHEN c.id IS NULL THEN 1 ELSE 0 END), 0) AS orphans
+        FROM company_policies cp
+        LEFT JOIN companies c ON c.id = cp.company_id
+    ) pol
+"""
+
+
+def empty_overview() -> Dict[str, Any]:
+    return {
+        "companies": {"count": 0},
+        "people": {"count": 0, "orphans_without_company": 0},
+        "assignments": {"count": 0, "orphans_without_company": 0, "orphans_without_person": 0},
+        "policies": {"count": 0, "orphans_without_company": 0},
+    }
+
+
+def _copy(overview: Dict[str, Any]) -> Dict[str, Any]:
+    return {section: dict(values) for section, values in overview.items()}
+
+
+class IntegrityMetrics:
+    """TTL-cached integrity overview for one engine."""
+
+    def __init__(self, engine: Any, ttl_seconds: Optional[float] = None) -> None:
+        self._engine = engine
+        self.ttl_seconds = _ttl_from_env() if ttl_seconds is None else max(0.0, float(ttl_seconds))
+        self._lock = threading.Lock()
+        self._cached: Optional[Tuple[float, Dict[str, Any]]] = None
+
+    def _query(self, case_join: str) -> Dict[str, Any]:
+        with self._engine.connect() as conn:
+            row = conn.execute(text(_INTEGRITY_METRICS_SQL.format(case_join=case_join)), {}).fetchone()
+        m = row._mapping
+        return {
+            "companies": {"count": int(m["companies"] or 0)},
+            "people": {"count": int(m["people"] or 0), "orphans_without_company": int(m["people_orphans"] or 0)},
+            "assignments": {
+                "count": int(m["assignments"] or 0),
+                "orphans_without_company": int(m["assignments_no_company"] or 0),
+                "orphans_without_person": int(m["assignments_no_person"] or 0),
+            },
+            "policies": {"count": int(m["policies"] or 0), "orphans_without_company": int(m["policies_orphans"] or 0)},
+        }
+
+    def overview(self, case_join: str, *, refresh: bool = False) -> Dict[str, Any]:
+        """Counts and orphan flags (a fresh copy), recomputed when older than the TTL or on ``refresh``."""
+        cached = self._cached
+        if not refresh and cached is not None and time.monotonic() - cached[0] < self.ttl_seconds:
+            return _copy(cached[1])
+        with self._lock:
+            cached = self._cached
+            if not refresh and cached is not None and time.monotonic() - cached[0] < self.ttl_seconds:
+                return _copy(cached[1])
+            try:
+                result = self._query(case_join)
+            except Exception as exc:
+                log.warning("integrity metrics query failed: %s", exc)
+                return empty_overview()
+            self._cached = (time.monotonic(), result)
+            return _copy(result)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cached = None
+
+
+_registries: "weakref.WeakKeyDictionary[Any, IntegrityMetrics]" = weakref.WeakKeyDictionary()
+_registries_lock = threading.Lock()
+
+
+def integrity_metrics(engine: Any) -> IntegrityMetrics:
+    """The shared metrics cache for ``engine`` (one per engine, created on first use)."""
+    metrics = _registries.get(engine)
+    if metrics is None:
+        with _registries_lock:
+            metrics = _registries.get(engine)
+            if metrics is None:
+                metrics = IntegrityMetrics(engine)
+                _registries[engine] = metrics
+    return metrics
@@ -0,0 +1,94 @@
+"""
+Process-wide schema capability registry: which tables and columns exist, per engine.
+
+The ``Database`` layer runs against SQLite locally and against Postgres deployments whose migrations
+may lag the code, so many statements are built conditionally ("only set companies.status when the
+column exists"). Answering that with a ``PRAGMA table_info`` / ``information_schema`` probe costs a
+round trip per call. The registry introspects every table's columns in one query the first time it
+is asked and answers from memory afterwards.
+
+Call ``refresh()`` after DDL (``Database.init_db`` does, and ``Database.refresh_schema_capabilities``
+is there for migrations applied while the process runs). A failed introspection is not cached: the
+lookup reports the table/column as missing and the next call retries.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from typing import Any, Dict, FrozenSet, Optional
+
+from sqlalchemy import text
+
+log = logging.getLogger(__name__)
+
+_SQLITE_COLUMNS_SQL = """
+    SELECT m.name AS table_name, p.name AS column_name
+    FROM sqlite_master m JOIN pragma_table_info(m.name) p
+    WHERE m.type = 'table'
+"""
+_POSTGRES_COLUMNS_SQL = """
+    SELECT table_name, column_name FROM information_schema.columns
+    WHERE table_schema = 'public'
+"""
+
+
+class SchemaCapabilities:
+    """Tables -> column names for one engine, loaded lazily and kept until ``refresh()``."""
+
+    def __init__(self, engine: Any) -> None:
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._tables: Optional[Dict[str, FrozenSet[str]]] = None
+
+    def _introspect(self) -> Dict[str, FrozenSet[str]]:
+        sql = _SQLITE_COLUMNS_SQL if self._engine.dialect.name == "sqlite" else _POSTGRES_COLUMNS_SQL
+        tables: Dict[str, set] = {}
+        with self._engine.connect() as conn:
+            for row in conn.execute(text(sql)).fetchall():
+                tables.setdefault(str(row[0]), set()).add(str(row[1]))
+        return {name: frozenset(cols) for name, cols in tables.items()}
+
+    def _snapshot(self) -> Dict[str, FrozenSet[str]]:
+        tables = self._tables
+        if tables is not None:
+            return tables
+        with self._lock:
+            if self._tables is None:
+                try:
+                    self._tables = self._introspect()
+                except Exception as exc:
+                    log.warning("schema capability introspection failed: %s", exc)
+                    return {}
+            return self._tables
+
+    def refresh(self) -> None:
+        """Drop the cached schema; the next lookup introspects again."""
+        with self._lock:
+            self._tables = None
+
+    def has_table(self, table: str) -> bool:
+        return table in self._snapshot()
+
+    def has_column(self, table: str, column: str) -> bool:
+        return column in self._snapshot().get(table, frozenset())
+
+    def columns(self, table: str) -> FrozenSet[str]:
+        """Column names of ``table`` (empty when the table does not exist)."""
+        return self._snapshot().get(table, frozenset())
+
+
+_registries: "weakref.WeakKeyDictionary[Any, SchemaCapabilities]" = weakref.WeakKeyDictionary()
+_registries_lock = threading.Lock()
+
+
+def schema_capabilities(engine: Any) -> SchemaCapabilities:
+    """The shared registry for ``engine`` (one per engine, created on first use)."""
+    registry = _registries.get(engine)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(engine)
+            if registry is None:
+                registry = SchemaCapabilities(engine)
+                _registries[engine] = registry
+    return registry
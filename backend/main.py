@@ -16,6 +16,7 @@ from fastapi.responses import JSONResponse
 from typing import Optional, Dict, Any, List, Tuple
 import os
 import uuid
+import itertools
 from datetime import datetime, date
 import re
 import json
@@ -101,6 +102,7 @@ from .services.explicit_pending_link_service import (
     PENDING_LINK_OTHER_OWNER,
 )
 from .dev_seed_auth import ensure_dev_seed_auth_user
+from .db_instrumentation import begin_request, end_request
 from .agents.orchestrator import IntakeOrchestrator
 from .agents.compliance_engine import ComplianceEngine
 from .policy_engine import PolicyEngine
@@ -179,6 +181,12 @@ async def lifespan(app: FastAPI):
     if not DISABLE_STARTUP_SEED:
         asyncio.create_task(_background_seed_task())
     yield
+    # Apply any wizard autosave side effects still waiting out their coalescing window.
+    cases_router.autosave.flush()
+    # Drain buffered analytics events (batched writer thread) before the process exits.
+    from .services.analytics_service import event_buffer as analytics_event_buffer
+
+    analytics_event_buffer.shutdown()
 
 log.info("DB engine: %s | host: %s", _db_scheme, _db_host)
 
@@ -300,10 +308,12 @@ async def request_id_and_timing_middleware(request: Request, call_next):
     """
     req_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
     request.state.request_id = req_id
+    query_stats, query_stats_token = begin_request(req_id)
     start = time.perf_counter()
     try:
         response = await call_next(request)
     except Exception as exc:  # pragma: no cover - defensive logging
+        end_request(query_stats, query_stats_token, _route_template(request))
         dur_ms = (time.perf_counter() - start) * 1000
         log.error(
             "request_id=%s method=%s path=%s error=%s dur_ms=%.2f",
@@ -316,20 +326,31 @@ async def request_id_and_timing_middleware(request: Request, call_next):
         )
         raise
     dur_ms = (time.perf_counter() - start) * 1000
+    end_request(query_stats, query_stats_token, _route_template(request))
     response.headers["X-Request-ID"] = req_id
+    response.headers["Server-Timing"] = f"{query_stats.server_timing()}, app;dur={dur_ms:.1f}"
     user_id = getattr(request.state, "user_id", None)
     log.info(
-        "request_id=%s method=%s path=%s status=%s dur_ms=%.2f user_id=%s",
+        "request_id=%s method=%s path=%s status=%s dur_ms=%.2f db_queries=%s db_ms=%.2f user_id=%s",
         req_id,
         request.method,
         request.url.path,
         response.status_code,
         dur_ms,
+        query_stats.count,
+        query_stats.total_ms,
         user_id,
     )
     return response
 
 
+def _route_template(request: Request) -> str:
+    """Matched route path (e.g. /api/cases/{case_id}) so histograms do not explode per id."""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return f"{request.method} {path}" if path else f"{request.method} (unmatched)"
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=default_origins,
@@ -337,7 +358,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["X-Request-ID"],
+    expose_headers=["X-Request-ID", "Server-Timing"],
     # Fewer preflight round-trips on repeat requests (helps perceived lag on slow networks).
     max_age=86400,
 )
@@ -379,10 +400,8 @@ def timed(span: str, request_id: Optional[str] = None):
       yield
   finally:
       dur_ms = (time.perf_counter() - start) * 1000
-      if request_id:
-          log.info("request_id=%s span=%s dur_ms=%.2f", request_id, span, dur_ms)
-      else:
-          log.info("span=%s dur_ms=%.2f", span, dur_ms)
+      # DEBUG only: per-request DB totals already come from db_instrumentation (Server-Timing).
+      log.debug("request_id=%s span=%s dur_ms=%.2f", request_id, span, dur_ms)
 
 
 @app.get("/health")
@@ -1046,6 +1065,21 @@ def _require_reason(reason: Optional[str]) -> None:
         raise HTTPException(status_code=400, detail="Reason is required for admin actions")
 
 
+_PURGE_MAX_BATCH_SIZE = 5000
+
+
+def _payload_int(payload: Dict[str, Any], key: str, default: Optional[int]) -> Optional[int]:
+    value = payload.get(key)
+    if value is None or value == "":
+        return default
+    if isinstance(value, bool):
+        raise HTTPException(status_code=400, detail=f"{key} must be an integer")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail=f"{key} must be an integer") from None
+
+
 def _deny_if_impersonating(user: Dict[str, Any]) -> None:
     if user.get("impersonation"):
         raise HTTPException(status_code=403, detail="View-as mode is read-only. Use admin actions instead.")
@@ -1583,11 +1617,21 @@ def stop_impersonation(
 
 
 @app.get("/api/admin/companies")
-def list_companies(q: Optional[str] = Query(None), user: Dict[str, Any] = Depends(require_admin)):
-    items = db.get_admin_company_index(q)
+def list_companies(
+    q: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    sort: str = Query("name"),
+    user: Dict[str, Any] = Depends(require_admin),
+):
+    """Admin company index. Pass ``limit`` for keyset pages; follow ``next_cursor`` with the same sort."""
+    try:
+        items, summary = db.get_admin_company_index(q, limit=limit, cursor=cursor, sort=sort)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     log.info("admin_companies list query=%s count=%s", q, len(items))
     db.log_audit(user["id"], "READ", "company", None, None, {"query": q})
-    return {"companies": items}
+    return {"companies": items, "next_cursor": summary.get("next_cursor")}
 
 
 @app.get("/api/admin/companies/{company_id}")
@@ -1779,9 +1823,17 @@ def list_users(
     q: Optional[str] = Query(None),
     company_id: Optional[str] = Query(None),
     role: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    sort: str = Query("name"),
     user: Dict[str, Any] = Depends(require_admin),
 ):
-    people, summary = db.get_admin_people_index(company_id=company_id, query=q, role=role)
+    try:
+        people, summary = db.get_admin_people_index(
+            company_id=company_id, query=q, role=role, limit=limit, cursor=cursor, sort=sort
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     log.info("admin_users list company_id=%s role=%s query=%s count=%s", company_id, role, q, summary.get("count"))
     db.log_audit(user["id"], "READ", "profile", None, None, {"query": q, "company_id": company_id, "role": role})
     return {"profiles": people, "summary": summary}
@@ -1792,10 +1844,21 @@ def list_people(
     company_id: Optional[str] = Query(None),
     role: Optional[str] = Query(None),
     query: Optional[str] = Query(None, alias="q"),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    sort: str = Query("name"),
     user: Dict[str, Any] = Depends(require_admin),
 ):
-    """Admin people list with company, role, and text filters. Returns admin-safe fields including company_name, status."""
-    people, summary = db.get_admin_people_index(company_id=company_id, query=query, role=role)
+    """
+    Admin people list with company, role, and text filters. Returns admin-safe fields including company_name, status.
+    Pass ``limit`` for keyset pages; ``summary.next_cursor`` continues the same sort.
+    """
+    try:
+        people, summary = db.get_admin_people_index(
+            company_id=company_id, query=query, role=role, limit=limit, cursor=cursor, sort=sort
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     db.log_audit(user["id"], "READ", "people", None, None, {"company_id": company_id, "role": role, "query": query})
     return {"people": people, "summary": summary}
 
@@ -1984,20 +2047,30 @@ def list_admin_assignments(
     employee_search: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     destination_country: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    sort: str = Query("-updated_at"),
     user: Dict[str, Any] = Depends(require_admin),
 ):
-    items = db.list_admin_assignments(
-        company_id=company_id,
-        employee_user_id=employee_user_id,
-        employee_search=employee_search,
-        status=status,
-        destination_country=destination_country,
-    )
+    """Admin assignment index. Pass ``limit`` for keyset pages; follow ``next_cursor`` with the same sort."""
+    try:
+        items, summary = db.get_admin_assignments_index(
+            company_id=company_id,
+            employee_user_id=employee_user_id,
+            employee_search=employee_search,
+            status=status,
+            destination_country=destination_country,
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     db.log_audit(
         user["id"], "READ", "admin_assignments", None, None,
         {"company_id": company_id, "status": status, "destination": destination_country},
     )
-    return {"assignments": items}
+    return {"assignments": items, "summary": summary, "next_cursor": summary.get("next_cursor")}
 
 
 @app.get("/api/admin/assignments/{assignment_id}")
@@ -2188,9 +2261,12 @@ def admin_create_assignment(
 
 
 @app.get("/api/admin/data-integrity/overview")
-def get_data_integrity_overview(user: Dict[str, Any] = Depends(require_admin)):
+def get_data_integrity_overview(
+    refresh: bool = Query(False, description="Bypass the short-lived metrics cache"),
+    user: Dict[str, Any] = Depends(require_admin),
+):
     """Admin: entity counts and orphan flags for data-integrity dashboard."""
-    data = db.get_data_integrity_overview()
+    data = db.get_data_integrity_overview(refresh=refresh)
     db.log_audit(user["id"], "READ", "data_integrity_overview", None, None, {})
     return data
 
@@ -2858,8 +2934,17 @@ def admin_purge_cases(request: AdminReasonRequest, user: Dict[str, Any] = Depend
         AssignmentStatus.AWAITING_INTAKE.value,
         AssignmentStatus.SUBMITTED.value,
     ]
-    stats = db.purge_inactive_cases(active_statuses)
-    db.log_audit(user["id"], "RESET", "assignment", None, request.reason, {"active_statuses": active_statuses, **stats})
+    dry_run = bool(payload.get("dry_run"))
+    batch_size = _payload_int(payload, "batch_size", 500)
+    max_batches = _payload_int(payload, "max_batches", None)
+    stats = db.purge_inactive_cases(
+        active_statuses,
+        batch_size=max(1, min(batch_size, _PURGE_MAX_BATCH_SIZE)),
+        max_batches=max_batches,
+        dry_run=dry_run,
+    )
+    action = "READ" if dry_run else "RESET"
+    db.log_audit(user["id"], action, "assignment", None, request.reason, {"active_statuses": active_statuses, **stats})
     return {"ok": True, "stats": stats}
 
 
@@ -2886,8 +2971,7 @@ def get_next_question(user: Dict[str, Any] = Depends(get_current_user)):
         profile = RelocationProfile(userId=effective["id"]).model_dump()
     
     # Get answered questions
-    answers = db.get_answers(effective["id"])
-    answered_question_ids = set(ans["question_id"] for ans in answers)
+    answered_question_ids = db.get_answered_question_ids(effective["id"])
     
     # Get next question from orchestrator
     response = orchestrator.get_next_question(profile, answered_question_ids)
@@ -2919,8 +3003,7 @@ def submit_answer(request: AnswerRequest, user: Dict[str, Any] = Depends(get_cur
     db.save_answer(effective["id"], request.questionId, request.answer, request.isUnknown)
     
     # Get next question
-    answers = db.get_answers(effective["id"])
-    answered_question_ids = set(ans["question_id"] for ans in answers)
+    answered_question_ids = db.get_answered_question_ids(effective["id"])
     next_response = orchestrator.get_next_question(profile, answered_question_ids)
     
     return {
@@ -5815,6 +5898,14 @@ def _hr_publish_policy_version(
         except Exception:
             pass
         updated = db.get_policy_version(policy_version_id) or {}
+        try:
+            from .services.employee_entitlement_materialization import refresh_materialized_views_on_publish
+
+            refresh_materialized_views_on_publish(
+                db, company_id=company_id, policy_id=policy_id, request_id=request_id
+            )
+        except Exception:
+            pass
     except Exception as exc:
         try:
             from .services.policy_pipeline_analytics import emit_policy_publish_failed
@@ -6459,8 +6550,12 @@ def _finalize_employee_policy_resolution(
     *,
     comparison_readiness_precalc: Optional[Dict[str, Any]] = None,
     telemetry: Optional[Dict[str, Any]] = None,
+    materialize_fingerprint: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Attach comparison_readiness / comparison_available for employee policy consumers."""
+    """
+    Attach comparison_readiness / comparison_available for employee policy consumers.
+    With materialize_fingerprint, a published result is also stored as the assignment's employee_policy view.
+    """
     from .services.policy_comparison_readiness import evaluate_version_comparison_readiness
 
     if not out.get("has_policy"):
@@ -6489,6 +6584,10 @@ def _finalize_employee_policy_resolution(
             )
         except Exception:
             pass
+    if materialize_fingerprint and out.get("assignment_id"):
+        from .services.employee_entitlement_materialization import VIEW_EMPLOYEE_POLICY, store_materialized_view
+
+        store_materialized_view(db, str(out["assignment_id"]), VIEW_EMPLOYEE_POLICY, out, materialize_fingerprint)
     _emit_employee_policy_telemetry(out, telemetry)
     return out
 
@@ -6605,6 +6704,36 @@ def _resolve_published_policy_for_employee(
         employee_profile = None
 
     candidates = collect_company_id_candidates_for_assignment(db, assignment, case)
+    fingerprint = None
+    if read_only:
+        from .services.employee_entitlement_materialization import (
+            VIEW_EMPLOYEE_POLICY,
+            load_materialized_view,
+            resolution_context_fingerprint,
+        )
+
+        fingerprint = resolution_context_fingerprint(assignment, case, profile, employee_profile, candidates)
+        materialized = load_materialized_view(db, assignment_id, VIEW_EMPLOYEE_POLICY, fingerprint, candidates)
+        if materialized is not None:
+            log.info(
+                "employee_policy materialized_hit request_id=%s assignment_id=%s policy_version_id=%s",
+                request_id,
+                assignment_id,
+                materialized.get("version_id"),
+            )
+            _emit_employee_policy_telemetry(
+                materialized,
+                {
+                    "request_id": request_id,
+                    "assignment_id": assignment_id,
+                    "case_id": case_id,
+                    "user_id": user.get("id"),
+                    "user_role": user.get("role"),
+                    "resolution_cache_hit": True,
+                },
+            )
+            return materialized
+
     pub = find_first_published_company_policy(db, candidates) if candidates else None
     if not pub:
         from .services.employee_policy_matrix_bridge import find_published_matrix_version, build_matrix_assignment_package
@@ -6765,6 +6894,7 @@ def _resolve_published_policy_for_employee(
                 "resolution_context": ctx,
             },
             comparison_readiness_precalc=readiness,
+            materialize_fingerprint=fingerprint,
             telemetry={
                 "request_id": request_id,
                 "assignment_id": assignment_id,
@@ -6893,6 +7023,7 @@ def _resolve_published_policy_for_employee(
             "resolution_context": ctx,
         },
         comparison_readiness_precalc=readiness,
+        materialize_fingerprint=fingerprint,
         telemetry={
             "request_id": request_id,
             "assignment_id": assignment_id,
@@ -7046,7 +7177,10 @@ def get_employee_assignment_entitlements(
     entitlement rows. Read-only; does not fabricate caps.
     """
     request_id = getattr(req.state, "request_id", None) or str(uuid.uuid4())
-    from .services.employee_entitlement_read_model import build_employee_entitlement_read_model
+    from .services.employee_entitlement_materialization import (
+        get_or_build_entitlements,
+        load_assignment_resolution_inputs,
+    )
     from .services.employee_entitlement_serializer import serialize_employee_entitlement_payload
 
     try:
@@ -7062,21 +7196,10 @@ def get_employee_assignment_entitlements(
         )
         raise HTTPException(status_code=403, detail="Assignment not accessible") from exc
 
-    case_id = assignment.get("case_id")
-    case = db.get_relocation_case(case_id) if case_id else None
-    profile = None
-    if case and case.get("profile_json"):
-        try:
-            profile = json.loads(case["profile_json"]) if isinstance(case["profile_json"], str) else case["profile_json"]
-        except Exception:
-            profile = None
-    try:
-        employee_profile = db.get_employee_profile(assignment_id)
-    except Exception:
-        employee_profile = None
+    case, profile, employee_profile = load_assignment_resolution_inputs(db, assignment_id, assignment)
 
     try:
-        raw = build_employee_entitlement_read_model(
+        raw = get_or_build_entitlements(
             db, assignment_id, assignment, case, profile, employee_profile
         )
         return serialize_employee_entitlement_payload(raw)
@@ -8963,7 +9086,7 @@ async def upload_policy_document(
         # Segment into clauses when we have raw text
         if result.get("raw_text") and result.get("processing_status") != "failed":
             try:
-                from .services.policy_document_clauses import segment_document_from_raw_text
+                from .services.policy_document_clauses import iter_document_clauses
                 policy_segment_ctx = {
                     "id": doc_id,
                     "document_id": doc_id,
@@ -8971,12 +9094,16 @@ async def upload_policy_document(
                     "extracted_metadata": result.get("extracted_metadata") or {},
                     "filename": filename,
                 }
-                clauses, seg_err = segment_document_from_raw_text(
+                # Stream clauses into batched inserts; keep existing clauses when nothing segments.
+                clause_stream = iter_document_clauses(
                     result["raw_text"], mime, data=content, policy_context=policy_segment_ctx
                 )
-                if not seg_err and clauses:
-                    db.upsert_policy_document_clauses(doc_id, clauses, request_id=request_id)
-                    log.info("request_id=%s policy_upload stage=segment ok clauses=%d", request_id, len(clauses))
+                first_clause = next(clause_stream, None)
+                if first_clause is not None:
+                    n_clauses = db.upsert_policy_document_clauses(
+                        doc_id, itertools.chain([first_clause], clause_stream), request_id=request_id
+                    )
+                    log.info("request_id=%s policy_upload stage=segment ok clauses=%d", request_id, n_clauses)
             except Exception as seg_exc:
                 log.warning("request_id=%s policy_upload stage=segment failed: %s", request_id, seg_exc)
     except Exception as exc:
@@ -9324,7 +9451,7 @@ async def reprocess_policy_document(
         # Re-segment clauses
         if result.get("raw_text") and result.get("processing_status") != "failed":
             try:
-                from .services.policy_document_clauses import segment_document_from_raw_text
+                from .services.policy_document_clauses import iter_document_clauses
                 policy_segment_ctx = {
                     "id": doc_id,
                     "document_id": doc_id,
@@ -9332,12 +9459,15 @@ async def reprocess_policy_document(
                     "extracted_metadata": result.get("extracted_metadata") or {},
                     "filename": doc.get("filename") or "",
                 }
-                clauses, seg_err = segment_document_from_raw_text(
+                clause_stream = iter_document_clauses(
                     result["raw_text"], doc.get("mime_type", ""), data=data, policy_context=policy_segment_ctx
                 )
-                if not seg_err and clauses:
-                    db.upsert_policy_document_clauses(doc_id, clauses, request_id=request_id)
-                    log.info("request_id=%s policy_document_reprocess segmented %d clauses", request_id, len(clauses))
+                first_clause = next(clause_stream, None)
+                if first_clause is not None:
+                    n_clauses = db.upsert_policy_document_clauses(
+                        doc_id, itertools.chain([first_clause], clause_stream), request_id=request_id
+                    )
+                    log.info("request_id=%s policy_document_reprocess segmented %d clauses", request_id, n_clauses)
             except Exception as seg_exc:
                 log.warning("request_id=%s policy_document_reprocess segmentation failed: %s", request_id, seg_exc)
     except Exception as exc:
@@ -10284,6 +10414,9 @@ def patch_benefit_rule(
             invalidate_comparison_readiness_cache(str(pv))
     except Exception:
         pass
+    from .services.employee_entitlement_materialization import invalidate_materialized_views_for_version
+
+    invalidate_materialized_views_for_version(db, rule.get("policy_version_id"))
     return {"benefit_rule": updated}
 
 
@@ -10345,6 +10478,9 @@ def patch_hr_benefit_rule_override(
         invalidate_comparison_readiness_cache(str(version_id))
     except Exception:
         pass
+    from .services.employee_entitlement_materialization import invalidate_materialized_views_for_version
+
+    invalidate_materialized_views_for_version(db, str(version_id))
     row = db.get_hr_benefit_rule_override(str(version_id), str(benefit_rule_id))
     return {"hr_override": row, "request_id": request_id}
 
@@ -10376,6 +10512,9 @@ def delete_hr_benefit_rule_override(
         invalidate_comparison_readiness_cache(str(version_id))
     except Exception:
         pass
+    from .services.employee_entitlement_materialization import invalidate_materialized_views_for_version
+
+    invalidate_materialized_views_for_version(db, str(version_id))
     return {"ok": True, "request_id": request_id}
 
 
@@ -10519,6 +10658,9 @@ def patch_exclusion(
     if not version or version.get("policy_id") != policy_id:
         raise HTTPException(status_code=404, detail="Exclusion not found")
     db.update_policy_exclusion(excl_id, description=body.get("description"), review_status=body.get("review_status"))
+    from .services.employee_entitlement_materialization import invalidate_materialized_views_for_version
+
+    invalidate_materialized_views_for_version(db, excl["policy_version_id"])
     with db.engine.connect() as conn:
         row = conn.execute(text("SELECT * FROM policy_exclusions WHERE id = :id"), {"id": excl_id}).fetchone()
     return {"exclusion": db._row_to_dict(row)}
@@ -10544,6 +10686,9 @@ def patch_condition(
     if not version or version.get("policy_id") != policy_id:
         raise HTTPException(status_code=404, detail="Condition not found")
     db.update_policy_rule_condition(cond_id, condition_value_json=body.get("condition_value_json"), review_status=body.get("review_status"))
+    from .services.employee_entitlement_materialization import invalidate_materialized_views_for_version
+
+    invalidate_materialized_views_for_version(db, cond["policy_version_id"])
     with db.engine.connect() as conn:
         row = conn.execute(text("SELECT * FROM policy_rule_conditions WHERE id = :id"), {"id": cond_id}).fetchone()
     d = db._row_to_dict(row)
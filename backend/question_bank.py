@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, FrozenSet, Iterable, List, Dict, Any, Mapping, Optional, Sequence, Tuple
 from .schemas import Question, QuestionOption
 
 
@@ -446,16 +448,60 @@ QUESTION_BANK: List[Question] = [
 ]
 
 
-def get_question_by_id(question_id: str) -> Question:
+QUESTIONS_BY_ID: Mapping[str, Question] = MappingProxyType({q.id: q for q in QUESTION_BANK})
+
+
+class QuestionIndex:
+    """
+    Ordered, immutable view of the question bank (minus skipped ids) with one bit per question.
+    The next unanswered question is the lowest clear bit of the answered mask, so the per-keystroke
+    intake endpoints do not walk or rebuild the bank.
+    """
+
+    def __init__(self, questions: Sequence[Question]) -> None:
+        self.questions: Tuple[Question, ...] = tuple(questions)
+        self._bits: Mapping[str, int] = MappingProxyType({q.id: 1 << i for i, q in enumerate(self.questions)})
+        self._all = (1 << len(self.questions)) - 1
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def answered_mask(self, answered_ids: Iterable[str]) -> int:
+        bits = self._bits
+        mask = 0
+        for qid in answered_ids:
+            mask |= bits.get(qid, 0)
+        return mask
+
+    def next_unanswered(
+        self, answered_ids: Iterable[str], accept: Optional[Callable[[Question], bool]] = None
+    ) -> Optional[Question]:
+        """First question in bank order that is not answered (and passes ``accept``), else None."""
+        open_bits = self._all & ~self.answered_mask(answered_ids)
+        while open_bits:
+            lowest = open_bits & -open_bits
+            question = self.questions[lowest.bit_length() - 1]
+            if accept is None or accept(question):
+                return question
+            open_bits ^= lowest
+        return None
+
+
+@lru_cache(maxsize=64)
+def _question_index(skip_ids: FrozenSet[str]) -> QuestionIndex:
+    return QuestionIndex([q for q in QUESTION_BANK if q.id not in skip_ids])
+
+
+def get_question_index(skip_ids: Optional[Iterable[str]] = None) -> QuestionIndex:
+    """Shared index for a skip set (built once per distinct set)."""
+    return _question_index(frozenset(skip_ids or ()))
+
+
+def get_question_by_id(question_id: str) -> Optional[Question]:
     """Get a question by its ID."""
-    for q in QUESTION_BANK:
-        if q.id == question_id:
-            return q
-    return None
+    return QUESTIONS_BY_ID.get(question_id)
 
 
-def get_all_questions(skip_ids: Optional[set] = None) -> List[Question]:
+def get_all_questions(skip_ids: Optional[set] = None) -> Sequence[Question]:
     """Get all questions, optionally skipping IDs for scenario logic."""
-    if not skip_ids:
-        return QUESTION_BANK
-    return [question for question in QUESTION_BANK if question.id not in skip_ids]
+    return get_question_index(skip_ids).questions
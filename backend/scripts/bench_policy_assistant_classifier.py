@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the policy assistant topic classifier.
+
+Runs the compiled scorer and the classifier entrypoints over every message in the QA regression
+corpus (backend/tests/test_policy_assistant_qa_regression.py) and prints per-call timings.
+
+Usage (from repo root):
+  PYTHONPATH=. python3 backend/scripts/bench_policy_assistant_classifier.py
+  PYTHONPATH=. python3 backend/scripts/bench_policy_assistant_classifier.py --rounds 2000 --json
+
+Memoization is cleared before the "cold" pass so it measures the single-scan scorer itself; the
+"warm" pass shows repeated scoring of the same message within a turn.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+_REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO not in sys.path:
+    sys.path.insert(0, _REPO)
+
+from backend.services.policy_assistant_classifier import (  # noqa: E402
+    _normalize_message,
+    _scan_topic_scores,
+    classify_policy_chat_message,
+    score_policy_assistant_topics,
+)
+from backend.services.policy_assistant_contract import PolicyAssistantRoleScope  # noqa: E402
+
+QA_REGRESSION_PATH = os.path.join(_REPO, "backend", "tests", "test_policy_assistant_qa_regression.py")
+
+
+def load_qa_regression_corpus(path: str = QA_REGRESSION_PATH) -> List[str]:
+    """User-style messages from the QA regression module (string literals, docstrings excluded)."""
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    docstrings = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            docstrings.add(id(node.value))
+    out: List[str] = []
+    seen = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Constant) or not isinstance(node.value, str):
+            continue
+        if id(node) in docstrings:
+            continue
+        text = node.value.strip()
+        if len(text) < 10 or " " not in text or text in seen:
+            continue
+        seen.add(text)
+        out.append(node.value)
+    return out
+
+
+def _time_per_call(fn: Callable[[str], object], corpus: List[str], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for msg in corpus:
+            fn(msg)
+    elapsed = time.perf_counter() - start
+    return elapsed / max(1, rounds * len(corpus)) * 1e6
+
+
+def run_benchmark(rounds: int) -> Dict[str, float]:
+    corpus = load_qa_regression_corpus()
+    norms = [_normalize_message(m) for m in corpus]
+
+    def _cold_scan(norm: str) -> object:
+        _scan_topic_scores.cache_clear()
+        return _scan_topic_scores(norm, False)
+
+    results: Dict[str, float] = {"corpus_size": float(len(corpus)), "rounds": float(rounds)}
+    results["scan_cold_us"] = _time_per_call(_cold_scan, norms, rounds)
+    _scan_topic_scores.cache_clear()
+    results["scan_warm_us"] = _time_per_call(lambda n: _scan_topic_scores(n, False), norms, rounds)
+    results["score_topics_us"] = _time_per_call(score_policy_assistant_topics, corpus, rounds)
+    results["classify_us"] = _time_per_call(
+        lambda m: classify_policy_chat_message(m, PolicyAssistantRoleScope.EMPLOYEE, None),
+        corpus,
+        rounds,
+    )
+    return results
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rounds", type=int, default=500, help="Passes over the corpus per measurement")
+    ap.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = ap.parse_args()
+
+    results = run_benchmark(max(1, args.rounds))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"corpus: {int(results['corpus_size'])} messages x {int(results['rounds'])} rounds")
+        for key in ("scan_cold_us", "scan_warm_us", "score_topics_us", "classify_us"):
+            print(f"  {key:<16} {results[key]:8.2f} us/call")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Per-stage benchmark for the policy ingestion / normalization pipeline.
+
+Runs intake → extract → segment → normalize → group → store → persist → resolve over the policy
+test fixtures and a synthetic multi-page DOCX policy, and reports median wall time, peak
+tracemalloc allocation and DB statement count per stage.
+
+Usage (from repo root):
+  PYTHONPATH=. python3 backend/scripts/bench_policy_pipeline.py --database-url sqlite:////tmp/bench.db
+  PYTHONPATH=. python3 backend/scripts/bench_policy_pipeline.py --rounds 5 --write-baseline policy-bench.json
+  PYTHONPATH=. python3 backend/scripts/bench_policy_pipeline.py --compare policy-bench.json
+  PYTHONPATH=. python3 backend/scripts/bench_policy_pipeline.py --no-db --pages 50
+
+``--no-db`` skips the store / persist / resolve stages. ``--compare`` exits with status 1 on regression.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+_REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO not in sys.path:
+    sys.path.insert(0, _REPO)
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--database-url", help="Override DATABASE_URL before the app modules are imported")
+    p.add_argument("--no-db", action="store_true", help="Only the in-memory stages")
+    p.add_argument("--pages", type=int, default=200, help="Synthetic policy pages (0 = fixtures only)")
+    p.add_argument("--rounds", type=int, default=3)
+    p.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    p.add_argument("--corpus", action="append", help="Corpus name to run (repeatable)")
+    p.add_argument("--write-baseline", metavar="PATH")
+    p.add_argument("--compare", metavar="PATH")
+    p.add_argument("--time-tolerance", type=float, default=0.25)
+    p.add_argument("--json", action="store_true")
+    args = p.parse_args(argv)
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    logging.basicConfig(level=logging.WARNING)
+
+    from backend.benchmarks.api import load_baseline, write_baseline
+    from backend.benchmarks.policy_pipeline import (
+        compare_policy_pipeline_reports,
+        default_corpora,
+        format_policy_pipeline_report,
+        run_policy_pipeline_benchmark,
+    )
+
+    db = None
+    if not args.no_db:
+        from backend.database import db
+
+    corpora = [c for c in default_corpora(args.pages) if not args.corpus or c.name in args.corpus]
+    report = run_policy_pipeline_benchmark(corpora, db=db, rounds=args.rounds, trace_memory=not args.no_memory)
+
+    regressions = None
+    if args.compare:
+        regressions = compare_policy_pipeline_reports(
+            report, load_baseline(args.compare), time_tolerance=args.time_tolerance
+        )
+        report["regressions"] = regressions
+    if args.write_baseline:
+        write_baseline(report, args.write_baseline)
+        print(f"baseline written to {args.write_baseline}", file=sys.stderr)
+
+    print(json.dumps(report, indent=2) if args.json else format_policy_pipeline_report(report, regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,12 @@ Usage (from repo root):
   PYTHONPATH=. python backend/scripts/reconcile_identity_data.py
   PYTHONPATH=. python backend/scripts/reconcile_identity_data.py --apply
   PYTHONPATH=. python backend/scripts/reconcile_identity_data.py --json-out /tmp/identity-audit.json
+  PYTHONPATH=. python backend/scripts/reconcile_identity_data.py --stream-jsonl /tmp/identity-audit.jsonl [--apply]
+  PYTHONPATH=. python backend/scripts/reconcile_identity_data.py --stream-jsonl /tmp/identity-audit.jsonl --apply --resume
+
+Streaming mode (--stream-jsonl) pages through tables with keyset pagination, writes one JSON
+line per finding, and applies fixes in batches (one transaction each) with a checkpoint file
+next to the report (<path>.checkpoint.json) so an interrupted --apply can be resumed.
 
 Uses DATABASE_URL from the environment (see backend/db_config.py). Default is dry-run only.
 """
@@ -25,7 +31,15 @@ os.chdir(_REPO_ROOT)
 os.environ.setdefault("DISABLE_DEMO_RESEED", "true")
 
 from backend.database import Database  # noqa: E402
-from backend.services.identity_data_reconciliation import apply_safe_fixes, audit_identity_data  # noqa: E402
+from backend.services.identity_data_reconciliation import (  # noqa: E402
+    DEFAULT_FIX_BATCH_SIZE,
+    DEFAULT_STREAM_PAGE_SIZE,
+    apply_safe_fixes,
+    apply_safe_fixes_batched,
+    audit_identity_data,
+    iter_auto_fixes_from_jsonl,
+    write_identity_audit_jsonl,
+)
 
 
 def _print_counts(title: str, counts: dict) -> None:
@@ -54,9 +68,35 @@ def main() -> int:
         default=20,
         help="Max manual-review rows to print to stdout (full list still in JSON if --json-out)",
     )
+    parser.add_argument(
+        "--stream-jsonl",
+        type=str,
+        default="",
+        help="Streaming mode: write findings incrementally as JSON lines to this path and apply fixes in batches",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_STREAM_PAGE_SIZE,
+        help="Streaming mode: rows per keyset page",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_FIX_BATCH_SIZE,
+        help="Streaming mode: fixes per committed batch",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Streaming mode: reuse the existing JSONL report and continue from its checkpoint",
+    )
     args = parser.parse_args()
 
     db = Database()
+    if args.stream_jsonl:
+        return _main_streaming(db, args)
+
     report = audit_identity_data(db.engine)
     _print_counts("Issue counts (audit)", report.counts)
 
@@ -96,5 +136,41 @@ def main() -> int:
     return 0
 
 
+def _main_streaming(db: Database, args: argparse.Namespace) -> int:
+    path = os.path.abspath(args.stream_jsonl)
+    checkpoint = path + ".checkpoint.json"
+    dry_run = not args.apply
+
+    if args.resume:
+        if not os.path.exists(path):
+            print(f"--resume: report {path} does not exist")
+            return 1
+        print(f"Resuming from existing report {path}")
+    else:
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        with open(path, "w", encoding="utf-8") as f:
+            counts = write_identity_audit_jsonl(db.engine, f, page_size=max(1, args.page_size))
+        _print_counts("Issue counts (streaming audit)", counts)
+        print(f"\nWrote JSONL report to {path}")
+
+    def _progress(done: int, applied: dict) -> None:
+        print(f"  ... {done} fixes processed")
+
+    with open(path, "r", encoding="utf-8") as f:
+        applied = apply_safe_fixes_batched(
+            db.engine,
+            iter_auto_fixes_from_jsonl(f),
+            dry_run=dry_run,
+            batch_size=max(1, args.batch_size),
+            checkpoint_path=checkpoint,
+            progress=_progress,
+        )
+    _print_counts("Auto-fix actions " + ("(dry-run, rolled back)" if dry_run else "(committed)"), applied)
+    if not dry_run:
+        print(f"\nCheckpoint: {checkpoint}")
+    return 0
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Synthetic multi-tenant benchmark for the HR / employee API surface.
+
+Seeds N companies × M assignments × K messages / milestones / policy versions into the database
+``DATABASE_URL`` points at (local SQLite by default, or a local Postgres), then drives the hot
+endpoints and prints p50/p95/p99 latency and per-request query counts.
+
+Usage (from repo root):
+  PYTHONPATH=. python3 backend/scripts/run_api_benchmark.py --companies 5 --assignments 50
+  PYTHONPATH=. python3 backend/scripts/run_api_benchmark.py --write-baseline bench-baseline.json
+  PYTHONPATH=. python3 backend/scripts/run_api_benchmark.py --compare bench-baseline.json
+
+By default requests run in-process through FastAPI's TestClient. ``--base-url`` sends them with httpx
+to a running server instead (it must use the same database the seed writes to). ``--compare`` exits
+with status 1 when any endpoint regresses against the baseline.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+_REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO not in sys.path:
+    sys.path.insert(0, _REPO)
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--database-url", help="Override DATABASE_URL before the app is imported")
+    p.add_argument("--base-url", help="Benchmark a running server (httpx) instead of the in-process TestClient")
+    p.add_argument("--companies", type=int, default=3)
+    p.add_argument("--assignments", type=int, default=20, help="Assignments per company")
+    p.add_argument("--messages", type=int, default=5, help="Messages per assignment")
+    p.add_argument("--milestones", type=int, default=4, help="Milestones per assignment")
+    p.add_argument("--policy-versions", type=int, default=3, help="Policy versions per company")
+    p.add_argument("--rounds", type=int, default=20, help="Measured requests per endpoint per company")
+    p.add_argument("--warmup", type=int, default=2)
+    p.add_argument("--only", action="append", help="Scenario name to run (repeatable)")
+    p.add_argument("--write-baseline", metavar="PATH")
+    p.add_argument("--compare", metavar="PATH", help="Baseline JSON to compare against")
+    p.add_argument("--latency-tolerance", type=float, default=0.25, help="Allowed relative p95 increase")
+    p.add_argument("--json", action="store_true", help="Print the report as JSON")
+    p.add_argument("--verbose", action="store_true", help="Keep per-request access logs")
+    args = p.parse_args(argv)
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    from backend.benchmarks.api import (
+        DEFAULT_SCENARIOS,
+        compare_to_baseline,
+        format_report,
+        load_baseline,
+        run_api_benchmark,
+        write_baseline,
+    )
+    from backend.benchmarks.seed import SeedConfig, seed_synthetic_tenants
+    from backend.database import db
+
+    manifest = seed_synthetic_tenants(
+        db,
+        SeedConfig(
+            companies=args.companies,
+            assignments_per_company=args.assignments,
+            messages_per_assignment=args.messages,
+            milestones_per_assignment=args.milestones,
+            policy_versions_per_company=args.policy_versions,
+        ),
+    )
+    print(f"seeded run_id={manifest.run_id} in {manifest.seconds}s", file=sys.stderr)
+
+    scenarios = [s for s in DEFAULT_SCENARIOS if not args.only or s.name in args.only]
+    if args.base_url:
+        import httpx
+
+        client = httpx.Client(base_url=args.base_url, timeout=60.0)
+    else:
+        from fastapi.testclient import TestClient
+
+        from backend.main import app
+
+        client = TestClient(app)
+    if not args.verbose:
+        for name in ("", "httpx", "backend"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+    with client:
+        report = run_api_benchmark(client, manifest, rounds=args.rounds, warmup=args.warmup, scenarios=scenarios)
+
+    regressions = None
+    if args.compare:
+        regressions = compare_to_baseline(report, load_baseline(args.compare), latency_tolerance=args.latency_tolerance)
+        report["regressions"] = regressions
+    if args.write_baseline:
+        write_baseline(report, args.write_baseline)
+        print(f"baseline written to {args.write_baseline}", file=sys.stderr)
+
+    print(json.dumps(report, indent=2, sort_keys=True) if args.json else format_report(report, regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,34 @@
 """
 Observability Analytics Service — emit structured events for workflow, recommendations, and RFQ.
 Events are logged and optionally persisted to analytics_events table.
+
+emit_event only appends to a bounded in-process buffer; a background worker logs and inserts the
+events in batches when the buffer reaches ANALYTICS_BATCH_SIZE or every ANALYTICS_FLUSH_SECONDS.
+When the buffer is full, new events are dropped and counted rather than blocking the request.
+The app lifespan drains the buffer on shutdown (atexit covers scripts).
 """
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import os
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 log = logging.getLogger(__name__)
 
+# Seconds between background flushes; <= 0 writes every event inline (previous behaviour).
+FLUSH_INTERVAL_SECONDS = float(os.getenv("ANALYTICS_FLUSH_SECONDS", "2.0"))
+BATCH_SIZE = int(os.getenv("ANALYTICS_BATCH_SIZE", "200"))
+MAX_BUFFERED_EVENTS = int(os.getenv("ANALYTICS_MAX_BUFFERED", "10000"))
+
+# (event_name, payload, created_at)
+BufferedEvent = Tuple[str, Dict[str, Any], str]
+BatchSink = Callable[[List[BufferedEvent]], None]
+
 # Canonical event names for observability
 EVENT_CASE_CREATED = "case_created"
 EVENT_SERVICES_SELECTED = "services_selected"
@@ -85,10 +103,112 @@ def emit_event(
     if extra:
         payload["extra"] = extra
 
-    log.info("analytics event=%s %s", event_name, json.dumps({k: v for k, v in payload.items() if k != "event"}))
+    event_buffer.put(event_name, payload)
+
+
+def _persist_batch(events: List[BufferedEvent]) -> None:
+    """Default sink: one INFO line per event, then one batched INSERT into analytics_events."""
+    for event_name, payload, _created_at in events:
+        log.info("analytics event=%s %s", event_name, json.dumps({k: v for k, v in payload.items() if k != "event"}, default=str))
+    from ..database import db
+
+    db.insert_analytics_events(events)
+
+
+class AnalyticsEventBuffer:
+    """Bounded FIFO of analytics events, written in batches by one background thread."""
+
+    def __init__(
+        self,
+        sink: BatchSink,
+        *,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        batch_size: int = BATCH_SIZE,
+        max_events: int = MAX_BUFFERED_EVENTS,
+    ) -> None:
+        self._sink = sink
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+        self.max_events = max(1, max_events)
+        self._events: Deque[BufferedEvent] = deque()
+        self._guard = threading.Lock()
+        # Held while a batch is taken and written, so flush() and the worker never write the same event.
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {"written": 0, "dropped": 0, "failed": 0, "batches": 0}
+
+    def put(self, event_name: str, payload: Dict[str, Any]) -> bool:
+        """Queue one event; False when it was dropped because the buffer is full."""
+        item: BufferedEvent = (event_name, payload, datetime.utcnow().isoformat())
+        inline = full_batch = False
+        with self._guard:
+            if self.flush_interval <= 0 or self._closed:
+                inline = True
+            elif len(self._events) >= self.max_events:
+                self._stats["dropped"] += 1
+                return False
+            else:
+                self._events.append(item)
+                full_batch = len(self._events) >= self.batch_size
+                if self._worker is None:
+                    self._start_worker()
+        if inline:
+            self._write([item])
+        elif full_batch:
+            self._wake.set()
+        return True
+
+    def flush(self) -> int:
+        """Write everything buffered now, in batches. Returns the number of events taken."""
+        taken = 0
+        while True:
+            with self._write_lock:
+                with self._guard:
+                    batch = [self._events.popleft() for _ in range(min(self.batch_size, len(self._events)))]
+                if not batch:
+                    return taken
+                taken += len(batch)
+                self._write(batch)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the worker and drain the buffer; later events are written inline."""
+        with self._guard:
+            self._closed = True
+            worker = self._worker
+        self._wake.set()
+        if worker is not None:
+            worker.join(timeout)
+        self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        with self._guard:
+            return {**self._stats, "buffered": len(self._events), "max_events": self.max_events}
+
+    def _start_worker(self) -> None:
+        # Called with self._guard held.
+        self._worker = threading.Thread(target=self._run, name="analytics-event-buffer", daemon=True)
+        self._worker.start()
+        atexit.register(self.shutdown)
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def _write(self, batch: List[BufferedEvent]) -> None:
+        try:
+            self._sink(batch)
+        except Exception as e:
+            with self._guard:
+                self._stats["failed"] += len(batch)
+            log.debug("analytics_event batch persist failed (non-fatal) size=%s: %s", len(batch), e)
+            return
+        with self._guard:
+            self._stats["written"] += len(batch)
+            self._stats["batches"] += 1
+
 
-    try:
-        from ..database import db
-        db.insert_analytics_event(event_name, payload)
-    except Exception as e:
-        log.debug("analytics_event persist failed (non-fatal): %s", e)
+event_buffer = AnalyticsEventBuffer(_persist_batch)
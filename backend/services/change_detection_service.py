@@ -7,7 +7,7 @@ from __future__ import annotations
 import hashlib
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from .supabase_client import get_supabase_admin_client
 
@@ -28,66 +28,186 @@ def _normalized_content_hash(text: str) -> str:
     return hashlib.sha256(_normalize_text(text).encode("utf-8", errors="replace")).hexdigest()
 
 
-def _find_previous_document(
-    source_name: str,
-    source_url: str,
-    exclude_crawl_run_id: Optional[str] = None,
-) -> Optional[Dict[str, Any]]:
-    """Find most recent document for same source+url from earlier runs."""
-    supabase = _get_supabase()
-    url = (source_url or "").strip()
-    q = supabase.table("crawled_source_documents").select(
-        "id, content_hash, page_title, created_at, crawl_run_id, final_url, source_url"
-    ).eq("source_name", source_name)
-    if exclude_crawl_run_id:
-        q = q.neq("crawl_run_id", exclude_crawl_run_id)
-    r = q.order("created_at", desc=True).limit(20).execute()
-    for row in (r.data or []):
-        if row.get("crawl_run_id") == exclude_crawl_run_id:
-            continue
-        doc_url = (row.get("final_url") or row.get("source_url") or "").strip()
-        if doc_url == url or (not url and not doc_url):
-            return row
-    return None
+# Shingle width (in words) and signature size for MinHash similarity.
+_SHINGLE_SIZE = 4
+_MINHASH_PERMUTATIONS = 64
+_MINHASH_PRIME = (1 << 61) - 1
+_MINHASH_MAX = (1 << 32) - 1
+# change_score at or above this is a significant change (score = 1 - similarity).
+_SIGNIFICANT_CHANGE_THRESHOLD = 0.25
+# Added to the text-based score when the (normalized) title changed; below the threshold on its own,
+# so a retitled page with the same body is a minor change.
+_TITLE_CHANGE_SCORE = 0.1
+# Rows scanned per run document when looking up previous versions.
+_PREVIOUS_SCAN_PER_DOC = 20
+# PostgREST truncates responses at max-rows (1000 by default): reads are paged below it and
+# in_() lists are chunked so URLs stay short.
+_READ_PAGE_SIZE = 1000
+_IN_CHUNK_SIZE = 100
 
 
-def run_change_detection_for_crawl_run(
-    crawl_run_id: Optional[str],
-    job_run_id: Optional[str] = None,
-) -> Dict[str, Any]:
+def _minhash_coefficients() -> List[Tuple[int, int]]:
+    coeffs: List[Tuple[int, int]] = []
+    for i in range(_MINHASH_PERMUTATIONS):
+        digest = hashlib.blake2b(f"minhash:{i}".encode("ascii"), digest_size=16).digest()
+        a = int.from_bytes(digest[:8], "big") % (_MINHASH_PRIME - 1) + 1
+        b = int.from_bytes(digest[8:], "big") % _MINHASH_PRIME
+        coeffs.append((a, b))
+    return coeffs
+
+
+_MINHASH_COEFFS = _minhash_coefficients()
+
+
+def _shingles(text: str) -> Set[int]:
+    """Word shingles of the normalized text, hashed to 32-bit ints."""
+    words = _normalize_text(text).split()
+    if not words:
+        return set()
+    if len(words) < _SHINGLE_SIZE:
+        grams = [" ".join(words)]
+    else:
+        grams = [" ".join(words[i:i + _SHINGLE_SIZE]) for i in range(len(words) - _SHINGLE_SIZE + 1)]
+    return {
+        int.from_bytes(hashlib.blake2b(g.encode("utf-8", errors="replace"), digest_size=4).digest(), "big")
+        for g in grams
+    }
+
+
+def _minhash_signature(text: str) -> Optional[List[int]]:
+    """MinHash signature over word shingles; None when there is no text."""
+    shingles = _shingles(text)
+    if not shingles:
+        return None
+    return [
+        min(((a * x + b) % _MINHASH_PRIME) & _MINHASH_MAX for x in shingles)
+        for a, b in _MINHASH_COEFFS
+    ]
+
+
+def _estimate_similarity(a: Optional[List[int]], b: Optional[List[int]]) -> Optional[float]:
+    """Estimated Jaccard similarity of two signatures (0-1), or None if either is missing."""
+    if not a or not b:
+        return None
+    same = sum(1 for x, y in zip(a, b) if x == y)
+    return round(same / len(a), 4)
+
+
+def _doc_url(doc: Dict[str, Any]) -> str:
+    return (doc.get("final_url") or doc.get("source_url") or "").strip()
+
+
+def _chunks(values: Sequence[Any], size: int = _IN_CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def _paged_rows(build_query: Callable[[], Any], max_rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
     """
-    Run change detection for documents in a crawl run.
-    Compares each document to previous version (same source+url).
-    Writes document_change_events.
+    Rows of an ordered query, one range() page at a time, until a short page (or max_rows).
+    build_query must return a fresh, deterministically ordered query builder on each call.
     """
-    if not crawl_run_id:
-        return {"documents_processed": 0, "changes": [], "error": "No crawl_run_id"}
+    offset = 0
+    while max_rows is None or offset < max_rows:
+        end = offset + _READ_PAGE_SIZE - 1
+        if max_rows is not None:
+            end = min(end, max_rows - 1)
+        rows = build_query().range(offset, end).execute().data or []
+        yield from rows
+        if len(rows) < end - offset + 1:
+            return
+        offset = end + 1
+
 
+def _find_previous_documents(
+    docs: List[Dict[str, Any]],
+    exclude_crawl_run_id: str,
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Most recent earlier document per (source_name, url) for all docs of a run.
+    Sources are looked up in chunks; each chunk is paged newest first and stops once every wanted
+    key is found or _PREVIOUS_SCAN_PER_DOC rows per document have been scanned.
+    """
+    wanted_by_source: Dict[str, Set[str]] = {}
+    for d in docs:
+        wanted_by_source.setdefault(d.get("source_name") or "", set()).add(_doc_url(d))
+    if not wanted_by_source:
+        return {}
     supabase = _get_supabase()
-    docs_r = (
-        supabase.table("crawled_source_documents")
-        .select("id, source_name, source_url, final_url, content_hash, page_title, country_code, city_name")
-        .eq("crawl_run_id", crawl_run_id)
-        .execute()
-    )
-    docs = docs_r.data or []
+    previous: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for source_names in _chunks(sorted(wanted_by_source)):
+        wanted = {(src, url) for src in source_names for url in wanted_by_source[src]}
 
-    crawl_run = supabase.table("crawl_runs").select("id").eq("id", crawl_run_id).limit(1).execute()
-    run_exists = (crawl_run.data or [{}])[0].get("id") == crawl_run_id
-    if not run_exists:
-        return {"documents_processed": 0, "changes": [], "error": "Crawl run not found"}
+        def build(names=list(source_names)):
+            return (
+                supabase.table("crawled_source_documents")
+                .select("id, source_name, content_hash, page_title, created_at, crawl_run_id, final_url, source_url")
+                .in_("source_name", names)
+                .neq("crawl_run_id", exclude_crawl_run_id)
+                .order("created_at", desc=True)
+                .order("id")
+            )
 
-    changes: List[Dict[str, Any]] = []
+        for row in _paged_rows(build, max_rows=len(wanted) * _PREVIOUS_SCAN_PER_DOC):
+            if row.get("crawl_run_id") == exclude_crawl_run_id:
+                continue
+            key = (row.get("source_name") or "", _doc_url(row))
+            if key in wanted and key not in previous:
+                previous[key] = row
+                wanted.discard(key)
+                if not wanted:
+                    break
+    return previous
+
+
+def _load_document_texts(document_ids: List[str]) -> Dict[str, str]:
+    """Concatenated chunk text per document id (ids chunked, chunks paged in order)."""
+    ids = sorted({i for i in document_ids if i})
+    if not ids:
+        return {}
+    supabase = _get_supabase()
+    parts: Dict[str, List[str]] = {}
+    for id_chunk in _chunks(ids):
+        def build(chunk=list(id_chunk)):
+            return (
+                supabase.table("crawled_source_chunks")
+                .select("document_id, chunk_index, chunk_text")
+                .in_("document_id", chunk)
+                .order("document_id")
+                .order("chunk_index")
+            )
+
+        for row in _paged_rows(build):
+            parts.setdefault(row.get("document_id"), []).append(row.get("chunk_text") or "")
+    return {doc_id: "\n".join(chunks) for doc_id, chunks in parts.items()}
+
+
+def classify_document_changes(
+    docs: List[Dict[str, Any]],
+    previous_by_key: Dict[Tuple[str, str], Dict[str, Any]],
+    texts_by_doc_id: Dict[str, str],
+    *,
+    crawl_run_id: Optional[str] = None,
+    job_run_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Build document_change_events rows for a run in memory.
+    change_score is 1 - estimated text similarity when both versions have text, plus
+    _TITLE_CHANGE_SCORE when the normalized title changed; otherwise it falls back to hash and
+    title comparison.
+    """
+    events: List[Dict[str, Any]] = []
     for doc in docs:
         source_name = doc.get("source_name", "")
-        url = doc.get("final_url") or doc.get("source_url", "")
+        url = _doc_url(doc)
         new_hash = doc.get("content_hash") or ""
-        prev = _find_previous_document(source_name, url, exclude_crawl_run_id=crawl_run_id)
+        prev = previous_by_key.get((source_name or "", url))
 
         change_type = "new"
         prev_hash = None
         prev_doc_id = None
         change_score = 1.0
+        diff_summary: Dict[str, Any] = {}
 
         if prev:
             prev_doc_id = prev.get("id")
@@ -96,13 +216,33 @@ def run_change_detection_for_crawl_run(
                 change_type = "unchanged"
                 change_score = 0.0
             else:
-                change_type = "updated"
-                change_score = 0.5
-                if prev.get("page_title") != doc.get("page_title"):
-                    change_score = 0.8
-                change_type = "significant_change" if change_score >= 0.5 else "minor_change"
+                title_changed = _normalize_text(prev.get("page_title") or "") != _normalize_text(
+                    doc.get("page_title") or ""
+                )
+                new_text = texts_by_doc_id.get(doc.get("id"))
+                old_text = texts_by_doc_id.get(prev_doc_id)
+                similarity = _estimate_similarity(
+                    _minhash_signature(new_text or ""),
+                    _minhash_signature(old_text or ""),
+                )
+                if similarity is None:
+                    change_score = 0.8 if title_changed else 0.5
+                else:
+                    change_score = 1.0 - similarity
+                    if title_changed:
+                        change_score += _TITLE_CHANGE_SCORE
+                    change_score = round(min(change_score, 1.0), 4)
+                    if new_text is not None and old_text is not None:
+                        diff_summary["text_unchanged"] = (
+                            _normalized_content_hash(new_text) == _normalized_content_hash(old_text)
+                        )
+                diff_summary["similarity"] = similarity
+                diff_summary["title_changed"] = title_changed
+                change_type = (
+                    "significant_change" if change_score >= _SIGNIFICANT_CHANGE_THRESHOLD else "minor_change"
+                )
 
-        event = {
+        events.append({
             "job_run_id": job_run_id,
             "crawl_run_id": crawl_run_id,
             "source_document_id": doc.get("id"),
@@ -115,12 +255,65 @@ def run_change_detection_for_crawl_run(
             "new_content_hash": new_hash,
             "change_type": change_type,
             "change_score": change_score,
-        }
+            "diff_summary_json": diff_summary,
+        })
+    return events
+
+
+def run_change_detection_for_crawl_run(
+    crawl_run_id: Optional[str],
+    job_run_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Run change detection for documents in a crawl run.
+    Looks up previous versions (same source+url) and chunk text for the whole run in bulk,
+    classifies in memory, then writes document_change_events in one insert.
+    """
+    if not crawl_run_id:
+        return {"documents_processed": 0, "changes": [], "error": "No crawl_run_id"}
+
+    supabase = _get_supabase()
+    docs = list(
+        _paged_rows(
+            lambda: supabase.table("crawled_source_documents")
+            .select("id, source_name, source_url, final_url, content_hash, page_title, country_code, city_name")
+            .eq("crawl_run_id", crawl_run_id)
+            .order("id")
+        )
+    )
+
+    crawl_run = supabase.table("crawl_runs").select("id").eq("id", crawl_run_id).limit(1).execute()
+    run_exists = (crawl_run.data or [{}])[0].get("id") == crawl_run_id
+    if not run_exists:
+        return {"documents_processed": 0, "changes": [], "error": "Crawl run not found"}
+
+    previous_by_key = _find_previous_documents(docs, crawl_run_id) if docs else {}
+    # Only fetch text where a hash differs; that is the only case similarity is needed for.
+    text_ids: List[str] = []
+    for doc in docs:
+        prev = previous_by_key.get((doc.get("source_name") or "", _doc_url(doc)))
+        if prev and prev.get("content_hash") != (doc.get("content_hash") or ""):
+            text_ids.extend([doc.get("id"), prev.get("id")])
+    try:
+        texts_by_doc_id = _load_document_texts(text_ids)
+    except Exception as e:
+        log.warning("Failed to load chunk text for similarity: %s", e)
+        texts_by_doc_id = {}
+
+    events = classify_document_changes(
+        docs,
+        previous_by_key,
+        texts_by_doc_id,
+        crawl_run_id=crawl_run_id,
+        job_run_id=job_run_id,
+    )
+    changes: List[Dict[str, Any]] = []
+    if events:
         try:
-            supabase.table("document_change_events").insert(event).execute()
-            changes.append(event)
+            supabase.table("document_change_events").insert(events).execute()
+            changes = events
         except Exception as e:
-            log.warning("Failed to write change event: %s", e)
+            log.warning("Failed to write %d change events: %s", len(events), e)
 
     return {
         "documents_processed": len(docs),
@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from .supabase_client import get_supabase_admin_client
+from .user_display_names import resolve_user_display_names
 
 log = logging.getLogger(__name__)
 
@@ -194,38 +195,40 @@ def list_comments(thread_id: str, actor_user_id: str) -> List[Dict[str, Any]]:
     )
     comments = r.data or []
 
-    # Fetch mentions and author display names per comment
-    for c in comments:
+    _enrich_comments(comments, actor_user_id, supabase)
+    return comments
+
+
+def _enrich_comments(comments: List[Dict[str, Any]], actor_user_id: str, supabase: Any) -> None:
+    """Mentions (one in_ query) and author display names (one bulk lookup) for a page of comments."""
+    if not comments:
+        return
+    mentions_by_comment: Dict[str, List[str]] = {}
+    ids = [c["id"] for c in comments if c.get("id")]
+    if ids:
         ments = (
             supabase.table("collaboration_comment_mentions")
-            .select("mentioned_user_id")
-            .eq("comment_id", c["id"])
+            .select("comment_id, mentioned_user_id")
+            .in_("comment_id", ids)
             .execute()
         ).data or []
-        c["mentions"] = [m["mentioned_user_id"] for m in ments]
+        for m in ments:
+            mentions_by_comment.setdefault(m["comment_id"], []).append(m["mentioned_user_id"])
+
+    names = resolve_user_display_names(c.get("author_user_id") for c in comments)
+    for c in comments:
+        c["mentions"] = mentions_by_comment.get(c.get("id"), [])
         c["can_edit"] = c.get("author_user_id") == actor_user_id
         c["can_delete"] = c.get("author_user_id") == actor_user_id
         aid = c.get("author_user_id")
         if aid:
-            try:
-                from ..database import db
-                profile = db.get_profile_record(aid)
-                if profile:
-                    c["author_display_name"] = profile.get("full_name") or profile.get("email") or aid[:8] + "…"
-                    c["author_email"] = profile.get("email")
-                else:
-                    user = db.get_user_by_id(aid)
-                    c["author_display_name"] = (user and (user.get("email") or user.get("name"))) or aid[:8] + "…"
-                    c["author_email"] = user.get("email") if user else None
-            except Exception:
-                c["author_display_name"] = aid[:8] + "…"
-                c["author_email"] = None
+            entry = names.get(str(aid)) or {}
+            c["author_display_name"] = entry.get("display_name") or aid[:8] + "…"
+            c["author_email"] = entry.get("email")
         else:
             c["author_display_name"] = "Unknown"
             c["author_email"] = None
 
-    return comments
-
 
 def create_comment(
     thread_id: str,
@@ -569,30 +572,29 @@ def list_all_threads(
     q = q.order("last_comment_at", desc=True, nullsfirst=False)
     q = q.range(offset, offset + limit - 1)
     rows = q.execute().data or []
-    out = []
-    for t in rows:
-        # Resolve participants
-        part_rows = (
+    part_by_thread: Dict[str, List[Dict[str, Any]]] = {}
+    thread_ids = [t["id"] for t in rows if t.get("id")]
+    if thread_ids:
+        part_rows_all = (
             supabase.table("collaboration_thread_participants")
-            .select("user_id, role_in_thread")
-            .eq("thread_id", t["id"])
+            .select("thread_id, user_id, role_in_thread")
+            .in_("thread_id", thread_ids)
             .execute()
         ).data or []
+        for p in part_rows_all:
+            part_by_thread.setdefault(p["thread_id"], []).append(p)
+    names = resolve_user_display_names(
+        p["user_id"] for parts in part_by_thread.values() for p in parts[:5] if p.get("user_id")
+    )
+    out = []
+    for t in rows:
+        part_rows = part_by_thread.get(t["id"], [])
         if participant_user_id and not any(p.get("user_id") == participant_user_id for p in part_rows):
             continue
         participant_ids = [p["user_id"] for p in part_rows]
-        participant_names = []
-        for pid in participant_ids[:5]:
-            try:
-                from ..database import db
-                prof = db.get_profile_record(pid)
-                if prof:
-                    participant_names.append(prof.get("full_name") or prof.get("email") or pid[:8] + "…")
-                else:
-                    u = db.get_user_by_id(pid)
-                    participant_names.append((u and (u.get("email") or u.get("name"))) or pid[:8] + "…")
-            except Exception:
-                participant_names.append(pid[:8] + "…")
+        participant_names = [
+            (names.get(str(pid)) or {}).get("display_name") or pid[:8] + "…" for pid in participant_ids[:5]
+        ]
         last_body = None
         if t.get("last_comment_at"):
             comm = (
@@ -322,84 +322,12 @@ def run_crawl_for_scope(
 def process_due_schedules(user_id: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Process all due schedules. Creates job runs, executes crawls, runs change detection.
-    Call from cron or manually. Prevents concurrent runs per schedule via lock.
+    Call from cron or manually. One batch of CrawlSchedulerWorker: SQL leases (one active run per
+    schedule), bounded concurrency, one freshness refresh for the whole batch.
     """
-    due = get_due_schedules()
-    results = []
-    for s in due:
-        schedule_id = s["id"]
-        scope = {
-            "source_scope_type": s.get("source_scope_type"),
-            "source_scope_ref": s.get("source_scope_ref"),
-            "country_code": s.get("country_code"),
-            "city_name": s.get("city_name"),
-            "content_domain": s.get("content_domain"),
-        }
-        job = create_job_run(
-            job_type="crawl_source" if s.get("source_scope_type") == "source" else "crawl_country_city_scope",
-            trigger_type="scheduled",
-            schedule_id=schedule_id,
-            scope=scope,
-            requested_by=user_id,
-        )
-        if not acquire_job_lock(job["id"]):
-            results.append({"schedule_id": schedule_id, "status": "skipped", "reason": "lock_failed"})
-            continue
+    from .crawl_scheduler_worker import CrawlSchedulerWorker
 
-        try:
-            report = run_crawl_for_scope(
-                source_name=s.get("source_scope_ref") if s.get("source_scope_type") == "source" else None,
-                country_code=s.get("country_code"),
-                city_name=s.get("city_name"),
-                content_domain=s.get("content_domain"),
-            )
-            if "error" in report:
-                complete_job_run(
-                    job["id"],
-                    status="failed",
-                    error_summary=report.get("error"),
-                )
-                update_schedule_after_run(schedule_id, False)
-                results.append({"schedule_id": schedule_id, "status": "failed", "error": report["error"]})
-                continue
-
-            complete_job_run(
-                job["id"],
-                status="succeeded" if not report.get("errors") else "partial_success",
-                crawl_run_id=report.get("run_id"),
-                documents_fetched=report.get("documents_fetched", 0),
-                chunks_created=report.get("chunks_created", 0),
-                staged_resources=report.get("resources_staged", 0),
-                staged_events=report.get("events_staged", 0),
-                errors=len(report.get("errors", [])),
-                warnings=len(report.get("warnings", [])),
-                summary=report,
-            )
-            update_schedule_after_run(schedule_id, not report.get("errors"))
-
-            # Trigger change detection and freshness refresh
-            try:
-                from .change_detection_service import run_change_detection_for_crawl_run
-                from .freshness_service import refresh_freshness_metrics
-                run_change_detection_for_crawl_run(report.get("run_id"), job_run_id=job["id"])
-                refresh_freshness_metrics()
-            except Exception as e:
-                log.warning("Change detection or freshness refresh failed: %s", e)
-
-            results.append({
-                "schedule_id": schedule_id,
-                "job_run_id": job["id"],
-                "status": "succeeded",
-                "run_id": report.get("run_id"),
-            })
-        except Exception as e:
-            log.exception("Schedule %s failed: %s", schedule_id, e)
-            release_job_lock(job["id"])
-            complete_job_run(job["id"], status="failed", error_summary=str(e))
-            update_schedule_after_run(schedule_id, False)
-            results.append({"schedule_id": schedule_id, "status": "failed", "error": str(e)})
-
-    return results
+    return CrawlSchedulerWorker(requested_by=user_id).run_batch()
 
 
 def list_job_runs(
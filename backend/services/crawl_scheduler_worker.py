@@ -0,0 +1,460 @@
+"""
+Crawl scheduler worker: claims due schedules under SQL leases and crawls them on a bounded pool.
+
+Locking goes through the application database (``Database.engine``) instead of the Supabase REST
+client, so it works the same on Postgres and on a local SQLite file:
+
+- A claim inserts the schedule's job run as ``running`` with ``lock_owner`` / ``lock_until`` in one
+  statement, only while the schedule is still due and has no queued/running run; a partial unique
+  index (one active run per schedule) turns a concurrent double claim into a skipped schedule.
+- The coordinating thread renews ``lock_until`` for every in-flight run while crawls are going, so
+  the lease can be short (``CRAWL_LEASE_SECONDS``, default 300) without expiring on long crawls.
+- Runs whose lease lapsed (crashed worker) are marked failed at the start of each batch; their
+  schedules are still due, so they are picked up again. Only worker leases (``lock_owner`` set) are
+  reclaimed: manual ``/trigger`` runs hold an unrenewed fixed lock and finish without an owner check.
+- A schedule's ``max_runtime_seconds`` bounds a crawl: past it the worker stops renewing, fails the
+  run and advances the schedule. The crawl thread cannot be interrupted, so it is abandoned; the
+  batch does not wait for it, and the worker keeps it off its capacity until the thread finishes
+  (a batch with no capacity left is skipped).
+- Change detection runs per crawl; the freshness refresh runs once per batch, not once per schedule.
+
+``process_due_schedules`` runs one batch; ``scripts/process_crawl_schedules.py --loop`` keeps a worker
+running.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+log = logging.getLogger(__name__)
+
+ACTIVE_JOB_STATUSES = ("queued", "running")
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+LEASE_SECONDS = _env_number("CRAWL_LEASE_SECONDS", 300)
+CONCURRENCY = max(1, int(_env_number("CRAWL_SCHEDULER_CONCURRENCY", 2)))
+
+
+def _ts(dt: datetime) -> str:
+    """UTC ISO timestamp with fixed-width microseconds, so SQLite text comparisons order correctly."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _job_type(schedule: Dict[str, Any]) -> str:
+    return "crawl_source" if schedule.get("source_scope_type") == "source" else "crawl_country_city_scope"
+
+
+def _scope(schedule: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "source_scope_type": schedule.get("source_scope_type"),
+        "source_scope_ref": schedule.get("source_scope_ref"),
+        "country_code": schedule.get("country_code"),
+        "city_name": schedule.get("city_name"),
+        "content_domain": schedule.get("content_domain"),
+    }
+
+
+class CrawlLeaseStore:
+    """crawl_schedules / crawl_job_runs access for the worker (SQLAlchemy engine; Postgres or SQLite)."""
+
+    def __init__(self, engine: Any) -> None:
+        self.engine = engine
+        self._is_pg = getattr(engine.dialect, "name", "") == "postgresql"
+
+    def _json(self, param: str) -> str:
+        return f"CAST(:{param} AS jsonb)" if self._is_pg else f":{param}"
+
+    def reclaim_expired(self, now: Optional[datetime] = None) -> int:
+        """Fail worker-owned queued/running runs whose lease has lapsed; returns how many were reclaimed."""
+        with self.engine.begin() as conn:
+            res = conn.execute(
+                text(
+                    """
+                    UPDATE crawl_job_runs
+                    SET status = 'failed', finished_at = :now, lock_until = NULL,
+                        error_summary = COALESCE(error_summary, 'lease expired')
+                    WHERE status IN ('queued', 'running') AND lock_owner IS NOT NULL
+                      AND lock_until IS NOT NULL AND lock_until < :now
+                    """
+                ),
+                {"now": _ts(now or _now())},
+            )
+        return max(0, res.rowcount or 0)
+
+    def due_schedules(self, now: Optional[datetime] = None, limit: int = 500) -> List[Dict[str, Any]]:
+        """Active schedules with next_run_at <= now and no queued/running job, highest priority first."""
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    """
+                    SELECT s.* FROM crawl_schedules s
+                    WHERE s.is_active = :active AND s.next_run_at <= :now
+                      AND NOT EXISTS (
+                        SELECT 1 FROM crawl_job_runs r
+                        WHERE r.schedule_id = s.id AND r.status IN ('queued', 'running')
+                      )
+                    ORDER BY s.priority DESC, s.next_run_at ASC
+                    LIMIT :limit
+                    """
+                ),
+                {"active": True, "now": _ts(now or _now()), "limit": limit},
+            ).mappings().all()
+        return [dict(r) for r in rows]
+
+    def claim(
+        self,
+        schedule: Dict[str, Any],
+        owner: str,
+        lease_seconds: float,
+        *,
+        requested_by: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Create the schedule's running job under a lease; None when it is no longer due or already claimed."""
+        now = now or _now()
+        job_id = str(uuid.uuid4())
+        lock_until = now + timedelta(seconds=lease_seconds)
+        try:
+            with self.engine.begin() as conn:
+                res = conn.execute(
+                    text(
+                        f"""
+                        INSERT INTO crawl_job_runs (
+                            id, schedule_id, job_type, trigger_type, status, started_at,
+                            lock_until, lock_owner, requested_by_user_id, scope_json, created_at
+                        )
+                        SELECT :id, s.id, :job_type, 'scheduled', 'running', :now,
+                               :lock_until, :owner, :requested_by, {self._json("scope")}, :now
+                        FROM crawl_schedules s
+                        WHERE s.id = :sid AND s.is_active = :active AND s.next_run_at <= :now
+                          AND NOT EXISTS (
+                            SELECT 1 FROM crawl_job_runs r
+                            WHERE r.schedule_id = s.id AND r.status IN ('queued', 'running')
+                          )
+                        """
+                    ),
+                    {
+                        "id": job_id,
+                        "sid": schedule["id"],
+                        "job_type": _job_type(schedule),
+                        "now": _ts(now),
+                        "lock_until": _ts(lock_until),
+                        "owner": owner,
+                        "requested_by": requested_by,
+                        "scope": json.dumps(_scope(schedule)),
+                        "active": True,
+                    },
+                )
+        except IntegrityError:
+            return None
+        if (res.rowcount or 0) != 1:
+            return None
+        return {"id": job_id, "schedule_id": schedule["id"], "lock_until": lock_until}
+
+    def renew(self, job_run_id: str, owner: str, lease_seconds: float, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Extend the lease; returns the new lock_until, or None when this owner no longer holds it."""
+        lock_until = (now or _now()) + timedelta(seconds=lease_seconds)
+        with self.engine.begin() as conn:
+            res = conn.execute(
+                text(
+                    "UPDATE crawl_job_runs SET lock_until = :until "
+                    "WHERE id = :id AND lock_owner = :owner AND status = 'running'"
+                ),
+                {"until": _ts(lock_until), "id": job_run_id, "owner": owner},
+            )
+        return lock_until if (res.rowcount or 0) == 1 else None
+
+    def complete(
+        self,
+        job_run_id: str,
+        owner: str,
+        status: str,
+        *,
+        report: Optional[Dict[str, Any]] = None,
+        error_summary: Optional[str] = None,
+    ) -> bool:
+        """Finish the run and drop the lease; False when the lease was lost (reclaimed by another worker)."""
+        report = report or {}
+        params: Dict[str, Any] = {
+            "id": job_run_id,
+            "owner": owner,
+            "status": status,
+            "now": _ts(_now()),
+            "crawl_run_id": report.get("run_id"),
+            "fetched": report.get("documents_fetched"),
+            "chunks": report.get("chunks_created"),
+            "resources": report.get("resources_staged"),
+            "events": report.get("events_staged"),
+            "errors": len(report["errors"]) if report.get("errors") is not None else None,
+            "warnings": len(report["warnings"]) if report.get("warnings") is not None else None,
+            "summary": json.dumps(report, default=str) if report else None,
+            "error_summary": error_summary,
+        }
+        with self.engine.begin() as conn:
+            res = conn.execute(
+                text(
+                    f"""
+                    UPDATE crawl_job_runs SET
+                        status = :status, finished_at = :now, lock_until = NULL,
+                        crawl_run_id = :crawl_run_id,
+                        documents_fetched_count = :fetched, chunks_created_count = :chunks,
+                        staged_resources_count = :resources, staged_events_count = :events,
+                        errors_count = :errors, warnings_count = :warnings,
+                        summary_json = COALESCE({self._json("summary")}, summary_json),
+                        error_summary = COALESCE(:error_summary, error_summary)
+                    WHERE id = :id AND lock_owner = :owner AND status = 'running'
+                    """
+                ),
+                params,
+            )
+        return (res.rowcount or 0) == 1
+
+    def advance_schedule(self, schedule: Dict[str, Any], now: Optional[datetime] = None) -> None:
+        """Record the run and move next_run_at past now."""
+        from .crawl_scheduler_service import _compute_next_run
+
+        now = now or _now()
+        next_run = _compute_next_run(
+            schedule.get("schedule_type") or "interval", schedule.get("schedule_expression") or "24", from_time=now
+        )
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("UPDATE crawl_schedules SET last_run_at = :now, next_run_at = :next WHERE id = :id"),
+                {"now": _ts(now), "next": _ts(next_run) if next_run else None, "id": schedule["id"]},
+            )
+
+
+def _default_crawl(schedule: Dict[str, Any]) -> Dict[str, Any]:
+    from .crawl_scheduler_service import run_crawl_for_scope
+
+    return run_crawl_for_scope(
+        source_name=schedule.get("source_scope_ref") if schedule.get("source_scope_type") == "source" else None,
+        country_code=schedule.get("country_code"),
+        city_name=schedule.get("city_name"),
+        content_domain=schedule.get("content_domain"),
+    )
+
+
+def _default_detect_changes(crawl_run_id: Optional[str], job_run_id: str) -> Any:
+    from .change_detection_service import run_change_detection_for_crawl_run
+
+    return run_change_detection_for_crawl_run(crawl_run_id, job_run_id=job_run_id)
+
+
+def _default_refresh_freshness() -> Any:
+    from .freshness_service import refresh_freshness_metrics
+
+    return refresh_freshness_metrics()
+
+
+class _InFlight:
+    __slots__ = ("schedule", "job", "renew_at", "deadline", "lease_lost")
+
+    def __init__(self, schedule: Dict[str, Any], job: Dict[str, Any], renew_at: float, started: float) -> None:
+        self.schedule = schedule
+        self.job = job
+        self.renew_at = renew_at
+        try:
+            max_runtime = float(schedule.get("max_runtime_seconds") or 0)
+        except (TypeError, ValueError):
+            max_runtime = 0.0
+        self.deadline = started + max_runtime if max_runtime > 0 else None
+        self.lease_lost = False
+
+
+class CrawlSchedulerWorker:
+    """
+    Runs due schedules with at most ``concurrency`` crawls in flight. Crawls (and their change
+    detection) run on the pool; claims, lease renewal and completion stay on the calling thread.
+    """
+
+    def __init__(
+        self,
+        store: Optional[CrawlLeaseStore] = None,
+        *,
+        concurrency: Optional[int] = None,
+        lease_seconds: Optional[float] = None,
+        requested_by: Optional[str] = None,
+        owner: Optional[str] = None,
+        crawl: Callable[[Dict[str, Any]], Dict[str, Any]] = _default_crawl,
+        detect_changes: Callable[[Optional[str], str], Any] = _default_detect_changes,
+        refresh_freshness: Callable[[], Any] = _default_refresh_freshness,
+    ) -> None:
+        if store is None:
+            from ..database import db
+
+            store = CrawlLeaseStore(db.engine)
+        self.store = store
+        self.concurrency = max(1, int(concurrency or CONCURRENCY))
+        self.lease_seconds = float(lease_seconds or LEASE_SECONDS)
+        self.requested_by = requested_by
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._crawl = crawl
+        self._detect_changes = detect_changes
+        self._refresh_freshness = refresh_freshness
+        # Overrun crawls still running on a pool thread, across batches.
+        self._abandoned: List[Future] = []
+
+    @property
+    def renew_interval(self) -> float:
+        return max(0.05, self.lease_seconds / 3)
+
+    def _run_one(self, schedule: Dict[str, Any], job_run_id: str) -> Dict[str, Any]:
+        report = self._crawl(schedule)
+        if "error" not in report:
+            try:
+                self._detect_changes(report.get("run_id"), job_run_id)
+            except Exception as e:
+                log.warning("Change detection failed job_run_id=%s: %s", job_run_id, e)
+        return report
+
+    def _renew_due(self, in_flight: Dict[Future, _InFlight]) -> None:
+        now = time.monotonic()
+        for item in in_flight.values():
+            if item.lease_lost or item.renew_at > now:
+                continue
+            if self.store.renew(item.job["id"], self.owner, self.lease_seconds) is None:
+                item.lease_lost = True
+                log.warning(
+                    "crawl_scheduler lease lost schedule_id=%s job_run_id=%s", item.schedule["id"], item.job["id"]
+                )
+            item.renew_at = now + self.renew_interval
+
+    def _expire_overrun(self, in_flight: Dict[Future, _InFlight]) -> List[Dict[str, Any]]:
+        """Fail and drop runs past their schedule's max_runtime_seconds; their threads are abandoned."""
+        now = time.monotonic()
+        results: List[Dict[str, Any]] = []
+        for future, item in list(in_flight.items()):
+            if item.deadline is None or now < item.deadline:
+                continue
+            del in_flight[future]
+            self._abandoned.append(future)
+            schedule_id, job_id = item.schedule["id"], item.job["id"]
+            log.warning("crawl_scheduler max runtime exceeded schedule_id=%s job_run_id=%s", schedule_id, job_id)
+            if not self.store.complete(job_id, self.owner, "failed", error_summary="max runtime exceeded"):
+                results.append({"schedule_id": schedule_id, "job_run_id": job_id, "status": "lease_lost"})
+                continue
+            self.store.advance_schedule(item.schedule)
+            results.append(
+                {"schedule_id": schedule_id, "job_run_id": job_id, "status": "failed", "error": "max runtime exceeded"}
+            )
+        return results
+
+    def _finish(self, item: _InFlight, future: Future) -> Dict[str, Any]:
+        schedule_id, job_id = item.schedule["id"], item.job["id"]
+        try:
+            report = future.result()
+        except Exception as e:
+            log.exception("Schedule %s failed: %s", schedule_id, e)
+            report, error = None, str(e)
+        else:
+            error = report.get("error")
+        if error is not None:
+            owned = self.store.complete(job_id, self.owner, "failed", error_summary=str(error))
+            result = {"schedule_id": schedule_id, "job_run_id": job_id, "status": "failed", "error": error}
+        else:
+            status = "succeeded" if not report.get("errors") else "partial_success"
+            owned = self.store.complete(job_id, self.owner, status, report=report)
+            result = {"schedule_id": schedule_id, "job_run_id": job_id, "status": "succeeded", "run_id": report.get("run_id")}
+        if not owned:
+            # Another worker reclaimed the run after our lease lapsed; it owns the schedule now.
+            return {"schedule_id": schedule_id, "job_run_id": job_id, "status": "lease_lost"}
+        self.store.advance_schedule(item.schedule)
+        return result
+
+    def run_batch(self) -> List[Dict[str, Any]]:
+        """
+        One pass over the schedules due now: reclaim lapsed leases, run every due schedule with at
+        most ``concurrency`` in flight, then refresh freshness metrics once. Crawls that overran
+        ``max_runtime_seconds`` are left running on the pool, which is shut down without waiting;
+        until they finish they count against ``concurrency`` in this and later batches.
+        """
+        self._abandoned = [f for f in self._abandoned if not f.done()]
+        capacity = self.concurrency - len(self._abandoned)
+        if capacity <= 0:
+            log.warning(
+                "crawl_scheduler skipping batch owner=%s: %d abandoned crawl(s) still running",
+                self.owner,
+                len(self._abandoned),
+            )
+            return []
+        reclaimed = self.store.reclaim_expired()
+        if reclaimed:
+            log.warning("crawl_scheduler reclaimed %d job run(s) with expired leases", reclaimed)
+        pending = self.store.due_schedules()
+        results: List[Dict[str, Any]] = []
+        in_flight: Dict[Future, _InFlight] = {}
+        abandoned_before = len(self._abandoned)
+        pool = ThreadPoolExecutor(max_workers=capacity, thread_name_prefix="crawl-scheduler")
+        try:
+            while pending or in_flight:
+                # Abandoned crawls still hold pool threads; schedules left over stay due for the next batch.
+                while pending and len(in_flight) + len(self._abandoned) < self.concurrency:
+                    schedule = pending.pop(0)
+                    job = self.store.claim(schedule, self.owner, self.lease_seconds, requested_by=self.requested_by)
+                    if job is None:
+                        results.append({"schedule_id": schedule["id"], "status": "skipped", "reason": "lock_failed"})
+                        continue
+                    future = pool.submit(self._run_one, schedule, job["id"])
+                    now = time.monotonic()
+                    in_flight[future] = _InFlight(schedule, job, now + self.renew_interval, now)
+                if not in_flight:
+                    break
+                timeout = self.renew_interval
+                deadlines = [i.deadline for i in in_flight.values() if i.deadline is not None]
+                if deadlines:
+                    timeout = max(0.0, min(timeout, min(deadlines) - time.monotonic()))
+                done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results.append(self._finish(in_flight.pop(future), future))
+                results.extend(self._expire_overrun(in_flight))
+                self._renew_due(in_flight)
+        finally:
+            left_running = len(self._abandoned) > abandoned_before
+            pool.shutdown(wait=not left_running, cancel_futures=left_running)
+        if any(r.get("status") == "succeeded" for r in results):
+            try:
+                self._refresh_freshness()
+            except Exception as e:
+                log.warning("Freshness refresh failed: %s", e)
+        log.info(
+            "crawl_scheduler batch owner=%s schedules=%d succeeded=%d failed=%d skipped=%d",
+            self.owner,
+            len(results),
+            sum(1 for r in results if r.get("status") == "succeeded"),
+            sum(1 for r in results if r.get("status") == "failed"),
+            sum(1 for r in results if r.get("status") in ("skipped", "lease_lost")),
+        )
+        return results
+
+    def run_forever(self, poll_seconds: float = 60.0, stop: Optional[threading.Event] = None) -> None:
+        """Run batches until ``stop`` is set, sleeping ``poll_seconds`` between passes."""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                self.run_batch()
+            except Exception as e:
+                log.exception("crawl_scheduler batch failed: %s", e)
+            stop.wait(poll_seconds)
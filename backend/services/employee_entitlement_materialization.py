@@ -0,0 +1,208 @@
+"""
+Materialized employee policy views, one row per (assignment, view) in ``employee_entitlement_read_models``.
+
+The employee entitlement and policy routes resolve company candidates, the published version, the
+benefit matrix, HR overrides and comparison readiness on every request. Once a version is published,
+that output only changes when:
+
+- another version is published or this one is archived; the read compares the row's version with the
+  policy's current published version in the same query;
+- HR edits Layer-2 rows or overrides on the version; callers drop the rows with
+  ``invalidate_materialized_views_for_version``;
+- the assignment's resolution context changes (assignment type, family status, tier, and the company
+  candidates: case company, HR owner's company, employee profile company); the row carries a
+  fingerprint of that context, recomputed from inputs the routes already load;
+- a different policy becomes the resolved one (e.g. a higher-priority candidate company publishes, or
+  a newer policy is published for the same company); the read resolves the candidates' policy in the
+  same query and compares it with the row's policy.
+
+Only published states are materialized; drafts and "no policy" answers are always computed live.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from .employee_entitlement_read_model import build_employee_entitlement_read_model
+from .policy_resolution import collect_company_id_candidates_for_assignment, extract_resolution_context
+
+log = logging.getLogger(__name__)
+
+VIEW_ENTITLEMENTS = "entitlements"
+VIEW_EMPLOYEE_POLICY = "employee_policy"
+
+# Assignments re-materialized synchronously when a version is published; the rest fill on first read.
+PUBLISH_WARM_LIMIT = 50
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def load_assignment_resolution_inputs(
+    db: Any, assignment_id: str, assignment: Dict[str, Any]
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """(case, case profile_json, employee_profile) for an assignment, as the employee routes load them."""
+    case_id = assignment.get("case_id")
+    case = db.get_relocation_case(case_id) if case_id else None
+    profile = None
+    if case and case.get("profile_json"):
+        try:
+            profile = json.loads(case["profile_json"]) if isinstance(case["profile_json"], str) else case["profile_json"]
+        except Exception:
+            profile = None
+    try:
+        employee_profile = db.get_employee_profile(assignment_id)
+    except Exception:
+        employee_profile = None
+    return case, profile, employee_profile
+
+
+def resolution_context_fingerprint(
+    assignment: Dict[str, Any],
+    case: Optional[Dict[str, Any]],
+    profile: Optional[Dict[str, Any]],
+    employee_profile: Optional[Dict[str, Any]],
+    company_ids: List[str],
+) -> str:
+    """
+    Stable hash of everything that selects or filters the policy for this assignment. ``company_ids`` is
+    collect_company_id_candidates_for_assignment, so HR or employee company moves change the hash.
+    """
+    ctx = extract_resolution_context(assignment, case, profile, employee_profile)
+    ctx["_company_ids"] = list(company_ids)
+    raw = json.dumps(ctx, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def load_materialized_view(
+    db: Any, assignment_id: str, view_name: str, fingerprint: str, company_ids: List[str]
+) -> Optional[Dict[str, Any]]:
+    """Stored payload when it is still current for the resolved policy, version and context, else None."""
+    try:
+        row = db.get_employee_entitlement_read_model(assignment_id, view_name, company_ids=company_ids)
+    except Exception as exc:
+        log.warning("entitlement_read_model load failed assignment_id=%s view=%s exc=%s", assignment_id, view_name, exc)
+        return None
+    if not row or not isinstance(row.get("payload_json"), dict):
+        return None
+    current = row.get("current_published_version_id")
+    if not current or str(current) != str(row.get("policy_version_id")):
+        return None
+    resolved = row.get("resolved_policy_id")
+    if resolved and str(resolved) != str(row.get("policy_id")):
+        return None
+    if row.get("context_fingerprint") != fingerprint:
+        return None
+    return row["payload_json"]
+
+
+def store_materialized_view(
+    db: Any, assignment_id: str, view_name: str, payload: Dict[str, Any], fingerprint: str
+) -> bool:
+    """Persist a published-state payload. Returns False (and stores nothing) for unpublished states."""
+    if view_name == VIEW_ENTITLEMENTS:
+        published = str(payload.get("policy_status") or "").startswith("published_")
+    else:
+        published = bool(payload.get("has_policy"))
+    policy_id = payload.get("policy_id")
+    version_id = payload.get("version_id")
+    if not (published and policy_id and version_id):
+        return False
+    try:
+        db.upsert_employee_entitlement_read_model(
+            assignment_id,
+            view_name,
+            company_id=payload.get("company_id"),
+            policy_id=str(policy_id),
+            policy_version_id=str(version_id),
+            context_fingerprint=fingerprint,
+            payload_json=json.dumps(payload, default=_json_default),
+        )
+    except Exception as exc:
+        log.warning("entitlement_read_model store failed assignment_id=%s view=%s exc=%s", assignment_id, view_name, exc)
+        return False
+    return True
+
+
+def get_or_build_entitlements(
+    db: Any,
+    assignment_id: str,
+    assignment: Dict[str, Any],
+    case: Optional[Dict[str, Any]],
+    profile: Optional[Dict[str, Any]],
+    employee_profile: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Entitlement read model from the materialized row, rebuilding and storing it when stale."""
+    company_ids = collect_company_id_candidates_for_assignment(db, assignment, case)
+    fingerprint = resolution_context_fingerprint(assignment, case, profile, employee_profile, company_ids)
+    cached = load_materialized_view(db, assignment_id, VIEW_ENTITLEMENTS, fingerprint, company_ids)
+    if cached is not None:
+        return cached
+    raw = build_employee_entitlement_read_model(db, assignment_id, assignment, case, profile, employee_profile)
+    store_materialized_view(db, assignment_id, VIEW_ENTITLEMENTS, raw, fingerprint)
+    return raw
+
+
+def invalidate_materialized_views_for_version(db: Any, policy_version_id: Optional[str]) -> None:
+    """Call after HR edits rules, exclusions, conditions or overrides on a version."""
+    if not policy_version_id:
+        return
+    try:
+        db.delete_employee_entitlement_read_models(policy_version_id=str(policy_version_id))
+    except Exception as exc:
+        log.warning("entitlement_read_model invalidate failed version_id=%s exc=%s", policy_version_id, exc)
+
+
+def refresh_materialized_views_on_publish(
+    db: Any,
+    *,
+    company_id: Optional[str],
+    policy_id: str,
+    limit: int = PUBLISH_WARM_LIMIT,
+    request_id: Optional[str] = None,
+) -> int:
+    """
+    Drop the policy's rows for earlier versions and re-materialize entitlements for up to ``limit`` of the
+    company's assignments. Returns the number of rows written; remaining assignments fill on first read.
+    """
+    try:
+        db.delete_employee_entitlement_read_models(policy_id=str(policy_id))
+    except Exception as exc:
+        log.warning("entitlement_read_model publish invalidate failed policy_id=%s exc=%s", policy_id, exc)
+        return 0
+    if not company_id or limit <= 0:
+        return 0
+    try:
+        assignments = db.list_assignments_for_company(str(company_id), request_id=request_id)
+    except Exception as exc:
+        log.warning("entitlement_read_model publish list_assignments failed company_id=%s exc=%s", company_id, exc)
+        return 0
+    written = 0
+    for assignment in assignments[:limit]:
+        aid = assignment.get("id")
+        if not aid:
+            continue
+        try:
+            case, profile, employee_profile = load_assignment_resolution_inputs(db, str(aid), assignment)
+            company_ids = collect_company_id_candidates_for_assignment(db, assignment, case)
+            fingerprint = resolution_context_fingerprint(assignment, case, profile, employee_profile, company_ids)
+            raw = build_employee_entitlement_read_model(db, str(aid), assignment, case, profile, employee_profile)
+            if store_materialized_view(db, str(aid), VIEW_ENTITLEMENTS, raw, fingerprint):
+                written += 1
+        except Exception as exc:
+            log.warning("entitlement_read_model publish warm failed assignment_id=%s exc=%s", aid, exc)
+    log.info(
+        "entitlement_read_model publish_refresh request_id=%s company_id=%s policy_id=%s written=%s assignments=%s",
+        request_id,
+        company_id,
+        policy_id,
+        written,
+        len(assignments),
+    )
+    return written
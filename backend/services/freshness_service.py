@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .supabase_client import get_supabase_admin_client
 
@@ -31,6 +31,7 @@ _FRESHNESS_STALE_RATIO = 1.0
 _FRESHNESS_OVERDUE_RATIO = 1.5
 _LIVE_RESOURCE_STALE_DAYS = 180
 _LIVE_EVENT_EXPIRY_DAYS = 0  # past events are expired
+_LIVE_BUCKET_PAGE_SIZE = 1000
 
 
 def _get_supabase():
@@ -66,8 +67,59 @@ def compute_source_freshness(
     return "fresh"
 
 
+def _load_source_states(supabase: Any) -> Optional[List[Dict[str, Any]]]:
+    """
+    Rows of source_freshness_state (one per source, kept current by triggers on crawl_runs,
+    document_change_events and the staged candidate tables). None when the table is not deployed.
+    """
+    try:
+        return supabase.table("source_freshness_state").select("*").execute().data or []
+    except Exception as e:
+        log.debug("source_freshness_state unavailable, falling back to crawl history scan: %s", e)
+        return None
+
+
+def _parse_ts(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+
+
+def _signals_from_states(states: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    result = []
+    for row in states:
+        if not row.get("last_success_at") and not row.get("last_failure_at"):
+            continue  # review-candidate counts only; never crawled
+        content_domain = row.get("content_domain") or "admin_essentials"
+        cadence = _cadence_days_for_domain(content_domain)
+        state = compute_source_freshness(
+            _parse_ts(row.get("last_success_at")), cadence, int(row.get("consecutive_failures") or 0)
+        )
+        result.append({
+            "source_name": row.get("source_name"),
+            "country_code": row.get("country_code"),
+            "city_name": row.get("city_name"),
+            "last_crawl": row.get("last_success_at"),
+            "content_domain": content_domain,
+            "expected_cadence_days": cadence,
+            "freshness_state": state,
+        })
+    return result
+
+
 def get_source_freshness_signals() -> List[Dict[str, Any]]:
-    """Get per-source freshness signals from crawl history."""
+    """Get per-source freshness signals (one state row per source; crawl history scan if not deployed)."""
+    states = _load_source_states(_get_supabase())
+    if states is not None:
+        return _signals_from_states(states)
+    return _scan_source_freshness_signals()
+
+
+def _scan_source_freshness_signals() -> List[Dict[str, Any]]:
+    """Per-source freshness signals recomputed from crawl history."""
     supabase = _get_supabase()
 
     # Last successful run per source (from crawl_runs + crawled_source_documents)
@@ -184,20 +236,24 @@ def get_stale_live_events(
     ]
 
 
-def refresh_freshness_metrics() -> Dict[str, Any]:
-    """Compute and persist freshness snapshot (global scope)."""
-    supabase = _get_supabase()
-    signals = get_source_freshness_signals()
-    fresh = sum(1 for s in signals if s.get("freshness_state") == "fresh")
-    stale = sum(1 for s in signals if s.get("freshness_state") == "stale")
-    overdue = sum(1 for s in signals if s.get("freshness_state") == "overdue")
+def _recent_change_count(supabase: Any, since: datetime) -> int:
+    """Changed documents since ``since`` from the per-source daily buckets (day granularity)."""
+    rows = (
+        supabase.table("source_change_daily")
+        .select("changed_count")
+        .gte("day", since.date().isoformat())
+        .execute()
+    ).data or []
+    return sum(int(r.get("changed_count") or 0) for r in rows)
+
 
-    since = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
+def _scan_change_and_review_counts(supabase: Any, since: datetime) -> Tuple[int, int]:
+    """Changed documents since ``since`` and open review candidates, counted on the source tables."""
     try:
         changes_r = (
             supabase.table("document_change_events")
             .select("id", count="exact")
-            .gte("detected_at", since)
+            .gte("detected_at", since.isoformat())
             .neq("change_type", "unchanged")
             .limit(1)
             .execute()
@@ -206,45 +262,105 @@ def refresh_freshness_metrics() -> Dict[str, Any]:
     except Exception:
         changes_count = 0
 
-    try:
-        needs_review_res = (
-            supabase.table("staged_resource_candidates")
-            .select("id", count="exact")
-            .in_("status", ["new", "needs_review"])
-            .limit(1)
+    needs_review = 0
+    for table in ("staged_resource_candidates", "staged_event_candidates"):
+        try:
+            r = (
+                supabase.table(table)
+                .select("id", count="exact")
+                .in_("status", ["new", "needs_review"])
+                .limit(1)
+                .execute()
+            )
+            needs_review += (r.count if hasattr(r, "count") else 0) or 0
+        except Exception:
+            pass
+    return changes_count, needs_review
+
+
+def _live_bucket_sum(supabase: Any, kind: str, before_day: str) -> int:
+    """Sum of live_content_expiry_daily buckets of ``kind`` dated before ``before_day`` (paged)."""
+    total = 0
+    start = 0
+    while True:
+        rows = (
+            supabase.table("live_content_expiry_daily")
+            .select("item_count")
+            .eq("kind", kind)
+            .lt("day", before_day)
+            .order("day")
+            .order("country_code")
+            .range(start, start + _LIVE_BUCKET_PAGE_SIZE - 1)
             .execute()
-        )
-        needs_review_res_count = needs_review_res.count if hasattr(needs_review_res, "count") else 0
-    except Exception:
-        needs_review_res_count = 0
+        ).data or []
+        total += sum(int(r.get("item_count") or 0) for r in rows)
+        if len(rows) < _LIVE_BUCKET_PAGE_SIZE:
+            return total
+        start += _LIVE_BUCKET_PAGE_SIZE
+
+
+def _live_expiry_counts(supabase: Any, now: datetime) -> Optional[Tuple[int, int]]:
+    """
+    (stale live resources, expired live events) from the per-country daily buckets kept by triggers on
+    country_resources and rkg_country_events, at UTC day granularity: a resource is stale once its last
+    update day is more than _LIVE_RESOURCE_STALE_DAYS days back, an event once its start day is past.
+    None when the bucket table is not deployed.
+    """
     try:
-        needs_review_ev = (
-            supabase.table("staged_event_candidates")
-            .select("id", count="exact")
-            .in_("status", ["new", "needs_review"])
-            .limit(1)
-            .execute()
+        stale_before = (now - timedelta(days=_LIVE_RESOURCE_STALE_DAYS)).date().isoformat()
+        expired_before = (now - timedelta(days=_LIVE_EVENT_EXPIRY_DAYS)).date().isoformat()
+        return (
+            _live_bucket_sum(supabase, "resource", stale_before),
+            _live_bucket_sum(supabase, "event", expired_before),
         )
-        needs_review_ev_count = needs_review_ev.count if hasattr(needs_review_ev, "count") else 0
-    except Exception:
-        needs_review_ev_count = 0
-    needs_review = (needs_review_res_count or 0) + (needs_review_ev_count or 0)
+    except Exception as e:
+        log.warning("live_content_expiry_daily unavailable, live staleness not counted: %s", e)
+        return None
+
+
+def refresh_freshness_metrics() -> Dict[str, Any]:
+    """
+    Compute and persist freshness snapshot (global scope).
+
+    Sums the per-source state rows, so the cost is O(sources): it does not rescan crawl history,
+    change events or review candidates. Live resource/event staleness sums the per-country daily
+    buckets; without them both counts are 0 and metrics_json records ``live_expiry: unavailable``.
+    """
+    supabase = _get_supabase()
+    now = datetime.now(timezone.utc)
+    since = now - timedelta(days=7)
+    states = _load_source_states(supabase)
+    if states is not None:
+        signals = _signals_from_states(states)
+        try:
+            changes_count = _recent_change_count(supabase, since)
+        except Exception:
+            changes_count = 0
+        needs_review = sum(int(s.get("needs_review_count") or 0) for s in states)
+    else:
+        signals = _scan_source_freshness_signals()
+        changes_count, needs_review = _scan_change_and_review_counts(supabase, since)
+    fresh = sum(1 for s in signals if s.get("freshness_state") == "fresh")
+    stale = sum(1 for s in signals if s.get("freshness_state") == "stale")
+    overdue = sum(1 for s in signals if s.get("freshness_state") == "overdue")
 
-    stale_resources = get_stale_live_resources(limit=1000)
-    stale_events = get_stale_live_events(limit=1000)
+    live = _live_expiry_counts(supabase, now)
+    stale_resources, stale_events = live if live is not None else (0, 0)
 
     snapshot = {
         "snapshot_scope_type": "global",
-        "captured_at": datetime.now(timezone.utc).isoformat(),
+        "captured_at": now.isoformat(),
         "fresh_sources_count": fresh,
         "stale_sources_count": stale,
         "overdue_sources_count": overdue,
         "documents_changed_recently_count": changes_count,
-        "live_resources_stale_count": len(stale_resources),
-        "live_events_expired_count": len(stale_events),
+        "live_resources_stale_count": stale_resources,
+        "live_events_expired_count": stale_events,
         "needs_review_candidates_count": needs_review,
         "metrics_json": {
             "source_signals_count": len(signals),
+            "source_state": "incremental" if states is not None else "scan",
+            "live_expiry": "daily_buckets" if live is not None else "unavailable",
         },
     }
     supabase.table("freshness_snapshots").insert(snapshot).execute()
@@ -7,13 +7,15 @@ for manual review — never silent merges of conflicting auth links.
 """
 from __future__ import annotations
 
+import json
 import logging
+import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 from backend import database as dbmod
 from backend.identity_normalize import email_normalized_from_identifier, normalize_invite_key
@@ -511,14 +513,15 @@ def _execute_identity_fixes(conn: Any, fix_list: List[Dict[str, Any]], applied:
             iid = (fix.get("invite_id") or "").strip()
             if not iid:
                 continue
-            conn.execute(
+            res = conn.execute(
                 text(
                     "UPDATE assignment_invites SET status = 'CLAIMED' "
                     "WHERE id = :iid AND UPPER(TRIM(status)) = 'ACTIVE'"
                 ),
                 {"iid": iid},
             )
-            applied["mark_legacy_invite_claimed"] += 1
+            if res.rowcount and res.rowcount > 0:
+                applied["mark_legacy_invite_claimed"] += 1
 
 
 def apply_safe_fixes(engine, report: IdentityDataReport, *, dry_run: bool = True) -> Dict[str, int]:
@@ -549,3 +552,613 @@ def apply_safe_fixes(engine, report: IdentityDataReport, *, dry_run: bool = True
     with engine.begin() as conn:
         _execute_identity_fixes(conn, fix_list, applied)
     return applied
+
+
+# ---------------------------------------------------------------------------
+# Streaming mode (large tenants): keyset-paginated audit -> JSONL, batched fixes
+# with resumable checkpoints. Same classifications and fix semantics as above.
+# ---------------------------------------------------------------------------
+
+DEFAULT_STREAM_PAGE_SIZE = 1000
+DEFAULT_FIX_BATCH_SIZE = 200
+
+_APPLIED_KEYS = (
+    "merge_duplicate_employee_contacts",
+    "backfill_employee_contact_id",
+    "link_employee_contact_to_auth_user",
+    "sync_claim_invite_to_assigned_employee",
+    "mark_legacy_invite_claimed",
+)
+
+
+def _iter_keyset(
+    conn,
+    sql: str,
+    key_sql: Union[str, Sequence[str]],
+    key_field: Union[str, Sequence[str]],
+    *,
+    page_size: int,
+    params: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield rows page by page ordered by key_sql. ``sql`` must contain a ``{keyset}``
+    placeholder inside its WHERE clause (replaced by ``AND <key_sql> > :_after`` after
+    the first page) and no ORDER BY / LIMIT. A tuple key (``key_sql``/``key_field`` of equal
+    length) pages on the composite key, for joins where the first column is not unique.
+    """
+    keys = [key_sql] if isinstance(key_sql, str) else list(key_sql)
+    fields = [key_field] if isinstance(key_field, str) else list(key_field)
+    after: Optional[List[Any]] = None
+    while True:
+        bind = dict(params or {})
+        bind["_limit"] = page_size
+        keyset = ""
+        if after is not None:
+            # (k0 > a0) OR (k0 = a0 AND k1 > a1) OR ...
+            terms = []
+            for n, k in enumerate(keys):
+                eqs = [f"{keys[m]} = :_after{m}" for m in range(n)]
+                terms.append("(" + " AND ".join(eqs + [f"{k} > :_after{n}"]) + ")")
+                bind[f"_after{n}"] = after[n]
+            keyset = "AND (" + " OR ".join(terms) + ")"
+        q = sql.format(keyset=keyset) + f" ORDER BY {', '.join(keys)} LIMIT :_limit"
+        rows = _fetchall_dicts(conn, q, bind)
+        for r in rows:
+            yield r
+        if len(rows) < page_size:
+            return
+        after = [rows[-1].get(f) for f in fields]
+
+
+def _iter_duplicate_contact_groups(conn, page_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Duplicate (company_id, normalized email) groups, grouped in SQL and paged by group key.
+    Only members of the current page of groups are loaded.
+    """
+    en_expr = "LOWER(TRIM(email_normalized))"
+    cid_expr = "TRIM(company_id)"
+    after: Optional[Tuple[str, str]] = None
+    while True:
+        keyset = ""
+        bind: Dict[str, Any] = {"_limit": page_size}
+        if after is not None:
+            keyset = f"AND ({cid_expr} > :_ac OR ({cid_expr} = :_ac AND {en_expr} > :_ae))"
+            bind["_ac"], bind["_ae"] = after
+        groups_sql = (
+            f"SELECT {cid_expr} AS g_company_id, {en_expr} AS g_email "
+            "FROM employee_contacts "
+            "WHERE company_id IS NOT NULL AND TRIM(company_id) != '' "
+            "AND email_normalized IS NOT NULL AND TRIM(email_normalized) != '' "
+            f"{keyset} "
+            f"GROUP BY {cid_expr}, {en_expr} HAVING COUNT(*) > 1 "
+            f"ORDER BY {cid_expr}, {en_expr} LIMIT :_limit"
+        )
+        rows = _fetchall_dicts(
+            conn,
+            "SELECT ec.id, ec.company_id, ec.invite_key, ec.email_normalized, ec.linked_auth_user_id, "
+            "ec.created_at, g.g_company_id, g.g_email "
+            f"FROM employee_contacts ec INNER JOIN ({groups_sql}) g "
+            "ON TRIM(ec.company_id) = g.g_company_id AND LOWER(TRIM(ec.email_normalized)) = g.g_email "
+            "ORDER BY g.g_company_id, g.g_email, ec.id",
+            bind,
+        )
+        group: List[Dict[str, Any]] = []
+        key: Optional[Tuple[str, str]] = None
+        n_groups = 0
+        for r in rows:
+            rk = (r.pop("g_company_id"), r.pop("g_email"))
+            if key is not None and rk != key:
+                yield group
+                n_groups += 1
+                group = []
+            key = rk
+            group.append(r)
+        if group:
+            yield group
+            n_groups += 1
+        if n_groups < page_size or key is None:
+            return
+        after = key
+
+
+def iter_identity_audit_entries(
+    engine,
+    *,
+    page_size: int = DEFAULT_STREAM_PAGE_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming counterpart of ``audit_identity_data``. Yields one dict per finding:
+    ``{"kind": "auto_fix", "action": ...}``, ``{"kind": "manual_review", "type": ...}``,
+    ``{"kind": "error", "message": ...}`` and finally ``{"kind": "counts", "counts": {...}}``.
+
+    Scans are keyset-paginated (bounded memory); duplicate detection is a SQL GROUP BY.
+    Unlike the in-memory audit, findings are not truncated. Auto-fixes are emitted in
+    execution order (merge -> backfill -> link -> sync claim -> legacy invite).
+    """
+    counts: Dict[str, int] = {}
+    join_on = dbmod._relocation_cases_join_on("a", "standard")
+
+    def bump(key: str, n: int = 1) -> None:
+        counts[key] = counts.get(key, 0) + n
+
+    def manual(entry_type: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        return {"kind": "manual_review", "type": entry_type, **row}
+
+    def fix(action: str, **fields: Any) -> Dict[str, Any]:
+        return {"kind": "auto_fix", "action": action, **fields}
+
+    checks: List[Tuple[str, Any]] = []
+
+    def duplicates(conn) -> Iterator[Dict[str, Any]]:
+        counts.setdefault("duplicate_contact_groups", 0)
+        counts.setdefault("duplicate_contact_rows_extra", 0)
+        counts.setdefault("duplicate_contact_manual_conflict", 0)
+        for g in _iter_duplicate_contact_groups(conn, page_size):
+            bump("duplicate_contact_groups")
+            canon, manual_reason = _pick_canonical_contact(g)
+            if manual_reason:
+                bump("duplicate_contact_manual_conflict")
+                yield manual(
+                    "duplicate_employee_contacts",
+                    {
+                        "reason": manual_reason,
+                        "company_id": g[0].get("company_id"),
+                        "email_normalized": (g[0].get("email_normalized") or "").strip().lower(),
+                        "contact_ids": [x.get("id") for x in g],
+                    },
+                )
+                continue
+            assert canon is not None
+            losers = [x for x in g if x.get("id") != canon.get("id")]
+            bump("duplicate_contact_rows_extra", len(losers))
+            yield fix(
+                "merge_duplicate_employee_contacts",
+                canonical_contact_id=canon.get("id"),
+                merge_from_contact_ids=[x.get("id") for x in losers],
+                invite_keys=sorted({(x.get("invite_key") or "") for x in g}),
+            )
+
+    checks.append(("duplicate_contact_groups", duplicates))
+
+    def keyset_check(count_key: str, sql: str, key_sql: Any, key_field: Any, emit) -> Any:
+        def run(conn) -> Iterator[Dict[str, Any]]:
+            counts.setdefault(count_key, 0)
+            for row in _iter_keyset(conn, sql, key_sql, key_field, page_size=page_size):
+                bump(count_key)
+                yield emit(row)
+        return run
+
+    checks.append((
+        "assignment_missing_employee_contact_id",
+        keyset_check(
+            "assignment_missing_employee_contact_id",
+            "SELECT id, case_id, employee_identifier FROM case_assignments "
+            "WHERE (employee_contact_id IS NULL OR TRIM(COALESCE(employee_contact_id, '')) = '') "
+            "AND employee_identifier IS NOT NULL AND TRIM(employee_identifier) != '' {keyset}",
+            "id",
+            "id",
+            lambda m: fix(
+                "backfill_employee_contact_id",
+                assignment_id=m.get("id"),
+                case_id=m.get("case_id"),
+                employee_identifier=m.get("employee_identifier"),
+            ),
+        ),
+    ))
+    checks.append((
+        "assignment_orphan_employee_contact_id",
+        keyset_check(
+            "assignment_orphan_employee_contact_id",
+            "SELECT a.id AS assignment_id, a.employee_contact_id "
+            "FROM case_assignments a "
+            "LEFT JOIN employee_contacts ec ON ec.id = a.employee_contact_id "
+            "WHERE a.employee_contact_id IS NOT NULL AND TRIM(COALESCE(a.employee_contact_id, '')) != '' "
+            "AND ec.id IS NULL {keyset}",
+            "a.id",
+            "assignment_id",
+            lambda o: manual("assignment_orphan_employee_contact", o),
+        ),
+    ))
+    checks.append((
+        "assignment_contact_company_mismatch",
+        keyset_check(
+            "assignment_contact_company_mismatch",
+            "SELECT a.id AS assignment_id, a.employee_contact_id, "
+            "ec.company_id AS contact_company_id, rc.company_id AS case_company_id "
+            "FROM case_assignments a "
+            "INNER JOIN employee_contacts ec ON ec.id = a.employee_contact_id "
+            f"LEFT JOIN relocation_cases rc ON {join_on} "
+            "WHERE ec.company_id IS NOT NULL AND TRIM(COALESCE(ec.company_id, '')) != '' "
+            "AND rc.company_id IS NOT NULL AND TRIM(COALESCE(rc.company_id, '')) != '' "
+            "AND CAST(ec.company_id AS TEXT) != CAST(rc.company_id AS TEXT) {keyset}",
+            "a.id",
+            "assignment_id",
+            lambda r: manual("assignment_contact_company_mismatch", r),
+        ),
+    ))
+    checks.append((
+        "contact_linkable_to_user",
+        keyset_check(
+            "contact_linkable_to_user",
+            "SELECT ec.id AS contact_id, ec.company_id, ec.email_normalized, u.id AS user_id "
+            "FROM employee_contacts ec "
+            "INNER JOIN users u ON LOWER(TRIM(COALESCE(u.email, ''))) = LOWER(TRIM(COALESCE(ec.email_normalized, ''))) "
+            "WHERE ec.email_normalized IS NOT NULL AND TRIM(ec.email_normalized) != '' "
+            "AND (ec.linked_auth_user_id IS NULL OR TRIM(COALESCE(ec.linked_auth_user_id, '')) = '') "
+            "AND u.email IS NOT NULL AND TRIM(u.email) != '' {keyset}",
+            # One contact can match several users: key on the pair so no match is skipped at a page edge.
+            ("ec.id", "u.id"),
+            ("contact_id", "user_id"),
+            lambda r: fix(
+                "link_employee_contact_to_auth_user",
+                contact_id=r.get("contact_id"),
+                user_id=r.get("user_id"),
+                email_normalized=r.get("email_normalized"),
+            ),
+        ),
+    ))
+    checks.append((
+        "contact_linked_auth_user_missing",
+        keyset_check(
+            "contact_linked_auth_user_missing",
+            "SELECT ec.id AS contact_id, ec.linked_auth_user_id "
+            "FROM employee_contacts ec "
+            "LEFT JOIN users u ON u.id = ec.linked_auth_user_id "
+            "WHERE ec.linked_auth_user_id IS NOT NULL AND TRIM(COALESCE(ec.linked_auth_user_id, '')) != '' "
+            "AND u.id IS NULL {keyset}",
+            "ec.id",
+            "contact_id",
+            lambda r: manual("contact_linked_auth_user_missing", r),
+        ),
+    ))
+    checks.append((
+        "claim_invite_pending_but_assignment_assigned",
+        keyset_check(
+            "claim_invite_pending_but_assignment_assigned",
+            "SELECT aci.id AS invite_id, aci.assignment_id, a.employee_user_id "
+            "FROM assignment_claim_invites aci "
+            "INNER JOIN case_assignments a ON a.id = aci.assignment_id "
+            "WHERE LOWER(TRIM(aci.status)) = 'pending' "
+            "AND a.employee_user_id IS NOT NULL AND TRIM(COALESCE(a.employee_user_id, '')) != '' {keyset}",
+            "aci.id",
+            "invite_id",
+            lambda r: fix(
+                "sync_claim_invite_to_assigned_employee",
+                invite_id=r.get("invite_id"),
+                assignment_id=r.get("assignment_id"),
+                employee_user_id=r.get("employee_user_id"),
+            ),
+        ),
+    ))
+    checks.append((
+        "claim_invite_claimed_user_mismatch",
+        keyset_check(
+            "claim_invite_claimed_user_mismatch",
+            "SELECT aci.id AS invite_id, aci.assignment_id, aci.claimed_by_user_id, a.employee_user_id "
+            "FROM assignment_claim_invites aci "
+            "INNER JOIN case_assignments a ON a.id = aci.assignment_id "
+            "WHERE LOWER(TRIM(aci.status)) = 'claimed' "
+            "AND aci.claimed_by_user_id IS NOT NULL AND TRIM(COALESCE(aci.claimed_by_user_id, '')) != '' "
+            "AND a.employee_user_id IS NOT NULL AND TRIM(COALESCE(a.employee_user_id, '')) != '' "
+            "AND CAST(aci.claimed_by_user_id AS TEXT) != CAST(a.employee_user_id AS TEXT) {keyset}",
+            "aci.id",
+            "invite_id",
+            lambda r: manual("claim_invite_claimed_user_mismatch", r),
+        ),
+    ))
+    checks.append((
+        "claim_invite_multiple_pending_per_assignment",
+        keyset_check(
+            "claim_invite_multiple_pending_per_assignment",
+            "SELECT assignment_id, COUNT(*) AS n FROM assignment_claim_invites "
+            "WHERE LOWER(TRIM(status)) = 'pending' {keyset} "
+            "GROUP BY assignment_id HAVING COUNT(*) > 1",
+            "assignment_id",
+            "assignment_id",
+            lambda r: manual(
+                "claim_invite_multiple_pending",
+                {"assignment_id": r.get("assignment_id"), "count": r.get("n")},
+            ),
+        ),
+    ))
+    checks.append((
+        "legacy_invite_active_but_assigned",
+        keyset_check(
+            "legacy_invite_active_but_assigned",
+            "SELECT ai.id AS invite_id, ai.case_id, ai.employee_identifier "
+            "FROM assignment_invites ai "
+            "WHERE UPPER(TRIM(COALESCE(ai.status, ''))) = 'ACTIVE' "
+            "AND EXISTS ("
+            "  SELECT 1 FROM case_assignments a "
+            "  WHERE a.case_id = ai.case_id "
+            "  AND LOWER(TRIM(COALESCE(a.employee_identifier, ''))) = LOWER(TRIM(COALESCE(ai.employee_identifier, ''))) "
+            "  AND a.employee_user_id IS NOT NULL AND TRIM(COALESCE(a.employee_user_id, '')) != ''"
+            ") {keyset}",
+            "ai.id",
+            "invite_id",
+            lambda r: fix(
+                "mark_legacy_invite_claimed",
+                invite_id=r.get("invite_id"),
+                case_id=r.get("case_id"),
+                employee_identifier=r.get("employee_identifier"),
+            ),
+        ),
+    ))
+    checks.append((
+        "employee_user_id_orphan",
+        keyset_check(
+            "employee_user_id_orphan",
+            "SELECT a.id AS assignment_id, a.employee_user_id "
+            "FROM case_assignments a "
+            "LEFT JOIN users u ON u.id = a.employee_user_id "
+            "WHERE a.employee_user_id IS NOT NULL AND TRIM(COALESCE(a.employee_user_id, '')) != '' "
+            "AND u.id IS NULL {keyset}",
+            "a.id",
+            "assignment_id",
+            lambda r: manual("employee_user_id_orphan", r),
+        ),
+    ))
+    checks.append((
+        "suspicious_employee_user_no_password",
+        keyset_check(
+            "suspicious_employee_user_no_password",
+            "SELECT id, email, username, role FROM users "
+            "WHERE UPPER(TRIM(COALESCE(role, ''))) IN ('EMPLOYEE', 'EMPLOYEE_USER') "
+            "AND (password_hash IS NULL OR TRIM(COALESCE(password_hash, '')) = '') {keyset}",
+            "id",
+            "id",
+            lambda r: manual("suspicious_employee_user_no_password", r),
+        ),
+    ))
+
+    # Checks that run in this order put the auto-fixes in _FIX_ORDER; keep it that way.
+    try:
+        with engine.connect() as conn:
+            for name, check in checks:
+                try:
+                    for entry in check(conn):
+                        yield entry
+                except Exception as exc:
+                    conn.rollback()
+                    counts.setdefault(name, 0)
+                    yield {"kind": "error", "message": f"{name} query: {exc}"}
+    except Exception as exc:
+        log.exception("streaming identity data audit failed")
+        yield {"kind": "error", "message": f"iter_identity_audit_entries: {exc}"}
+
+    yield {"kind": "counts", "counts": counts}
+
+
+def write_identity_audit_jsonl(
+    engine,
+    fp: TextIO,
+    *,
+    page_size: int = DEFAULT_STREAM_PAGE_SIZE,
+) -> Dict[str, int]:
+    """Write streaming audit entries to ``fp`` as JSON lines; returns the final counts."""
+    counts: Dict[str, int] = {}
+    for entry in iter_identity_audit_entries(engine, page_size=page_size):
+        fp.write(json.dumps(entry, default=str) + "\n")
+        if entry.get("kind") == "counts":
+            counts = entry.get("counts") or {}
+    fp.flush()
+    return counts
+
+
+def iter_auto_fixes_from_jsonl(fp: TextIO) -> Iterator[Dict[str, Any]]:
+    """Auto-fix entries from a JSONL audit report, in file order."""
+    for line in fp:
+        line = line.strip()
+        if not line:
+            continue
+        entry = json.loads(line)
+        if entry.get("kind") == "auto_fix":
+            yield entry
+
+
+# ids per set-based fix statement; keeps bind parameters well under driver limits.
+_FIX_IN_CHUNK = 500
+
+
+def _execute_in(
+    conn: Any,
+    sql: str,
+    ids: Sequence[str],
+    params: Optional[Dict[str, Any]] = None,
+    per_id: Optional[Dict[str, Any]] = None,
+    key_column: str = "id",
+) -> int:
+    """
+    Run ``sql`` (filtering on ``<key_column> IN :ids``) once per chunk of ids and return the rows
+    changed. ``per_id`` supplies a per-row value, which ``sql`` reads as ``{per_id}``: a CASE on
+    ``key_column`` over the chunk's ids. Each chunk is one statement, so its rowcount is exact on
+    every driver (executemany rowcount is not: psycopg2 reports -1 or the last statement's count).
+    """
+    ids = list(dict.fromkeys(ids))
+    changed = 0
+    for start in range(0, len(ids), _FIX_IN_CHUNK):
+        chunk = ids[start:start + _FIX_IN_CHUNK]
+        bind: Dict[str, Any] = dict(params or {}, ids=chunk)
+        case_sql = ""
+        if per_id is not None:
+            whens = []
+            for n, key in enumerate(chunk):
+                whens.append(f"WHEN :k{n} THEN :v{n}")
+                bind[f"k{n}"], bind[f"v{n}"] = key, per_id[key]
+            case_sql = f"CASE {key_column} {' '.join(whens)} END"
+        stmt = text(sql.format(per_id=case_sql)).bindparams(bindparam("ids", expanding=True))
+        rc = conn.execute(stmt, bind).rowcount
+        if rc and rc > 0:
+            changed += rc
+    return changed
+
+
+def _execute_fix_batch(conn: Any, batch: List[Dict[str, Any]], applied: Dict[str, int]) -> None:
+    """
+    Run one batch of fixes (one transaction, grouped by action), with one set-based statement per
+    action and table. Applied counts are the rows the statements changed, not the fixes attempted;
+    backfill keeps the per-row resolution from _execute_identity_fixes.
+    """
+    i = 0
+    while i < len(batch):
+        action = batch[i].get("action")
+        j = i
+        while j < len(batch) and batch[j].get("action") == action:
+            j += 1
+        group = batch[i:j]
+        i = j
+
+        if action == "merge_duplicate_employee_contacts":
+            # loser contact id -> canonical contact id (first fix wins when a loser repeats)
+            canon_for: Dict[str, str] = {}
+            for f in group:
+                canon = (f.get("canonical_contact_id") or "").strip()
+                if not canon:
+                    continue
+                for lid in f.get("merge_from_contact_ids") or []:
+                    lid = (lid or "").strip()
+                    if lid and lid != canon:
+                        canon_for.setdefault(lid, canon)
+            if not canon_for:
+                continue
+            losers = list(canon_for)
+            now = _now_iso()
+            present: set = set()
+            for start in range(0, len(losers), _FIX_IN_CHUNK):
+                rows = conn.execute(
+                    text("SELECT id FROM employee_contacts WHERE id IN :ids").bindparams(
+                        bindparam("ids", expanding=True)
+                    ),
+                    {"ids": losers[start:start + _FIX_IN_CHUNK]},
+                ).fetchall()
+                present.update(str(r[0]) for r in rows)
+            _execute_in(
+                conn,
+                "UPDATE case_assignments SET employee_contact_id = {per_id}, updated_at = :ua "
+                "WHERE employee_contact_id IN :ids",
+                losers,
+                {"ua": now},
+                per_id=canon_for,
+                key_column="employee_contact_id",
+            )
+            _execute_in(
+                conn,
+                "UPDATE assignment_claim_invites SET employee_contact_id = {per_id} WHERE employee_contact_id IN :ids",
+                losers,
+                per_id=canon_for,
+                key_column="employee_contact_id",
+            )
+            _execute_in(conn, "DELETE FROM employee_contacts WHERE id IN :ids", losers)
+            # One applied merge per canonical contact that actually lost duplicates.
+            applied["merge_duplicate_employee_contacts"] += len({canon_for[lid] for lid in present})
+
+        elif action == "link_employee_contact_to_auth_user":
+            uid_for: Dict[str, str] = {}
+            for f in group:
+                uid, ecid = (f.get("user_id") or "").strip(), (f.get("contact_id") or "").strip()
+                if uid and ecid:
+                    uid_for.setdefault(ecid, uid)
+            if uid_for:
+                applied["link_employee_contact_to_auth_user"] += _execute_in(
+                    conn,
+                    "UPDATE employee_contacts SET linked_auth_user_id = {per_id}, updated_at = :ua "
+                    "WHERE id IN :ids AND (linked_auth_user_id IS NULL OR linked_auth_user_id = {per_id})",
+                    list(uid_for),
+                    {"ua": _now_iso()},
+                    per_id=uid_for,
+                )
+
+        elif action == "sync_claim_invite_to_assigned_employee":
+            uid_for = {}
+            for f in group:
+                uid, iid = (f.get("employee_user_id") or "").strip(), (f.get("invite_id") or "").strip()
+                if uid and iid:
+                    uid_for.setdefault(iid, uid)
+            if uid_for:
+                applied["sync_claim_invite_to_assigned_employee"] += _execute_in(
+                    conn,
+                    "UPDATE assignment_claim_invites "
+                    "SET status = 'claimed', claimed_by_user_id = {per_id}, claimed_at = :ca "
+                    "WHERE id IN :ids AND LOWER(TRIM(status)) = 'pending'",
+                    list(uid_for),
+                    {"ca": _now_iso()},
+                    per_id=uid_for,
+                )
+
+        elif action == "mark_legacy_invite_claimed":
+            ids = [(f.get("invite_id") or "").strip() for f in group if (f.get("invite_id") or "").strip()]
+            if ids:
+                applied["mark_legacy_invite_claimed"] += _execute_in(
+                    conn,
+                    "UPDATE assignment_invites SET status = 'CLAIMED' WHERE id IN :ids AND UPPER(TRIM(status)) = 'ACTIVE'",
+                    ids,
+                )
+
+        else:
+            _execute_identity_fixes(conn, group, applied)
+
+
+def _read_checkpoint(path: Optional[str]) -> int:
+    if not path or not os.path.exists(path):
+        return 0
+    with open(path, "r", encoding="utf-8") as f:
+        return int((json.load(f) or {}).get("fixes_done") or 0)
+
+
+def _write_checkpoint(path: str, fixes_done: int, applied: Dict[str, int]) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"fixes_done": fixes_done, "applied": applied, "updated_at": _now_iso()}, f)
+    os.replace(tmp, path)
+
+
+def apply_safe_fixes_batched(
+    engine,
+    fixes: Iterable[Dict[str, Any]],
+    *,
+    dry_run: bool = True,
+    batch_size: int = DEFAULT_FIX_BATCH_SIZE,
+    checkpoint_path: Optional[str] = None,
+    progress: Optional[Callable[[int, Dict[str, int]], None]] = None,
+) -> Dict[str, int]:
+    """
+    Apply a stream of auto-fixes (already in _FIX_ORDER, e.g. from iter_auto_fixes_from_jsonl)
+    in batches, one transaction per batch. After each committed batch the number of fixes
+    consumed is written to ``checkpoint_path``; a re-run with the same fix stream and
+    checkpoint skips what was already committed. Dry-run rolls every batch back and
+    never writes the checkpoint.
+    """
+    applied = {k: 0 for k in _APPLIED_KEYS}
+    skip = 0 if dry_run else _read_checkpoint(checkpoint_path)
+    done = 0
+    batch: List[Dict[str, Any]] = []
+
+    def flush() -> None:
+        nonlocal done
+        if not batch:
+            return
+        if dry_run:
+            with engine.connect() as conn:
+                trans = conn.begin()
+                try:
+                    _execute_fix_batch(conn, batch, applied)
+                finally:
+                    trans.rollback()
+        else:
+            with engine.begin() as conn:
+                _execute_fix_batch(conn, batch, applied)
+        done += len(batch)
+        batch.clear()
+        if checkpoint_path and not dry_run:
+            _write_checkpoint(checkpoint_path, skip + done, applied)
+        if progress:
+            progress(skip + done, applied)
+
+    for idx, fx in enumerate(fixes):
+        if idx < skip:
+            continue
+        batch.append(fx)
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+    return applied
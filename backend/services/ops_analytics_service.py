@@ -1,19 +1,64 @@
 """
 Ops Analytics Service: SLA, queue, reviewer, destination, and notification metrics.
 Admin-only. Used by the SLA reporting dashboard.
+
+Dashboard reads come from pre-aggregated rollups (ops_metrics_buckets, ops_backlog_state)
+once refresh_ops_metrics_rollup has run; until then they fall back to scanning
+review_queue_items directly. Flow metrics use the rollup only for ranges inside the
+window its buckets cover (ops_metrics_rollup_runs.covered_since).
 """
 from __future__ import annotations
 
+import logging
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .supabase_client import get_supabase_admin_client
 
+log = logging.getLogger(__name__)
+
+_OPEN_STATUSES = ["new", "triaged", "assigned", "in_progress", "blocked", "waiting"]
+_WORKLOAD_STATUSES = ("assigned", "in_progress", "blocked", "waiting")
+_CLOSED_RESOLVED = ("resolved", "rejected")
+
+# Upper bound (hours, exclusive) -> histogram bin label for time-to-assign/resolve.
+_HIST_BINS: Tuple[Tuple[float, str], ...] = (
+    (1, "lt_1h"),
+    (4, "1h_4h"),
+    (24, "4h_24h"),
+    (72, "1d_3d"),
+    (168, "3d_7d"),
+    (float("inf"), "gt_7d"),
+)
+
+_BUCKET_KEY_COLS = "granularity,bucket_start,country_code,priority_band"
+_BACKLOG_KEY_COLS = ("country_code", "city_name", "priority_band", "status", "queue_item_type", "assigned_to_user_id")
+
+# Seconds to cache the rollup coverage (start of the covered bucket window, None = never run).
+_ROLLUP_AVAILABLE_TTL = 60.0
+_rollup_available_cache: Dict[str, Any] = {"checked_at": 0.0, "value": None}
+# First refresh backfills this many days (the longest dashboard range).
+_ROLLUP_BACKFILL_DAYS = 90
+# Rows per request; below PostgREST max-rows so reads are never silently truncated.
+_READ_PAGE_SIZE = 1000
+
 
 def _get_supabase():
     return get_supabase_admin_client()
 
 
+def _paged_rows(build_query: Callable[[], Any]) -> Iterator[Dict[str, Any]]:
+    """All rows of a deterministically ordered query, one range() page at a time."""
+    offset = 0
+    while True:
+        rows = build_query().range(offset, offset + _READ_PAGE_SIZE - 1).execute().data or []
+        yield from rows
+        if len(rows) < _READ_PAGE_SIZE:
+            return
+        offset += _READ_PAGE_SIZE
+
+
 def _parse_dt(s: Optional[str]):
     if not s:
         return None
@@ -23,7 +68,7 @@ def _parse_dt(s: Optional[str]):
         return None
 
 
-def get_sla_overview(
+def _get_sla_overview_raw(
     country_code: Optional[str] = None,
     days: int = 30,
 ) -> Dict[str, Any]:
@@ -116,7 +161,7 @@ def get_sla_overview(
     }
 
 
-def get_queue_backlog(
+def _get_queue_backlog_raw(
     country_code: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Queue backlog metrics by status and priority."""
@@ -175,7 +220,7 @@ def get_queue_breaches(
     return {"items": breached, "total": len(breached)}
 
 
-def get_reviewer_workload() -> Dict[str, Any]:
+def _get_reviewer_workload_raw() -> Dict[str, Any]:
     """Workload by assignee."""
     supabase = _get_supabase()
     items = (
@@ -205,7 +250,7 @@ def get_reviewer_workload() -> Dict[str, Any]:
     return {"by_assignee": by_assignee}
 
 
-def get_destination_ops_metrics() -> Dict[str, Any]:
+def _get_destination_ops_metrics_raw() -> Dict[str, Any]:
     """Metrics by country/city."""
     supabase = _get_supabase()
     items = (
@@ -269,3 +314,437 @@ def get_ops_bottlenecks() -> Dict[str, Any]:
         "total_backlog": backlog.get("total", 0),
         "unassigned_count": backlog.get("by_status", {}).get("new", 0) + backlog.get("by_status", {}).get("triaged", 0),
     }
+
+
+# ---------------------------------------------------------------------------
+# Rollup: periodic materialization + incremental backlog updates
+# ---------------------------------------------------------------------------
+
+def _floor_hour(dt: datetime) -> datetime:
+    return dt.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _floor_day(dt: datetime) -> datetime:
+    return _floor_hour(dt).replace(hour=0)
+
+
+def _hist_bin(hours: float) -> str:
+    for upper, label in _HIST_BINS:
+        if hours < upper:
+            return label
+    return _HIST_BINS[-1][1]
+
+
+def _dims(country_code: Optional[str], priority_band: Optional[str]) -> Iterable[Tuple[str, str]]:
+    """Each item counts toward its own (country, band) and the '' (= all) roll-ups of both."""
+    cc = country_code or ""
+    band = priority_band or ""
+    return {(cc, band), (cc, ""), ("", band), ("", "")}
+
+
+def _empty_bucket(granularity: str, bucket_start: datetime, cc: str, band: str) -> Dict[str, Any]:
+    return {
+        "granularity": granularity,
+        "bucket_start": bucket_start.isoformat(),
+        "country_code": cc,
+        "priority_band": band,
+        "created_count": 0,
+        "sla_tracked_count": 0,
+        "resolved_count": 0,
+        "resolved_breached_count": 0,
+        "assign_hours_sum": 0.0,
+        "assign_count": 0,
+        "resolve_hours_sum": 0.0,
+        "resolve_count": 0,
+        "assign_hist_json": {},
+        "resolve_hist_json": {},
+    }
+
+
+def compute_flow_buckets(
+    items: Iterable[Dict[str, Any]],
+    window_start: datetime,
+) -> Dict[Tuple[str, str, str, str], Dict[str, Any]]:
+    """
+    Aggregate created/resolved flow metrics into hour and day buckets at or after window_start.
+    Keyed by (granularity, bucket_start iso, country_code, priority_band).
+    """
+    buckets: Dict[Tuple[str, str, str, str], Dict[str, Any]] = {}
+
+    def touch(at: datetime, cc: str, band: str) -> List[Dict[str, Any]]:
+        out = []
+        for gran, start in (("hour", _floor_hour(at)), ("day", _floor_day(at))):
+            key = (gran, start.isoformat(), cc, band)
+            if key not in buckets:
+                buckets[key] = _empty_bucket(gran, start, cc, band)
+            out.append(buckets[key])
+        return out
+
+    for it in items:
+        created = _parse_dt(it.get("created_at"))
+        resolved_at = _parse_dt(it.get("resolved_at"))
+        assigned = _parse_dt(it.get("assigned_at"))
+        sla = _parse_dt(it.get("sla_target_at"))
+        for cc, band in _dims(it.get("country_code"), it.get("priority_band")):
+            if created and created >= window_start:
+                for b in touch(created, cc, band):
+                    b["created_count"] += 1
+                    if sla:
+                        b["sla_tracked_count"] += 1
+            if it.get("status") in _CLOSED_RESOLVED and resolved_at and resolved_at >= window_start:
+                for b in touch(resolved_at, cc, band):
+                    b["resolved_count"] += 1
+                    if sla and resolved_at > sla:
+                        b["resolved_breached_count"] += 1
+                    if created:
+                        hours = (resolved_at - created).total_seconds() / 3600
+                        b["resolve_hours_sum"] += hours
+                        b["resolve_count"] += 1
+                        label = _hist_bin(hours)
+                        b["resolve_hist_json"][label] = b["resolve_hist_json"].get(label, 0) + 1
+                        if assigned:
+                            a_hours = (assigned - created).total_seconds() / 3600
+                            b["assign_hours_sum"] += a_hours
+                            b["assign_count"] += 1
+                            label = _hist_bin(a_hours)
+                            b["assign_hist_json"][label] = b["assign_hist_json"].get(label, 0) + 1
+    for b in buckets.values():
+        b["assign_hours_sum"] = round(b["assign_hours_sum"], 4)
+        b["resolve_hours_sum"] = round(b["resolve_hours_sum"], 4)
+    return buckets
+
+
+def _backlog_key(item: Dict[str, Any]) -> Tuple[str, ...]:
+    return tuple(str(item.get(col) or "") for col in _BACKLOG_KEY_COLS)
+
+
+def _backlog_flags(item: Dict[str, Any], now: datetime) -> Tuple[int, int]:
+    """(overdue, breached) for an open item: due_at passed; sla_target_at (or due_at) passed."""
+    due = _parse_dt(item.get("due_at"))
+    sla = _parse_dt(item.get("sla_target_at") or item.get("due_at"))
+    return (1 if due and now > due else 0, 1 if sla and now > sla else 0)
+
+
+def compute_backlog_state(
+    open_items: Iterable[Dict[str, Any]],
+    now: datetime,
+) -> Dict[Tuple[str, ...], Dict[str, Any]]:
+    """Open backlog grouped by dimension key with open/overdue/breached counts."""
+    state: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+    for it in open_items:
+        key = _backlog_key(it)
+        row = state.get(key)
+        if row is None:
+            row = dict(zip(_BACKLOG_KEY_COLS, key))
+            row.update({"open_count": 0, "overdue_count": 0, "breached_count": 0})
+            state[key] = row
+        overdue, breached = _backlog_flags(it, now)
+        row["open_count"] += 1
+        row["overdue_count"] += overdue
+        row["breached_count"] += breached
+    return state
+
+
+def _last_rollup_run(supabase) -> Optional[Dict[str, Any]]:
+    rows = (
+        supabase.table("ops_metrics_rollup_runs")
+        .select("completed_at, covered_since")
+        .order("completed_at", desc=True)
+        .limit(1)
+        .execute()
+    ).data or []
+    return rows[0] if rows else None
+
+
+def refresh_ops_metrics_rollup(
+    now: Optional[datetime] = None,
+    lookback_hours: int = 48,
+) -> Dict[str, Any]:
+    """
+    Periodic job. Recomputes hour/day flow buckets for the recent window (from the start of
+    the day lookback_hours ago, extended back to the previous run so coverage has no gaps;
+    _ROLLUP_BACKFILL_DAYS on the first run) and rewrites the open backlog state. Only items
+    created or resolved inside the window, plus currently open items, are read.
+    """
+    now = now or datetime.now(timezone.utc)
+    supabase = _get_supabase()
+    window_start = _floor_day(now - timedelta(hours=lookback_hours))
+    last = _last_rollup_run(supabase)
+    covered_since = _parse_dt((last or {}).get("covered_since"))
+    last_completed = _parse_dt((last or {}).get("completed_at"))
+    if covered_since is None or last_completed is None:
+        window_start = min(window_start, _floor_day(now - timedelta(days=_ROLLUP_BACKFILL_DAYS)))
+        covered_since = window_start
+    else:
+        window_start = min(window_start, _floor_day(last_completed))
+        covered_since = min(covered_since, window_start)
+    since = window_start.isoformat()
+    cols = "id, status, country_code, city_name, priority_band, created_at, assigned_at, resolved_at, sla_target_at"
+
+    by_id: Dict[Any, Dict[str, Any]] = {}
+    for ts_col in ("created_at", "resolved_at"):
+        for i in _paged_rows(
+            lambda ts_col=ts_col: supabase.table("review_queue_items").select(cols).gte(ts_col, since).order("id")
+        ):
+            by_id.setdefault(i.get("id"), i)
+
+    buckets = compute_flow_buckets(by_id.values(), window_start)
+    # Zero buckets in the window that no longer receive contributions (e.g. reopened items).
+    existing = _paged_rows(
+        lambda: supabase.table("ops_metrics_buckets")
+        .select("granularity, bucket_start, country_code, priority_band")
+        .gte("bucket_start", since)
+        .order("id")
+    )
+    for row in existing:
+        start = _parse_dt(row.get("bucket_start"))
+        if not start:
+            continue
+        key = (row.get("granularity"), start.isoformat(), row.get("country_code") or "", row.get("priority_band") or "")
+        if key not in buckets:
+            buckets[key] = _empty_bucket(key[0], start, key[2], key[3])
+    bucket_rows = list(buckets.values())
+    for b in bucket_rows:
+        b["updated_at"] = now.isoformat()
+    for i in range(0, len(bucket_rows), _READ_PAGE_SIZE):
+        supabase.table("ops_metrics_buckets").upsert(
+            bucket_rows[i:i + _READ_PAGE_SIZE], on_conflict=_BUCKET_KEY_COLS
+        ).execute()
+
+    open_items = list(_paged_rows(
+        lambda: supabase.table("review_queue_items")
+        .select("id, status, country_code, city_name, priority_band, queue_item_type, assigned_to_user_id, due_at, sla_target_at")
+        .in_("status", _OPEN_STATUSES)
+        .order("id")
+    ))
+    state = compute_backlog_state(open_items, now)
+    stale = _paged_rows(
+        lambda: supabase.table("ops_backlog_state").select(",".join(_BACKLOG_KEY_COLS)).gt("open_count", 0).order("id")
+    )
+    for row in stale:
+        key = _backlog_key(row)
+        if key not in state:
+            zero = dict(zip(_BACKLOG_KEY_COLS, key))
+            zero.update({"open_count": 0, "overdue_count": 0, "breached_count": 0})
+            state[key] = zero
+    state_rows = list(state.values())
+    for r in state_rows:
+        r["updated_at"] = now.isoformat()
+    for i in range(0, len(state_rows), _READ_PAGE_SIZE):
+        supabase.table("ops_backlog_state").upsert(
+            state_rows[i:i + _READ_PAGE_SIZE], on_conflict=",".join(_BACKLOG_KEY_COLS)
+        ).execute()
+
+    supabase.table("ops_metrics_rollup_runs").insert({
+        "window_start": since,
+        "covered_since": covered_since.isoformat(),
+        "items_scanned": len(by_id) + len(open_items),
+        "buckets_written": len(bucket_rows),
+        "completed_at": now.isoformat(),
+    }).execute()
+    _rollup_available_cache.update({"checked_at": time.monotonic(), "value": covered_since})
+    return {
+        "window_start": since,
+        "covered_since": covered_since.isoformat(),
+        "items_scanned": len(by_id) + len(open_items),
+        "buckets_written": len(bucket_rows),
+        "backlog_rows_written": len(state_rows),
+    }
+
+
+def _adjust_backlog_row(supabase, item: Dict[str, Any], delta: int) -> None:
+    """Atomic open_count += delta on the item's backlog row (ops_backlog_adjust upsert)."""
+    params = {f"p_{col}": val for col, val in zip(_BACKLOG_KEY_COLS, _backlog_key(item))}
+    params["p_delta"] = delta
+    supabase.rpc("ops_backlog_adjust", params).execute()
+
+
+def apply_queue_transition_to_rollup(
+    before: Optional[Dict[str, Any]],
+    after: Optional[Dict[str, Any]],
+    now: Optional[datetime] = None,
+) -> None:
+    """
+    Incrementally move one queue item between backlog state rows on create / assign /
+    status change (open_count only). Flow buckets and overdue/breached counts are left to the
+    periodic refresh: they depend on the clock, not on transitions, so between refreshes they
+    lag (transitions only clamp them to open_count). Best-effort: failures are logged and the
+    next refresh_ops_metrics_rollup corrects the state.
+    """
+    now = now or datetime.now(timezone.utc)
+    was_open = bool(before and before.get("status") in _OPEN_STATUSES)
+    is_open = bool(after and after.get("status") in _OPEN_STATUSES)
+    if was_open and is_open and _backlog_key(before) == _backlog_key(after):
+        return
+    if not was_open and not is_open:
+        return
+    try:
+        supabase = _get_supabase()
+        if was_open:
+            _adjust_backlog_row(supabase, before, -1)
+        if is_open:
+            _adjust_backlog_row(supabase, after, 1)
+    except Exception as e:
+        log.warning("Ops backlog rollup update failed: %s", e)
+
+
+def _rollup_covered_since() -> Optional[datetime]:
+    """Start of the window the flow buckets cover; None when the rollup has not run."""
+    now = time.monotonic()
+    if now - _rollup_available_cache["checked_at"] < _ROLLUP_AVAILABLE_TTL:
+        return _rollup_available_cache["value"]
+    try:
+        last = _last_rollup_run(_get_supabase())
+        value = _parse_dt((last or {}).get("covered_since"))
+    except Exception:
+        value = None
+    _rollup_available_cache.update({"checked_at": now, "value": value})
+    return value
+
+
+def _rollup_available() -> bool:
+    return _rollup_covered_since() is not None
+
+
+def _backlog_rows(country_code: Optional[str] = None, statuses: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    def build():
+        q = _get_supabase().table("ops_backlog_state").select("*").gt("open_count", 0)
+        if country_code:
+            q = q.eq("country_code", country_code)
+        if statuses:
+            q = q.in_("status", list(statuses))
+        return q.order("id")
+
+    return list(_paged_rows(build))
+
+
+def _sum_hist(rows: Iterable[Dict[str, Any]], col: str) -> Dict[str, int]:
+    out = {label: 0 for _, label in _HIST_BINS}
+    for r in rows:
+        for label, n in (r.get(col) or {}).items():
+            out[label] = out.get(label, 0) + int(n or 0)
+    return out
+
+
+def _get_sla_overview_rollup(country_code: Optional[str], days: int) -> Dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    since = _floor_day(now) - timedelta(days=max(days, 1) - 1)
+    rows = (
+        _get_supabase().table("ops_metrics_buckets")
+        .select("*")
+        .eq("granularity", "day")
+        .eq("country_code", country_code or "")
+        .in_("priority_band", ["", "critical"])
+        .gte("bucket_start", since.isoformat())
+        .execute()
+    ).data or []
+    all_rows = [r for r in rows if (r.get("priority_band") or "") == ""]
+    crit_rows = [r for r in rows if r.get("priority_band") == "critical"]
+
+    def total(rs: List[Dict[str, Any]], col: str) -> float:
+        return sum(float(r.get(col) or 0) for r in rs)
+
+    backlog = _backlog_rows(country_code)
+    open_count = sum(int(r.get("open_count") or 0) for r in backlog)
+    open_breached = sum(int(r.get("breached_count") or 0) for r in backlog)
+    crit_open_breached = sum(int(r.get("breached_count") or 0) for r in backlog if r.get("priority_band") == "critical")
+
+    breached_count = open_breached + int(total(all_rows, "resolved_breached_count"))
+    total_with_sla = int(total(all_rows, "sla_tracked_count"))
+    on_time = total_with_sla - breached_count if total_with_sla else 0
+    on_time_rate = (on_time / total_with_sla * 100) if total_with_sla else 100
+    assign_n = total(all_rows, "assign_count")
+    resolve_n = total(all_rows, "resolve_count")
+
+    return {
+        "open_count": open_count,
+        "overdue_count": open_breached,
+        "breached_count": breached_count,
+        "on_time_resolution_rate_pct": round(on_time_rate, 1),
+        "avg_time_to_assign_hours": round(total(all_rows, "assign_hours_sum") / assign_n, 2) if assign_n else 0,
+        "avg_time_to_resolve_hours": round(total(all_rows, "resolve_hours_sum") / resolve_n, 2) if resolve_n else 0,
+        "resolved_count": int(total(all_rows, "resolved_count")),
+        "created_count": int(total(all_rows, "created_count")),
+        "critical_resolved": int(total(crit_rows, "resolved_count")),
+        "critical_breach_count": crit_open_breached + int(total(crit_rows, "resolved_breached_count")),
+        "time_to_assign_histogram": _sum_hist(all_rows, "assign_hist_json"),
+        "time_to_resolve_histogram": _sum_hist(all_rows, "resolve_hist_json"),
+    }
+
+
+def get_sla_overview(
+    country_code: Optional[str] = None,
+    days: int = 30,
+) -> Dict[str, Any]:
+    """SLA overview KPIs for review queue items (from day buckets + backlog state when they cover the range)."""
+    covered_since = _rollup_covered_since()
+    since = _floor_day(datetime.now(timezone.utc)) - timedelta(days=max(days, 1) - 1)
+    if covered_since is not None and covered_since <= since:
+        return _get_sla_overview_rollup(country_code, days)
+    return _get_sla_overview_raw(country_code=country_code, days=days)
+
+
+def get_queue_backlog(
+    country_code: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Queue backlog metrics by status and priority."""
+    if not _rollup_available():
+        return _get_queue_backlog_raw(country_code=country_code)
+    by_status: Dict[str, int] = {}
+    by_priority: Dict[str, int] = {}
+    by_type: Dict[str, int] = {}
+    total = 0
+    for r in _backlog_rows(country_code):
+        n = int(r.get("open_count") or 0)
+        total += n
+        s = r.get("status") or "unknown"
+        by_status[s] = by_status.get(s, 0) + n
+        p = r.get("priority_band") or "medium"
+        by_priority[p] = by_priority.get(p, 0) + n
+        t = r.get("queue_item_type") or "unknown"
+        by_type[t] = by_type.get(t, 0) + n
+    return {
+        "total": total,
+        "by_status": by_status,
+        "by_priority": by_priority,
+        "by_queue_item_type": by_type,
+    }
+
+
+def get_reviewer_workload() -> Dict[str, Any]:
+    """Workload by assignee."""
+    if not _rollup_available():
+        return _get_reviewer_workload_raw()
+    by_assignee: Dict[str, Dict[str, Any]] = {}
+    for r in _backlog_rows(statuses=_WORKLOAD_STATUSES):
+        aid = r.get("assigned_to_user_id") or "_unassigned"
+        n = int(r.get("open_count") or 0)
+        if aid not in by_assignee:
+            by_assignee[aid] = {"total": 0, "in_progress": 0, "blocked": 0, "overdue": 0, "critical": 0}
+        by_assignee[aid]["total"] += n
+        if r.get("status") == "in_progress":
+            by_assignee[aid]["in_progress"] += n
+        if r.get("status") == "blocked":
+            by_assignee[aid]["blocked"] += n
+        if r.get("priority_band") == "critical":
+            by_assignee[aid]["critical"] += n
+        by_assignee[aid]["overdue"] += int(r.get("overdue_count") or 0)
+    return {"by_assignee": by_assignee}
+
+
+def get_destination_ops_metrics() -> Dict[str, Any]:
+    """Metrics by country/city."""
+    if not _rollup_available():
+        return _get_destination_ops_metrics_raw()
+    by_dest: Dict[str, Dict[str, Any]] = {}
+    for r in _backlog_rows():
+        cc = r.get("country_code") or None
+        city = r.get("city_name") or None
+        key = f"{cc or 'unknown'}:{city or ''}"
+        if key not in by_dest:
+            by_dest[key] = {"country_code": cc, "city_name": city, "total": 0, "critical": 0}
+        n = int(r.get("open_count") or 0)
+        by_dest[key]["total"] += n
+        if r.get("priority_band") == "critical":
+            by_dest[key]["critical"] += n
+    return {"items": list(by_dest.values())}
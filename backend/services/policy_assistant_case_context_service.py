@@ -213,6 +213,22 @@ def get_source_chunks_for_fact_ids(db: Database, fact_ids: List[str]) -> List[Di
     return db.get_policy_document_chunks_by_ids(list(dict.fromkeys(chunk_ids)))
 
 
+def search_supporting_chunks_for_message(
+    db: Database,
+    company_id: str,
+    message: str,
+    *,
+    limit: int = 5,
+) -> List[Dict[str, Any]]:
+    """Top-k chunks of the company's active snapshot for ``message`` (indexed lexical retrieval)."""
+    if not company_id or not (message or "").strip() or not db.policy_assistant_tables_available():
+        return []
+    snap = db.get_active_policy_knowledge_snapshot_for_company(company_id)
+    if not snap:
+        return []
+    return db.search_policy_document_chunks(str(snap.get("id")), message, limit=limit)
+
+
 def build_policy_assistant_context(db: Database, case_id: str) -> Dict[str, Any]:
     """PolicyAssistantContext payload for GET /api/policy-assistant/cases/{case_id}/context"""
     res = get_policy_facts_for_case(db, case_id)
@@ -9,6 +9,7 @@ from __future__ import annotations
 import re
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -374,33 +375,143 @@ _TOPIC_RULES: Tuple[_TopicRule, ...] = (
 )
 
 
+# --- Compiled topic scorer ---
+#
+# Built once at import: every literal phrase across ``_TOPIC_RULES`` is folded into a single
+# prefix-trie alternation inside a lookahead, so one scan of the message finds the longest literal
+# starting at each position. Literals that are prefixes of that hit are credited too, which keeps
+# the original ``phrase in norm`` substring semantics. Regex phrases and negatives are deduplicated
+# and each distinct pattern is evaluated at most once per message; negatives only for rules that hit.
+
+
+def _trie_alternation(words: Sequence[str]) -> str:
+    """Regex alternation over ``words`` factored by common prefix; greedy, so the longest word wins."""
+    trie: Dict[str, dict] = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _emit(node: Dict[str, dict]) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + _emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return "(?:" + body + ")?"
+        return body
+
+    return _emit(trie)
+
+
+@dataclass(frozen=True)
+class _CompiledTopicRules:
+    # Flattened (rule index, weight) per phrase; indices below refer to this tuple.
+    phrases: Tuple[Tuple[int, int], ...]
+    literal_scan: Optional[re.Pattern[str]]
+    # Longest literal hit -> phrase indices of every literal that is a prefix of it.
+    literal_credits: Dict[str, Tuple[int, ...]]
+    patterns: Tuple[Tuple[re.Pattern[str], Tuple[int, ...]], ...]
+    negatives: Tuple[re.Pattern[str], ...]
+    # Per rule: indices into ``negatives``.
+    rule_negatives: Tuple[Tuple[int, ...], ...]
+    rule_topics: Tuple[PolicyAssistantCanonicalTopic, ...]
+
+
+def _compile_topic_rules(rules: Sequence[_TopicRule]) -> _CompiledTopicRules:
+    phrases: List[Tuple[int, int]] = []
+    literal_ids: Dict[str, List[int]] = {}
+    pattern_ids: Dict[Tuple[str, int], Tuple[re.Pattern[str], List[int]]] = {}
+    negative_index: Dict[Tuple[str, int], int] = {}
+    negatives: List[re.Pattern[str]] = []
+    rule_negatives: List[Tuple[int, ...]] = []
+
+    for rule_idx, rule in enumerate(rules):
+        for p, w in rule.phrases:
+            idx = len(phrases)
+            phrases.append((rule_idx, w))
+            if isinstance(p, str):
+                literal_ids.setdefault(p, []).append(idx)
+            else:
+                pattern_ids.setdefault((p.pattern, p.flags), (p, []))[1].append(idx)
+        neg_ids: List[int] = []
+        for n in rule.negatives:
+            key = (n.pattern, n.flags)
+            if key not in negative_index:
+                negative_index[key] = len(negatives)
+                negatives.append(n)
+            neg_ids.append(negative_index[key])
+        rule_negatives.append(tuple(neg_ids))
+
+    literals = sorted(literal_ids, key=lambda x: (-len(x), x))
+    literal_scan = re.compile("(?=(" + _trie_alternation(literals) + "))") if literals else None
+    literal_credits = {
+        hit: tuple(i for lit in literals if hit.startswith(lit) for i in literal_ids[lit])
+        for hit in literals
+    }
+    return _CompiledTopicRules(
+        phrases=tuple(phrases),
+        literal_scan=literal_scan,
+        literal_credits=literal_credits,
+        patterns=tuple((p, tuple(ids)) for p, ids in pattern_ids.values()),
+        negatives=tuple(negatives),
+        rule_negatives=tuple(rule_negatives),
+        rule_topics=tuple(rule.topic for rule in rules),
+    )
+
+
+_COMPILED_TOPIC_RULES = _compile_topic_rules(_TOPIC_RULES)
+
+
+@lru_cache(maxsize=512)
+def _scan_topic_scores(norm: str, relaxed: bool) -> Tuple[Tuple[PolicyAssistantCanonicalTopic, int], ...]:
+    """Score every rule topic in one pass over ``norm`` (memoized; scores do not depend on ``allowed``)."""
+    compiled = _COMPILED_TOPIC_RULES
+    hits = set()
+    if compiled.literal_scan is not None:
+        for m in compiled.literal_scan.finditer(norm):
+            hits.update(compiled.literal_credits[m.group(1)])
+    for pat, ids in compiled.patterns:
+        if pat.search(norm):
+            hits.update(ids)
+
+    hit_rules = {compiled.phrases[idx][0] for idx in hits}
+    negative_hits: Dict[int, bool] = {}
+    skipped = set()
+    for rule_idx in hit_rules:
+        neg_ids = compiled.rule_negatives[rule_idx]
+        matched = False
+        for i in neg_ids:
+            if i not in negative_hits:
+                negative_hits[i] = compiled.negatives[i].search(norm) is not None
+            if negative_hits[i]:
+                matched = True
+                break
+        if not matched:
+            continue
+        topic = compiled.rule_topics[rule_idx]
+        if relaxed and topic == PolicyAssistantCanonicalTopic.SCHOOL_SEARCH and "school search" in norm:
+            continue
+        skipped.add(rule_idx)
+
+    scores: Dict[PolicyAssistantCanonicalTopic, int] = {t: 0 for t in compiled.rule_topics}
+    for idx in hits:
+        rule_idx, weight = compiled.phrases[idx]
+        if rule_idx not in skipped:
+            scores[compiled.rule_topics[rule_idx]] += weight
+    return tuple(scores.items())
+
+
 def _score_topics(
     norm: str,
     allowed: List[PolicyAssistantCanonicalTopic],
     *,
     relaxed: bool = False,
 ) -> Dict[PolicyAssistantCanonicalTopic, int]:
-    scores: Dict[PolicyAssistantCanonicalTopic, int] = {t: 0 for t in allowed}
-    for rule in _TOPIC_RULES:
-        if rule.topic not in scores:
-            continue
-        skip = any(n.search(norm) for n in rule.negatives)
-        if (
-            skip
-            and relaxed
-            and rule.topic == PolicyAssistantCanonicalTopic.SCHOOL_SEARCH
-            and "school search" in norm
-        ):
-            skip = False
-        if skip:
-            continue
-        for p, w in rule.phrases:
-            if isinstance(p, str):
-                if p in norm:
-                    scores[rule.topic] += w
-            elif p.search(norm):
-                scores[rule.topic] += w
-    return scores
+    all_scores = dict(_scan_topic_scores(norm, bool(relaxed)))
+    return {t: all_scores.get(t, 0) for t in allowed}
 
 
 def score_policy_assistant_topics(
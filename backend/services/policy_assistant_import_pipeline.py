@@ -1,9 +1,11 @@
 """
-Orchestrates assistant import: lock → text → candidate snapshot → chunks → facts → activate (append-only).
+Orchestrates assistant import: lock → text → candidate snapshot → chunks + facts (one transaction) → activate
+(append-only).
 """
 from __future__ import annotations
 
 import logging
+import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 
@@ -11,7 +13,6 @@ from ..database import Database
 from .audit_log_service import ACTOR_HUMAN, insert_audit_log
 from .policy_context_graph_service import PolicyContextGraphService
 from .policy_fact_extraction_service import extract_minimal_policy_facts
-from .policy_knowledge_snapshot_service import PolicyKnowledgeSnapshotService
 from .policy_storage_paths import BUCKET_HR_POLICIES, normalize_policy_storage_object_key
 from .policy_text_extraction_service import PolicyTextExtractionService, build_chunks
 from .supabase_client import get_supabase_admin_client
@@ -120,26 +121,21 @@ def run_policy_assistant_import_pipeline(
             activation_state="candidate",
         )
 
+        # Chunk ids are assigned up front so facts can reference them; chunks + facts are then written
+        # in one transaction and the snapshot is only activated after that commit. The chunk retrieval index
+        # (FTS5 triggers / generated tsvector) is populated by the same insert.
         chunk_defs = build_chunks(full_text)
         chunk_rows: list[dict[str, Any]] = []
         for c in chunk_defs:
-            cid = db.insert_policy_document_chunk(
-                doc_id,
-                int(c["chunk_index"]),
-                str(c["text_content"]),
-                page_number=c.get("page_number"),
-                section_title=c.get("section_title"),
-                token_count=max(1, len(str(c["text_content"])) // 4),
-                metadata_json=c.get("metadata_json"),
-                snapshot_id=snapshot_id,
-            )
             chunk_rows.append(
                 {
-                    "id": cid,
-                    "chunk_index": c["chunk_index"],
-                    "text_content": c["text_content"],
+                    "id": str(uuid.uuid4()),
+                    "chunk_index": int(c["chunk_index"]),
+                    "text_content": str(c["text_content"]),
                     "section_title": c.get("section_title"),
                     "page_number": c.get("page_number"),
+                    "token_count": max(1, len(str(c["text_content"])) // 4),
+                    "metadata_json": c.get("metadata_json"),
                 }
             )
 
@@ -154,15 +150,13 @@ def run_policy_assistant_import_pipeline(
 
         facts = extract_minimal_policy_facts(chunk_rows)
         run_facts = db.insert_policy_processing_run(doc_id, "fact_extraction", status="running")
+        db.insert_policy_snapshot_contents(doc_id, snapshot_id, chunk_rows, facts)
         db.finish_policy_processing_run(
             run_facts,
             "completed",
             metrics_json={"facts": len(facts), "snapshot_id": snapshot_id},
         )
 
-        snap_svc = PolicyKnowledgeSnapshotService(db)
-        snap_svc.attach_facts_to_snapshot(snapshot_id, facts)
-
         run_graph = db.insert_policy_processing_run(doc_id, "graph_sync", status="running")
         db.activate_policy_knowledge_snapshot(snapshot_id, company_id, doc_id, uid)
         graph = PolicyContextGraphService(db)
@@ -130,6 +130,27 @@ _CANONICAL_PHRASES: Tuple[Tuple[str, str, float], ...] = (
 )
 
 
+# Disambiguation patterns (compiled once; run on every summary row)
+_LANGUAGE_SCHOOL_RE = re.compile(r"\blanguage\s+school\b")
+_SCHOOL_FEES_RE = re.compile(r"\b(school fees|tuition reimbursement|tuition difference)\b")
+_TRANSPORT_LABEL_RE = re.compile(r"\b(transport|transportation|car|vehicle|driving|commute|parking)\b", re.I)
+_TEMP_HOUSING_LABEL_RE = re.compile(r"\b(host housing|temporary accommodation|temporary living)\b", re.I)
+_HOUSING_WORD_RE = re.compile(r"\bhousing\b", re.I)
+_TRANSPORT_WORD_RE = re.compile(r"\btransport\b", re.I)
+_COMPENSATION_LABEL_RE = re.compile(r"\b(compensation|payroll|remuneration|salary package)\b", re.I)
+_COMPENSATION_SECTION_RE = re.compile(r"compensation\s+and\s+payroll", re.I)
+_EXPLICIT_HOUSING_RE = re.compile(
+    r"\b(host housing|temporary living|temporary accommodation|company housing)\b", re.I
+)
+_SPOUSE_SUPPORT_RE = re.compile(
+    r"\b(spouse support|partner career|dual career|trailing spouse|spousal allowance|partner support)\b",
+    re.I,
+)
+_HOUSING_SIGNAL_RE = re.compile(r"\b(host housing|housing allowance|accommodation|rent|lease)\b", re.I)
+_TEMP_ACCOMMODATION_RE = re.compile(r"\b(temporary living|temporary accommodation|interim housing|hotel)\b")
+_HOST_HOUSING_RE = re.compile(r"\b(host housing|host-provided housing|company housing)\b")
+
+
 def _apply_phrase_scores(
     scores: Dict[str, float],
     *,
@@ -220,9 +241,7 @@ def _disambiguate_education_vs_language(scores: Dict[str, float], combined: str)
         scores["school_search"] = max(0.0, scores.get("school_search", 0.0) - 10.0)
         scores["language_training"] = scores.get("language_training", 0.0) + 4.0
 
-    if re.search(r"\blanguage\s+school\b", combined) and not re.search(
-        r"\b(school fees|tuition reimbursement|tuition difference)\b", combined
-    ):
+    if _LANGUAGE_SCHOOL_RE.search(combined) and not _SCHOOL_FEES_RE.search(combined):
         scores["child_education"] = max(0.0, scores.get("child_education", 0.0) - 8.0)
         scores["language_training"] = scores.get("language_training", 0.0) + 5.0
 
@@ -242,13 +261,7 @@ def _disambiguate_housing_vs_transport(
     section: str,
     combined: str,
 ) -> None:
-    trans_label = bool(
-        re.search(
-            r"\b(transport|transportation|car|vehicle|driving|commute|parking)\b",
-            label,
-            re.I,
-        )
-    )
+    trans_label = bool(_TRANSPORT_LABEL_RE.search(label))
     trans_words = any(
         p in combined
         for p in (
@@ -273,9 +286,7 @@ def _disambiguate_housing_vs_transport(
         )
     )
 
-    if trans_label and trans_words and not re.search(
-        r"\b(host housing|temporary accommodation|temporary living)\b", label, re.I
-    ):
+    if trans_label and trans_words and not _TEMP_HOUSING_LABEL_RE.search(label):
         scores["host_transportation"] = scores.get("host_transportation", 0.0) + 10.0
         scores["host_housing"] = max(0.0, scores.get("host_housing", 0.0) - 14.0)
         scores["temporary_living_outbound"] = max(0.0, scores.get("temporary_living_outbound", 0.0) - 8.0)
@@ -283,9 +294,7 @@ def _disambiguate_housing_vs_transport(
     if trans_words and not housing_words:
         scores["host_housing"] = max(0.0, scores.get("host_housing", 0.0) - 6.0)
 
-    housing_section = bool(re.search(r"\bhousing\b", section, re.I)) and not re.search(
-        r"\btransport\b", section, re.I
-    )
+    housing_section = bool(_HOUSING_WORD_RE.search(section)) and not _TRANSPORT_WORD_RE.search(section)
     if housing_section and trans_label:
         scores["host_transportation"] = scores.get("host_transportation", 0.0) + 8.0
         scores["host_housing"] = max(0.0, scores.get("host_housing", 0.0) - 10.0)
@@ -298,16 +307,8 @@ def _disambiguate_compensation_vs_housing(
     section: str,
     combined: str,
 ) -> None:
-    comp_heading = bool(
-        re.search(r"\b(compensation|payroll|remuneration|salary package)\b", label, re.I)
-    ) or bool(re.search(r"compensation\s+and\s+payroll", section, re.I))
-    explicit_housing = bool(
-        re.search(
-            r"\b(host housing|temporary living|temporary accommodation|company housing)\b",
-            combined,
-            re.I,
-        )
-    )
+    comp_heading = bool(_COMPENSATION_LABEL_RE.search(label)) or bool(_COMPENSATION_SECTION_RE.search(section))
+    explicit_housing = bool(_EXPLICIT_HOUSING_RE.search(combined))
     if comp_heading and not explicit_housing:
         scores["host_housing"] = max(0.0, scores.get("host_housing", 0.0) - 16.0)
         scores["temporary_living_outbound"] = max(0.0, scores.get("temporary_living_outbound", 0.0) - 10.0)
@@ -317,16 +318,8 @@ def _disambiguate_compensation_vs_housing(
 
 
 def _disambiguate_spouse_vs_housing(scores: Dict[str, float], combined: str) -> None:
-    spouse_signal = bool(
-        re.search(
-            r"\b(spouse support|partner career|dual career|trailing spouse|spousal allowance|partner support)\b",
-            combined,
-            re.I,
-        )
-    )
-    housing_signal = bool(
-        re.search(r"\b(host housing|housing allowance|accommodation|rent|lease)\b", combined, re.I)
-    )
+    spouse_signal = bool(_SPOUSE_SUPPORT_RE.search(combined))
+    housing_signal = bool(_HOUSING_SIGNAL_RE.search(combined))
     if spouse_signal and not housing_signal:
         scores["spouse_support"] = scores.get("spouse_support", 0.0) + 8.0
         scores["host_housing"] = max(0.0, scores.get("host_housing", 0.0) - 12.0)
@@ -334,9 +327,9 @@ def _disambiguate_spouse_vs_housing(scores: Dict[str, float], combined: str) ->
 
 def _cross_penalties_host_temp(scores: Dict[str, float], combined: str) -> None:
     """Strong temporary-accommodation language suppresses host housing and vice versa."""
-    if re.search(r"\b(temporary living|temporary accommodation|interim housing|hotel)\b", combined):
+    if _TEMP_ACCOMMODATION_RE.search(combined):
         scores["host_housing"] = max(0.0, scores.get("host_housing", 0.0) - 5.0)
-    if re.search(r"\b(host housing|host-provided housing|company housing)\b", combined):
+    if _HOST_HOUSING_RE.search(combined):
         scores["temporary_living_outbound"] = max(0.0, scores.get("temporary_living_outbound", 0.0) - 5.0)
 
 
@@ -0,0 +1,342 @@
+"""
+Heuristic clause signals: the keyword tables and regexes used by clause segmentation (Layer-1
+hints, clause typing) and by normalization's text helpers, compiled once at import.
+
+``clause_signals(text)`` returns a cached, per-text object whose signals are computed on first
+access. Segmentation (``_extract_normalized_hints`` / ``_classify_clause``) and normalization
+(calc type, amount, applicability helpers) read the same object, so a clause is lowered once and
+each table is scanned once, however many helpers ask.
+
+Keyword lists stay as plain substring checks: on clause-sized text they measured 2-3x faster than
+a single merged regex alternation, so only the regex tables are precompiled.
+"""
+from __future__ import annotations
+
+import re
+from functools import cached_property, lru_cache
+from typing import List, Optional, Tuple
+
+from .policy_source_provenance import filter_candidate_numeric_values
+
+# Clause types
+CLAUSE_SCOPE = "scope"
+CLAUSE_ELIGIBILITY = "eligibility"
+CLAUSE_BENEFIT = "benefit"
+CLAUSE_EXCLUSION = "exclusion"
+CLAUSE_APPROVAL_RULE = "approval_rule"
+CLAUSE_EVIDENCE_RULE = "evidence_rule"
+CLAUSE_TAX_RULE = "tax_rule"
+CLAUSE_DEFINITION = "definition"
+CLAUSE_LIFECYCLE_RULE = "lifecycle_rule"
+CLAUSE_UNKNOWN = "unknown"
+
+# Section headings that map to clause sections (case-insensitive)
+SECTION_HEADINGS = [
+    "scope and exclusions",
+    "scope",
+    "exclusions",
+    "family status",
+    "accompanying family",
+    "social coverage",
+    "social security",
+    "taxation",
+    "tax equalization",
+    "moving services",
+    "household goods",
+    "accommodation",
+    "housing",
+    "schooling",
+    "education",
+    "tuition",
+    "home leave",
+    "support to partner",
+    "spousal support",
+    "tax equalization",
+    "responsibility matrix",
+    "long term assignment",
+    "short term assignment",
+    "policy summary",
+    "eligibility",
+    "definitions",
+]
+
+# Clause-type keyword mapping (phrase -> clause_type)
+CLAUSE_TYPE_SIGNALS: List[Tuple[List[str], str]] = [
+    (["scope", "applies to", "in scope", "out of scope", "coverage applies"], CLAUSE_SCOPE),
+    (["eligibility", "eligible", "qualify", "qualification"], CLAUSE_ELIGIBILITY),
+    (["exclusion", "excluded", "not covered", "ineligible", "does not apply"], CLAUSE_EXCLUSION),
+    (["approval", "pre-approval", "prior approval", "requires approval", "hr approval"], CLAUSE_APPROVAL_RULE),
+    (["evidence", "receipt", "invoice", "documentation required", "submit receipts"], CLAUSE_EVIDENCE_RULE),
+    (["tax equalization", "hypothetical tax", "tax protection", "tax assistance"], CLAUSE_TAX_RULE),
+    (["definition", "defined as", "means ", "refers to"], CLAUSE_DEFINITION),
+    (["repatriation", "return shipment", "end of assignment", "lifecycle"], CLAUSE_LIFECYCLE_RULE),
+    (["housing", "allowance", "moving", "school", "tuition", "home leave", "mobility premium"], CLAUSE_BENEFIT),
+]
+
+# Benefit key candidates (normalized keys for downstream)
+BENEFIT_KEY_PATTERNS: List[Tuple[str, str]] = [
+    ("housing", r"\b(housing|accommodation|rental|temporary housing)\b"),
+    ("household_goods", r"\b(household goods|shipment|moving|movers|freight)\b"),
+    ("tuition", r"\b(tuition|education|schooling)\b"),
+    ("home_leave", r"\b(home leave|home flight)\b"),
+    ("mobility_premium", r"\b(mobility premium|expatriate premium)\b"),
+    ("settling_in", r"\b(settling[- ]?in|relocation allowance)\b"),
+    ("tax_equalization", r"\b(tax equalization|hypothetical tax)\b"),
+    ("spouse_support", r"\b(spousal support|partner support)\b"),
+]
+
+CURRENCY_PATTERN = re.compile(r"\b(USD|EUR|GBP|CHF|CAD|AUD|JPY)\b", re.I)
+UNIT_PATTERNS = [
+    (r"\b(%|percent|percentage)\b", "%"),
+    (r"\b(days?)\b", "days"),
+    (r"\b(weeks?)\b", "weeks"),
+    (r"\b(months?)\b", "months"),
+    (r"\b(years?)\b", "years"),
+    (r"\b(lbs?|kg)\b", "weight"),
+]
+NUMERIC_PATTERN = re.compile(
+    r"(?:\b|\$|€|£)\s*([0-9]+(?:,[0-9]{3})*(?:\.[0-9]+)?)\s*(?:k|K|m|M|%|USD|EUR|GBP)?\b"
+)
+FREQUENCY_PATTERNS = [
+    (r"\b(per year|annually|yearly)\b", "per_year"),
+    (r"\b(per assignment|per move)\b", "per_assignment"),
+    (r"\b(monthly|per month)\b", "monthly"),
+    (r"\b(one[- ]?time|once)\b", "one_time"),
+]
+ASSIGNMENT_TYPE_TERMS = ["long_term", "short_term", "permanent", "commuter", "international"]
+ASSIGNMENT_PATTERNS = [
+    (r"\b(long[- ]?term|long term|lta)\b", "long_term"),
+    (r"\b(short[- ]?term|short term|sta)\b", "short_term"),
+    (r"\b(permanent transfer|permanent relocation)\b", "permanent"),
+    (r"\b(commuter)\b", "commuter"),
+]
+FAMILY_TERMS = ["single", "married", "spouse", "dependents", "accompanying", "family"]
+EXCLUSION_SIGNALS = ["exclusion", "excluded", "not covered", "ineligible", "does not apply", "out of scope"]
+APPROVAL_SIGNALS = ["approval", "pre-approval", "prior approval", "requires approval", "hr approval"]
+EVIDENCE_ITEMS = ["receipt", "receipts", "invoice", "invoices", "documentation", "proof", "quote", "estimates"]
+
+# calc_type detection patterns (normalization)
+CALC_PERCENT = re.compile(r"(\d{1,3})\s*%\s*(?:of|on)?\s*(?:base\s+)?salary", re.I)
+CALC_DAYS = re.compile(r"(\d{1,4})\s*(?:days?|working\s+days?)", re.I)
+CALC_DIFFERENCE = re.compile(r"difference|reimburse.*difference|difference\s+only", re.I)
+CALC_PER_DIEM = re.compile(r"per\s+diem|daily\s+(?:rate|allowance)", re.I)
+
+# Phrases that frame a clause as an exclusion even when segmentation did not flag it
+EXCLUSION_LANGUAGE_PHRASES = (
+    "not covered",
+    "no coverage",
+    "does not cover",
+    "not eligible",
+    "excludes",
+    "excluded",
+    "not available",
+    "will not be provided",
+    "will not cover",
+    "not payable",
+    "not reimbursed",
+    "without coverage",
+)
+# Checked in this order against the upper-cased text, then the symbols
+CURRENCY_TOKENS = ("EUR", "USD", "GBP", "CHF", "CAD", "AUD", "SGD", "NZD")
+TABLE_BENEFIT_MARKERS = ("usd", "eur", "%", "limit", "allowance", "cover")
+
+_BENEFIT_KEY_RES = tuple((key, re.compile(pat, re.I)) for key, pat in BENEFIT_KEY_PATTERNS)
+_UNIT_RES = tuple((re.compile(pat), unit) for pat, unit in UNIT_PATTERNS)
+_FREQUENCY_RES = tuple((re.compile(pat), freq) for pat, freq in FREQUENCY_PATTERNS)
+_ASSIGNMENT_RES = tuple((re.compile(pat), at) for pat, at in ASSIGNMENT_PATTERNS)
+
+_CURRENCY_AMOUNT_RE = re.compile(
+    r"(?:EUR|USD|GBP|CHF|CAD|AUD|SGD|NZD)\s*([0-9]+(?:,[0-9]{3})*(?:\.[0-9]+)?)", re.I
+)
+_BARE_AMOUNT_RE = re.compile(r"(?:\b|\$|€|£)\s*([0-9]+(?:,[0-9]{3})*(?:\.[0-9]+)?)")
+_PERCENT_AMOUNT_RE = re.compile(r"(\d{1,3})\s*%")
+_PERCENT_WORD_RE = re.compile(r"\bpercent\b", re.I)
+_DIRECTORS_RE = re.compile(r"\bdirectors?\b")
+_EXECUTIVES_RE = re.compile(r"\bexecutives?\b|\bsenior management\b|\bc[- ]suite\b")
+_SINGLE_RE = re.compile(r"\bsingle(?:\s+employees?)?\b|\bunmarried\b")
+_NIGHTS_DAYS_RE = re.compile(r"(\d{1,4})\s*(?:additional\s+)?(nights?|days?)\b", re.I)
+_LONG_TERM_RE = re.compile(r"long[-\s]term")
+_SHORT_TERM_RE = re.compile(r"short[-\s]term")
+_COMMUTER_RE = re.compile(r"\bcommuter\b")
+_PERMANENT_RE = re.compile(r"\bpermanent\b")
+_DURATION_THRESHOLD_RE = re.compile(r"(\d{1,3})\s*(?:months?|years?)", re.I)
+
+
+def _first_amount(pattern: "re.Pattern[str]", text: str) -> Optional[float]:
+    m = pattern.search(text)
+    if m:
+        try:
+            return float(m.group(1).replace(",", ""))
+        except ValueError:
+            pass
+    return None
+
+
+class ClauseTextSignals:
+    """
+    Lazily computed heuristic signals for one clause text. Values are immutable (tuples / scalars)
+    because instances are shared through the ``clause_signals`` cache; callers copy into lists.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.lower = text.lower()
+
+    # --- Segmentation (Layer-1 hints, clause typing) ---
+
+    @cached_property
+    def benefit_key(self) -> Optional[str]:
+        for key, pat in _BENEFIT_KEY_RES:
+            if pat.search(self.lower):
+                return key
+        return None
+
+    @cached_property
+    def currency(self) -> Optional[str]:
+        m = CURRENCY_PATTERN.search(self.text)
+        return m.group(1).upper() if m else None
+
+    @cached_property
+    def unit(self) -> Optional[str]:
+        for pat, unit in _UNIT_RES:
+            if pat.search(self.lower):
+                return unit
+        return None
+
+    @cached_property
+    def numeric_values(self) -> Tuple[float, ...]:
+        nums = []
+        for m in NUMERIC_PATTERN.finditer(self.text):
+            s = m.group(1).replace(",", "")
+            try:
+                n = float(s)
+                if 0 < n < 1e12:
+                    nums.append(n)
+            except ValueError:
+                pass
+        if not nums:
+            return ()
+        return tuple(filter_candidate_numeric_values(list(dict.fromkeys(nums))[:12], self.text)[:10])
+
+    @cached_property
+    def frequency(self) -> Optional[str]:
+        for pat, freq in _FREQUENCY_RES:
+            if pat.search(self.lower):
+                return freq
+        return None
+
+    @cached_property
+    def assignment_types(self) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(at for pat, at in _ASSIGNMENT_RES if pat.search(self.lower)))
+
+    @cached_property
+    def family_terms(self) -> Tuple[str, ...]:
+        return tuple(t for t in FAMILY_TERMS if t in self.lower)
+
+    @cached_property
+    def exclusion_flag(self) -> bool:
+        return any(s in self.lower for s in EXCLUSION_SIGNALS)
+
+    @cached_property
+    def approval_flag(self) -> bool:
+        return any(s in self.lower for s in APPROVAL_SIGNALS)
+
+    @cached_property
+    def evidence_items(self) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(e for e in EVIDENCE_ITEMS if e in self.lower))
+
+    @cached_property
+    def clause_type_hits(self) -> Tuple[str, ...]:
+        """Clause types with at least one signal phrase present, in ``CLAUSE_TYPE_SIGNALS`` order."""
+        return tuple(ctype for signals, ctype in CLAUSE_TYPE_SIGNALS if any(s in self.lower for s in signals))
+
+    @cached_property
+    def table_benefit_marker(self) -> bool:
+        return any(x in self.lower for x in TABLE_BENEFIT_MARKERS)
+
+    # --- Normalization text helpers ---
+
+    @cached_property
+    def exclusion_language(self) -> bool:
+        return any(p in self.lower for p in EXCLUSION_LANGUAGE_PHRASES)
+
+    @cached_property
+    def currency_token(self) -> Optional[str]:
+        upper = self.text.upper()
+        for token in CURRENCY_TOKENS:
+            if token in upper:
+                return token
+        if "€" in self.text:
+            return "EUR"
+        if "£" in self.text:
+            return "GBP"
+        if "$" in self.text:
+            return "USD"
+        return None
+
+    @cached_property
+    def text_amount(self) -> Optional[float]:
+        """First amount in the text (currency-prefixed, then bare number, then percentage)."""
+        for pattern in (_CURRENCY_AMOUNT_RE, _BARE_AMOUNT_RE):
+            value = _first_amount(pattern, self.text)
+            if value is not None:
+                return value
+        m = _PERCENT_AMOUNT_RE.search(self.text)
+        return float(m.group(1)) if m else None
+
+    @cached_property
+    def mentions_percent(self) -> bool:
+        return "%" in self.text or bool(_PERCENT_WORD_RE.search(self.text))
+
+    @cached_property
+    def role_hints(self) -> Tuple[str, ...]:
+        out = []
+        if _DIRECTORS_RE.search(self.lower):
+            out.append("directors")
+        if _EXECUTIVES_RE.search(self.lower):
+            out.append("executives")
+        return tuple(out)
+
+    @cached_property
+    def family_context_terms(self) -> Tuple[str, ...]:
+        out = []
+        if _SINGLE_RE.search(self.lower):
+            out.append("single")
+        if "married" in self.lower or "spouse" in self.lower or "accompanied" in self.lower:
+            out.append("family_context")
+        return tuple(out)
+
+    @cached_property
+    def nights_or_days(self) -> Optional[Tuple[int, str]]:
+        m = _NIGHTS_DAYS_RE.search(self.text)
+        if not m:
+            return None
+        return int(m.group(1)), ("nights" if "night" in m.group(2).lower() else "days")
+
+    @cached_property
+    def assignment_type_keys(self) -> Tuple[str, ...]:
+        """``ASSIGNMENT_TYPE_MAP`` keys implied by free text (weakly structured summaries)."""
+        out = []
+        if _LONG_TERM_RE.search(self.lower):
+            out.append("long_term")
+        if _SHORT_TERM_RE.search(self.lower):
+            out.append("short_term")
+        if _COMMUTER_RE.search(self.lower):
+            out.append("commuter")
+        if _PERMANENT_RE.search(self.lower) and "assignment" in self.lower:
+            out.append("permanent")
+        return tuple(out)
+
+    @cached_property
+    def duration_threshold_match(self) -> Optional[Tuple[int, bool]]:
+        """(number, is_years) for the first ``N months/years`` mention."""
+        m = _DURATION_THRESHOLD_RE.search(self.text)
+        if not m:
+            return None
+        return int(m.group(1)), "year" in m.group(0).lower()
+
+
+@lru_cache(maxsize=4096)
+def clause_signals(text: str) -> ClauseTextSignals:
+    """Shared signals for ``text``. Segmentation and normalization of the same clause hit the cache."""
+    return ClauseTextSignals(text)
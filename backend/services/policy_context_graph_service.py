@@ -10,6 +10,7 @@ from .case_context_service import CaseContextError, CaseContextService
 from .policy_assistant_case_context_service import (
     get_policy_facts_for_case as fetch_policy_facts_for_case,
     get_source_chunks_for_fact_ids as fetch_source_chunks_for_fact_ids,
+    search_supporting_chunks_for_message,
 )
 
 
@@ -64,3 +65,7 @@ class PolicyContextGraphService:
 
     def get_source_chunks_for_fact_ids(self, fact_ids: List[str]) -> List[Dict[str, Any]]:
         return fetch_source_chunks_for_fact_ids(self._db, fact_ids)
+
+    def search_supporting_chunks(self, company_id: str, message: str, *, limit: int = 5) -> List[Dict[str, Any]]:
+        """Rank the active snapshot's chunks against a user message; see Database.search_policy_document_chunks."""
+        return search_supporting_chunks_for_message(self._db, company_id, message, limit=limit)
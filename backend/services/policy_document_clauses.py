@@ -10,108 +10,45 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, List, Optional, Tuple
-
-from .policy_source_provenance import filter_candidate_numeric_values
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .policy_clause_signals import (  # noqa: F401 - tables re-exported for existing importers
+    APPROVAL_SIGNALS,
+    ASSIGNMENT_PATTERNS,
+    ASSIGNMENT_TYPE_TERMS,
+    BENEFIT_KEY_PATTERNS,
+    CLAUSE_APPROVAL_RULE,
+    CLAUSE_BENEFIT,
+    CLAUSE_DEFINITION,
+    CLAUSE_ELIGIBILITY,
+    CLAUSE_EVIDENCE_RULE,
+    CLAUSE_EXCLUSION,
+    CLAUSE_LIFECYCLE_RULE,
+    CLAUSE_SCOPE,
+    CLAUSE_TAX_RULE,
+    CLAUSE_TYPE_SIGNALS,
+    CLAUSE_UNKNOWN,
+    CURRENCY_PATTERN,
+    EVIDENCE_ITEMS,
+    EXCLUSION_SIGNALS,
+    FAMILY_TERMS,
+    FREQUENCY_PATTERNS,
+    NUMERIC_PATTERN,
+    SECTION_HEADINGS,
+    UNIT_PATTERNS,
+    clause_signals,
+)
 
 log = logging.getLogger(__name__)
 
-# Clause types
-CLAUSE_SCOPE = "scope"
-CLAUSE_ELIGIBILITY = "eligibility"
-CLAUSE_BENEFIT = "benefit"
-CLAUSE_EXCLUSION = "exclusion"
-CLAUSE_APPROVAL_RULE = "approval_rule"
-CLAUSE_EVIDENCE_RULE = "evidence_rule"
-CLAUSE_TAX_RULE = "tax_rule"
-CLAUSE_DEFINITION = "definition"
-CLAUSE_LIFECYCLE_RULE = "lifecycle_rule"
-CLAUSE_UNKNOWN = "unknown"
-
-# Section headings that map to clause sections (case-insensitive)
-SECTION_HEADINGS = [
-    "scope and exclusions",
-    "scope",
-    "exclusions",
-    "family status",
-    "accompanying family",
-    "social coverage",
-    "social security",
-    "taxation",
-    "tax equalization",
-    "moving services",
-    "household goods",
-    "accommodation",
-    "housing",
-    "schooling",
-    "education",
-    "tuition",
-    "home leave",
-    "support to partner",
-    "spousal support",
-    "tax equalization",
-    "responsibility matrix",
-    "long term assignment",
-    "short term assignment",
-    "policy summary",
-    "eligibility",
-    "definitions",
-]
-
-# Clause-type keyword mapping (phrase -> clause_type)
-CLAUSE_TYPE_SIGNALS: List[Tuple[List[str], str]] = [
-    (["scope", "applies to", "in scope", "out of scope", "coverage applies"], CLAUSE_SCOPE),
-    (["eligibility", "eligible", "qualify", "qualification"], CLAUSE_ELIGIBILITY),
-    (["exclusion", "excluded", "not covered", "ineligible", "does not apply"], CLAUSE_EXCLUSION),
-    (["approval", "pre-approval", "prior approval", "requires approval", "hr approval"], CLAUSE_APPROVAL_RULE),
-    (["evidence", "receipt", "invoice", "documentation required", "submit receipts"], CLAUSE_EVIDENCE_RULE),
-    (["tax equalization", "hypothetical tax", "tax protection", "tax assistance"], CLAUSE_TAX_RULE),
-    (["definition", "defined as", "means ", "refers to"], CLAUSE_DEFINITION),
-    (["repatriation", "return shipment", "end of assignment", "lifecycle"], CLAUSE_LIFECYCLE_RULE),
-    (["housing", "allowance", "moving", "school", "tuition", "home leave", "mobility premium"], CLAUSE_BENEFIT),
-]
-
-# Benefit key candidates (normalized keys for downstream)
-BENEFIT_KEY_PATTERNS: List[Tuple[str, str]] = [
-    ("housing", r"\b(housing|accommodation|rental|temporary housing)\b"),
-    ("household_goods", r"\b(household goods|shipment|moving|movers|freight)\b"),
-    ("tuition", r"\b(tuition|education|schooling)\b"),
-    ("home_leave", r"\b(home leave|home flight)\b"),
-    ("mobility_premium", r"\b(mobility premium|expatriate premium)\b"),
-    ("settling_in", r"\b(settling[- ]?in|relocation allowance)\b"),
-    ("tax_equalization", r"\b(tax equalization|hypothetical tax)\b"),
-    ("spouse_support", r"\b(spousal support|partner support)\b"),
-]
-
-CURRENCY_PATTERN = re.compile(r"\b(USD|EUR|GBP|CHF|CAD|AUD|JPY)\b", re.I)
-UNIT_PATTERNS = [
-    (r"\b(%|percent|percentage)\b", "%"),
-    (r"\b(days?)\b", "days"),
-    (r"\b(weeks?)\b", "weeks"),
-    (r"\b(months?)\b", "months"),
-    (r"\b(years?)\b", "years"),
-    (r"\b(lbs?|kg)\b", "weight"),
-]
-NUMERIC_PATTERN = re.compile(
-    r"(?:\b|\$|€|£)\s*([0-9]+(?:,[0-9]{3})*(?:\.[0-9]+)?)\s*(?:k|K|m|M|%|USD|EUR|GBP)?\b"
+_NUMBERED_HEADING_RES = (
+    re.compile(r"^(\d+\.)+\s"),
+    re.compile(r"^[a-zA-Z][\).]\s"),
+    re.compile(r"^\(\d+\)\s"),
+    re.compile(r"^[IVX]+\.\s", re.I),
 )
-FREQUENCY_PATTERNS = [
-    (r"\b(per year|annually|yearly)\b", "per_year"),
-    (r"\b(per assignment|per move)\b", "per_assignment"),
-    (r"\b(monthly|per month)\b", "monthly"),
-    (r"\b(one[- ]?time|once)\b", "one_time"),
-]
-ASSIGNMENT_TYPE_TERMS = ["long_term", "short_term", "permanent", "commuter", "international"]
-ASSIGNMENT_PATTERNS = [
-    (r"\b(long[- ]?term|long term|lta)\b", "long_term"),
-    (r"\b(short[- ]?term|short term|sta)\b", "short_term"),
-    (r"\b(permanent transfer|permanent relocation)\b", "permanent"),
-    (r"\b(commuter)\b", "commuter"),
-]
-FAMILY_TERMS = ["single", "married", "spouse", "dependents", "accompanying", "family"]
-EXCLUSION_SIGNALS = ["exclusion", "excluded", "not covered", "ineligible", "does not apply", "out of scope"]
-APPROVAL_SIGNALS = ["approval", "pre-approval", "prior approval", "requires approval", "hr approval"]
-EVIDENCE_ITEMS = ["receipt", "receipts", "invoice", "invoices", "documentation", "proof", "quote", "estimates"]
+_NUMBERED_TITLE_RE = re.compile(r"^((?:\d+\.)+\d*)\s*(.+)")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _extract_normalized_hints(
@@ -119,83 +56,59 @@ def _extract_normalized_hints(
 ) -> Dict[str, Any]:
     """
     Extract first-pass hints from clause text. All optional, non-authoritative.
+    Returns a fresh dict (callers mutate it); signals come from the shared per-text cache.
     """
-    lower = text.lower()
+    sig = clause_signals(text)
     hints: Dict[str, Any] = {}
 
     # candidate_benefit_key
-    for key, pat in BENEFIT_KEY_PATTERNS:
-        if re.search(pat, lower, re.I):
-            hints["candidate_benefit_key"] = key
-            break
-    if not hints.get("candidate_benefit_key") and section_label:
+    if sig.benefit_key:
+        hints["candidate_benefit_key"] = sig.benefit_key
+    elif section_label:
         sl = section_label.lower()
         for key, _ in BENEFIT_KEY_PATTERNS:
             if key.replace("_", " ") in sl or key in sl:
                 hints["candidate_benefit_key"] = key
                 break
 
-    # candidate_currency
-    m = CURRENCY_PATTERN.search(text)
-    if m:
-        hints["candidate_currency"] = m.group(1).upper()
-
-    # candidate_unit
-    for pat, unit in UNIT_PATTERNS:
-        if re.search(pat, lower):
-            hints["candidate_unit"] = unit
-            break
-
-    # candidate_numeric_values
-    nums = []
-    for m in NUMERIC_PATTERN.finditer(text):
-        s = m.group(1).replace(",", "")
-        try:
-            n = float(s)
-            if 0 < n < 1e12:
-                nums.append(n)
-        except ValueError:
-            pass
-    if nums:
-        nums = filter_candidate_numeric_values(list(dict.fromkeys(nums))[:12], text)
-        if nums:
-            hints["candidate_numeric_values"] = nums[:10]
-
-    # candidate_frequency
-    for pat, freq in FREQUENCY_PATTERNS:
-        if re.search(pat, lower):
-            hints["candidate_frequency"] = freq
-            break
-
-    # candidate_assignment_types
-    ats = []
-    for pat, at in ASSIGNMENT_PATTERNS:
-        if re.search(pat, lower):
-            ats.append(at)
-    if ats:
-        hints["candidate_assignment_types"] = list(dict.fromkeys(ats))
-
-    # candidate_family_status_terms
-    fts = [t for t in FAMILY_TERMS if t in lower]
-    if fts:
-        hints["candidate_family_status_terms"] = fts
-
-    # candidate_exclusion_flag
-    if any(s in lower for s in EXCLUSION_SIGNALS):
+    if sig.currency:
+        hints["candidate_currency"] = sig.currency
+    if sig.unit:
+        hints["candidate_unit"] = sig.unit
+    if sig.numeric_values:
+        hints["candidate_numeric_values"] = list(sig.numeric_values)
+    if sig.frequency:
+        hints["candidate_frequency"] = sig.frequency
+    if sig.assignment_types:
+        hints["candidate_assignment_types"] = list(sig.assignment_types)
+    if sig.family_terms:
+        hints["candidate_family_status_terms"] = list(sig.family_terms)
+    if sig.exclusion_flag:
         hints["candidate_exclusion_flag"] = True
-
-    # candidate_approval_flag
-    if any(s in lower for s in APPROVAL_SIGNALS):
+    if sig.approval_flag:
         hints["candidate_approval_flag"] = True
-
-    # candidate_evidence_items
-    evs = [e for e in EVIDENCE_ITEMS if e in lower]
-    if evs:
-        hints["candidate_evidence_items"] = list(dict.fromkeys(evs))
+    if sig.evidence_items:
+        hints["candidate_evidence_items"] = list(sig.evidence_items)
 
     return hints
 
 
+def _is_pdf_mime(mime_type: str) -> bool:
+    return mime_type in ("application/pdf", "pdf") or (
+        isinstance(mime_type, str) and "pdf" in mime_type.lower()
+    )
+
+
+def _is_docx_mime(mime_type: str) -> bool:
+    return mime_type in (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "docx",
+    ) or (
+        isinstance(mime_type, str)
+        and ("word" in mime_type.lower() or "docx" in mime_type.lower())
+    )
+
+
 def extract_lines_with_pages(
     data: bytes, mime_type: str
 ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
@@ -203,46 +116,79 @@ def extract_lines_with_pages(
     Extract text with page numbers and table markers.
     Returns list of {"text": str, "page": int, "is_table_row": bool}.
     """
-    if mime_type in ("application/pdf", "pdf") or (
-        isinstance(mime_type, str) and "pdf" in mime_type.lower()
-    ):
+    if _is_pdf_mime(mime_type):
         return _extract_pdf_with_pages(data)
-    if mime_type in (
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "docx",
-    ) or (
-        isinstance(mime_type, str)
-        and ("word" in mime_type.lower() or "docx" in mime_type.lower())
-    ):
+    if _is_docx_mime(mime_type):
         return _extract_docx_with_pages(data)
     return [], f"Unsupported mime type: {mime_type}"
 
 
+def iter_lines_with_pages(data: bytes, mime_type: str) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming form of extract_lines_with_pages: yields the same items lazily, one PDF page at a
+    time (page caches are released after each page). Raises instead of returning an error string:
+    ValueError for an unsupported mime type, ImportError when the parser is missing, and parser
+    exceptions as they occur mid-stream.
+    """
+    if _is_pdf_mime(mime_type):
+        return _iter_pdf_lines(data)
+    if _is_docx_mime(mime_type):
+        return _iter_docx_lines(data)
+    raise ValueError(f"Unsupported mime type: {mime_type}")
+
+
+def _iter_pdf_lines(data: bytes) -> Iterator[Dict[str, Any]]:
+    import io
+
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for page_num, page in enumerate(pdf.pages, start=1):
+            text = page.extract_text() or ""
+            for line in text.splitlines():
+                s = _WHITESPACE_RE.sub(" ", line.strip())
+                if s:
+                    yield {"text": s, "page": page_num, "is_table_row": False}
+            for table in page.extract_tables() or []:
+                for row in table:
+                    cells = [str(c).strip() if c else "" for c in row if c is not None]
+                    if cells:
+                        yield {
+                            "text": " | ".join(cells),
+                            "page": page_num,
+                            "is_table_row": True,
+                        }
+            page.close()
+
+
+def _iter_docx_lines(data: bytes) -> Iterator[Dict[str, Any]]:
+    import io
+
+    from docx import Document
+
+    doc = Document(io.BytesIO(data))
+    for p in doc.paragraphs:
+        s = _WHITESPACE_RE.sub(" ", (p.text or "").strip())
+        if s:
+            yield {"text": s, "page": 1, "is_table_row": False}
+    for table in doc.tables:
+        for row in table.rows:
+            cells = [c.text.strip() for c in row.cells if c.text]
+            if cells:
+                yield {
+                    "text": " | ".join(cells),
+                    "page": 1,
+                    "is_table_row": True,
+                }
+
+
 def _extract_pdf_with_pages(data: bytes) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     try:
-        import pdfplumber
-        import io
+        import pdfplumber  # noqa: F401
     except ImportError as exc:
         return [], f"pdfplumber required: {exc}"
     try:
-        items: List[Dict[str, Any]] = []
-        with pdfplumber.open(io.BytesIO(data)) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                text = page.extract_text() or ""
-                for line in text.splitlines():
-                    s = re.sub(r"\s+", " ", line.strip())
-                    if s:
-                        items.append({"text": s, "page": page_num, "is_table_row": False})
-                for table in page.extract_tables() or []:
-                    for row in table:
-                        cells = [str(c).strip() if c else "" for c in row if c is not None]
-                        if cells:
-                            items.append({
-                                "text": " | ".join(cells),
-                                "page": page_num,
-                                "is_table_row": True,
-                            })
-        return items, None
+        return list(_iter_pdf_lines(data)), None
     except Exception as e:
         log.warning("pdf extraction with pages failed: %s", e, exc_info=True)
         return [], str(e)
@@ -250,27 +196,11 @@ def _extract_pdf_with_pages(data: bytes) -> Tuple[List[Dict[str, Any]], Optional
 
 def _extract_docx_with_pages(data: bytes) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     try:
-        from docx import Document
-        import io
+        from docx import Document  # noqa: F401
     except ImportError as exc:
         return [], f"python-docx required: {exc}"
     try:
-        items: List[Dict[str, Any]] = []
-        doc = Document(io.BytesIO(data))
-        for p in doc.paragraphs:
-            s = re.sub(r"\s+", " ", (p.text or "").strip())
-            if s:
-                items.append({"text": s, "page": 1, "is_table_row": False})
-        for table in doc.tables:
-            for row in table.rows:
-                cells = [c.text.strip() for c in row.cells if c.text]
-                if cells:
-                    items.append({
-                        "text": " | ".join(cells),
-                        "page": 1,
-                        "is_table_row": True,
-                    })
-        return items, None
+        return list(_iter_docx_lines(data)), None
     except Exception as e:
         log.warning("docx extraction with pages failed: %s", e, exc_info=True)
         return [], str(e)
@@ -282,9 +212,7 @@ def _is_heading(line: str) -> bool:
     if not s or len(s) > 120:
         return False
     # Numbering: 1. 1.1 1.1.1 a) (1) I. II.
-    if re.match(r"^(\d+\.)+\s", s) or re.match(r"^[a-zA-Z][\).]\s", s):
-        return True
-    if re.match(r"^\(\d+\)\s", s) or re.match(r"^[IVX]+\.\s", s, re.I):
+    if any(p.match(s) for p in _NUMBERED_HEADING_RES):
         return True
     # All caps and short
     if s.isupper() and len(s) < 80:
@@ -305,23 +233,21 @@ def _classify_clause(text: str, is_table_row: bool) -> Tuple[str, float]:
     """
     Rule-based clause type classification. Returns (clause_type, confidence).
     """
-    lower = text.lower()
+    sig = clause_signals(text)
     best = (CLAUSE_UNKNOWN, 0.3)
 
-    for signals, ctype in CLAUSE_TYPE_SIGNALS:
-        for sig in signals:
-            if sig in lower:
-                # Benefit is default for table rows with amounts/percentages
-                if ctype == CLAUSE_BENEFIT or (is_table_row and " | " in text):
-                    conf = 0.75
-                else:
-                    conf = 0.8
-                if conf > best[1]:
-                    best = (ctype, conf)
+    for ctype in sig.clause_type_hits:
+        # Benefit is default for table rows with amounts/percentages
+        if ctype == CLAUSE_BENEFIT or (is_table_row and " | " in text):
+            conf = 0.75
+        else:
+            conf = 0.8
+        if conf > best[1]:
+            best = (ctype, conf)
 
     # Table rows often encode benefits
     if is_table_row and " | " in text and best[0] == CLAUSE_UNKNOWN:
-        if any(x in lower for x in ["usd", "eur", "%", "limit", "allowance", "cover"]):
+        if sig.table_benefit_marker:
             best = (CLAUSE_BENEFIT, 0.7)
 
     return best
@@ -335,18 +261,22 @@ def segment_into_clauses(
     items: list of {text, page, is_table_row} from extract_lines_with_pages.
     Returns list of clause dicts ready for DB insert.
     """
-    if not items:
-        return []
+    return list(iter_clauses(items))
+
 
-    clauses: List[Dict[str, Any]] = []
+def iter_clauses(items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming segmentation: consumes items lazily and yields each clause dict as soon as its
+    boundary (next heading, table row or end of input) is seen. Only the open clause's lines are
+    buffered, so memory stays flat however long the document is.
+    """
     current_section = None
     current_path: List[str] = []
     buffer: List[Dict[str, Any]] = []
-    current_page_start = items[0].get("page", 1)
 
     def flush_buffer(title: Optional[str] = None, clause_type: Optional[str] = None):
         if not buffer:
-            return
+            return None
         texts = [b["text"] for b in buffer]
         pages = [b["page"] for b in buffer]
         is_table = any(b.get("is_table_row") for b in buffer)
@@ -357,7 +287,8 @@ def segment_into_clauses(
             conf = 0.9
         section_path = " > ".join(current_path) if current_path else None
         hints = _extract_normalized_hints(raw, is_table, current_section)
-        clauses.append({
+        buffer.clear()
+        return {
             "section_label": current_section,
             "section_path": section_path,
             "clause_type": ctype,
@@ -368,12 +299,9 @@ def segment_into_clauses(
             "source_page_end": max(pages) if pages else None,
             "source_anchor": texts[0][:100] if texts else None,
             "confidence": conf,
-        })
-        buffer.clear()
+        }
 
-    i = 0
-    while i < len(items):
-        item = items[i]
+    for item in items:
         text = item.get("text", "").strip()
         page = item.get("page", 1)
         is_table = item.get("is_table_row", False)
@@ -381,40 +309,41 @@ def segment_into_clauses(
         # Section heading
         section = _is_section_name(text)
         if section:
-            flush_buffer()
+            clause = flush_buffer()
+            if clause:
+                yield clause
             current_section = section
             # Use first heading word as path component
             path_part = section.split()[0] if section else None
             if path_part and (not current_path or current_path[-1] != path_part):
                 current_path.append(path_part)
             buffer.append(item)
-            flush_buffer(title=text, clause_type=None)
-            current_page_start = page
-            i += 1
+            yield flush_buffer(title=text, clause_type=None)
             continue
 
         # Numbered heading (1.1, 2.3.1, etc.)
         if _is_heading(text) and not is_table:
-            flush_buffer()
-            match = re.match(r"^((?:\d+\.)+\d*)\s*(.+)", text)
+            clause = flush_buffer()
+            if clause:
+                yield clause
+            match = _NUMBERED_TITLE_RE.match(text)
+            buffer.append(item)
             if match:
                 num, rest = match.groups()
                 current_path = num.rstrip(".").split(".")
                 current_section = rest.strip()
-                buffer.append(item)
-                flush_buffer(title=text)
-            else:
-                buffer.append(item)
-            i += 1
+                yield flush_buffer(title=text)
             continue
 
         # Table row: emit as separate clause for traceability
         if is_table:
-            flush_buffer()
+            clause = flush_buffer()
+            if clause:
+                yield clause
             ctype, conf = _classify_clause(text, True)
             section_path = " > ".join(current_path) if current_path else None
             hints = _extract_normalized_hints(text, True, current_section)
-            clauses.append({
+            yield {
                 "section_label": current_section,
                 "section_path": section_path,
                 "clause_type": ctype,
@@ -425,16 +354,15 @@ def segment_into_clauses(
                 "source_page_end": page,
                 "source_anchor": text[:100],
                 "confidence": conf,
-            })
-            i += 1
+            }
             continue
 
         # Bullet or continuation
         buffer.append(item)
-        i += 1
 
-    flush_buffer()
-    return clauses
+    clause = flush_buffer()
+    if clause:
+        yield clause
 
 
 def segment_document_from_raw_text(
@@ -474,3 +402,51 @@ def segment_document_from_raw_text(
         )
         return row_clauses, None
     return segment_into_clauses(items), None
+
+
+def iter_document_clauses(
+    raw_text: str,
+    mime_type: str,
+    data: Optional[bytes] = None,
+    policy_context: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming form of segment_document_from_raw_text, for feeding
+    Database.upsert_policy_document_clauses without holding every extracted item in memory (the
+    upsert stages clauses a batch at a time as they are yielded).
+
+    When the document context rules out the summary-row parser, elements are segmented as they
+    are extracted. Otherwise items are materialized, because the row gate counts table rows over
+    the whole document (summary documents are short tables). Extraction errors raise.
+    """
+    from .policy_summary_row_parser import summary_row_parser_possible
+
+    if data:
+        from .policy_structural_parse import iter_policy_document_elements
+
+        items: Iterable[Dict[str, Any]] = iter_policy_document_elements(data, mime_type)
+    else:
+        items = (
+            {"text": l, "page": 1, "is_table_row": " | " in l and len(l) > 20}
+            for l in (line.strip() for line in raw_text.splitlines())
+            if l
+        )
+
+    if not summary_row_parser_possible(policy_context):
+        yield from iter_clauses(items)
+        return
+
+    from .policy_summary_row_parser import try_build_clauses_via_summary_rows
+
+    items = list(items)
+    row_clauses = try_build_clauses_via_summary_rows(items, policy_context)
+    if row_clauses is not None:
+        log.info(
+            "policy_segment strategy=summary_row_candidates items=%d clauses=%d document_id=%s",
+            len(items),
+            len(row_clauses),
+            (policy_context or {}).get("id") or (policy_context or {}).get("document_id") or "?",
+        )
+        yield from row_clauses
+        return
+    yield from iter_clauses(items)
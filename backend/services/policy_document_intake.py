@@ -105,6 +105,15 @@ EVIDENCE_SIGNALS = [
     "supporting documentation", "submit receipts", "receipts required",
 ]
 
+_UNIT_RES = [re.compile(p, re.I) for p in UNIT_PATTERNS]
+_WHITESPACE_RE = re.compile(r"\s+")
+_ADDENDUM_RE = re.compile(r"(addendum|annex|appendix)\s+.*\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b", re.I)
+_VERSION_RE = re.compile(r"(?:version|v\.?)\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?)", re.I)
+_EFFECTIVE_ISO_RE = re.compile(r"(?:effective|valid from)\s*[:\-]?\s*([0-9]{4}-[0-9]{2}-[0-9]{2})", re.I)
+_SLASH_DATE_RE = re.compile(r"([0-9]{1,2}[/\-][0-9]{1,2}[/\-][0-9]{4})")
+_DATE_SEP_RE = re.compile(r"[/\-]")
+_ISO_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
 
 def compute_checksum(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
@@ -129,7 +138,7 @@ def _normalize_lines(lines: List[str]) -> List[str]:
     for line in lines:
         if not line:
             continue
-        s = re.sub(r"\s+", " ", line.strip())
+        s = _WHITESPACE_RE.sub(" ", line.strip())
         if s:
             cleaned.append(s)
     return cleaned
@@ -251,7 +260,7 @@ def classify_document(lines: List[str], request_id: Optional[str] = None) -> Tup
         return (doc_type, scope, needs_review)
 
     # Country addendum: country name + addendum
-    country_addendum = re.search(r"(addendum|annex|appendix)\s+.*\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b", text, re.I)
+    country_addendum = _ADDENDUM_RE.search(text)
     if country_addendum and any(c in text for c in ["country", "local", "host"]):
         doc_type = DOC_TYPE_COUNTRY_ADDENDUM
         scope = SCOPE_UNKNOWN
@@ -345,22 +354,22 @@ def extract_metadata(lines: List[str]) -> Dict[str, Any]:
 
     # detected_version
     for line in lines[:60]:
-        m = re.search(r"(?:version|v\.?)\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?)", line, re.I)
+        m = _VERSION_RE.search(line)
         if m:
             meta["detected_version"] = m.group(1)
             break
 
     # detected_effective_date
     for line in lines[:80]:
-        m = re.search(r"(?:effective|valid from)\s*[:\-]?\s*([0-9]{4}-[0-9]{2}-[0-9]{2})", line, re.I)
+        m = _EFFECTIVE_ISO_RE.search(line)
         if m:
             meta["detected_effective_date"] = m.group(1)
             break
         if not meta["detected_effective_date"]:
-            m = re.search(r"([0-9]{1,2}[/\-][0-9]{1,2}[/\-][0-9]{4})", line)
+            m = _SLASH_DATE_RE.search(line)
             if m:
                 d = m.group(1)
-                parts = re.split(r"[/\-]", d)
+                parts = _DATE_SEP_RE.split(d)
                 if len(parts) == 3:
                     y, mo, day = (
                         (parts[2], parts[0], parts[1])
@@ -370,7 +379,7 @@ def extract_metadata(lines: List[str]) -> Dict[str, Any]:
                     meta["detected_effective_date"] = f"{y}-{mo.zfill(2)}-{day.zfill(2)}"
                     break
         if not meta["detected_effective_date"]:
-            m = re.search(r"([0-9]{4})-([0-9]{2})-([0-9]{2})", line)
+            m = _ISO_DATE_RE.search(line)
             if m:
                 meta["detected_effective_date"] = m.group(0)
                 break
@@ -392,8 +401,8 @@ def extract_metadata(lines: List[str]) -> Dict[str, Any]:
 
     # mentioned_units (currencies, %, time units)
     seen: set = set()
-    for pat in UNIT_PATTERNS:
-        for m in re.finditer(pat, text_lower, re.I):
+    for pat in _UNIT_RES:
+        for m in pat.finditer(text_lower):
             u = m.group(1).lower()
             if u not in seen:
                 seen.add(u)
@@ -404,11 +413,7 @@ def extract_metadata(lines: List[str]) -> Dict[str, Any]:
     meta["likely_table_heavy"] = table_like >= 3
 
     # likely_country_addendum
-    addendum_match = re.search(
-        r"(addendum|annex|appendix)\s+.*\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b",
-        text_full,
-        re.I,
-    )
+    addendum_match = _ADDENDUM_RE.search(text_full)
     meta["likely_country_addendum"] = bool(
         addendum_match and any(c in text_lower for c in ["country", "local", "host"])
     )
@@ -156,7 +156,7 @@ def extract_minimal_policy_facts(
 ) -> List[Dict[str, Any]]:
     """
     chunks: rows with at least id, text_content (or text), section_title, chunk_index.
-    Returns fact dicts ready for insert_policy_fact (plus source_chunk_id).
+    Returns fact dicts ready for insert_policy_facts_bulk (plus source_chunk_id).
     """
     facts: List[Dict[str, Any]] = []
     for ch in chunks:
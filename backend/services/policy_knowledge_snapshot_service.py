@@ -12,23 +12,9 @@ class PolicyKnowledgeSnapshotService:
     def __init__(self, db: Database) -> None:
         self._db = db
 
-    def attach_facts_to_snapshot(self, snapshot_id: str, facts: List[Dict[str, Any]]) -> None:
-        """Insert extracted facts for an existing candidate snapshot."""
-        for f in facts:
-            self._db.insert_policy_fact(
-                snapshot_id,
-                str(f["fact_type"]),
-                str(f.get("category") or ""),
-                subcategory=f.get("subcategory"),
-                normalized_value_json=f.get("normalized_value_json"),
-                applicability_json=f.get("applicability_json"),
-                ambiguity_flag=bool(f.get("ambiguity_flag")),
-                confidence_score=f.get("confidence_score"),
-                source_chunk_id=str(f["source_chunk_id"]),
-                source_page=f.get("source_page"),
-                source_section=f.get("source_section"),
-                source_quote=f.get("source_quote"),
-            )
+    def attach_facts_to_snapshot(self, snapshot_id: str, facts: List[Dict[str, Any]]) -> List[str]:
+        """Insert extracted facts for an existing candidate snapshot (one transaction)."""
+        return self._db.insert_policy_facts_bulk(snapshot_id, facts)
 
     def create_snapshot_from_document(
         self,
@@ -33,6 +33,7 @@ _SLASH_LEAD_DEP_RE = re.compile(
     r"^\s*([\d,]+(?:\.\d+)?)\s*/\s*(?:each\s+)?depend",
     re.I,
 )
+_CAP_AT_RE = re.compile(r"\bcap(?:ped)?\s+(?:at|to)\b", re.I)
 
 
 def parse_allowance_value_structure(summary_text: str) -> Dict[str, Any]:
@@ -55,21 +56,27 @@ def parse_allowance_value_structure(summary_text: str) -> Dict[str, Any]:
         out["amount_tiers"] = tiers
     if _ONE_OFF_RE.search(summary_text):
         out["allowance_payment_type"] = "one_off"
-    if _CAPPED_REIMBURSE_RE.search(summary_text) or re.search(
-        r"\bcap(?:ped)?\s+(?:at|to)\b", summary_text, re.I
-    ):
+    if _CAPPED_REIMBURSE_RE.search(summary_text) or _CAP_AT_RE.search(summary_text):
         out["reimbursement_cap_mentioned"] = True
     return out
 
 
 # --- Travel / leave variants (standard, split family, dependant in education, R&R) ---
 
-_VARIANT_SYNONYMS: Tuple[Tuple[str, str], ...] = (
-    (r"standard\s+home\s+leave|standard\s+leave", "standard home leave"),
-    (r"split\s+family\s+leave|split\s+family", "split family leave"),
-    (r"depend(?:a|e)nt\s+in\s+education\s+leave|education\s+leave", "dependant in education leave"),
-    (r"\br&r\b|rest\s+and\s+recuperation|r\s+and\s+r", "R&R travel"),
+_VARIANT_SYNONYMS: Tuple[Tuple["re.Pattern[str]", str], ...] = tuple(
+    (re.compile(pattern, re.I), canonical)
+    for pattern, canonical in (
+        (r"standard\s+home\s+leave|standard\s+leave", "standard home leave"),
+        (r"split\s+family\s+leave|split\s+family", "split family leave"),
+        (r"depend(?:a|e)nt\s+in\s+education\s+leave|education\s+leave", "dependant in education leave"),
+        (r"\br&r\b|rest\s+and\s+recuperation|r\s+and\s+r", "R&R travel"),
+    )
 )
+_HOME_LEAVE_PREFIX_RE = re.compile(r"^\s*home\s+leave\s*[:\s–\-]*", re.I)
+_SLASH_SPLIT_RE = re.compile(r"\s*/\s*")
+_WHITESPACE_RE = re.compile(r"\s+")
+_LIST_LEAD_IN_RE = re.compile(r"^\s*(?:including|covers?|such\s+as)\s+", re.I)
+_LIST_SPLIT_RE = re.compile(r",|\s+and\s+")
 
 
 def parse_travel_leave_variants(summary_text: str) -> List[str]:
@@ -93,11 +100,11 @@ def parse_travel_leave_variants(summary_text: str) -> List[str]:
         variants.append(t)
 
     # Slash-separated (after optional "Home leave" prefix)
-    stripped = re.sub(r"^\s*home\s+leave\s*[:\s–\-]*", "", text, flags=re.I)
+    stripped = _HOME_LEAVE_PREFIX_RE.sub("", text)
     if "/" in stripped:
-        parts = [p.strip() for p in re.split(r"\s*/\s*", stripped) if p.strip()]
+        parts = [p.strip() for p in _SLASH_SPLIT_RE.split(stripped) if p.strip()]
         for p in parts:
-            pl = re.sub(r"\s+", " ", p.lower())
+            pl = _WHITESPACE_RE.sub(" ", p.lower())
             if pl in ("home leave", "homeleave", "leave"):
                 continue
             add_label(p)
@@ -106,8 +113,8 @@ def parse_travel_leave_variants(summary_text: str) -> List[str]:
     if len(variants) < 2:
         chunk = text
         # strip leading "including" / "covers"
-        chunk = re.sub(r"^\s*(?:including|covers?|such\s+as)\s+", "", chunk, flags=re.I)
-        pieces = re.split(r",|\s+and\s+", chunk)
+        chunk = _LIST_LEAD_IN_RE.sub("", chunk)
+        pieces = _LIST_SPLIT_RE.split(chunk)
         for p in pieces:
             p = p.strip().rstrip(".")
             if len(p) < 6 or len(p) > 100:
@@ -122,7 +129,7 @@ def parse_travel_leave_variants(summary_text: str) -> List[str]:
     # Regex synonym capture (full text)
     lower = text.lower()
     for pattern, canonical in _VARIANT_SYNONYMS:
-        if re.search(pattern, lower, re.I):
+        if pattern.search(lower):
             add_label(canonical)
 
     return variants[:24]
@@ -137,26 +144,28 @@ def travel_leave_variants_as_subvalues(summary_text: str) -> Dict[str, Any]:
 
 # --- Family coverage (assignee, spouse, children conditional) ---
 
+_ASSIGNEE_RE = re.compile(r"\bassignee\b|\bemployee\b|\bprincipal\s+assignee\b")
+_SPOUSE_PARTNER_RE = re.compile(r"\bspouse\b|\bpartner\b|\baccompanying\s+spouse\b")
+_CHILDREN_RE = re.compile(r"\bchildren\b|\bchild\b|\bdepend(?:a|e)nts?\b")
+_CHILDREN_CONDITIONAL_RE = re.compile(
+    r"\bwhere\s+eligible\b|\bif\s+eligible\b|\bwhen\s+eligible\b|"
+    r"\bin\s+full[-\s]?time\s+education\b|\bconditional\w*\s+on\b"
+)
+_ASSIGNEE_ONLY_RE = re.compile(r"\bassignee\s+only\b|\bemployee\s+only\b")
+
+
 def build_family_coverage_structure(text: str) -> Dict[str, Any]:
     lower = text.lower()
     out: Dict[str, Any] = {
         "assignee": bool(
-            re.search(r"\bassignee\b|\bemployee\b|\bprincipal\s+assignee\b", lower)
+            _ASSIGNEE_RE.search(lower)
             or ("only" in lower and "assignee" in lower)
         ),
-        "spouse_partner": bool(
-            re.search(r"\bspouse\b|\bpartner\b|\baccompanying\s+spouse\b", lower)
-        ),
-        "children": bool(re.search(r"\bchildren\b|\bchild\b|\bdepend(?:a|e)nts?\b", lower)),
-        "children_conditional": bool(
-            re.search(
-                r"\bwhere\s+eligible\b|\bif\s+eligible\b|\bwhen\s+eligible\b|"
-                r"\bin\s+full[-\s]?time\s+education\b|\bconditional\w*\s+on\b",
-                lower,
-            )
-        ),
+        "spouse_partner": bool(_SPOUSE_PARTNER_RE.search(lower)),
+        "children": bool(_CHILDREN_RE.search(lower)),
+        "children_conditional": bool(_CHILDREN_CONDITIONAL_RE.search(lower)),
     }
-    if re.search(r"\bassignee\s+only\b|\bemployee\s+only\b", lower):
+    if _ASSIGNEE_ONLY_RE.search(lower):
         out["assignee"] = True
         out["spouse_partner"] = out.get("spouse_partner", False)
     notes: List[str] = []
@@ -188,6 +197,7 @@ _EXT_POLICY_RE = re.compile(
 _GLOBAL_TRAVEL_RE = re.compile(
     r"\bglobal\s+travel\s+policy\b|\bcompany\s+travel\s+policy\b", re.I
 )
+_DISCRETIONARY_RE = re.compile(r"\bsubject\s+to\b|\bat\s+discretion\b|\bmay\s+be\b")
 
 
 def analyze_external_reference(text: str) -> Dict[str, Any]:
@@ -234,7 +244,7 @@ def analyze_external_reference(text: str) -> Dict[str, Any]:
     else:
         comp_ready = "partial"
 
-    if re.search(r"\bsubject\s+to\b|\bat\s+discretion\b|\bmay\s+be\b", lower) and third_party:
+    if _DISCRETIONARY_RE.search(lower) and third_party:
         comp_ready = "not_ready"
 
     return {
@@ -247,18 +257,21 @@ def analyze_external_reference(text: str) -> Dict[str, Any]:
 
 # --- Governance / approval ---
 
+_PRIOR_APPROVAL_RE = re.compile(
+    r"\b(?:prior|advance|pre[-\s]?)\s+approval\b|\bwith\s+approval\b|\brequires?\s+approval\b"
+)
+_QUOTES_REQUIRED_RE = re.compile(
+    r"\b(two|three|2|3)\s+(?:competitive\s+)?quotes?\s+required\b|\b(?:two|three|2|3)\s+quotes?\b"
+)
+_BUSINESS_LINE_APPROVAL_RE = re.compile(r"\bbusiness\s+line\s+approval\b|\bline\s+manager\s+approval\b")
+
+
 def extract_governance_conditions(text: str) -> List[Dict[str, Any]]:
     lower = text.lower()
     out: List[Dict[str, Any]] = []
-    if re.search(
-        r"\b(?:prior|advance|pre[-\s]?)\s+approval\b|\bwith\s+approval\b|\brequires?\s+approval\b",
-        lower,
-    ):
+    if _PRIOR_APPROVAL_RE.search(lower):
         out.append({"kind": "prior_approval", "text": "Prior or management approval required"})
-    mq = re.search(
-        r"\b(two|three|2|3)\s+(?:competitive\s+)?quotes?\s+required\b|\b(?:two|three|2|3)\s+quotes?\b",
-        lower,
-    )
+    mq = _QUOTES_REQUIRED_RE.search(lower)
     if mq:
         n = mq.group(1)
         count = 2 if n in ("two", "2") else 3 if n in ("three", "3") else None
@@ -269,7 +282,7 @@ def extract_governance_conditions(text: str) -> List[Dict[str, Any]]:
                 "text": mq.group(0)[:120],
             }
         )
-    if re.search(r"\bbusiness\s+line\s+approval\b|\bline\s+manager\s+approval\b", lower):
+    if _BUSINESS_LINE_APPROVAL_RE.search(lower):
         out.append({"kind": "business_line_approval", "text": "Business line / management approval"})
     return out
 
@@ -282,6 +295,7 @@ _COMP_INFO_RE = re.compile(
     r"\bpayroll\s+delivery\b|\bremuneration\s+structure\b",
     re.I,
 )
+_SPLIT_PAYROLL_RE = re.compile(r"split\s+payroll|payroll\s+split")
 
 
 def analyze_compensation_informational(text: str, component_label: str = "") -> Dict[str, Any]:
@@ -289,7 +303,7 @@ def analyze_compensation_informational(text: str, component_label: str = "") ->
     if not _COMP_INFO_RE.search(combined):
         return {"is_informational": False, "topics": []}
     topics: List[str] = []
-    if re.search(r"split\s+payroll|payroll\s+split", combined):
+    if _SPLIT_PAYROLL_RE.search(combined):
         topics.append("split_payroll")
     if "compensation approach" in combined:
         topics.append("compensation_approach")
@@ -39,6 +39,13 @@ from .policy_taxonomy import (
     get_benefit_meta,
     resolve_theme,
 )
+from .policy_clause_signals import (
+    CALC_DAYS,
+    CALC_DIFFERENCE,
+    CALC_PER_DIEM,
+    CALC_PERCENT,
+    clause_signals,
+)
 from .policy_pipeline_layers import layer1_fields_for_company_policy_shell
 from .policy_pipeline_diagnostics import raw_text_diagnostic_flags
 from .policy_source_provenance import (
@@ -71,16 +78,11 @@ ALLOWED_CALC_TYPES = frozenset(
     }
 )
 
-# calc_type detection patterns
-CALC_PERCENT = re.compile(r"(\d{1,3})\s*%\s*(?:of|on)?\s*(?:base\s+)?salary", re.I)
-CALC_DAYS = re.compile(r"(\d{1,4})\s*(?:days?|working\s+days?)", re.I)
-CALC_DIFFERENCE = re.compile(r"difference|reimburse.*difference|difference\s+only", re.I)
-CALC_PER_DIEM = re.compile(r"per\s+diem|daily\s+(?:rate|allowance)", re.I)
 
 
 def _detect_calc_type(raw_text: str, hints: Dict[str, Any], benefit_key: str) -> str:
     """Infer calc_type from text and hints."""
-    lower = raw_text.lower()
+    lower = clause_signals(raw_text).lower
     meta = get_benefit_meta(benefit_key)
     default = meta.get("default_calc_type", "other")
 
@@ -117,26 +119,7 @@ def _extract_amount_value(hints: Dict[str, Any], raw_text: str) -> Optional[floa
     nums = hints.get("candidate_numeric_values") or []
     if nums:
         return float(nums[0])
-    m = re.search(
-        r"(?:EUR|USD|GBP|CHF|CAD|AUD|SGD|NZD)\s*([0-9]+(?:,[0-9]{3})*(?:\.[0-9]+)?)",
-        raw_text,
-        re.I,
-    )
-    if m:
-        try:
-            return float(m.group(1).replace(",", ""))
-        except ValueError:
-            pass
-    m = re.search(r"(?:\b|\$|€|£)\s*([0-9]+(?:,[0-9]{3})*(?:\.[0-9]+)?)", raw_text)
-    if m:
-        try:
-            return float(m.group(1).replace(",", ""))
-        except ValueError:
-            pass
-    m = re.search(r"(\d{1,3})\s*%", raw_text)
-    if m:
-        return float(m.group(1))
-    return None
+    return clause_signals(raw_text).text_amount
 
 
 def _normalize_assignment_types(hints: Dict[str, Any]) -> List[str]:
@@ -183,42 +166,15 @@ _VAGUE_COVERAGE_RE = re.compile(
     re.I,
 )
 
-_EXCLUSION_PHRASES = (
-    "not covered",
-    "no coverage",
-    "does not cover",
-    "not eligible",
-    "excludes",
-    "excluded",
-    "not available",
-    "will not be provided",
-    "will not cover",
-    "not payable",
-    "not reimbursed",
-    "without coverage",
-)
-
-
 def _text_suggests_exclusion_language(raw: str) -> bool:
-    rl = (raw or "").lower()
-    return any(p in rl for p in _EXCLUSION_PHRASES)
+    return clause_signals(raw or "").exclusion_language
 
 
 def _extract_currency_hint(raw: str, hints: Dict[str, Any]) -> Optional[str]:
     c = hints.get("candidate_currency")
     if c and str(c).strip():
         return str(c).strip().upper()
-    ru = (raw or "").upper()
-    for token in ("EUR", "USD", "GBP", "CHF", "CAD", "AUD", "SGD", "NZD"):
-        if token in ru:
-            return token
-    if "€" in (raw or ""):
-        return "EUR"
-    if "£" in (raw or ""):
-        return "GBP"
-    if "$" in (raw or ""):
-        return "USD"
-    return None
+    return clause_signals(raw or "").currency_token
 
 
 def _has_structured_monetary_cap(raw: str, hints: Dict[str, Any]) -> bool:
@@ -228,7 +184,7 @@ def _has_structured_monetary_cap(raw: str, hints: Dict[str, Any]) -> bool:
             if float(nums[0]) > 0:
                 if hints.get("candidate_currency") or _extract_currency_hint(raw, hints):
                     return True
-                if "%" in raw or re.search(r"\bpercent\b", raw, re.I):
+                if clause_signals(raw).mentions_percent:
                     return True
         except (TypeError, ValueError):
             pass
@@ -236,7 +192,8 @@ def _has_structured_monetary_cap(raw: str, hints: Dict[str, Any]) -> bool:
     if av is not None and av > 0:
         if _extract_currency_hint(raw, hints):
             return True
-        if "%" in raw or "percent" in raw.lower() or "salary" in raw.lower():
+        lower = clause_signals(raw).lower
+        if "%" in raw or "percent" in lower or "salary" in lower:
             return True
     return False
 
@@ -248,52 +205,26 @@ def _is_vague_coverage_framing(raw: str, has_structured_cap: bool) -> bool:
 
 
 def _role_hints_from_text(raw: str) -> List[str]:
-    rl = (raw or "").lower()
-    out: List[str] = []
-    if re.search(r"\bdirectors?\b", rl):
-        out.append("directors")
-    if re.search(r"\bexecutives?\b|\bsenior management\b|\bc[- ]suite\b", rl):
-        out.append("executives")
-    return out
+    return list(clause_signals(raw or "").role_hints)
 
 
 def _family_terms_from_text(raw: str) -> List[str]:
-    rl = (raw or "").lower()
-    out: List[str] = []
-    if re.search(r"\bsingle(?:\s+employees?)?\b|\bunmarried\b", rl):
-        out.append("single")
-    if "married" in rl or "spouse" in rl or "accompanied" in rl:
-        out.append("family_context")
-    return out
+    return list(clause_signals(raw or "").family_context_terms)
 
 
 def _duration_quantity_fragment(raw: str) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
-    m = re.search(r"(\d{1,4})\s*(?:additional\s+)?(nights?|days?)\b", raw or "", re.I)
-    if m:
-        out["quantity"] = int(m.group(1))
-        out["unit"] = "nights" if "night" in m.group(2).lower() else "days"
+    found = clause_signals(raw or "").nights_or_days
+    if found:
+        out["quantity"], out["unit"] = found
     return out
 
 
 def _assignment_types_from_text(raw: str) -> List[str]:
     """Infer assignment types from free text when hints are missing (weakly structured summaries)."""
-    rl = (raw or "").lower()
     out: List[str] = []
-    if re.search(r"long[-\s]term", rl):
-        m = ASSIGNMENT_TYPE_MAP.get("long_term")
-        if m and m not in out:
-            out.append(m)
-    if re.search(r"short[-\s]term", rl):
-        m = ASSIGNMENT_TYPE_MAP.get("short_term")
-        if m and m not in out:
-            out.append(m)
-    if re.search(r"\bcommuter\b", rl):
-        m = ASSIGNMENT_TYPE_MAP.get("commuter")
-        if m and m not in out:
-            out.append(m)
-    if re.search(r"\bpermanent\b", rl) and "assignment" in rl:
-        m = ASSIGNMENT_TYPE_MAP.get("permanent")
+    for key in clause_signals(raw or "").assignment_type_keys:
+        m = ASSIGNMENT_TYPE_MAP.get(key)
         if m and m not in out:
             out.append(m)
     return out
@@ -541,10 +472,11 @@ def normalize_clauses_to_objects(
                     "_benefit_clause_idx": i,
                     "_clause_id": cid,
                 })
-            m = re.search(r"(\d{1,3})\s*(?:months?|years?)", raw, re.I)
-            if m and any(w in raw.lower() for w in ("assignment", "duration", "longer than", "exceeds")):
-                val = int(m.group(1))
-                if "year" in m.group(0).lower():
+            sig = clause_signals(raw)
+            duration = sig.duration_threshold_match
+            if duration and any(w in sig.lower for w in ("assignment", "duration", "longer than", "exceeds")):
+                val, in_years = duration
+                if in_years:
                     val = val * 12
                 conditions.append({
                     "object_type": "benefit_rule",
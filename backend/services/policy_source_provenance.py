@@ -6,6 +6,7 @@ Used by clause hint extraction, normalize_clauses_to_objects, and persisted on L
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 # Dotted policy section references (not version years, not large amounts)
@@ -36,6 +37,21 @@ def looks_like_dotted_section_number(n: float) -> bool:
     return bool(_DOTTED_SECTION_NUM_RE.match(s))
 
 
+@lru_cache(maxsize=2048)
+def _section_ref_amount_context_re(token: str) -> "re.Pattern[str]":
+    """
+    One compiled pattern per dotted token for "currency before it" or "%, duration unit or nights after it".
+    Cached here because a long document has hundreds of distinct section numbers; building four
+    patterns per call overflowed the ``re`` module cache and recompiled on every clause.
+    """
+    t = re.escape(token)
+    return re.compile(
+        rf"(?:EUR|USD|GBP|CHF|CAD|AUD|SGD|NZD|JPY)\s*{t}\b"
+        rf"|\b{t}\s*(?:%|(?:days?|weeks?|months?|years?|nights?)\b)",
+        re.I,
+    )
+
+
 def should_exclude_numeric_as_section_reference(n: float, raw_text: str) -> bool:
     """
     If True, this numeric must not be used as amount_value / cap hint.
@@ -43,17 +59,7 @@ def should_exclude_numeric_as_section_reference(n: float, raw_text: str) -> bool
     """
     if not looks_like_dotted_section_number(n):
         return False
-    r = raw_text or ""
-    token = re.escape(_format_dotted_number(n))
-    if re.search(rf"(?:EUR|USD|GBP|CHF|CAD|AUD|SGD|NZD|JPY)\s*{token}\b", r, re.I):
-        return False
-    if re.search(rf"\b{token}\s*%", r):
-        return False
-    if re.search(rf"\b{token}\s*(?:days?|weeks?|months?|years?)\b", r, re.I):
-        return False
-    if re.search(rf"\b{token}\s*(?:nights?)\b", r, re.I):
-        return False
-    return True
+    return not _section_ref_amount_context_re(_format_dotted_number(n)).search(raw_text or "")
 
 
 def filter_candidate_numeric_values(nums: List[Any], raw_text: str) -> List[float]:
@@ -12,7 +12,7 @@ from __future__ import annotations
 import logging
 import os
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 log = logging.getLogger(__name__)
 
@@ -38,20 +38,19 @@ def _normalize_backend(name: Optional[str]) -> StructuralParseBackend:
     return StructuralParseBackend.NATIVE
 
 
+def _shape_element(it: Dict[str, Any], index: int, source: str) -> Dict[str, Any]:
+    row = dict(it)
+    row.setdefault("text", "")
+    row.setdefault("page", 1)
+    row.setdefault("is_table_row", False)
+    row["structural_source"] = source
+    row.setdefault("element_index", index)
+    return row
+
+
 def _ensure_element_shape(items: List[Dict[str, Any]], source: str) -> List[Dict[str, Any]]:
     """Attach optional provenance; required keys unchanged for downstream."""
-    out: List[Dict[str, Any]] = []
-    for i, it in enumerate(items):
-        if not isinstance(it, dict):
-            continue
-        row = dict(it)
-        row.setdefault("text", "")
-        row.setdefault("page", 1)
-        row.setdefault("is_table_row", False)
-        row["structural_source"] = source
-        row.setdefault("element_index", i)
-        out.append(row)
-    return out
+    return [_shape_element(it, i, source) for i, it in enumerate(items) if isinstance(it, dict)]
 
 
 def _parse_native(data: bytes, mime_type: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
@@ -132,3 +131,29 @@ def parse_policy_document_to_elements(
         return _parse_unstructured_placeholder(data, mime_type, fallback_on_error=fallback_on_error)
 
     return _parse_native(data, mime_type)
+
+
+def iter_policy_document_elements(
+    data: bytes,
+    mime_type: str,
+    *,
+    backend: Optional[StructuralParseBackend] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming form of parse_policy_document_to_elements for large documents. The native backend
+    yields elements as the file is read; placeholder backends are parsed fully, then yielded.
+    Errors raise (ValueError for a parse error string) rather than being returned.
+    """
+    be = backend or _normalize_backend(os.environ.get(ENV_STRUCTURAL_BACKEND))
+    if be != StructuralParseBackend.NATIVE:
+        items, err = parse_policy_document_to_elements(data, mime_type, backend=be, fallback_on_error=True)
+        if err:
+            raise ValueError(err)
+        yield from items
+        return
+
+    from .policy_document_clauses import iter_lines_with_pages
+
+    source = StructuralParseBackend.NATIVE.value
+    for i, it in enumerate(iter_lines_with_pages(data, mime_type)):
+        yield _shape_element(it, i, source)
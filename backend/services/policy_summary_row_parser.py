@@ -31,6 +31,11 @@ _STANDALONE_SECTION_REF_RE = re.compile(r"^\s*(\d+(?:\.\d+){1,3})\s*$")
 _TRAILING_SECTION_REF_RE = re.compile(r"([\s.;,]+)(\d+(?:\.\d+){1,3})\s*$")
 # Numbered heading at line start (context, not a data row)
 _NUMBERED_HEADING_RE = re.compile(r"^(\d+(?:\.\d+)*)\s+(.+)$")
+# Heading-context line rejections: long numbers, amounts, narrative modal verbs
+_LONG_NUMBER_RE = re.compile(r"\d{3,}")
+_DIGIT_RE = re.compile(r"\d")
+_AMOUNT_TOKEN_RE = re.compile(r"(?:USD|EUR|GBP|CHF|CAD|AUD|%)\b", re.I)
+_NARRATIVE_VERB_RE = re.compile(r"\b(may|will|shall|must|can|could|should|provided|eligible|covered)\b")
 
 STRATEGY_SUMMARY_TABLE = "summary_table_pipe"
 
@@ -53,6 +58,20 @@ class PolicyRowCandidate:
         return asdict(self)
 
 
+def summary_row_parser_possible(policy_context: Optional[Dict[str, Any]]) -> bool:
+    """
+    Context-only half of the gate: False means row parsing is ruled out before any line is read,
+    so callers may stream legacy segmentation instead of materializing every item.
+    """
+    ctx = policy_context or {}
+    em = ctx.get("extracted_metadata") if isinstance(ctx.get("extracted_metadata"), dict) else {}
+    if em.get("force_summary_row_parser") is True or em.get("parser_profile") == "summary_rows":
+        return True
+    sub = (em.get("subformat") or "").strip().lower()
+    dt = (ctx.get("detected_document_type") or "").strip()
+    return dt in SUMMARY_ROW_DOCUMENT_TYPES or sub in ("summary_table", "compact_benefit_matrix")
+
+
 def should_use_summary_row_parser(
     policy_context: Optional[Dict[str, Any]],
     items: Sequence[Dict[str, Any]],
@@ -68,11 +87,7 @@ def should_use_summary_row_parser(
         return True
     if em.get("parser_profile") == "summary_rows":
         return True
-    sub = (em.get("subformat") or "").strip().lower()
-    if sub in ("summary_table", "compact_benefit_matrix", "policy_summary"):
-        pass  # still require table signal below
-    dt = (ctx.get("detected_document_type") or "").strip()
-    if dt not in SUMMARY_ROW_DOCUMENT_TYPES and sub not in ("summary_table", "compact_benefit_matrix"):
+    if not summary_row_parser_possible(policy_context):
         return False
 
     table_like = 0
@@ -90,15 +105,15 @@ def _is_heading_context_line(text: str) -> bool:
     s = text.strip()
     if not s or len(s) > 120 or "|" in s:
         return False
-    if re.search(r"\d{3,}", s):
+    if _LONG_NUMBER_RE.search(s):
         return False
-    if re.search(r"(?:USD|EUR|GBP|CHF|CAD|AUD|%)\b", s, re.I):
+    if _AMOUNT_TOKEN_RE.search(s):
         return False
     if _NUMBERED_HEADING_RE.match(s):
         return True
     lower = s.lower()
     # Avoid narrative lines
-    if re.search(r"\b(may|will|shall|must|can|could|should|provided|eligible|covered)\b", lower):
+    if _NARRATIVE_VERB_RE.search(lower):
         return False
     # Known section-style phrases
     known = (
@@ -119,7 +134,7 @@ def _is_heading_context_line(text: str) -> bool:
     # Short titled lines (2–7 words), title-like, no sentence punctuation
     words = s.split()
     if 2 <= len(words) <= 7 and s[-1] not in ".;:":
-        if s[:1].isupper() and not re.search(r"\d", s):
+        if s[:1].isupper() and not _DIGIT_RE.search(s):
             return True
     return False
 
@@ -161,7 +176,7 @@ def _continuation_line(text: str) -> bool:
     # Wrapped description continuation
     if s[0].islower():
         return True
-    if re.match(r"^[a-z]", s):
+    if "a" <= s[0] <= "z":
         return True
     if s.startswith(("and ", "or ", "including ", "excluding ", "see ", "per ")):
         return True
@@ -63,6 +63,62 @@ def _score_content_domain(domain: Optional[str]) -> int:
     return 5
 
 
+def _band_for_score(score: int) -> str:
+    if score >= 75:
+        return "critical"
+    if score >= 55:
+        return "high"
+    if score >= 30:
+        return "medium"
+    return "low"
+
+
+# Age thresholds (hours) at which the aging bonus steps up.
+_AGE_STEPS_HOURS = (24, 72)
+# SLA target within this many hours counts as "SLA approaching".
+_SLA_SOON_HOURS = 24
+
+_TIME_REASON_PREFIXES = ("Item overdue", "Item aged", "SLA ")
+
+
+def compute_time_priority_bonus(
+    is_overdue: bool = False,
+    age_in_queue_hours: Optional[float] = None,
+    sla_breach: bool = False,
+    sla_hours_remaining: Optional[float] = None,
+) -> tuple[int, List[str]]:
+    """
+    Time-dependent part of the priority score: (bonus points, reasons).
+    Shared by compute_priority_score and the periodic priority scheduler.
+    """
+    bonus = 0
+    reasons: List[str] = []
+
+    # Overdue
+    if is_overdue:
+        bonus += 15
+        reasons.append("Item overdue for review")
+
+    # Aging
+    if age_in_queue_hours is not None:
+        if age_in_queue_hours >= 72:
+            bonus += 15
+            reasons.append("Item aged 3+ days in queue")
+        elif age_in_queue_hours >= 24:
+            bonus += 8
+            reasons.append("Item aged 1+ day in queue")
+
+    # SLA breach / approaching
+    if sla_breach:
+        bonus += 25
+        reasons.append("SLA breach")
+    elif sla_hours_remaining is not None and sla_hours_remaining <= _SLA_SOON_HOURS:
+        bonus += 10
+        reasons.append("SLA target within 24 hours")
+
+    return bonus, reasons
+
+
 def compute_priority_score(
     queue_item_type: str,
     trust_tier: Optional[str] = None,
@@ -73,6 +129,7 @@ def compute_priority_score(
     event_start_soon_days: Optional[int] = None,
     age_in_queue_hours: Optional[float] = None,
     sla_breach: bool = False,
+    sla_hours_remaining: Optional[float] = None,
 ) -> tuple[int, str, List[str]]:
     """
     Returns (score, priority_band, reasons).
@@ -131,40 +188,23 @@ def compute_priority_score(
         score += 10
         reasons.append("Live content flagged as stale")
 
-    # Overdue
-    if is_overdue:
-        score += 15
-        reasons.append("Item overdue for review")
-
     # Event soon
     if event_start_soon_days is not None and event_start_soon_days <= 2:
         score += 20
         reasons.append(f"Event starts within {event_start_soon_days} days")
 
-    # Aging
-    if age_in_queue_hours is not None:
-        if age_in_queue_hours >= 72:
-            score += 15
-            reasons.append("Item aged 3+ days in queue")
-        elif age_in_queue_hours >= 24:
-            score += 8
-            reasons.append("Item aged 1+ day in queue")
-
-    # SLA breach
-    if sla_breach:
-        score += 25
-        reasons.append("SLA breach")
+    # Overdue, aging, SLA
+    bonus, time_reasons = compute_time_priority_bonus(
+        is_overdue=is_overdue,
+        age_in_queue_hours=age_in_queue_hours,
+        sla_breach=sla_breach,
+        sla_hours_remaining=sla_hours_remaining,
+    )
+    score += bonus
+    reasons.extend(time_reasons)
 
     score = min(100, score)
-
-    if score >= 75:
-        band = "critical"
-    elif score >= 55:
-        band = "high"
-    elif score >= 30:
-        band = "medium"
-    else:
-        band = "low"
+    band = _band_for_score(score)
 
     return score, band, reasons[:5]
 
@@ -174,6 +214,172 @@ def _ensure_table():
     pass  # Rely on migration
 
 
+def _parse_ts(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _ts_filter_value(dt: datetime) -> str:
+    """UTC timestamp without '+' so it is safe inside PostgREST or_() filters."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+# Stored in priority_next_check_at once no time threshold is left; NULL means "never scheduled".
+_PRIORITY_SETTLED_AT = datetime(9999, 12, 31, tzinfo=timezone.utc)
+
+
+def _priority_check_value(next_check: Optional[datetime]) -> str:
+    """priority_next_check_at column value: the next check, or the settled sentinel."""
+    return (next_check or _PRIORITY_SETTLED_AT).isoformat()
+
+
+def _next_priority_check_at(
+    created_at: Optional[datetime],
+    due_at: Optional[datetime],
+    sla_target_at: Optional[datetime],
+    now: datetime,
+) -> Optional[datetime]:
+    """
+    Earliest future moment at which the time bonus can change (age step, due, SLA window, SLA breach).
+    None when no further time threshold applies.
+    """
+    candidates: List[datetime] = []
+    if created_at:
+        candidates.extend(created_at + timedelta(hours=h) for h in _AGE_STEPS_HOURS)
+    if due_at:
+        candidates.append(due_at)
+    if sla_target_at:
+        candidates.append(sla_target_at - timedelta(hours=_SLA_SOON_HOURS))
+        candidates.append(sla_target_at)
+    future = [c for c in candidates if c > now]
+    return min(future) if future else None
+
+
+def _with_priority_schedule(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Record the static base score and first re-check time on a new queue row."""
+    now = datetime.now(timezone.utc)
+    next_check = _next_priority_check_at(now, _parse_ts(row.get("due_at")), _parse_ts(row.get("sla_target_at")), now)
+    row["base_priority_score"] = row.get("priority_score", 0)
+    row["priority_next_check_at"] = _priority_check_value(next_check)
+    return row
+
+
+def _record_rollup_transition(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> None:
+    """Keep the ops backlog rollup in step with a queue create / status transition."""
+    try:
+        from .ops_analytics_service import apply_queue_transition_to_rollup
+        apply_queue_transition_to_rollup(before, after)
+    except Exception as e:
+        log.warning("Ops rollup update failed for queue transition: %s", e)
+
+
+def _stored_reasons(item: Dict[str, Any]) -> List[str]:
+    pr = item.get("priority_reasons_json")
+    if isinstance(pr, str):
+        try:
+            pr = json.loads(pr)
+        except Exception:
+            pr = []
+    return [r for r in (pr or []) if isinstance(r, str)]
+
+
+def evaluate_time_aware_priority(
+    item: Dict[str, Any],
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Current priority for an open queue item: stored base score plus the time bonus
+    (age, overdue, SLA proximity/breach). Returns score, band, reasons, next_check_at.
+    """
+    now = now or datetime.now(timezone.utc)
+    base = item.get("base_priority_score")
+    if base is None:
+        base = item.get("priority_score") or 0
+    created_at = _parse_ts(item.get("created_at"))
+    due_at = _parse_ts(item.get("due_at"))
+    sla_target_at = _parse_ts(item.get("sla_target_at"))
+
+    bonus, time_reasons = compute_time_priority_bonus(
+        is_overdue=bool(due_at and due_at < now),
+        age_in_queue_hours=(now - created_at).total_seconds() / 3600 if created_at else None,
+        sla_breach=bool(sla_target_at and sla_target_at < now),
+        sla_hours_remaining=(sla_target_at - now).total_seconds() / 3600 if sla_target_at else None,
+    )
+    score = min(100, int(base) + bonus)
+    reasons = [r for r in _stored_reasons(item) if not r.startswith(_TIME_REASON_PREFIXES)] + time_reasons
+    return {
+        "priority_score": score,
+        "priority_band": _band_for_score(score),
+        "reasons": reasons[:5],
+        "next_check_at": _next_priority_check_at(created_at, due_at, sla_target_at, now),
+    }
+
+
+def recompute_queue_priorities(now: Optional[datetime] = None, limit: int = 500) -> Dict[str, Any]:
+    """
+    Periodic job: re-score only open items whose next time threshold has passed
+    (priority_next_check_at <= now, or never scheduled). Items whose score is unchanged
+    only get their next check time moved forward; items with no threshold left are
+    parked at _PRIORITY_SETTLED_AT so they are not selected again.
+    """
+    now = now or datetime.now(timezone.utc)
+    supabase = _get_supabase()
+    due_filter = f"priority_next_check_at.is.null,priority_next_check_at.lte.{_ts_filter_value(now)}"
+    items = (
+        supabase.table("review_queue_items")
+        .select(
+            "id, status, priority_score, priority_band, base_priority_score, priority_reasons_json, "
+            "created_at, due_at, sla_target_at, priority_next_check_at, "
+            "country_code, city_name, queue_item_type, assigned_to_user_id"
+        )
+        .in_("status", list(_OPEN_STATUSES))
+        .or_(due_filter)
+        .order("priority_next_check_at", desc=False, nullsfirst=True)
+        .limit(limit)
+        .execute()
+    ).data or []
+
+    rescored = 0
+    band_changed: List[str] = []
+    for it in items:
+        ev = evaluate_time_aware_priority(it, now)
+        next_check = ev["next_check_at"]
+        updates: Dict[str, Any] = {
+            "priority_next_check_at": _priority_check_value(next_check),
+        }
+        if it.get("base_priority_score") is None:
+            updates["base_priority_score"] = it.get("priority_score") or 0
+        if ev["priority_score"] != it.get("priority_score") or ev["priority_band"] != it.get("priority_band"):
+            updates["priority_score"] = ev["priority_score"]
+            updates["priority_band"] = ev["priority_band"]
+            updates["priority_reasons_json"] = json.dumps(ev["reasons"])
+            rescored += 1
+            if ev["priority_band"] != it.get("priority_band"):
+                band_changed.append(it["id"])
+        supabase.table("review_queue_items").update(updates).eq("id", it["id"]).execute()
+        if "priority_band" in updates and updates["priority_band"] != it.get("priority_band"):
+            _record_rollup_transition(it, {**it, **updates})
+
+    if band_changed:
+        try:
+            from .ops_notification_service import evaluate_queue_notification_rules
+            for iid in band_changed:
+                item = get_review_queue_item(iid)
+                if item:
+                    evaluate_queue_notification_rules(item)
+        except Exception as e:
+            log.warning("Notification evaluation failed after priority recompute: %s", e)
+
+    return {"evaluated": len(items), "rescored": rescored, "band_changed": len(band_changed)}
+
+
 def create_queue_item_from_staged_resource(candidate: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Create queue item from staged resource candidate. De-duplicates."""
     supabase = _get_supabase()
@@ -217,9 +423,10 @@ def create_queue_item_from_staged_resource(candidate: Dict[str, Any]) -> Optiona
         "created_from_signal_id": cid,
         "priority_reasons_json": json.dumps(reasons),
     }
-    r = supabase.table("review_queue_items").insert(row).execute()
+    r = supabase.table("review_queue_items").insert(_with_priority_schedule(row)).execute()
     created = (r.data or [{}])[0] if r.data else None
     if created:
+        _record_rollup_transition(None, created)
         try:
             from .ops_notification_service import evaluate_queue_notification_rules
             evaluate_queue_notification_rules(created)
@@ -280,9 +487,10 @@ def create_queue_item_from_staged_event(candidate: Dict[str, Any]) -> Optional[D
         "priority_reasons_json": json.dumps(reasons),
         "context_json": json.dumps({"start_datetime": start_str}),
     }
-    r = supabase.table("review_queue_items").insert(row).execute()
+    r = supabase.table("review_queue_items").insert(_with_priority_schedule(row)).execute()
     created = (r.data or [{}])[0] if r.data else None
     if created:
+        _record_rollup_transition(None, created)
         try:
             from .ops_notification_service import evaluate_queue_notification_rules
             evaluate_queue_notification_rules(created)
@@ -337,9 +545,10 @@ def create_queue_item_from_source_change(change: Dict[str, Any]) -> Optional[Dic
         "priority_reasons_json": json.dumps(reasons),
         "context_json": json.dumps({"change_type": change.get("change_type"), "change_score": ch_score}),
     }
-    r = supabase.table("review_queue_items").insert(row).execute()
+    r = supabase.table("review_queue_items").insert(_with_priority_schedule(row)).execute()
     created = (r.data or [{}])[0] if r.data else None
     if created:
+        _record_rollup_transition(None, created)
         try:
             from .ops_notification_service import evaluate_queue_notification_rules
             evaluate_queue_notification_rules(created)
@@ -385,9 +594,10 @@ def create_queue_item_from_stale_live_resource(resource: Dict[str, Any]) -> Opti
         "priority_reasons_json": json.dumps(reasons),
         "context_json": json.dumps({"stale_reason": resource.get("stale_reason", "old_updated_at")}),
     }
-    r = supabase.table("review_queue_items").insert(row).execute()
+    r = supabase.table("review_queue_items").insert(_with_priority_schedule(row)).execute()
     created = (r.data or [{}])[0] if r.data else None
     if created:
+        _record_rollup_transition(None, created)
         try:
             from .ops_notification_service import evaluate_queue_notification_rules
             evaluate_queue_notification_rules(created)
@@ -433,9 +643,10 @@ def create_queue_item_from_stale_live_event(event: Dict[str, Any]) -> Optional[D
         "priority_reasons_json": json.dumps(reasons),
         "context_json": json.dumps({"stale_reason": event.get("stale_reason", "event_expired")}),
     }
-    r = supabase.table("review_queue_items").insert(row).execute()
+    r = supabase.table("review_queue_items").insert(_with_priority_schedule(row)).execute()
     created = (r.data or [{}])[0] if r.data else None
     if created:
+        _record_rollup_transition(None, created)
         try:
             from .ops_notification_service import evaluate_queue_notification_rules
             evaluate_queue_notification_rules(created)
@@ -498,7 +709,11 @@ def list_review_queue_items(
         order_col = "created_at"
         order_asc = True
 
-    q = q.order(order_col, desc=not order_asc).range(offset, offset + limit - 1)
+    q = q.order(order_col, desc=not order_asc)
+    if sort == "priority":
+        # Tie-break matches idx_review_queue_status_priority so the page is one index range scan
+        q = q.order("created_at", desc=False)
+    q = q.range(offset, offset + limit - 1)
     r = q.execute()
     items = r.data or []
     total = r.count if hasattr(r, "count") and r.count is not None else len(items)
@@ -613,7 +828,9 @@ def assign_queue_item(
     }).eq("id", item_id).execute()
 
     _log_activity(item_id, "assign", actor_user_id, previous_assignee_id=prev_assignee, new_assignee_id=assignee_user_id)
-    return get_review_queue_item(item_id)
+    updated = get_review_queue_item(item_id)
+    _record_rollup_transition(item, updated)
+    return updated
 
 
 def claim_queue_item(item_id: str, actor_user_id: str) -> Optional[Dict[str, Any]]:
@@ -640,7 +857,9 @@ def unassign_queue_item(item_id: str, actor_user_id: str) -> Optional[Dict[str,
     }).eq("id", item_id).execute()
 
     _log_activity(item_id, "unassign", actor_user_id, previous_assignee_id=prev_assignee, new_assignee_id=None)
-    return get_review_queue_item(item_id)
+    updated = get_review_queue_item(item_id)
+    _record_rollup_transition(item, updated)
+    return updated
 
 
 def change_queue_item_status(
@@ -672,7 +891,9 @@ def change_queue_item_status(
 
     supabase.table("review_queue_items").update(updates).eq("id", item_id).execute()
     _log_activity(item_id, "status_change", actor_user_id, previous_status=current, new_status=new_status, note=note)
-    return get_review_queue_item(item_id)
+    updated = get_review_queue_item(item_id)
+    _record_rollup_transition(item, updated)
+    return updated
 
 
 def defer_queue_item(
@@ -688,14 +909,22 @@ def defer_queue_item(
 
     supabase = _get_supabase()
     now = datetime.now(timezone.utc).isoformat()
-    updates: Dict[str, Any] = {"status": "deferred", "due_at": due_at, "updated_at": now}
+    # New due date: rescore on the next recompute instead of staying parked on the old schedule.
+    updates: Dict[str, Any] = {
+        "status": "deferred",
+        "due_at": due_at,
+        "updated_at": now,
+        "priority_next_check_at": now,
+    }
     if note:
         existing_notes = item.get("notes") or ""
         updates["notes"] = (existing_notes + "\n[Deferred] " + note).strip()
     supabase.table("review_queue_items").update(updates).eq("id", item_id).execute()
 
     _log_activity(item_id, "defer", actor_user_id, previous_status=item.get("status"), new_status="deferred", note=note)
-    return get_review_queue_item(item_id)
+    updated = get_review_queue_item(item_id)
+    _record_rollup_transition(item, updated)
+    return updated
 
 
 def resolve_queue_item(
@@ -721,7 +950,9 @@ def resolve_queue_item(
     }).eq("id", item_id).execute()
 
     _log_activity(item_id, "resolve", actor_user_id, previous_status=item.get("status"), new_status="resolved", note=resolution_summary)
-    return get_review_queue_item(item_id)
+    updated = get_review_queue_item(item_id)
+    _record_rollup_transition(item, updated)
+    return updated
 
 
 def reopen_queue_item(item_id: str, actor_user_id: str, note: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -740,10 +971,14 @@ def reopen_queue_item(item_id: str, actor_user_id: str, note: Optional[str] = No
         "resolved_at": None,
         "resolved_by_user_id": None,
         "updated_at": now,
+        # A settled item is parked at _PRIORITY_SETTLED_AT; make it due for rescoring again.
+        "priority_next_check_at": now,
     }).eq("id", item_id).execute()
 
     _log_activity(item_id, "reopen", actor_user_id, previous_status=item.get("status"), new_status="new", note=note)
-    return get_review_queue_item(item_id)
+    updated = get_review_queue_item(item_id)
+    _record_rollup_transition(item, updated)
+    return updated
 
 
 def update_queue_item_notes(item_id: str, notes: str, actor_user_id: str) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,97 @@
+"""
+User display names for admin surfaces (collaboration comments, admin thread list, notification renderers).
+
+Resolves many user ids with one bulk profiles query plus one users query for the misses, behind a
+short TTL cache so a page that renders the same handful of admins repeatedly does not hit the DB
+per row. Display rule matches the historical per-row lookups: profile full_name → profile email →
+user email → user name → short id.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# Names change rarely; a few minutes of staleness is acceptable for admin-only rendering.
+_DISPLAY_NAME_TTL_SEC = 300.0
+_DISPLAY_NAME_CACHE_MAX = 5000
+_display_name_cache: Dict[str, Tuple[float, Dict[str, Optional[str]]]] = {}
+_lock = threading.Lock()
+
+
+def _short_id(user_id: str) -> str:
+    return user_id[:8] + "…"
+
+
+def _entry_from_rows(
+    user_id: str,
+    profile: Optional[Dict[str, Any]],
+    user: Optional[Dict[str, Any]],
+) -> Dict[str, Optional[str]]:
+    if profile:
+        return {
+            "display_name": profile.get("full_name") or profile.get("email") or _short_id(user_id),
+            "email": profile.get("email"),
+        }
+    return {
+        "display_name": (user and (user.get("email") or user.get("name"))) or _short_id(user_id),
+        "email": user.get("email") if user else None,
+    }
+
+
+def invalidate_user_display_names(user_ids: Optional[Iterable[str]] = None) -> None:
+    """Drop cached names (all when ``user_ids`` is None), e.g. after a profile rename."""
+    with _lock:
+        if user_ids is None:
+            _display_name_cache.clear()
+            return
+        for uid in user_ids:
+            _display_name_cache.pop(str(uid), None)
+
+
+def resolve_user_display_names(user_ids: Iterable[str], db: Any = None) -> Dict[str, Dict[str, Optional[str]]]:
+    """
+    Map each distinct user id to {"display_name", "email"}.
+    Cache misses are resolved in bulk; on lookup failure the short id is returned (not cached).
+    """
+    ids: List[str] = list(dict.fromkeys(str(u) for u in user_ids if u))
+    if not ids:
+        return {}
+    now = time.monotonic()
+    out: Dict[str, Dict[str, Optional[str]]] = {}
+    missing: List[str] = []
+    with _lock:
+        for uid in ids:
+            hit = _display_name_cache.get(uid)
+            if hit and (now - hit[0]) < _DISPLAY_NAME_TTL_SEC:
+                out[uid] = hit[1]
+            else:
+                missing.append(uid)
+    if not missing:
+        return out
+
+    try:
+        if db is None:
+            from ..database import db as _db
+
+            db = _db
+        profiles = db.get_profile_records_by_ids(missing)
+        no_profile = [uid for uid in missing if uid not in profiles]
+        users = db.get_users_by_ids(no_profile) if no_profile else {}
+    except Exception as exc:
+        log.warning("resolve_user_display_names bulk lookup failed n=%s: %s", len(missing), exc)
+        for uid in missing:
+            out[uid] = {"display_name": _short_id(uid), "email": None}
+        return out
+
+    resolved = {uid: _entry_from_rows(uid, profiles.get(uid), users.get(uid)) for uid in missing}
+    with _lock:
+        if len(_display_name_cache) + len(resolved) > _DISPLAY_NAME_CACHE_MAX:
+            _display_name_cache.clear()
+        for uid, entry in resolved.items():
+            _display_name_cache[uid] = (now, entry)
+    out.update(resolved)
+    return out
@@ -0,0 +1,156 @@
+"""Admin indexes: keyset pages, cursor validation and write-maintained company counters."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+import uuid
+
+from sqlalchemy import event, text
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.db_instrumentation import capture_queries  # noqa: E402
+
+
+class AdminIndexPaginationTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        from backend.database import db
+
+        cls.db = db
+        cls.tag = uuid.uuid4().hex[:8]
+        cls.company_ids = []
+        for i in range(5):
+            cid = str(uuid.uuid4())
+            db.create_company(cid, f"Keyset {cls.tag} {i}", "SG", "51-200", "", "", "")
+            cls.company_ids.append(cid)
+        cls.hr_profile = str(uuid.uuid4())
+        db.ensure_profile_record(cls.hr_profile, f"hr-{cls.tag}@example.com", "HR", f"Keyset {cls.tag} HR")
+        db.create_hr_user(str(uuid.uuid4()), cls.company_ids[0], cls.hr_profile)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        # Drop what the tests seeded into the shared database, children first.
+        with cls.db.engine.begin() as conn:
+            for cid in cls.company_ids:
+                for table in ("company_policies", "relocation_cases", "hr_users", "company_index_counters"):
+                    conn.execute(text(f"DELETE FROM {table} WHERE company_id = :cid"), {"cid": cid})
+                conn.execute(text("DELETE FROM companies WHERE id = :cid"), {"cid": cid})
+            conn.execute(text("DELETE FROM profiles WHERE id = :pid"), {"pid": cls.hr_profile})
+
+    def _walk(self, fetch, sort: str, limit: int = 2):
+        seen, cursor = [], None
+        while True:
+            items, next_cursor = fetch(sort=sort, limit=limit, cursor=cursor)
+            self.assertLessEqual(len(items), limit)
+            seen.extend(items)
+            if not next_cursor:
+                return seen
+            cursor = next_cursor
+
+    def _companies(self, **kw):
+        items, summary = self.db.get_admin_company_index(f"keyset {self.tag}", **kw)
+        return items, summary["next_cursor"]
+
+    def test_company_pages_cover_every_row_once_in_order(self) -> None:
+        full, _ = self.db.get_admin_company_index(f"keyset {self.tag}")
+        for sort in ("name", "-name", "created_at"):
+            with self.subTest(sort=sort):
+                paged = self._walk(self._companies, sort)
+                ids = [c["id"] for c in paged]
+                self.assertEqual(len(ids), len(set(ids)))
+                self.assertEqual(set(ids), {c["id"] for c in full})
+        names = [c["name"] for c in self._walk(self._companies, "-name")]
+        self.assertEqual(names, sorted(names, reverse=True))
+
+    def test_counters_follow_writes_and_page_cost_is_flat(self) -> None:
+        cid = self.company_ids[1]
+        case_id, hr_profile = str(uuid.uuid4()), str(uuid.uuid4())
+        self.db.create_hr_user(str(uuid.uuid4()), cid, hr_profile)
+        self.db.create_case(case_id, hr_profile, {}, company_id=cid)
+        aid = str(uuid.uuid4())
+        self.db.create_assignment(aid, case_id, hr_profile, None, f"e-{self.tag}", "active")
+        with capture_queries("page") as stats:
+            items, _ = self.db.get_admin_company_index(f"keyset {self.tag} 1", limit=10)
+        self.assertEqual(stats.count, 1)
+        row = items[0]
+        self.assertEqual((row["hr_users_count"], row["assignments_count"]), (1, 1))
+        self.db.delete_assignment(aid)
+        items, _ = self.db.get_admin_company_index(f"keyset {self.tag} 1", limit=10)
+        self.assertEqual(items[0]["assignments_count"], 0)
+
+    def test_policy_relink_moves_policy_counts(self) -> None:
+        source, target = self.company_ids[2], self.company_ids[3]
+        policy_id = str(uuid.uuid4())
+        self.db.create_company_policy(policy_id, source, "Relink", None, None, "r.pdf", "application/pdf", None)
+        self.db.refresh_company_index_counters([source, target])
+
+        def counts():
+            items, _ = self.db.get_admin_company_index(f"keyset {self.tag}", limit=10)
+            by_id = {c["id"]: c["policies_count"] for c in items}
+            return by_id[source], by_id[target]
+
+        self.assertEqual(counts(), (1, 0))
+        self.db.admin_link_policy_company(policy_id, target)
+        self.assertEqual(counts(), (0, 1))
+
+    def test_counter_writes_apply_deltas_matching_a_full_recount(self) -> None:
+        source, target = self.company_ids[3], self.company_ids[4]
+        hr_profile, case_id, aid = str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())
+        self.db.create_hr_user(str(uuid.uuid4()), source, hr_profile)
+        self.db.refresh_company_index_counters([source, target])
+        self.db.create_case(case_id, hr_profile, {})
+        self.db.create_assignment(aid, case_id, hr_profile, None, f"e-{self.tag}", "active")
+
+        def counters():
+            with self.db.engine.connect() as conn:
+                rows = conn.execute(
+                    text(
+                        "SELECT company_id, hr_users_count, assignments_count, policies_count "
+                        "FROM company_index_counters WHERE company_id IN (:s, :t) ORDER BY company_id"
+                    ),
+                    {"s": source, "t": target},
+                ).fetchall()
+            return [tuple(r) for r in rows]
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(self.db.engine, "before_cursor_execute", record)
+        try:
+            # The case has no company, so the assignment follows its HR owner to the target company.
+            self.db.ensure_hr_user_for_profile(hr_profile, target)
+        finally:
+            event.remove(self.db.engine, "before_cursor_execute", record)
+        moved = counters()
+        self.assertEqual({r[0]: r[1:3] for r in moved}, {source: (0, 0), target: (1, 1)})
+        self.assertFalse([s for s in statements if "INSERT INTO company_index_counters" in s])
+        self.assertTrue([s for s in statements if s.lstrip().startswith("UPDATE company_index_counters")])
+        self.db.refresh_company_index_counters([source, target])
+        self.assertEqual(counters(), moved)
+        self.db.delete_assignment(aid)
+        with self.db.engine.begin() as conn:
+            conn.execute(text("DELETE FROM hr_users WHERE profile_id = :p"), {"p": hr_profile})
+
+    def test_people_pages_and_cursor_validation(self) -> None:
+        def fetch(**kw):
+            items, summary = self.db.get_admin_people_index(query=self.tag, **kw)
+            return items, summary["next_cursor"]
+
+        people = self._walk(fetch, "email", limit=1)
+        self.assertEqual([p["id"] for p in people], [self.hr_profile])
+        self.assertEqual((people[0]["hr_link_count"], people[0]["employee_link_count"]), (1, 0))
+        _, cursor = self._companies(sort="name", limit=1)
+        with self.assertRaises(ValueError):
+            self._companies(sort="-name", limit=1, cursor=cursor)
+        with self.assertRaises(ValueError):
+            self._companies(sort="id; DROP TABLE companies", limit=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
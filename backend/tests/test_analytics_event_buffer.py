@@ -0,0 +1,89 @@
+"""Buffered analytics sink: batching, backpressure drops, forced flush and shutdown drain."""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import unittest
+import uuid
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.services.analytics_service import AnalyticsEventBuffer, _persist_batch  # noqa: E402
+
+
+class AnalyticsEventBufferTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def _sink(self, batch) -> None:
+        with self._lock:
+            self.batches.append([payload["n"] for _, payload, _ in batch])
+
+    def _written(self):
+        return [n for batch in self.batches for n in batch]
+
+    def test_no_loss_or_duplicates_across_flush_and_shutdown(self) -> None:
+        buf = AnalyticsEventBuffer(self._sink, flush_interval=0.01, batch_size=7, max_events=10_000)
+
+        def produce(start: int) -> None:
+            for n in range(start, start + 250):
+                buf.put("evt", {"n": n})
+
+        threads = [threading.Thread(target=produce, args=(i * 250,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        buf.flush()
+        for t in threads:
+            t.join()
+        buf.shutdown()
+        buf.put("evt", {"n": 1000})  # after shutdown: written inline
+        written = self._written()
+        self.assertEqual(sorted(written), list(range(1001)))
+        self.assertTrue(all(len(b) <= 7 for b in self.batches))
+        self.assertEqual(buf.stats()["written"], 1001)
+        self.assertEqual(buf.stats()["dropped"], 0)
+
+    def test_full_buffer_drops_and_counts(self) -> None:
+        buf = AnalyticsEventBuffer(self._sink, flush_interval=3600, batch_size=100, max_events=3)
+        accepted = [buf.put("evt", {"n": n}) for n in range(5)]
+        self.assertEqual(accepted, [True, True, True, False, False])
+        self.assertEqual(self.batches, [])
+        buf.shutdown()
+        self.assertEqual(self._written(), [0, 1, 2])
+        self.assertEqual(buf.stats()["dropped"], 2)
+
+    def test_default_sink_inserts_one_batch(self) -> None:
+        from backend.database import db
+
+        name = f"buffer_test_{uuid.uuid4().hex[:8]}"
+        _persist_batch([(name, {"event": name, "n": n}, "2026-01-01T00:00:00") for n in range(3)])
+        self.addCleanup(self._delete_events, db, name)
+        rows = db.list_analytics_events(event_name=name, limit=10)
+        self.assertEqual(len(rows), 3)
+
+    def test_default_sink_writes_one_statement_per_chunk(self) -> None:
+        import backend.database as database
+        from backend.db_instrumentation import capture_queries
+
+        name = f"buffer_test_{uuid.uuid4().hex[:8]}"
+        self.addCleanup(self._delete_events, database.db, name)
+        events = [(name, {"n": n}, "2026-01-01T00:00:00") for n in range(database._ANALYTICS_INSERT_CHUNK + 1)]
+        with capture_queries() as stats:
+            self.assertEqual(database.db.insert_analytics_events(events), len(events))
+        self.assertEqual(stats.count, 2)
+        self.assertEqual(len(database.db.list_analytics_events(event_name=name, limit=len(events) + 1)), len(events))
+
+    @staticmethod
+    def _delete_events(db, name: str) -> None:
+        from sqlalchemy import text
+
+        with db.engine.begin() as conn:
+            conn.execute(text("DELETE FROM analytics_events WHERE event_name = :n"), {"n": name})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""API benchmark harness: percentiles, Server-Timing parsing, baseline comparison, tiny seeded run."""
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from sqlalchemy import create_engine
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.benchmarks.api import (  # noqa: E402
+    DEFAULT_SCENARIOS,
+    compare_to_baseline,
+    parse_server_timing,
+    percentile,
+    run_api_benchmark,
+)
+
+
+def _report(p95_ms: float, queries_p95: float, errors: int = 0) -> dict:
+    return {"endpoints": {"hr_assignments": {"p95_ms": p95_ms, "queries_p95": queries_p95, "errors": errors}}}
+
+
+class BenchmarkHelpersTests(unittest.TestCase):
+    def test_percentile_interpolates(self) -> None:
+        values = [10.0, 20.0, 30.0, 40.0, 50.0]
+        self.assertEqual(percentile(values, 50), 30.0)
+        self.assertEqual(percentile(values, 95), 48.0)
+        self.assertEqual(percentile(values, 100), 50.0)
+        self.assertEqual(percentile([], 99), 0.0)
+
+    def test_parse_server_timing(self) -> None:
+        self.assertEqual(parse_server_timing('db;dur=3.5;desc="12 queries", app;dur=9.1'), (12, 3.5))
+        self.assertEqual(parse_server_timing(None), (None, None))
+
+    def test_compare_flags_latency_query_and_error_regressions(self) -> None:
+        base = _report(20.0, 10)
+        self.assertEqual(compare_to_baseline(_report(23.0, 10), base), [])
+        # Relative increase but below the absolute noise floor.
+        self.assertEqual(compare_to_baseline(_report(2.0, 1), _report(1.0, 1)), [])
+        metrics = {r["metric"] for r in compare_to_baseline(_report(40.0, 14, errors=1), base)}
+        self.assertEqual(metrics, {"p95_ms", "queries_p95", "errors"})
+
+
+class SeededBenchmarkRunTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Seed into a throwaway SQLite file, not the shared dev database.
+        import backend.database as dbmod
+        from backend.db_instrumentation import install_query_instrumentation
+        from backend.main import db
+
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmp, 'bench.db')}", connect_args={"check_same_thread": False}
+        )
+        self.addCleanup(engine.dispose)
+        install_query_instrumentation(engine)
+        prev_engine = dbmod._engine
+        dbmod._engine = engine
+        self.addCleanup(setattr, dbmod, "_engine", prev_engine)
+        dbmod.Database()  # create the schema on the temp file
+        patcher = mock.patch.object(db, "engine", engine)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_tiny_seeded_run_reports_every_scenario(self) -> None:
+        from fastapi.testclient import TestClient
+
+        from backend.benchmarks.seed import SeedConfig, seed_synthetic_tenants
+        from backend.main import app, db
+
+        manifest = seed_synthetic_tenants(
+            db,
+            SeedConfig(
+                companies=1,
+                assignments_per_company=2,
+                messages_per_assignment=2,
+                milestones_per_assignment=2,
+                policy_versions_per_company=2,
+            ),
+        )
+        scenarios = [s for s in DEFAULT_SCENARIOS if s.name in ("hr_assignments", "hr_message_conversations")]
+        report = run_api_benchmark(TestClient(app), manifest, rounds=2, warmup=0, scenarios=scenarios)
+
+        self.assertEqual(set(report["endpoints"]), {"hr_assignments", "hr_message_conversations"})
+        for name, r in report["endpoints"].items():
+            self.assertEqual(r["errors"], 0, (name, r["statuses"]))
+            self.assertEqual(r["requests"], 2)
+            self.assertGreater(r["queries_p50"], 0)
+        self.assertEqual(compare_to_baseline(report, report), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Typed resolved_case_id join key: same rows as the CAST/COALESCE predicates it replaces.
+
+Runs against the SQLite triggers only; the Postgres trigger (including the uuid-typed column path in
+20260427150000_case_assignments_resolved_case_id.sql) is not exercised by this suite.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime
+from unittest import mock
+
+from sqlalchemy import text
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+import backend.database as database  # noqa: E402
+
+
+class ResolvedCaseJoinKeyTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.db = database.db
+        now = datetime.utcnow().isoformat()
+        cls.case_a, cls.case_b = str(uuid.uuid4()), str(uuid.uuid4())
+        # (canonical_case_id, case_id) combinations the COALESCE/NULLIF/TRIM predicate distinguishes.
+        combos = [
+            (None, cls.case_a),
+            ("", cls.case_a),
+            ("   ", cls.case_a),
+            (cls.case_b, cls.case_a),
+            (None, str(uuid.uuid4())),
+        ]
+        cls.assignment_ids = []
+        with cls.db.engine.begin() as conn:
+            for cid in (cls.case_a, cls.case_b):
+                conn.execute(
+                    text(
+                        "INSERT INTO relocation_cases (id, hr_user_id, profile_json, created_at, updated_at) "
+                        "VALUES (:id, 'hr-join', '{}', :now, :now)"
+                    ),
+                    {"id": cid, "now": now},
+                )
+            for canonical, case_id in combos:
+                aid = str(uuid.uuid4())
+                conn.execute(
+                    text(
+                        "INSERT INTO case_assignments (id, case_id, canonical_case_id, hr_user_id, "
+                        "employee_identifier, status, created_at, updated_at) "
+                        "VALUES (:id, :case_id, :canonical, 'hr-join', 'e-join', 'active', :now, :now)"
+                    ),
+                    {"id": aid, "case_id": case_id, "canonical": canonical, "now": now},
+                )
+                cls.assignment_ids.append(aid)
+            # Writes after insert keep the key current.
+            conn.execute(
+                text("UPDATE case_assignments SET canonical_case_id = :c WHERE id = :id"),
+                {"c": cls.case_b, "id": cls.assignment_ids[1]},
+            )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        with cls.db.engine.begin() as conn:
+            for aid in cls.assignment_ids:
+                conn.execute(text("DELETE FROM case_assignments WHERE id = :id"), {"id": aid})
+            for cid in (cls.case_a, cls.case_b):
+                conn.execute(text("DELETE FROM relocation_cases WHERE id = :id"), {"id": cid})
+
+    def _joined(self, predicate: str):
+        placeholders = ", ".join(f":a{i}" for i in range(len(self.assignment_ids)))
+        with self.db.engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    f"SELECT a.id, rc.id FROM case_assignments a "
+                    f"LEFT JOIN relocation_cases rc ON {predicate} WHERE a.id IN ({placeholders})"
+                ),
+                {f"a{i}": aid for i, aid in enumerate(self.assignment_ids)},
+            ).fetchall()
+        return sorted((r[0], r[1]) for r in rows)
+
+    def _legacy(self, style: str, *, sqlite: bool) -> str:
+        with mock.patch.object(database, "_case_assignments_has_resolved_case_id", False), mock.patch.object(
+            database, "_is_sqlite", sqlite
+        ):
+            return database._relocation_cases_join_on("a", style)
+
+    def test_typed_key_matches_cast_predicates(self) -> None:
+        self.assertTrue(database._case_assignments_has_resolved_case_id)
+        typed = database._relocation_cases_join_on("a", "standard")
+        self.assertEqual(typed, "rc.id = a.resolved_case_id")
+        expected = self._joined(typed)
+        self.assertEqual(
+            [rc for _, rc in expected].count(None), 1, "only the assignment with an unknown case is unmatched"
+        )
+        for style in ("standard", "canonical_coalesce"):
+            for sqlite in (True, False):
+                with self.subTest(style=style, dialect="sqlite" if sqlite else "postgresql"):
+                    self.assertEqual(self._joined(self._legacy(style, sqlite=sqlite)), expected)
+
+    def test_postgres_predicates_are_plain_equality(self) -> None:
+        with mock.patch.object(database, "_is_sqlite", False):
+            for style in ("standard", "canonical_coalesce"):
+                predicate = database._relocation_cases_join_on("a", style)
+                self.assertNotIn("CAST", predicate)
+                self.assertNotIn("COALESCE", predicate)
+            self.assertIn("CAST", database._eq_text("m.id", ":mid"))
+        self.assertEqual(database._eq_text("m.id", ":mid"), "m.id = :mid")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -38,3 +38,79 @@ def test_resolve_mention_uuid():
 
 def test_resolve_mention_empty():
     assert _resolve_mention_to_user_id("") is None
+
+
+class _FakeQuery:
+    def __init__(self, rows, log):
+        self._rows = rows
+        self._log = log
+
+    def select(self, *_a):
+        return self
+
+    def in_(self, col, values):
+        self._log.append(("in_", col, tuple(values)))
+        self._rows = [r for r in self._rows if r.get(col) in values]
+        return self
+
+    def execute(self):
+        return type("R", (), {"data": self._rows})()
+
+
+class _FakeSupabase:
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls = []
+
+    def table(self, name):
+        self.calls.append(name)
+        return _FakeQuery(list(self.tables.get(name, [])), self.calls)
+
+
+class _FakeDb:
+    def __init__(self):
+        self.calls = []
+
+    def get_profile_records_by_ids(self, ids):
+        self.calls.append(("profiles", tuple(ids)))
+        return {"u1": {"id": "u1", "full_name": "Ada Admin", "email": "ada@example.com"}}
+
+    def get_users_by_ids(self, ids):
+        self.calls.append(("users", tuple(ids)))
+        return {"u2": {"id": "u2", "email": "bob@example.com"}}
+
+
+def test_enrich_comments_batches_mentions_and_authors(monkeypatch):
+    from services import collaboration_service, user_display_names
+
+    user_display_names.invalidate_user_display_names()
+    fake_db = _FakeDb()
+    monkeypatch.setattr(
+        collaboration_service,
+        "resolve_user_display_names",
+        lambda ids: user_display_names.resolve_user_display_names(ids, db=fake_db),
+    )
+    comments = [
+        {"id": f"c{i}", "author_user_id": ("u1", "u2", "u3")[i % 3]} for i in range(40)
+    ]
+    sb = _FakeSupabase({
+        "collaboration_comment_mentions": [
+            {"comment_id": "c0", "mentioned_user_id": "u2"},
+            {"comment_id": "c0", "mentioned_user_id": "u3"},
+            {"comment_id": "c5", "mentioned_user_id": "u1"},
+        ]
+    })
+    collaboration_service._enrich_comments(comments, "u1", sb)
+
+    assert sb.calls.count("collaboration_comment_mentions") == 1
+    assert fake_db.calls == [("profiles", ("u1", "u2", "u3")), ("users", ("u2", "u3"))]
+    assert comments[0]["mentions"] == ["u2", "u3"]
+    assert comments[1]["mentions"] == []
+    assert comments[0]["author_display_name"] == "Ada Admin" and comments[0]["can_edit"]
+    assert comments[1]["author_display_name"] == "bob@example.com"
+    assert comments[2]["author_display_name"] == "u3"[:8] + "…"
+
+    # Second render is served from the TTL cache.
+    collaboration_service._enrich_comments([{"id": "c9", "author_user_id": "u1"}], "u1", sb)
+    assert len(fake_db.calls) == 2
+    user_display_names.invalidate_user_display_names()
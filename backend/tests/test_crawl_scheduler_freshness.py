@@ -93,6 +93,228 @@ class TestChangeDetectionLogic(unittest.TestCase):
         h2 = _normalized_content_hash("Goodbye World")
         self.assertNotEqual(h1, h2)
 
+    def test_similarity_identical_and_disjoint(self):
+        from backend.services.change_detection_service import _estimate_similarity, _minhash_signature
 
+        text = "Residence permits are issued by the immigration office after an appointment is booked online."
+        self.assertEqual(_estimate_similarity(_minhash_signature(text), _minhash_signature(text.upper())), 1.0)
+        other = "Public transport tickets can be bought in the app for zones one through four daily."
+        self.assertLess(_estimate_similarity(_minhash_signature(text), _minhash_signature(other)), 0.2)
+        self.assertIsNone(_estimate_similarity(_minhash_signature(""), _minhash_signature(text)))
 
+    def test_classify_minor_vs_significant_by_text(self):
+        from backend.services.change_detection_service import classify_document_changes
 
+        base = " ".join(f"sentence {i} about registering with the local tax office." for i in range(40))
+        small_edit = base.replace("sentence 39", "sentence thirty-nine")
+        rewrite = " ".join(f"paragraph {i} on school enrolment deadlines for families." for i in range(40))
+        docs = [
+            {"id": "d1", "source_name": "s", "source_url": "https://a", "content_hash": "h1b", "page_title": "A"},
+            {"id": "d2", "source_name": "s", "source_url": "https://b", "content_hash": "h2b", "page_title": "B"},
+            {"id": "d3", "source_name": "s", "source_url": "https://c", "content_hash": "h3", "page_title": "C"},
+            {"id": "d4", "source_name": "s", "source_url": "https://new", "content_hash": "h4", "page_title": "D"},
+        ]
+        previous = {
+            ("s", "https://a"): {"id": "p1", "content_hash": "h1a", "page_title": "A"},
+            ("s", "https://b"): {"id": "p2", "content_hash": "h2a", "page_title": "B"},
+            ("s", "https://c"): {"id": "p3", "content_hash": "h3", "page_title": "C"},
+        }
+        texts = {"d1": small_edit, "p1": base, "d2": rewrite, "p2": base}
+        events = classify_document_changes(docs, previous, texts, crawl_run_id="r2", job_run_id="j1")
+        by_doc = {e["source_document_id"]: e for e in events}
+        self.assertEqual(by_doc["d1"]["change_type"], "minor_change")
+        self.assertEqual(by_doc["d2"]["change_type"], "significant_change")
+        self.assertEqual(by_doc["d3"]["change_type"], "unchanged")
+        self.assertEqual(by_doc["d4"]["change_type"], "new")
+        self.assertEqual(by_doc["d1"]["previous_document_id"], "p1")
+        self.assertGreater(by_doc["d1"]["diff_summary_json"]["similarity"], 0.75)
+
+    def test_title_change_adds_to_score_but_not_significant_alone(self):
+        from backend.services.change_detection_service import classify_document_changes
+
+        text = " ".join(f"line {i} of the housing guide." for i in range(30))
+        rewrite = " ".join(f"entry {i} on the school guide." for i in range(30))
+        docs = [
+            {"id": "d1", "source_name": "s", "source_url": "https://a", "content_hash": "n", "page_title": "New"},
+            {"id": "d2", "source_name": "s", "source_url": "https://b", "content_hash": "n2", "page_title": " guide "},
+            {"id": "d3", "source_name": "s", "source_url": "https://c", "content_hash": "n3", "page_title": "New"},
+        ]
+        previous = {
+            ("s", "https://a"): {"id": "p1", "content_hash": "o", "page_title": "Old"},
+            ("s", "https://b"): {"id": "p2", "content_hash": "o2", "page_title": "Guide"},
+            ("s", "https://c"): {"id": "p3", "content_hash": "o3", "page_title": "Old"},
+        }
+        texts = {"d1": text, "p1": text, "d2": text, "p2": text, "d3": rewrite, "p3": text}
+        by_doc = {e["source_document_id"]: e for e in classify_document_changes(docs, previous, texts)}
+        self.assertEqual(by_doc["d1"]["change_type"], "minor_change")
+        self.assertTrue(by_doc["d1"]["diff_summary_json"]["title_changed"])
+        self.assertAlmostEqual(by_doc["d1"]["change_score"], 0.1)
+        # Whitespace/casing-only title edits are not title changes.
+        self.assertFalse(by_doc["d2"]["diff_summary_json"]["title_changed"])
+        self.assertEqual(by_doc["d2"]["change_score"], 0.0)
+        self.assertEqual(by_doc["d3"]["change_type"], "significant_change")
+
+    def test_reads_are_chunked_and_paged(self):
+        from backend.services import change_detection_service as cds
+
+        ids = [f"d{i}" for i in range(150)]
+        rows = [{"document_id": f"d{i}", "chunk_index": 0, "chunk_text": f"t{i}"} for i in range(150)]
+        calls = []
+
+        class Query:
+            def __init__(self):
+                self.chunk = []
+
+            def select(self, *a, **k):
+                return self
+
+            def in_(self, col, values):
+                self.chunk = list(values)
+                return self
+
+            def order(self, *a, **k):
+                return self
+
+            def range(self, start, end):
+                calls.append((len(self.chunk), start, end))
+                data = [r for r in rows if r["document_id"] in self.chunk][start:end + 1]
+                return MagicMock(execute=MagicMock(return_value=MagicMock(data=data)))
+
+        supabase = MagicMock()
+        supabase.table.side_effect = lambda name: Query()
+        with patch.object(cds, "_get_supabase", return_value=supabase), patch.object(cds, "_READ_PAGE_SIZE", 40):
+            texts = cds._load_document_texts(ids)
+        self.assertEqual(len(texts), 150)
+        self.assertEqual(texts["d149"], "t149")
+        self.assertTrue(all(size <= cds._IN_CHUNK_SIZE for size, _, _ in calls))
+        self.assertTrue(all(end - start + 1 == 40 for _, start, end in calls))
+        self.assertGreater(len(calls), 2)
+
+    def test_run_uses_bulk_lookups_and_single_insert(self):
+        from backend.services import change_detection_service as cds
+
+        docs = [
+            {"id": f"d{i}", "source_name": "s", "source_url": f"https://x/{i}", "content_hash": f"h{i}"}
+            for i in range(5)
+        ]
+        previous = {("s", "https://x/0"): {"id": "p0", "content_hash": "h0"}}
+        supabase = MagicMock()
+        tables = {}
+
+        def table(name):
+            return tables.setdefault(name, MagicMock())
+
+        supabase.table.side_effect = table
+        table("crawled_source_documents").select.return_value.eq.return_value.order.return_value.range.return_value.execute.return_value.data = docs
+        table("crawl_runs").select.return_value.eq.return_value.limit.return_value.execute.return_value.data = [{"id": "r1"}]
+        with patch.object(cds, "_get_supabase", return_value=supabase), \
+                patch.object(cds, "_find_previous_documents", return_value=previous) as find_prev, \
+                patch.object(cds, "_load_document_texts", return_value={}) as load_texts:
+            result = cds.run_change_detection_for_crawl_run("r1", job_run_id="j1")
+
+        find_prev.assert_called_once()
+        load_texts.assert_called_once_with([])
+        table("document_change_events").insert.assert_called_once()
+        inserted = table("document_change_events").insert.call_args[0][0]
+        self.assertEqual(len(inserted), 5)
+        self.assertEqual(result["documents_processed"], 5)
+        self.assertEqual(result["changes_count"], 4)
+
+
+class TestIncrementalFreshnessSnapshot(unittest.TestCase):
+    def _supabase(self, states):
+        supabase = MagicMock()
+        tables = {}
+
+        def table(name):
+            return tables.setdefault(name, MagicMock())
+
+        supabase.table.side_effect = table
+        if states is None:
+            table("source_freshness_state").select.return_value.execute.side_effect = RuntimeError("missing")
+        else:
+            table("source_freshness_state").select.return_value.execute.return_value.data = states
+        table("source_change_daily").select.return_value.gte.return_value.execute.return_value.data = [
+            {"changed_count": 3},
+            {"changed_count": 2},
+        ]
+        buckets = {"resource": [{"item_count": 3}, {"item_count": 1}], "event": [{"item_count": 9}]}
+        self.bucket_cutoffs = {}
+
+        def bucket_query(column, kind):
+            query = MagicMock()
+
+            def lt(column, day):
+                self.bucket_cutoffs[kind] = day
+                return query.lt.return_value
+
+            query.lt.side_effect = lt
+            page = query.lt.return_value.order.return_value.order.return_value.range.return_value
+            page.execute.return_value.data = buckets[kind]
+            return query
+
+        table("live_content_expiry_daily").select.return_value.eq.side_effect = bucket_query
+        return supabase, tables
+
+    def test_snapshot_sums_per_source_state(self):
+        from backend.services import freshness_service as fs
+
+        now = datetime.now(timezone.utc)
+        states = [
+            {"source_name": "a", "last_success_at": (now - timedelta(hours=2)).isoformat(), "needs_review_count": 2},
+            {"source_name": "b", "last_success_at": (now - timedelta(days=8)).isoformat(), "needs_review_count": 1},
+            {"source_name": "c", "last_success_at": (now - timedelta(days=20)).isoformat()},
+            {"source_name": "d", "last_success_at": now.isoformat(), "consecutive_failures": 3},
+            {"source_name": "unknown", "needs_review_count": 4},
+        ]
+        supabase, tables = self._supabase(states)
+        with patch.object(fs, "_get_supabase", return_value=supabase):
+            snapshot = fs.refresh_freshness_metrics()
+            by_source = {s["source_name"]: s["freshness_state"] for s in fs.get_source_freshness_signals()}
+
+        self.assertEqual(
+            (snapshot["fresh_sources_count"], snapshot["stale_sources_count"], snapshot["overdue_sources_count"]),
+            (1, 1, 1),
+        )
+        self.assertEqual(by_source, {"a": "fresh", "b": "stale", "c": "overdue", "d": "error"})
+        self.assertEqual(snapshot["needs_review_candidates_count"], 7)
+        self.assertEqual(snapshot["documents_changed_recently_count"], 5)
+        self.assertEqual(snapshot["live_resources_stale_count"], 4)
+        self.assertEqual(snapshot["live_events_expired_count"], 9)
+        self.assertEqual(
+            self.bucket_cutoffs,
+            {"resource": (now - timedelta(days=fs._LIVE_RESOURCE_STALE_DAYS)).date().isoformat(), "event": now.date().isoformat()},
+        )
+        self.assertEqual(snapshot["metrics_json"]["source_state"], "incremental")
+        self.assertEqual(snapshot["metrics_json"]["live_expiry"], "daily_buckets")
+        # No crawl-history, change-event, candidate or live content scans.
+        for name in ("crawl_runs", "crawled_source_documents", "document_change_events",
+                     "staged_resource_candidates", "staged_event_candidates",
+                     "country_resources", "rkg_country_events"):
+            self.assertNotIn(name, tables)
+        tables["freshness_snapshots"].insert.assert_called_once()
+
+    def test_falls_back_to_scan_without_state_table(self):
+        from backend.services import freshness_service as fs
+
+        supabase, _ = self._supabase(None)
+        with patch.object(fs, "_get_supabase", return_value=supabase), \
+                patch.object(fs, "_scan_source_freshness_signals", return_value=[{"freshness_state": "fresh"}]) as scan, \
+                patch.object(fs, "_scan_change_and_review_counts", return_value=(6, 1)):
+            snapshot = fs.refresh_freshness_metrics()
+        scan.assert_called_once()
+        self.assertEqual(snapshot["fresh_sources_count"], 1)
+        self.assertEqual(snapshot["documents_changed_recently_count"], 6)
+        self.assertEqual(snapshot["metrics_json"]["source_state"], "scan")
+
+    def test_missing_live_buckets_are_reported_not_estimated(self):
+        from backend.services import freshness_service as fs
+
+        supabase, tables = self._supabase([])
+        tables["live_content_expiry_daily"].select.return_value.eq.side_effect = RuntimeError("missing")
+        with patch.object(fs, "_get_supabase", return_value=supabase):
+            snapshot = fs.refresh_freshness_metrics()
+        self.assertEqual((snapshot["live_resources_stale_count"], snapshot["live_events_expired_count"]), (0, 0))
+        self.assertEqual(snapshot["metrics_json"]["live_expiry"], "unavailable")
+        self.assertNotIn("country_resources", tables)
+        self.assertNotIn("rkg_country_events", tables)
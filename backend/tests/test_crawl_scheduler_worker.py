@@ -0,0 +1,205 @@
+"""Crawl scheduler worker against a local SQLite backend: leases, bounded pool, reclaim, max runtime, batched freshness."""
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, text
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.database import _sqlite_ensure_crawl_scheduler_tables  # noqa: E402
+from backend.services.crawl_scheduler_worker import (  # noqa: E402
+    CrawlLeaseStore,
+    CrawlSchedulerWorker,
+    _ts,
+)
+
+
+class CrawlSchedulerWorkerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        self.engine = create_engine(f"sqlite:///{os.path.join(tmp, 'crawl.db')}")
+        self.addCleanup(self.engine.dispose)
+        with self.engine.begin() as conn:
+            _sqlite_ensure_crawl_scheduler_tables(conn)
+        self.store = CrawlLeaseStore(self.engine)
+        self.detected = []
+        self.refreshes = 0
+
+    def _schedule(self, name: str, *, due: bool = True, max_runtime_seconds=None) -> str:
+        sid = str(uuid.uuid4())
+        next_run = datetime.now(timezone.utc) + timedelta(hours=-1 if due else 1)
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO crawl_schedules (id, name, is_active, schedule_type, schedule_expression, "
+                    "source_scope_type, source_scope_ref, max_runtime_seconds, next_run_at) "
+                    "VALUES (:id, :name, 1, 'interval', '24', 'source', :name, :max_rt, :next)"
+                ),
+                {"id": sid, "name": name, "max_rt": max_runtime_seconds, "next": _ts(next_run)},
+            )
+        return sid
+
+    def _worker(self, crawl, **kwargs) -> CrawlSchedulerWorker:
+        def refresh() -> None:
+            self.refreshes += 1
+
+        return CrawlSchedulerWorker(
+            self.store,
+            crawl=crawl,
+            detect_changes=lambda run_id, job_id: self.detected.append((run_id, job_id)),
+            refresh_freshness=refresh,
+            **kwargs,
+        )
+
+    def _jobs(self):
+        with self.engine.connect() as conn:
+            return [dict(r) for r in conn.execute(text("SELECT * FROM crawl_job_runs")).mappings().all()]
+
+    def test_bounded_pool_and_one_freshness_refresh_per_batch(self) -> None:
+        ids = [self._schedule(f"src-{i}") for i in range(5)]
+        self._schedule("not-due", due=False)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def crawl(schedule):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.05)
+            with lock:
+                state["running"] -= 1
+            return {"run_id": f"run-{schedule['name']}", "documents_fetched": 3, "errors": [], "warnings": []}
+
+        results = self._worker(crawl, concurrency=2, lease_seconds=5).run_batch()
+        self.assertEqual(sorted(r["schedule_id"] for r in results), sorted(ids))
+        self.assertTrue(all(r["status"] == "succeeded" for r in results))
+        self.assertEqual(state["peak"], 2)
+        self.assertEqual(len(self.detected), 5)
+        self.assertEqual(self.refreshes, 1)
+        jobs = self._jobs()
+        self.assertEqual({j["status"] for j in jobs}, {"succeeded"})
+        self.assertTrue(all(j["lock_until"] is None and j["documents_fetched_count"] == 3 for j in jobs))
+        # Schedules moved forward, so nothing is due any more.
+        self.assertEqual(self.store.due_schedules(), [])
+
+    def test_lease_renewed_during_long_crawl(self) -> None:
+        self._schedule("slow")
+        seen = {}
+
+        def crawl(schedule):
+            time.sleep(1.0)
+            # Older than the 0.4s lease, but the worker keeps renewing it.
+            seen["reclaimed"] = self.store.reclaim_expired()
+            return {"run_id": "run-slow", "errors": [], "warnings": []}
+
+        results = self._worker(crawl, concurrency=1, lease_seconds=0.4).run_batch()
+        self.assertEqual(seen["reclaimed"], 0)
+        self.assertEqual(results[0]["status"], "succeeded")
+
+    def test_expired_lease_reclaimed_and_claims_are_exclusive(self) -> None:
+        sid = self._schedule("crashed")
+        schedule = self.store.due_schedules()[0]
+        past = datetime.now(timezone.utc) - timedelta(minutes=10)
+        job = self.store.claim(schedule, "dead-worker", 60, now=past)
+        self.assertIsNotNone(job)
+        # Claimed schedules are neither due nor claimable until the lease is reclaimed.
+        self.assertEqual(self.store.due_schedules(), [])
+        self.assertIsNone(self.store.claim(schedule, "other", 60))
+
+        results = self._worker(lambda s: {"run_id": "run-2", "errors": [], "warnings": []}).run_batch()
+        self.assertEqual([r["status"] for r in results], ["succeeded"])
+        by_owner = {j["lock_owner"]: j for j in self._jobs()}
+        self.assertEqual(by_owner["dead-worker"]["status"], "failed")
+        self.assertEqual(by_owner["dead-worker"]["error_summary"], "lease expired")
+        self.assertFalse(self.store.complete(job["id"], "dead-worker", "succeeded"))
+        self.assertIsNone(self.store.renew(job["id"], "dead-worker", 60))
+        self.assertEqual(results[0]["schedule_id"], sid)
+
+    def test_manual_trigger_runs_are_not_reclaimed(self) -> None:
+        # admin /trigger: queued row without an owner, then a fixed lock that is never renewed.
+        past = datetime.now(timezone.utc) - timedelta(minutes=45)
+        with self.engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO crawl_job_runs (id, job_type, trigger_type, status, started_at, lock_until, created_at) "
+                    "VALUES ('manual-1', 'crawl_country_city_scope', 'manual', 'running', :start, :until, :start)"
+                ),
+                {"start": _ts(past), "until": _ts(past + timedelta(minutes=30))},
+            )
+        self.assertEqual(self.store.reclaim_expired(), 0)
+        self.assertEqual(self._jobs()[0]["status"], "running")
+
+    def test_max_runtime_fails_hung_crawl_without_waiting(self) -> None:
+        sid = self._schedule("hung", max_runtime_seconds=0.3)
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def crawl(schedule):
+            release.wait(10)
+            return {"run_id": "run-late", "errors": [], "warnings": []}
+
+        started = time.monotonic()
+        results = self._worker(crawl, concurrency=1, lease_seconds=5).run_batch()
+        self.assertLess(time.monotonic() - started, 3)
+        self.assertEqual(results, [
+            {"schedule_id": sid, "job_run_id": results[0]["job_run_id"], "status": "failed", "error": "max runtime exceeded"}
+        ])
+        job = self._jobs()[0]
+        self.assertEqual((job["status"], job["error_summary"], job["lock_until"]), ("failed", "max runtime exceeded", None))
+        # The schedule moved on, and the abandoned crawl can no longer complete the run.
+        self.assertEqual(self.store.due_schedules(), [])
+        self.assertIsNone(self.store.renew(job["id"], job["lock_owner"], 5))
+        self.assertEqual(self.detected, [])
+
+    def test_abandoned_crawl_holds_capacity_across_batches(self) -> None:
+        self._schedule("first", max_runtime_seconds=0.3)
+        self._schedule("second", max_runtime_seconds=0.3)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = []
+
+        def crawl(schedule):
+            calls.append(schedule["id"])
+            if len(calls) == 1:
+                release.wait(10)
+            return {"run_id": f"run-{len(calls)}", "errors": [], "warnings": []}
+
+        worker = self._worker(crawl, concurrency=1, lease_seconds=5)
+        self.assertEqual([r["status"] for r in worker.run_batch()], ["failed"])
+        # The hung thread still occupies the only slot, so the next batch runs nothing.
+        self.assertEqual(worker.run_batch(), [])
+        self.assertEqual(len(calls), 1)
+
+        release.set()
+        worker._abandoned[0].result(timeout=5)
+        self.assertEqual([r["status"] for r in worker.run_batch()], ["succeeded"])
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(worker._abandoned, [])
+
+    def test_crawl_failure_marks_run_failed_and_skips_refresh(self) -> None:
+        self._schedule("broken")
+
+        def crawl(schedule):
+            raise RuntimeError("boom")
+
+        results = self._worker(crawl).run_batch()
+        self.assertEqual(results[0]["status"], "failed")
+        self.assertEqual(self._jobs()[0]["status"], "failed")
+        self.assertEqual(self.refreshes, 0)
+        self.assertEqual(self.detected, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
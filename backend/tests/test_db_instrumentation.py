@@ -0,0 +1,95 @@
+"""Per-request query counting, N+1 detection, slow-query sampling and Server-Timing."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+
+from sqlalchemy import create_engine, text
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend import db_instrumentation as inst  # noqa: E402
+
+
+class DbInstrumentationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        inst.reset_query_stats()
+        self.engine = create_engine("sqlite://")
+        inst.install_query_instrumentation(self.engine)
+        inst.install_query_instrumentation(self.engine)  # idempotent
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)"))
+
+    def tearDown(self) -> None:
+        inst.reset_query_stats()
+
+    def test_normalize_sql_collapses_literals_params_and_in_lists(self) -> None:
+        a = inst.normalize_sql("SELECT *  FROM t\n WHERE id = :id AND name = 'bob' AND x IN (:p0, :p1, :p2)")
+        b = inst.normalize_sql("select * from t where id = 7 and name = 'al' and x in (?, ?)")
+        self.assertEqual(a, "SELECT * FROM t WHERE id = ? AND name = ? AND x IN (?...)")
+        self.assertEqual(a.lower(), b.lower())
+
+    def test_counts_per_request_and_flags_n_plus_one(self) -> None:
+        stats, token = inst.begin_request("req-1", "GET /things")
+        with self.engine.connect() as conn:
+            for i in range(inst.N_PLUS_ONE_THRESHOLD + 2):
+                conn.execute(text("SELECT name FROM t WHERE id = :id"), {"id": i})
+            conn.execute(text("SELECT COUNT(*) FROM t"))
+        inst.end_request(stats, token)
+
+        self.assertEqual(stats.count, inst.N_PLUS_ONE_THRESHOLD + 3)
+        self.assertEqual(stats.n_plus_one, ["SELECT name FROM t WHERE id = ?"])
+        self.assertIn(f'desc="{stats.count} queries"', stats.server_timing())
+        self.assertIsNone(inst.current_request_stats())
+
+        snap = inst.get_query_stats_snapshot()
+        route = snap["routes"][0]
+        self.assertEqual(route["route"], "GET /things")
+        self.assertEqual(route["requests"], 1)
+        self.assertEqual(route["n_plus_one_requests"], 1)
+        self.assertEqual(sum(route["query_count_histogram"].values()), 1)
+        self.assertEqual(snap["n_plus_one"][0]["request_id"], "req-1")
+
+    def test_queries_outside_requests_are_not_counted(self) -> None:
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        self.assertEqual(inst.get_query_stats_snapshot()["routes"], [])
+
+    def test_slow_statements_are_sampled(self) -> None:
+        orig = inst.SLOW_QUERY_MS
+        inst.SLOW_QUERY_MS = 0.0
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT name FROM t WHERE name = 'secret'"))
+        finally:
+            inst.SLOW_QUERY_MS = orig
+        slow = inst.get_query_stats_snapshot()["slow_queries"]
+        self.assertTrue(slow)
+        self.assertNotIn("secret", slow[0]["shape"])
+
+    def test_failed_statement_does_not_leak_start_time(self) -> None:
+        with self.engine.connect() as conn:
+            with self.assertRaises(Exception):
+                conn.execute(text("SELECT * FROM missing_table"))
+            self.assertEqual(conn.info.get("_query_start"), [])
+            conn.execute(text("SELECT 1"))
+            self.assertEqual(conn.info.get("_query_start"), [])
+
+
+class ServerTimingHeaderTests(unittest.TestCase):
+    def test_health_response_has_server_timing(self) -> None:
+        from fastapi.testclient import TestClient
+
+        from backend.main import app
+
+        res = TestClient(app).get("/health")
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("db;dur=", res.headers.get("server-timing", ""))
+        self.assertIn("app;dur=", res.headers.get("server-timing", ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
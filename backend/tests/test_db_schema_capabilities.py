@@ -0,0 +1,54 @@
+"""Schema capability registry: one introspection per engine, answered from memory until refresh."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+
+from sqlalchemy import create_engine, text
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.db_instrumentation import capture_queries, install_query_instrumentation  # noqa: E402
+from backend.db_schema_capabilities import schema_capabilities  # noqa: E402
+
+
+class SchemaCapabilitiesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite://")
+        install_query_instrumentation(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE companies (id TEXT PRIMARY KEY, name TEXT)"))
+
+    def test_lookups_share_one_introspection_until_refresh(self) -> None:
+        registry = schema_capabilities(self.engine)
+        self.assertIs(registry, schema_capabilities(self.engine))
+        with capture_queries("lookups") as stats:
+            self.assertTrue(registry.has_table("companies"))
+            self.assertTrue(registry.has_column("companies", "name"))
+            self.assertFalse(registry.has_column("companies", "status"))
+            self.assertFalse(registry.has_table("profiles"))
+            self.assertEqual(registry.columns("companies"), frozenset({"id", "name"}))
+        self.assertEqual(stats.count, 1)
+
+        with self.engine.begin() as conn:
+            conn.execute(text("ALTER TABLE companies ADD COLUMN status TEXT"))
+        self.assertFalse(registry.has_column("companies", "status"))
+        registry.refresh()
+        self.assertTrue(registry.has_column("companies", "status"))
+
+    def test_database_conditional_sql_does_not_probe(self) -> None:
+        from backend.database import db
+
+        db.get_admin_people_index(limit=1)
+        with capture_queries("people") as stats:
+            db.get_admin_people_index(limit=1)
+            self.assertTrue(db.policy_assistant_tables_available())
+        # page rows + first-page summary; no profiles.status / table-existence probe
+        self.assertEqual(stats.count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Materialized employee entitlement views: staleness by published version, resolved policy, context and HR edits."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.db_instrumentation import capture_queries  # noqa: E402
+from backend.services import employee_entitlement_materialization as mat  # noqa: E402
+
+
+class EntitlementMaterializationTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        from backend.database import db
+
+        cls.db = db
+
+    def setUp(self) -> None:
+        self.company_id = f"co-mat-{uuid.uuid4().hex[:8]}"
+        self.policy_id = str(uuid.uuid4())
+        self.v1 = str(uuid.uuid4())
+        self.db.create_company_policy(
+            self.policy_id, self.company_id, "Mobility", None, None, "p.pdf", "application/pdf", None
+        )
+        self.db.create_policy_version(self.v1, self.policy_id, version_number=1, status="published")
+        self.assignment_id = str(uuid.uuid4())
+        self.assignment = {"id": self.assignment_id, "assignment_type": "LTA", "hr_user_id": "hr-1"}
+        self.case = {"id": str(uuid.uuid4()), "company_id": self.company_id}
+        self.builds = 0
+        self.addCleanup(self.db.delete_employee_entitlement_read_models, policy_id=self.policy_id)
+
+    def _raw(self, version_id: str, policy_id=None) -> dict:
+        return {
+            "policy_status": "published_comparison_ready",
+            "assignment_id": self.assignment_id,
+            "company_id": self.company_id,
+            "policy_id": policy_id or self.policy_id,
+            "version_id": version_id,
+            "entitlements": [{"service_key": "temporary_housing", "cap": Decimal("2500.50")}],
+        }
+
+    def _get(self, version_id: str, employee_profile=None, policy_id=None) -> dict:
+        def fake_build(*args, **kwargs):
+            self.builds += 1
+            return self._raw(version_id, policy_id)
+
+        with mock.patch.object(mat, "build_employee_entitlement_read_model", side_effect=fake_build):
+            return mat.get_or_build_entitlements(
+                self.db, self.assignment_id, self.assignment, self.case, None, employee_profile
+            )
+
+    def test_second_read_skips_resolution(self) -> None:
+        first = self._get(self.v1)
+        with capture_queries("read") as stats:
+            second = self._get(self.v1)
+        self.assertEqual(self.builds, 1)
+        # HR owner's company lookup (profile + hr_users) and the read model row.
+        self.assertEqual(stats.count, 3)
+        self.assertEqual(second["entitlements"][0]["cap"], 2500.5)
+        self.assertEqual(second["version_id"], first["version_id"])
+
+    def test_publishing_new_version_makes_row_stale(self) -> None:
+        self._get(self.v1)
+        v2 = str(uuid.uuid4())
+        self.db.create_policy_version(v2, self.policy_id, version_number=2, status="published")
+        self.db.archive_other_published_versions(self.policy_id, v2)
+        self.assertEqual(self._get(v2)["version_id"], v2)
+        self.assertEqual(self.builds, 2)
+        self.assertEqual(mat.refresh_materialized_views_on_publish(self.db, company_id=None, policy_id=self.policy_id), 0)
+        self.assertIsNone(self.db.get_employee_entitlement_read_model(self.assignment_id, mat.VIEW_ENTITLEMENTS))
+
+    def test_newer_policy_for_the_company_makes_row_stale(self) -> None:
+        self._get(self.v1)
+        newer, newer_v1 = str(uuid.uuid4()), str(uuid.uuid4())
+        self.db.create_company_policy(newer, self.company_id, "Mobility 2", None, None, "q.pdf", "application/pdf", None)
+        self.db.create_policy_version(newer_v1, newer, version_number=1, status="published")
+        self.addCleanup(self.db.delete_employee_entitlement_read_models, policy_id=newer)
+        # The old policy's version is still published; only the resolved policy changed.
+        self.assertEqual(self._get(newer_v1, policy_id=newer)["policy_id"], newer)
+        self._get(newer_v1, policy_id=newer)
+        self.assertEqual(self.builds, 2)
+
+    def test_hr_company_change_rebuilds(self) -> None:
+        self._get(self.v1)
+        with mock.patch.object(self.db, "get_hr_company_id", return_value="co-other"):
+            self._get(self.v1)
+        self.assertEqual(self.builds, 2)
+
+    def test_context_change_and_hr_edit_rebuild(self) -> None:
+        self._get(self.v1)
+        self._get(self.v1, employee_profile={"maritalStatus": "married", "spouse": {"fullName": "A"}})
+        self.assertEqual(self.builds, 2)
+        mat.invalidate_materialized_views_for_version(self.db, self.v1)
+        self.assertIsNone(self.db.get_employee_entitlement_read_model(self.assignment_id, mat.VIEW_ENTITLEMENTS))
+
+    def test_unpublished_states_are_not_stored(self) -> None:
+        draft = {**self._raw(self.v1), "policy_status": "draft_only"}
+        self.assertFalse(mat.store_materialized_view(self.db, self.assignment_id, mat.VIEW_ENTITLEMENTS, draft, "fp"))
+        self.assertFalse(
+            mat.store_materialized_view(self.db, self.assignment_id, mat.VIEW_EMPLOYEE_POLICY, {"has_policy": False}, "fp")
+        )
+        self.assertIsNone(self.db.get_employee_entitlement_read_model(self.assignment_id, mat.VIEW_ENTITLEMENTS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,16 @@
 """Tests for identity / assignment historical data reconciliation."""
 from __future__ import annotations
 
+import io
+import json
 import os
 import sys
+import tempfile
 import unittest
 import uuid
 from datetime import datetime
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 
 _REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 if _REPO_ROOT not in sys.path:
@@ -19,7 +22,11 @@ from backend.services.identity_data_reconciliation import (
     _group_duplicate_contacts_by_email,
     _pick_canonical_contact,
     apply_safe_fixes,
+    apply_safe_fixes_batched,
     audit_identity_data,
+    iter_auto_fixes_from_jsonl,
+    iter_identity_audit_entries,
+    write_identity_audit_jsonl,
 )
 
 
@@ -121,3 +128,123 @@ class IdentityDataReconciliationDbTests(unittest.TestCase):
         report = audit_identity_data(db.engine)
         self.assertIsInstance(report.counts, dict)
         self.assertGreaterEqual(report.counts.get("assignment_missing_employee_contact_id", 0), 0)
+
+    def _seed_duplicate_groups(self, n_groups: int) -> None:
+        now = datetime.utcnow().isoformat()
+        with self.db.engine.begin() as conn:
+            conn.execute(text("DROP INDEX IF EXISTS idx_employee_contacts_company_email_unique"))
+            for g in range(n_groups):
+                cid = f"co-stream-{g % 3}"
+                email = f"person{g}@example.com"
+                for k in range(2):
+                    conn.execute(
+                        text(
+                            "INSERT INTO employee_contacts (id, company_id, invite_key, email_normalized, "
+                            "first_name, last_name, linked_auth_user_id, created_at, updated_at) "
+                            "VALUES (:id, :c, :ik, :en, NULL, NULL, NULL, :ca, :ua)"
+                        ),
+                        {"id": str(uuid.uuid4()), "c": cid, "ik": f"{email}-{k}", "en": email.upper() if k else email, "ca": now, "ua": now},
+                    )
+
+    def test_streaming_audit_matches_in_memory_counts(self):
+        self._seed_duplicate_groups(7)
+        report = audit_identity_data(self.db.engine)
+        entries = list(iter_identity_audit_entries(self.db.engine, page_size=2))
+        self.assertEqual(entries[-1]["kind"], "counts")
+        self.assertEqual(entries[-1]["counts"], report.counts)
+        merges = [e for e in entries if e.get("action") == "merge_duplicate_employee_contacts"]
+        self.assertEqual(len(merges), 7)
+        self.assertFalse([e for e in entries if e["kind"] == "error"])
+
+    def test_streaming_jsonl_and_resumable_batched_apply(self):
+        self._seed_duplicate_groups(5)
+        buf = io.StringIO()
+        counts = write_identity_audit_jsonl(self.db.engine, buf, page_size=2)
+        self.assertEqual(counts["duplicate_contact_groups"], 5)
+        lines = [json.loads(line) for line in buf.getvalue().splitlines()]
+        self.assertEqual(lines[-1]["kind"], "counts")
+
+        buf.seek(0)
+        dry = apply_safe_fixes_batched(self.db.engine, iter_auto_fixes_from_jsonl(buf), dry_run=True, batch_size=2)
+        self.assertEqual(dry["merge_duplicate_employee_contacts"], 5)
+        with self.db.engine.connect() as conn:
+            self.assertEqual(int(conn.execute(text("SELECT COUNT(*) FROM employee_contacts")).scalar()), 10)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            ckpt = os.path.join(tmp, "ckpt.json")
+            fixes = [e for e in lines if e["kind"] == "auto_fix"]
+
+            class Interrupt(Exception):
+                pass
+
+            def stop_after_first(done, applied):
+                raise Interrupt()
+
+            with self.assertRaises(Interrupt):
+                apply_safe_fixes_batched(
+                    self.db.engine, iter(fixes), dry_run=False, batch_size=2,
+                    checkpoint_path=ckpt, progress=stop_after_first,
+                )
+            with open(ckpt, encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["fixes_done"], 2)
+
+            resumed = apply_safe_fixes_batched(
+                self.db.engine, iter(fixes), dry_run=False, batch_size=2, checkpoint_path=ckpt,
+            )
+            self.assertEqual(resumed["merge_duplicate_employee_contacts"], 3)
+        with self.db.engine.connect() as conn:
+            self.assertEqual(int(conn.execute(text("SELECT COUNT(*) FROM employee_contacts")).scalar()), 5)
+
+    def test_linkable_pages_on_contact_user_pair_and_counts_real_updates(self):
+        now = datetime.utcnow().isoformat()
+        contact = "ec-multi"
+        with self.db.engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO employee_contacts (id, company_id, invite_key, email_normalized, "
+                    "first_name, last_name, linked_auth_user_id, created_at, updated_at) "
+                    "VALUES (:id, 'co-multi', 'k', 'multi@example.com', NULL, NULL, NULL, :ca, :ca)"
+                ),
+                {"id": contact, "ca": now},
+            )
+            for uid, email in (("u-a", "multi@example.com"), ("u-b", "MULTI@example.com")):
+                conn.execute(
+                    text("INSERT INTO users (id, email, role, created_at) VALUES (:id, :e, 'EMPLOYEE', :ca)"),
+                    {"id": uid, "e": email, "ca": now},
+                )
+            conn.execute(
+                text(
+                    "INSERT INTO assignment_invites (id, case_id, hr_user_id, employee_identifier, token, status, created_at) "
+                    "VALUES ('inv-done', 'c', 'h', 'e', 't', 'CLAIMED', :ca)"
+                ),
+                {"ca": now},
+            )
+
+        entries = list(iter_identity_audit_entries(self.db.engine, page_size=1))
+        links = [e for e in entries if e.get("action") == "link_employee_contact_to_auth_user"]
+        self.assertEqual(sorted(e["user_id"] for e in links), ["u-a", "u-b"])
+
+        fixes = links + [{"kind": "auto_fix", "action": "mark_legacy_invite_claimed", "invite_id": "inv-done"}]
+        applied = apply_safe_fixes_batched(self.db.engine, iter(fixes), dry_run=False, batch_size=10)
+        # The contact links to the first user only; the already-claimed invite changes nothing.
+        self.assertEqual(applied["link_employee_contact_to_auth_user"], 1)
+        self.assertEqual(applied["mark_legacy_invite_claimed"], 0)
+
+    def test_batched_fixes_are_one_statement_per_action_and_table(self):
+        self._seed_duplicate_groups(4)
+        fixes = [e for e in iter_identity_audit_entries(self.db.engine) if e.get("kind") == "auto_fix"]
+        self.assertEqual(len(fixes), 4)
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(("UPDATE", "DELETE")):
+                statements.append(statement)
+
+        event.listen(self.db.engine, "before_cursor_execute", count)
+        self.addCleanup(event.remove, self.db.engine, "before_cursor_execute", count)
+        applied = apply_safe_fixes_batched(self.db.engine, iter(fixes), dry_run=False, batch_size=10)
+        self.assertEqual(applied["merge_duplicate_employee_contacts"], 4)
+        # case_assignments, assignment_claim_invites, employee_contacts: one statement each.
+        self.assertEqual(len(statements), 3)
+        with self.db.engine.connect() as conn:
+            self.assertEqual(int(conn.execute(text("SELECT COUNT(*) FROM employee_contacts")).scalar()), 4)
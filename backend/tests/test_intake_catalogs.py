@@ -0,0 +1,103 @@
+"""Memoized intake catalogs: rules parsed once per file version, question index matches a linear walk."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.agents import compliance_engine  # noqa: E402
+from backend.agents.compliance_engine import ComplianceEngine  # noqa: E402
+from backend.agents.orchestrator import IntakeOrchestrator  # noqa: E402
+from backend.question_bank import QUESTION_BANK, get_all_questions, get_question_index  # noqa: E402
+from backend.schemas import RelocationProfile  # noqa: E402
+
+
+class ComplianceRulesCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+        self._write({"minLeadTimeDays": 45, "requiredDocs": ["Passport scans"]}, mtime=1_000_000)
+
+    def _write(self, rules, *, mtime: int) -> None:
+        with open(self.path, "w", encoding="utf-8") as handle:
+            json.dump(rules, handle)
+        os.utime(self.path, (mtime, mtime))
+
+    def test_rules_parsed_once_and_reloaded_on_change(self) -> None:
+        engine = ComplianceEngine(self.path)
+        with mock.patch.dict(os.environ, {"COMPLIANCE_RULES_RELOAD": "1"}), mock.patch.object(
+            compliance_engine.json, "load", wraps=json.load
+        ) as load:
+            first = engine.load_rules()
+            self.assertIs(ComplianceEngine(self.path).load_rules(), first)
+            self.assertEqual(load.call_count, 1)
+            self.assertEqual(first["minLeadTimeDays"], 45)
+
+            self._write({"minLeadTimeDays": 60}, mtime=1_000_100)
+            self.assertEqual(engine.load_rules()["minLeadTimeDays"], 60)
+            self.assertEqual(load.call_count, 2)
+
+            with mock.patch.dict(os.environ, {"COMPLIANCE_RULES_RELOAD": "0"}):
+                self._write({"minLeadTimeDays": 90}, mtime=1_000_200)
+                self.assertEqual(engine.load_rules()["minLeadTimeDays"], 60)
+            self.assertEqual(load.call_count, 2)
+
+    def test_rules_are_read_only(self) -> None:
+        rules = ComplianceEngine(self.path).load_rules()
+        with self.assertRaises(TypeError):
+            rules["minLeadTimeDays"] = 1  # type: ignore[index]
+        self.assertIsInstance(rules["requiredDocs"], tuple)
+        missing = ComplianceEngine(self.path + ".missing").load_rules()
+        self.assertIs(missing, compliance_engine.DEFAULT_RULES)
+        result = ComplianceEngine(self.path).run(RelocationProfile(userId="u-rules").model_dump())
+        self.assertIn("checks", result)
+
+
+class QuestionIndexTests(unittest.TestCase):
+    @staticmethod
+    def _linear(questions, answered, accept):
+        for question in questions:
+            if question.id not in answered and accept(question):
+                return question
+        return None
+
+    def test_next_unanswered_matches_linear_walk(self) -> None:
+        ids = [q.id for q in QUESTION_BANK]
+        skip_sets = [None, set(ids[1:3]), {ids[0], ids[-1]}]
+        answered_sets = [set(), set(ids[:1]), set(ids[::2]), set(ids[:-1]), set(ids), {"unknown-question"}]
+        accepts = [lambda q: True, lambda q: not q.id.endswith(ids[0][-1:])]
+        for skip in skip_sets:
+            questions = [q for q in QUESTION_BANK if not skip or q.id not in skip]
+            index = get_question_index(skip)
+            self.assertEqual(len(index), len(questions))
+            for answered in answered_sets:
+                for accept in accepts:
+                    with self.subTest(skip=skip, answered=sorted(answered)):
+                        self.assertIs(
+                            index.next_unanswered(answered, accept), self._linear(questions, answered, accept)
+                        )
+
+    def test_index_shared_and_immutable(self) -> None:
+        skip = {QUESTION_BANK[0].id}
+        self.assertIs(get_question_index(skip), get_question_index(frozenset(skip)))
+        self.assertIsInstance(get_all_questions(), tuple)
+
+    def test_orchestrator_progress_and_next_question(self) -> None:
+        orchestrator = IntakeOrchestrator()
+        profile = RelocationProfile(userId="u-intake").model_dump()
+        response = orchestrator.get_next_question(profile, {QUESTION_BANK[0].id})
+        self.assertEqual(response.progress["totalQuestions"], len(QUESTION_BANK))
+        if not response.isComplete:
+            self.assertNotEqual(response.question.id, QUESTION_BANK[0].id)
+
+
+if __name__ == "__main__":
+    unittest.main()
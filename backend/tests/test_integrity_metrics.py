@@ -0,0 +1,127 @@
+"""Data-integrity overview: one aggregate statement, same figures as the per-entity counts, TTL-cached."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime
+
+from sqlalchemy import text
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+import backend.database as database  # noqa: E402
+from backend.db_instrumentation import capture_queries  # noqa: E402
+from backend.db_integrity_metrics import IntegrityMetrics  # noqa: E402
+
+
+def _count(conn, sql: str) -> int:
+    return int(conn.execute(text(sql)).scalar() or 0)
+
+
+class IntegrityMetricsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.db = database.db
+        now = datetime.utcnow().isoformat()
+        cls.seeded = {"profiles": str(uuid.uuid4()), "case_assignments": str(uuid.uuid4()), "company_policies": str(uuid.uuid4())}
+        with cls.db.engine.begin() as conn:
+            # orphan person, orphan assignment (no case, no person), orphan policy
+            conn.execute(
+                text("INSERT INTO profiles (id, role, email, full_name, created_at) VALUES (:id, 'EMPLOYEE', :e, 'Orphan', :now)"),
+                {"id": cls.seeded["profiles"], "e": f"orphan-{uuid.uuid4().hex[:8]}@example.com", "now": now},
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO case_assignments (id, case_id, hr_user_id, employee_identifier, status, created_at, updated_at) "
+                    "VALUES (:id, :cid, 'hr-orphan', 'e-orphan', 'active', :now, :now)"
+                ),
+                {"id": cls.seeded["case_assignments"], "cid": str(uuid.uuid4()), "now": now},
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO company_policies (id, company_id, title, file_url, file_type, extraction_status, created_at) "
+                    "VALUES (:id, :cid, 'Orphan policy', 'x', 'pdf', 'pending', :now)"
+                ),
+                {"id": cls.seeded["company_policies"], "cid": str(uuid.uuid4()), "now": now},
+            )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        with cls.db.engine.begin() as conn:
+            for table, row_id in cls.seeded.items():
+                conn.execute(text(f"DELETE FROM {table} WHERE id = :id"), {"id": row_id})
+        cls.db.integrity_metrics.invalidate()
+
+    def _expected(self):
+        join = database._relocation_cases_join_on("a", "canonical_coalesce")
+        with self.db.engine.connect() as conn:
+            return {
+                "companies": {"count": _count(conn, "SELECT COUNT(*) FROM companies")},
+                "people": {
+                    "count": _count(conn, "SELECT COUNT(*) FROM profiles"),
+                    "orphans_without_company": _count(
+                        conn,
+                        "SELECT COUNT(*) FROM profiles WHERE (role IN ('HR','EMPLOYEE','EMPLOYEE_USER') OR role IS NULL) "
+                        "AND (company_id IS NULL OR TRIM(company_id) = '')",
+                    ),
+                },
+                "assignments": {
+                    "count": _count(conn, "SELECT COUNT(*) FROM case_assignments"),
+                    "orphans_without_company": _count(
+                        conn,
+                        f"SELECT COUNT(*) FROM case_assignments a LEFT JOIN relocation_cases rc ON {join} "
+                        "LEFT JOIN hr_users hu ON hu.profile_id = a.hr_user_id "
+                        "WHERE COALESCE(rc.company_id, hu.company_id) IS NULL",
+                    ),
+                    "orphans_without_person": _count(
+                        conn,
+                        "SELECT COUNT(*) FROM case_assignments "
+                        "WHERE employee_user_id IS NULL OR TRIM(COALESCE(employee_user_id,'')) = ''",
+                    ),
+                },
+                "policies": {
+                    "count": _count(conn, "SELECT COUNT(*) FROM company_policies"),
+                    "orphans_without_company": _count(
+                        conn,
+                        "SELECT COUNT(*) FROM company_policies cp "
+                        "WHERE NOT EXISTS (SELECT 1 FROM companies c WHERE c.id = cp.company_id)",
+                    ),
+                },
+            }
+
+    def test_single_statement_matches_per_entity_counts(self) -> None:
+        with capture_queries("integrity") as stats:
+            overview = self.db.get_data_integrity_overview(refresh=True)
+        self.assertEqual(stats.count, 1)
+        self.assertEqual(overview, self._expected())
+        for section in ("people", "assignments", "policies"):
+            self.assertGreaterEqual(overview[section]["orphans_without_company"], 1)
+
+    def test_cached_within_ttl_and_invalidated(self) -> None:
+        metrics = IntegrityMetrics(self.db.engine, ttl_seconds=60)
+        join = database._relocation_cases_join_on("a", "canonical_coalesce")
+        first = metrics.overview(join)
+        first["companies"]["count"] = -1
+        with capture_queries("cached") as stats:
+            second = metrics.overview(join)
+        self.assertEqual(stats.count, 0)
+        self.assertNotEqual(second["companies"]["count"], -1)
+
+        metrics.invalidate()
+        with capture_queries("invalidated") as stats:
+            metrics.overview(join)
+        self.assertEqual(stats.count, 1)
+
+        uncached = IntegrityMetrics(self.db.engine, ttl_seconds=0)
+        with capture_queries("ttl0") as stats:
+            uncached.overview(join)
+            uncached.overview(join)
+        self.assertEqual(stats.count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
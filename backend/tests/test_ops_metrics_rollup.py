@@ -0,0 +1,228 @@
+"""
+Tests for the ops metrics rollup (pre-aggregated SLA buckets and backlog state).
+Uses mocks for Supabase; tests aggregation logic without DB.
+"""
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from backend.services import ops_analytics_service as ops  # noqa: E402
+
+NOW = datetime(2026, 5, 2, 15, 30, tzinfo=timezone.utc)
+
+
+def _iso(dt):
+    return dt.isoformat()
+
+
+class TestFlowBuckets(unittest.TestCase):
+    def test_created_and_resolved_buckets_with_histograms(self):
+        window = datetime(2026, 5, 1, tzinfo=timezone.utc)
+        items = [
+            {
+                "id": "a", "status": "resolved", "country_code": "NO", "priority_band": "critical",
+                "created_at": _iso(datetime(2026, 5, 1, 9, 10, tzinfo=timezone.utc)),
+                "assigned_at": _iso(datetime(2026, 5, 1, 9, 40, tzinfo=timezone.utc)),
+                "resolved_at": _iso(datetime(2026, 5, 2, 11, 10, tzinfo=timezone.utc)),
+                "sla_target_at": _iso(datetime(2026, 5, 2, 9, 0, tzinfo=timezone.utc)),
+            },
+            {
+                "id": "b", "status": "new", "country_code": "FR", "priority_band": "low",
+                "created_at": _iso(datetime(2026, 5, 2, 11, 5, tzinfo=timezone.utc)),
+            },
+            {
+                "id": "old", "status": "new", "country_code": "FR", "priority_band": "low",
+                "created_at": _iso(datetime(2026, 4, 20, tzinfo=timezone.utc)),
+            },
+        ]
+        buckets = ops.compute_flow_buckets(items, window)
+        day1_all = buckets[("day", _iso(window), "", "")]
+        self.assertEqual(day1_all["created_count"], 1)
+        self.assertEqual(day1_all["sla_tracked_count"], 1)
+        day2_all = buckets[("day", _iso(window + timedelta(days=1)), "", "")]
+        self.assertEqual(day2_all["created_count"], 1)
+        self.assertEqual(day2_all["resolved_count"], 1)
+        self.assertEqual(day2_all["resolved_breached_count"], 1)
+        self.assertEqual(day2_all["resolve_hist_json"], {"1d_3d": 1})
+        self.assertEqual(day2_all["assign_hist_json"], {"lt_1h": 1})
+        hour = buckets[("hour", _iso(datetime(2026, 5, 2, 11, tzinfo=timezone.utc)), "NO", "critical")]
+        self.assertEqual(hour["resolved_count"], 1)
+        self.assertNotIn(("day", _iso(datetime(2026, 4, 20, tzinfo=timezone.utc)), "", ""), buckets)
+
+
+class TestBacklogState(unittest.TestCase):
+    def test_groups_and_flags(self):
+        items = [
+            {"status": "new", "country_code": "NO", "priority_band": "high", "queue_item_type": "t",
+             "due_at": _iso(NOW - timedelta(hours=1))},
+            {"status": "new", "country_code": "NO", "priority_band": "high", "queue_item_type": "t",
+             "sla_target_at": _iso(NOW - timedelta(hours=1))},
+            {"status": "assigned", "country_code": "NO", "priority_band": "high", "queue_item_type": "t",
+             "assigned_to_user_id": "u1"},
+        ]
+        state = ops.compute_backlog_state(items, NOW)
+        self.assertEqual(len(state), 2)
+        new_row = state[("NO", "", "high", "new", "t", "")]
+        self.assertEqual((new_row["open_count"], new_row["overdue_count"], new_row["breached_count"]), (2, 1, 2))
+
+    def test_transition_moves_item_between_rows(self):
+        with patch.object(ops, "_adjust_backlog_row") as adjust, patch.object(ops, "_get_supabase"):
+            before = {"status": "new", "country_code": "NO"}
+            after = {"status": "assigned", "country_code": "NO", "assigned_to_user_id": "u1"}
+            ops.apply_queue_transition_to_rollup(before, after, NOW)
+            self.assertEqual([c.args[2] for c in adjust.call_args_list], [-1, 1])
+            adjust.reset_mock()
+            ops.apply_queue_transition_to_rollup(after, {**after, "status": "resolved"}, NOW)
+            self.assertEqual([c.args[2] for c in adjust.call_args_list], [-1])
+            adjust.reset_mock()
+            ops.apply_queue_transition_to_rollup(after, dict(after), NOW)
+            adjust.assert_not_called()
+
+
+class TestRollupReads(unittest.TestCase):
+    def setUp(self):
+        ops._rollup_available_cache.update({"checked_at": 0.0, "value": None})
+
+    def test_falls_back_to_raw_scan_without_rollup(self):
+        with patch.object(ops, "_rollup_available", return_value=False), \
+                patch.object(ops, "_get_queue_backlog_raw", return_value={"total": 3}) as raw:
+            self.assertEqual(ops.get_queue_backlog(), {"total": 3})
+            raw.assert_called_once()
+
+    def test_backlog_and_workload_from_state_rows(self):
+        rows = [
+            {"status": "in_progress", "priority_band": "critical", "queue_item_type": "t",
+             "assigned_to_user_id": "u1", "open_count": 2, "overdue_count": 1, "country_code": "NO", "city_name": "Oslo"},
+            {"status": "new", "priority_band": "low", "queue_item_type": "t",
+             "assigned_to_user_id": "", "open_count": 5, "overdue_count": 0, "country_code": "NO", "city_name": "Oslo"},
+        ]
+        with patch.object(ops, "_rollup_available", return_value=True), \
+                patch.object(ops, "_backlog_rows", side_effect=lambda country_code=None, statuses=None: [
+                    r for r in rows if not statuses or r["status"] in statuses
+                ]):
+            backlog = ops.get_queue_backlog()
+            workload = ops.get_reviewer_workload()
+            dest = ops.get_destination_ops_metrics()
+        self.assertEqual(backlog["total"], 7)
+        self.assertEqual(backlog["by_status"], {"in_progress": 2, "new": 5})
+        self.assertEqual(workload["by_assignee"]["u1"], {"total": 2, "in_progress": 2, "blocked": 0, "overdue": 1, "critical": 2})
+        self.assertEqual(dest["items"], [{"country_code": "NO", "city_name": "Oslo", "total": 7, "critical": 2}])
+
+    def test_sla_overview_from_day_buckets(self):
+        bucket_rows = [
+            {"priority_band": "", "created_count": 10, "sla_tracked_count": 8, "resolved_count": 4,
+             "resolved_breached_count": 1, "assign_hours_sum": 6, "assign_count": 3,
+             "resolve_hours_sum": 40, "resolve_count": 4, "assign_hist_json": {"lt_1h": 3},
+             "resolve_hist_json": {"4h_24h": 4}},
+            {"priority_band": "critical", "created_count": 2, "sla_tracked_count": 2, "resolved_count": 1,
+             "resolved_breached_count": 1, "assign_hours_sum": 0, "assign_count": 0,
+             "resolve_hours_sum": 0, "resolve_count": 0},
+        ]
+        supabase = MagicMock()
+        chain = supabase.table.return_value.select.return_value.eq.return_value.eq.return_value
+        chain.in_.return_value.gte.return_value.execute.return_value.data = bucket_rows
+        backlog = [{"open_count": 6, "breached_count": 2, "priority_band": "critical"}]
+        covered = datetime.now(timezone.utc) - timedelta(days=90)
+        with patch.object(ops, "_rollup_covered_since", return_value=covered), \
+                patch.object(ops, "_get_supabase", return_value=supabase), \
+                patch.object(ops, "_backlog_rows", return_value=backlog):
+            out = ops.get_sla_overview(days=30)
+        self.assertEqual(out["open_count"], 6)
+        self.assertEqual(out["breached_count"], 3)
+        self.assertEqual(out["on_time_resolution_rate_pct"], 62.5)
+        self.assertEqual(out["avg_time_to_assign_hours"], 2.0)
+        self.assertEqual(out["avg_time_to_resolve_hours"], 10.0)
+        self.assertEqual(out["critical_breach_count"], 3)
+        self.assertEqual(out["time_to_resolve_histogram"]["4h_24h"], 4)
+
+    def test_sla_overview_falls_back_when_range_not_covered(self):
+        covered = datetime.now(timezone.utc) - timedelta(days=2)
+        with patch.object(ops, "_rollup_covered_since", return_value=covered), \
+                patch.object(ops, "_get_sla_overview_rollup") as rollup, \
+                patch.object(ops, "_get_sla_overview_raw", return_value={"open_count": 1}) as raw:
+            self.assertEqual(ops.get_sla_overview(days=30), {"open_count": 1})
+            ops.get_sla_overview(days=1)
+        raw.assert_called_once()
+        rollup.assert_called_once()
+
+
+class _Query:
+    """Minimal PostgREST query builder over in-memory rows (filters ignored except range)."""
+
+    def __init__(self, store, name):
+        self.store, self.name = store, name
+
+    def __getattr__(self, attr):
+        if attr in ("select", "gte", "gt", "in_", "eq", "order", "limit"):
+            return lambda *a, **k: self
+        raise AttributeError(attr)
+
+    def range(self, start, end):
+        self.store["ranges"].append((self.name, start, end))
+        data = self.store["rows"].get(self.name, [])[start:end + 1]
+        return MagicMock(execute=MagicMock(return_value=MagicMock(data=data)))
+
+    def execute(self):
+        return MagicMock(data=self.store["rows"].get(self.name, [])[:1])
+
+    def upsert(self, rows, on_conflict=None):
+        self.store["upserts"].setdefault(self.name, []).append(len(rows))
+        return self
+
+    def insert(self, row):
+        self.store["inserts"].append((self.name, row))
+        return self
+
+
+class TestRefreshRollup(unittest.TestCase):
+    def _supabase(self, rows):
+        store = {"rows": rows, "ranges": [], "upserts": {}, "inserts": []}
+        supabase = MagicMock()
+        supabase.table.side_effect = lambda name: _Query(store, name)
+        return supabase, store
+
+    def test_first_run_backfills_and_reads_are_paged(self):
+        items = [
+            {"id": f"i{n:04d}", "status": "new", "created_at": _iso(NOW - timedelta(days=60, minutes=n))}
+            for n in range(5)
+        ]
+        supabase, store = self._supabase({"review_queue_items": items})
+        with patch.object(ops, "_get_supabase", return_value=supabase), patch.object(ops, "_READ_PAGE_SIZE", 2):
+            out = ops.refresh_ops_metrics_rollup(now=NOW)
+        self.assertEqual(out["covered_since"], _iso(datetime(2026, 2, 1, tzinfo=timezone.utc)))
+        run = [row for name, row in store["inserts"] if name == "ops_metrics_rollup_runs"][0]
+        self.assertEqual(run["covered_since"], out["covered_since"])
+        # 5 rows at page size 2 -> three range() reads per query; the 60-day-old items are bucketed.
+        item_pages = [r for r in store["ranges"] if r[0] == "review_queue_items"]
+        self.assertEqual(len(item_pages), 9)
+        self.assertGreater(out["buckets_written"], 0)
+
+    def test_later_run_extends_back_to_previous_run(self):
+        last = {
+            "completed_at": _iso(NOW - timedelta(days=5)),
+            "covered_since": _iso(datetime(2026, 2, 1, tzinfo=timezone.utc)),
+        }
+        supabase, _ = self._supabase({"ops_metrics_rollup_runs": [last]})
+        with patch.object(ops, "_get_supabase", return_value=supabase):
+            out = ops.refresh_ops_metrics_rollup(now=NOW)
+        self.assertEqual(out["window_start"], _iso(datetime(2026, 4, 27, tzinfo=timezone.utc)))
+        self.assertEqual(out["covered_since"], last["covered_since"])
+
+    def test_transition_adjusts_backlog_atomically(self):
+        supabase = MagicMock()
+        with patch.object(ops, "_get_supabase", return_value=supabase):
+            ops.apply_queue_transition_to_rollup(None, {"status": "new", "country_code": "NO"}, NOW)
+        supabase.rpc.assert_called_once()
+        name, params = supabase.rpc.call_args.args
+        self.assertEqual(name, "ops_backlog_adjust")
+        self.assertEqual(params["p_delta"], 1)
+        self.assertEqual(params["p_country_code"], "NO")
+        supabase.table.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,14 @@ _REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")
 if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
-from backend.services.policy_assistant_classifier import classify_policy_chat_message
+from backend.scripts.bench_policy_assistant_classifier import load_qa_regression_corpus
+from backend.services.policy_assistant_classifier import (
+    _TOPIC_RULES,
+    _normalize_message,
+    _scan_topic_scores,
+    classify_policy_chat_message,
+    score_policy_assistant_topics,
+)
 from backend.services.policy_assistant_contract import (
     PolicyAssistantCanonicalTopic,
     PolicyAssistantIntent,
@@ -18,6 +25,31 @@ from backend.services.policy_assistant_contract import (
 )
 
 
+def _reference_scores(norm, allowed, relaxed=False):
+    """Per-rule, per-phrase loop the compiled scorer replaced."""
+    scores = {t: 0 for t in allowed}
+    for rule in _TOPIC_RULES:
+        if rule.topic not in scores:
+            continue
+        skip = any(n.search(norm) for n in rule.negatives)
+        if (
+            skip
+            and relaxed
+            and rule.topic == PolicyAssistantCanonicalTopic.SCHOOL_SEARCH
+            and "school search" in norm
+        ):
+            skip = False
+        if skip:
+            continue
+        for p, w in rule.phrases:
+            if isinstance(p, str):
+                if p in norm:
+                    scores[rule.topic] += w
+            elif p.search(norm):
+                scores[rule.topic] += w
+    return scores
+
+
 class PolicyAssistantClassifierTests(unittest.TestCase):
     def test_clear_in_scope_entitlement_examples(self) -> None:
         r = classify_policy_chat_message(
@@ -169,6 +201,36 @@ class PolicyAssistantClassifierTests(unittest.TestCase):
         r = classify_policy_chat_message("  Hello?  ", PolicyAssistantRoleScope.EMPLOYEE, None)
         self.assertTrue(r.normalized_question)
 
+    def test_compiled_scores_match_reference_loop(self) -> None:
+        corpus = load_qa_regression_corpus() + [
+            "Do I get tax return support and a tax briefing?",
+            "Are work permits and residence permit fees covered?",
+            "Host country housing vs temporary housing — which applies?",
+            "Which school search support do I get for my family?",
+            "Shipment cap for household goods shipping",
+            "home leave home leave r&r trip home",
+        ]
+        self.assertGreater(len(corpus), 20)
+        allowed_sets = [
+            list(PolicyAssistantCanonicalTopic),
+            [PolicyAssistantCanonicalTopic.TEMPORARY_HOUSING, PolicyAssistantCanonicalTopic.HOST_HOUSING],
+        ]
+        _scan_topic_scores.cache_clear()
+        for msg in corpus:
+            norm = _normalize_message(msg)
+            for allowed in allowed_sets:
+                for relaxed in (False, True):
+                    with self.subTest(msg=msg, relaxed=relaxed, n_allowed=len(allowed)):
+                        got = score_policy_assistant_topics(msg, allowed, relaxed=relaxed)
+                        self.assertEqual(got, _reference_scores(norm, allowed, relaxed))
+                        self.assertEqual(list(got), allowed)
+
+    def test_scores_are_fresh_dicts_across_memoized_calls(self) -> None:
+        first = score_policy_assistant_topics("What is my shipment cap?")
+        first[PolicyAssistantCanonicalTopic.SHIPMENT] = -1
+        second = score_policy_assistant_topics("What is my shipment cap?")
+        self.assertEqual(second[PolicyAssistantCanonicalTopic.SHIPMENT], 11)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -95,8 +95,9 @@ class PolicyAssistantImportTests(unittest.TestCase):
                 self.snapshots.append({"id": sid, "status": k.get("status", "failed")})
                 return sid
 
-            def insert_policy_fact(self, snapshot_id, fact_type, category, **kwargs):
-                self.facts.append({"snapshot_id": snapshot_id, "fact_type": fact_type})
+            def insert_policy_facts_bulk(self, snapshot_id, facts):
+                self.facts.extend({"snapshot_id": snapshot_id, "fact_type": f["fact_type"]} for f in facts)
+                return [str(uuid.uuid4()) for _ in facts]
 
             def activate_policy_knowledge_snapshot(
                 self, new_snapshot_id, company_id, policy_document_id, activated_by_user_id
@@ -131,6 +132,120 @@ class PolicyAssistantImportTests(unittest.TestCase):
         self.assertEqual(db.activate_calls[0][1], sid)
         self.assertEqual(db.facts[0]["snapshot_id"], sid)
 
+    def test_snapshot_contents_written_in_one_transaction(self) -> None:
+        from backend.database import Database
+
+        db = Database()
+        if not db.policy_assistant_tables_available():
+            self.skipTest("policy assistant tables missing")
+        company_id = str(uuid.uuid4())
+        doc_id = str(uuid.uuid4())
+        db.create_policy_document(doc_id, company_id, "u1", "p.pdf", "application/pdf", f"p/{doc_id}.pdf")
+        sid = db.insert_policy_knowledge_snapshot(company_id, doc_id)
+        chunks = [
+            {"id": str(uuid.uuid4()), "chunk_index": i, "text_content": f"Housing allowance USD {i},000 per month."}
+            for i in range(3)
+        ]
+        facts = extract_minimal_policy_facts(chunks)
+        chunk_ids, fact_ids = db.insert_policy_snapshot_contents(doc_id, sid, chunks, facts)
+        self.assertEqual(chunk_ids, [c["id"] for c in chunks])
+        self.assertEqual(len(fact_ids), len(facts))
+        self.assertEqual(len(db.list_policy_document_chunks_for_snapshot(doc_id, sid)), 3)
+        self.assertEqual(db.count_policy_facts_for_snapshot(sid), len(facts))
+
+        # Duplicate chunk_index violates the (snapshot_id, chunk_index) index: nothing is kept.
+        sid2 = db.insert_policy_knowledge_snapshot(company_id, doc_id, revision_number=2)
+        bad = [
+            {"id": str(uuid.uuid4()), "chunk_index": 0, "text_content": "a"},
+            {"id": str(uuid.uuid4()), "chunk_index": 0, "text_content": "b"},
+        ]
+        with self.assertRaises(Exception):
+            db.insert_policy_snapshot_contents(doc_id, sid2, bad, [])
+        self.assertEqual(db.list_policy_document_chunks_for_snapshot(doc_id, sid2), [])
+
+    def test_search_policy_document_chunks_ranks_within_snapshot(self) -> None:
+        from backend.database import Database
+
+        db = Database()
+        if not db.policy_assistant_tables_available():
+            self.skipTest("policy assistant tables missing")
+        company_id = str(uuid.uuid4())
+        doc_id = str(uuid.uuid4())
+        db.create_policy_document(doc_id, company_id, "u1", "p.pdf", "application/pdf", f"p/{doc_id}.pdf")
+        sid = db.insert_policy_knowledge_snapshot(company_id, doc_id)
+        other = db.insert_policy_knowledge_snapshot(company_id, doc_id, revision_number=2)
+        db.insert_policy_snapshot_contents(
+            doc_id,
+            sid,
+            [
+                {"chunk_index": 0, "section_title": "Shipment", "text_content": "Household goods shipment up to 20ft container."},
+                {"chunk_index": 1, "section_title": "Home leave", "text_content": "One home leave trip per year for the family."},
+                {"chunk_index": 2, "section_title": "Tax", "text_content": "Tax briefing before departure."},
+            ],
+            [],
+        )
+        db.insert_policy_snapshot_contents(
+            doc_id, other, [{"chunk_index": 0, "text_content": "Home leave is not covered."}], []
+        )
+        hits = db.search_policy_document_chunks(sid, "How many home leave trips do I get?", limit=2)
+        self.assertTrue(hits)
+        self.assertEqual(hits[0]["chunk_index"], 1)
+        self.assertTrue(all(h["snapshot_id"] == sid for h in hits))
+        self.assertGreater(hits[0]["retrieval_score"], 0)
+        self.assertEqual(db.search_policy_document_chunks(sid, "what is the"), [])
+
+    def test_chunk_fts_survives_vacuum_and_upgrades_rowid_index(self) -> None:
+        import shutil
+        import tempfile
+
+        from sqlalchemy import create_engine, text
+
+        from backend.database import _sqlite_ensure_policy_chunk_fts
+
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp, True)
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'fts.db')}")
+        self.addCleanup(engine.dispose)
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE policy_document_chunks (id TEXT PRIMARY KEY, section_title TEXT, text_content TEXT NOT NULL)"
+            ))
+            try:
+                # Index keyed on the implicit rowid, as created before the search key table.
+                conn.execute(text(
+                    "CREATE VIRTUAL TABLE policy_document_chunks_fts USING fts5(section_title, text_content, "
+                    "content='policy_document_chunks', content_rowid='rowid')"
+                ))
+            except Exception:
+                self.skipTest("FTS5 unavailable")
+            for cid, body in (("a", "alpha housing"), ("b", "bravo schooling"), ("c", "charlie shipment")):
+                conn.execute(text("INSERT INTO policy_document_chunks VALUES (:id, '', :t)"), {"id": cid, "t": body})
+            _sqlite_ensure_policy_chunk_fts(conn)
+            conn.execute(text("DELETE FROM policy_document_chunks WHERE id IN ('a', 'b')"))
+            conn.execute(text("INSERT INTO policy_document_chunks VALUES ('d', '', 'delta shipment')"))
+            conn.execute(text("UPDATE policy_document_chunks SET text_content = 'charlie container' WHERE id = 'c'"))
+        with engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("VACUUM"))
+
+        def search(term: str):
+            with engine.connect() as conn:
+                return sorted(
+                    r[0]
+                    for r in conn.execute(
+                        text(
+                            "SELECT c.id FROM policy_document_chunks_fts "
+                            "JOIN policy_document_chunk_search_keys k ON k.search_rowid = policy_document_chunks_fts.rowid "
+                            "JOIN policy_document_chunks c ON c.id = k.chunk_id "
+                            "WHERE policy_document_chunks_fts MATCH :q"
+                        ),
+                        {"q": term},
+                    )
+                )
+
+        self.assertEqual(search("shipment"), ["d"])
+        self.assertEqual(search("container"), ["c"])
+        self.assertEqual(search("alpha OR bravo"), [])
+
     def test_get_source_chunks_for_fact_ids_empty(self) -> None:
         class _Db:
             policy_assistant_tables_available = lambda self: False  # noqa: E731
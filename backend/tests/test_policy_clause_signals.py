@@ -0,0 +1,184 @@
+"""Clause signal engine: cached signals reproduce the per-helper regex / keyword scans they replaced."""
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import unittest
+from typing import Any, Dict, List, Optional
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.services import policy_normalization as pn  # noqa: E402
+from backend.services.policy_clause_signals import (  # noqa: E402
+    APPROVAL_SIGNALS,
+    ASSIGNMENT_PATTERNS,
+    BENEFIT_KEY_PATTERNS,
+    CLAUSE_BENEFIT,
+    CLAUSE_TYPE_SIGNALS,
+    CLAUSE_UNKNOWN,
+    CURRENCY_PATTERN,
+    EVIDENCE_ITEMS,
+    EXCLUSION_SIGNALS,
+    FAMILY_TERMS,
+    FREQUENCY_PATTERNS,
+    NUMERIC_PATTERN,
+    UNIT_PATTERNS,
+    clause_signals,
+)
+from backend.services.policy_document_clauses import _classify_clause, _extract_normalized_hints  # noqa: E402
+from backend.services.policy_source_provenance import filter_candidate_numeric_values  # noqa: E402
+from backend.services.policy_taxonomy import ASSIGNMENT_TYPE_MAP  # noqa: E402
+from backend.tests.fixtures.policy_processing_e2e_fixtures import (  # noqa: E402
+    structured_policy_clauses,
+    summary_only_clauses,
+)
+
+_EDGE_TEXTS = [
+    "Housing allowance: USD 5,000 per month for long-term assignees (see 2.1).",
+    "Schooling | Tuition reimbursed up to EUR 25,000 per year | 4.2",
+    "Mobility premium of 10 % of base salary, paid monthly.",
+    "Home leave: 2 additional nights per year; directors and senior management fly business.",
+    "Spouse / accompanied partner support is not covered for short term or commuter assignments.",
+    "Permanent assignment: one-time settling-in allowance £1,200; receipts and invoices required.",
+    "Single employees are not eligible. Prior approval from HR approval desk is required.",
+    "Assignments longer than 24 months qualify for tax equalization (hypothetical tax).",
+    "Per diem daily allowance $85 within 30 working days; difference only for school fees.",
+    "",
+]
+
+
+def _reference_hints(text: str, section_label: Optional[str]) -> Dict[str, Any]:
+    """Loop-per-table implementation that ``_extract_normalized_hints`` replaced."""
+    lower = text.lower()
+    hints: Dict[str, Any] = {}
+    for key, pat in BENEFIT_KEY_PATTERNS:
+        if re.search(pat, lower, re.I):
+            hints["candidate_benefit_key"] = key
+            break
+    if not hints.get("candidate_benefit_key") and section_label:
+        sl = section_label.lower()
+        for key, _ in BENEFIT_KEY_PATTERNS:
+            if key.replace("_", " ") in sl or key in sl:
+                hints["candidate_benefit_key"] = key
+                break
+    m = CURRENCY_PATTERN.search(text)
+    if m:
+        hints["candidate_currency"] = m.group(1).upper()
+    for pat, unit in UNIT_PATTERNS:
+        if re.search(pat, lower):
+            hints["candidate_unit"] = unit
+            break
+    nums = []
+    for m in NUMERIC_PATTERN.finditer(text):
+        n = float(m.group(1).replace(",", ""))
+        if 0 < n < 1e12:
+            nums.append(n)
+    if nums:
+        nums = filter_candidate_numeric_values(list(dict.fromkeys(nums))[:12], text)
+        if nums:
+            hints["candidate_numeric_values"] = nums[:10]
+    for pat, freq in FREQUENCY_PATTERNS:
+        if re.search(pat, lower):
+            hints["candidate_frequency"] = freq
+            break
+    ats = [at for pat, at in ASSIGNMENT_PATTERNS if re.search(pat, lower)]
+    if ats:
+        hints["candidate_assignment_types"] = list(dict.fromkeys(ats))
+    fts = [t for t in FAMILY_TERMS if t in lower]
+    if fts:
+        hints["candidate_family_status_terms"] = fts
+    if any(s in lower for s in EXCLUSION_SIGNALS):
+        hints["candidate_exclusion_flag"] = True
+    if any(s in lower for s in APPROVAL_SIGNALS):
+        hints["candidate_approval_flag"] = True
+    evs = [e for e in EVIDENCE_ITEMS if e in lower]
+    if evs:
+        hints["candidate_evidence_items"] = list(dict.fromkeys(evs))
+    return hints
+
+
+def _reference_classify(text: str, is_table_row: bool):
+    lower = text.lower()
+    best = (CLAUSE_UNKNOWN, 0.3)
+    for signals, ctype in CLAUSE_TYPE_SIGNALS:
+        for sig in signals:
+            if sig in lower:
+                conf = 0.75 if ctype == CLAUSE_BENEFIT or (is_table_row and " | " in text) else 0.8
+                if conf > best[1]:
+                    best = (ctype, conf)
+    if is_table_row and " | " in text and best[0] == CLAUSE_UNKNOWN:
+        if any(x in lower for x in ["usd", "eur", "%", "limit", "allowance", "cover"]):
+            best = (CLAUSE_BENEFIT, 0.7)
+    return best
+
+
+def _reference_assignment_types_from_text(raw: str) -> List[str]:
+    rl = raw.lower()
+    keys = []
+    if re.search(r"long[-\s]term", rl):
+        keys.append("long_term")
+    if re.search(r"short[-\s]term", rl):
+        keys.append("short_term")
+    if re.search(r"\bcommuter\b", rl):
+        keys.append("commuter")
+    if re.search(r"\bpermanent\b", rl) and "assignment" in rl:
+        keys.append("permanent")
+    return list(dict.fromkeys(ASSIGNMENT_TYPE_MAP[k] for k in keys if ASSIGNMENT_TYPE_MAP.get(k)))
+
+
+def _reference_text_amount(raw: str) -> Optional[float]:
+    for pat, flags in (
+        (r"(?:EUR|USD|GBP|CHF|CAD|AUD|SGD|NZD)\s*([0-9]+(?:,[0-9]{3})*(?:\.[0-9]+)?)", re.I),
+        (r"(?:\b|\$|€|£)\s*([0-9]+(?:,[0-9]{3})*(?:\.[0-9]+)?)", 0),
+    ):
+        m = re.search(pat, raw, flags)
+        if m:
+            return float(m.group(1).replace(",", ""))
+    m = re.search(r"(\d{1,3})\s*%", raw)
+    return float(m.group(1)) if m else None
+
+
+def _corpus() -> List[str]:
+    texts = [c["raw_text"] for c in summary_only_clauses() + structured_policy_clauses()]
+    path = os.path.join(os.path.dirname(__file__), "fixtures", "lta_policy_summary_regression.json")
+    with open(path, encoding="utf-8") as f:
+        texts += [i["text"] for i in json.load(f)["items"]]
+    return texts + _EDGE_TEXTS
+
+
+class ClauseSignalsEquivalenceTests(unittest.TestCase):
+    def test_hints_and_classification_match_reference(self) -> None:
+        for text in _corpus():
+            for section in (None, "Household Goods"):
+                with self.subTest(text=text[:60], section=section):
+                    self.assertEqual(_extract_normalized_hints(text, False, section), _reference_hints(text, section))
+            for is_table in (False, True):
+                self.assertEqual(_classify_clause(text, is_table), _reference_classify(text, is_table))
+
+    def test_normalization_helpers_match_reference(self) -> None:
+        for text in _corpus():
+            with self.subTest(text=text[:60]):
+                self.assertEqual(pn._assignment_types_from_text(text), _reference_assignment_types_from_text(text))
+                self.assertEqual(pn._extract_amount_value({}, text), _reference_text_amount(text))
+        raw = _EDGE_TEXTS[3]
+        self.assertEqual(pn._duration_quantity_fragment(raw), {"quantity": 2, "unit": "nights"})
+        self.assertEqual(pn._role_hints_from_text(raw), ["directors", "executives"])
+        self.assertEqual(pn._family_terms_from_text(_EDGE_TEXTS[6]), ["single"])
+        self.assertTrue(pn._text_suggests_exclusion_language(_EDGE_TEXTS[4]))
+        self.assertEqual(pn._extract_currency_hint(_EDGE_TEXTS[5], {}), "GBP")
+
+    def test_returned_hints_are_fresh_per_call(self) -> None:
+        text = _EDGE_TEXTS[1]
+        first = _extract_normalized_hints(text, True, None)
+        first["candidate_numeric_values"].append(999.0)
+        first["candidate_benefit_key"] = "changed"
+        self.assertEqual(_extract_normalized_hints(text, True, None), _reference_hints(text, None))
+        self.assertIs(clause_signals(text), clause_signals(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
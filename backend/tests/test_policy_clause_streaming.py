@@ -0,0 +1,117 @@
+"""Streaming clause segmentation and batched clause upsert."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+import uuid
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.benchmarks.policy_pipeline import DOCX_MIME, synthetic_policy_docx  # noqa: E402
+from backend.db_instrumentation import capture_queries  # noqa: E402
+from backend.services.policy_document_clauses import (  # noqa: E402
+    iter_clauses,
+    iter_document_clauses,
+    segment_document_from_raw_text,
+)
+
+_CONTEXT = {"id": "doc-stream", "detected_document_type": "assignment_policy", "extracted_metadata": {}}
+
+
+class ClauseStreamingTests(unittest.TestCase):
+    def test_stream_matches_list_segmentation(self) -> None:
+        data = synthetic_policy_docx(4)
+        expected, err = segment_document_from_raw_text("", DOCX_MIME, data=data, policy_context=_CONTEXT)
+        self.assertIsNone(err)
+        streamed = list(iter_document_clauses("", DOCX_MIME, data=data, policy_context=_CONTEXT))
+        self.assertEqual(streamed, expected)
+        self.assertGreater(len(streamed), 4)
+
+    def test_clauses_are_emitted_before_input_is_exhausted(self) -> None:
+        consumed = []
+
+        def items():
+            for n in range(1000):
+                consumed.append(n)
+                yield {"text": f"{n + 1}. Section {n}", "page": n // 10 + 1, "is_table_row": False}
+                yield {"text": "Housing allowance is paid monthly.", "page": n // 10 + 1, "is_table_row": False}
+
+        stream = iter_clauses(items())
+        first = next(stream)
+        self.assertEqual(first["title"], "1. Section 0")
+        self.assertLess(len(consumed), 3)
+
+
+class BatchedClauseUpsertTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        from backend.database import db
+
+        cls.db = db
+        cls.doc_id = str(uuid.uuid4())
+        db.create_policy_document(
+            cls.doc_id, "co-stream", "hr-stream", "stream.docx", DOCX_MIME, f"stream/{cls.doc_id}.docx"
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.db.delete_policy_document(cls.doc_id)
+
+    def _clauses(self, n: int):
+        for i in range(n):
+            yield {"clause_type": "benefit", "raw_text": f"clause {i}", "source_page_start": i, "confidence": 0.7}
+
+    def _staged(self) -> int:
+        from sqlalchemy import text
+
+        with self.db.engine.connect() as conn:
+            return int(
+                conn.execute(
+                    text("SELECT COUNT(*) FROM policy_document_clause_staging WHERE policy_document_id = :id"),
+                    {"id": self.doc_id},
+                ).scalar()
+            )
+
+    def test_generator_is_inserted_in_batches(self) -> None:
+        with capture_queries("upsert") as stats:
+            n = self.db.upsert_policy_document_clauses(self.doc_id, self._clauses(25), batch_size=10)
+        self.assertEqual(n, 25)
+        self.assertEqual(len(self.db.list_policy_document_clauses(self.doc_id)), 25)
+        # three staged batches, then DELETE, promote and staging cleanup
+        self.assertEqual(stats.count, 6)
+        self.assertEqual(self._staged(), 0)
+
+    def test_batches_are_staged_while_the_stream_is_parsed(self) -> None:
+        self.db.upsert_policy_document_clauses(self.doc_id, list(self._clauses(2)))
+        seen = []
+
+        def tracked():
+            for i, c in enumerate(self._clauses(12)):
+                # Never more than one batch read ahead of what is staged; live clauses untouched.
+                seen.append((i - self._staged(), len(self.db.list_policy_document_clauses(self.doc_id))))
+                yield c
+
+        self.db.upsert_policy_document_clauses(self.doc_id, tracked(), batch_size=5)
+        self.assertEqual({live for _, live in seen}, {2})
+        self.assertEqual([ahead for ahead, _ in seen], [0, 1, 2, 3, 4] * 2 + [0, 1])
+        self.assertEqual(len(self.db.list_policy_document_clauses(self.doc_id)), 12)
+
+    def test_failure_mid_stream_keeps_previous_clauses(self) -> None:
+        self.db.upsert_policy_document_clauses(self.doc_id, list(self._clauses(3)))
+
+        def broken():
+            yield from self._clauses(15)
+            raise ValueError("parser failed")
+
+        with self.assertRaises(ValueError):
+            self.db.upsert_policy_document_clauses(self.doc_id, broken(), batch_size=10)
+        rows = self.db.list_policy_document_clauses(self.doc_id)
+        self.assertEqual(sorted(r["raw_text"] for r in rows), ["clause 0", "clause 1", "clause 2"])
+        self.assertEqual(self._staged(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Policy pipeline micro-benchmark: stage coverage, statement counts and baseline comparison."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.benchmarks.policy_pipeline import (  # noqa: E402
+    PolicyCorpus,
+    compare_policy_pipeline_reports,
+    fixture_corpora,
+    run_policy_pipeline_benchmark,
+    synthetic_policy_docx,
+)
+
+
+class PolicyPipelineBenchmarkTests(unittest.TestCase):
+    def test_in_memory_stages_on_fixtures_and_small_synthetic_docx(self) -> None:
+        corpora = fixture_corpora() + [PolicyCorpus("synthetic_3p", data=synthetic_policy_docx(3))]
+        report = run_policy_pipeline_benchmark(corpora, db=None, rounds=1)
+
+        lta = report["corpora"]["lta_summary"]
+        self.assertEqual(list(lta["stages"]), ["segment", "normalize", "group"])
+        self.assertEqual(lta["counts"]["clauses"], 7)
+        synth = report["corpora"]["synthetic_3p"]
+        self.assertEqual(list(synth["stages"]), ["intake", "extract", "segment", "normalize", "group"])
+        self.assertGreater(synth["counts"]["clauses"], 3)
+        for stage in synth["stages"].values():
+            self.assertEqual(stage["statements"], 0)
+            self.assertIn("peak_kib", stage)
+
+    def test_db_stages_count_statements(self) -> None:
+        from backend.database import db
+
+        corpus = [c for c in fixture_corpora() if c.name == "e2e_structured"]
+        report = run_policy_pipeline_benchmark(corpus, db=db, rounds=1, trace_memory=False)
+        stages = report["corpora"]["e2e_structured"]["stages"]
+        for name in ("store", "persist", "resolve"):
+            self.assertIn(name, stages)
+            self.assertGreater(stages[name]["statements"], 0)
+        self.assertNotIn("peak_kib", stages["persist"])
+
+    def test_compare_flags_time_statement_and_memory_regressions(self) -> None:
+        def rep(ms: float, stmts: int, kib: float) -> dict:
+            return {"corpora": {"c": {"stages": {"persist": {"wall_ms_p50": ms, "statements": stmts, "peak_kib": kib}}}}}
+
+        base = rep(10.0, 5, 1000.0)
+        self.assertEqual(compare_policy_pipeline_reports(rep(11.0, 5, 1100.0), base), [])
+        metrics = {r["metric"] for r in compare_policy_pipeline_reports(rep(20.0, 6, 2000.0), base)}
+        self.assertEqual(metrics, {"wall_ms_p50", "statements", "peak_kib"})
+
+
+if __name__ == "__main__":
+    unittest.main()
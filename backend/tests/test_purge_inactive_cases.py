@@ -0,0 +1,141 @@
+"""Batched purge of inactive cases: dry-run counts, bounded committed batches, resumable runs."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime
+from unittest import mock
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+import backend.database as database  # noqa: E402
+import backend.main as main  # noqa: E402
+
+
+class PurgeInactiveCasesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = database.db
+        self.status = f"purge-{uuid.uuid4().hex[:8]}"
+        now = datetime.utcnow().isoformat()
+        self.assignment_ids = []
+        self.case_ids = []
+        with self.db.engine.begin() as conn:
+            for i in range(7):
+                case_id, aid = str(uuid.uuid4()), str(uuid.uuid4())
+                conn.execute(
+                    text(
+                        "INSERT INTO relocation_cases (id, hr_user_id, profile_json, status, created_at, updated_at) "
+                        "VALUES (:id, 'hr-purge', '{}', :status, :now, :now)"
+                    ),
+                    {"id": case_id, "status": self.status, "now": now},
+                )
+                conn.execute(
+                    text(
+                        "INSERT INTO case_assignments (id, case_id, hr_user_id, employee_identifier, status, created_at, updated_at) "
+                        "VALUES (:id, :cid, 'hr-purge', 'e-purge', :status, :now, :now)"
+                    ),
+                    {"id": aid, "cid": case_id, "status": self.status, "now": now},
+                )
+                conn.execute(
+                    text(
+                        "INSERT INTO employee_answers (assignment_id, question_id, answer_json, created_at) "
+                        "VALUES (:aid, 'q1', '{}', :now)"
+                    ),
+                    {"aid": aid, "now": now},
+                )
+                conn.execute(
+                    text(
+                        "INSERT INTO assignment_invites (id, case_id, hr_user_id, employee_identifier, token, status, created_at) "
+                        "VALUES (:id, :cid, 'hr-purge', 'e-purge', :tok, 'pending', :now)"
+                    ),
+                    {"id": str(uuid.uuid4()), "cid": case_id, "tok": uuid.uuid4().hex, "now": now},
+                )
+                self.assignment_ids.append(aid)
+                self.case_ids.append(case_id)
+            # Every other status in the tree counts as active, so only this test's rows are purged.
+            self.active = sorted(
+                {
+                    r[0]
+                    for r in conn.execute(
+                        text("SELECT status FROM case_assignments UNION SELECT status FROM relocation_cases")
+                    ).fetchall()
+                    if r[0] and r[0] != self.status
+                }
+                | {"active"}
+            )
+
+    def tearDown(self) -> None:
+        self.db.purge_inactive_cases(self.active)
+
+    def _remaining(self, sql: str, ids) -> int:
+        with self.db.engine.connect() as conn:
+            return sum(int(conn.execute(text(sql), {"id": i}).scalar() or 0) for i in ids)
+
+    def test_dry_run_counts_without_deleting(self) -> None:
+        stats = self.db.purge_inactive_cases(self.active, dry_run=True)
+        self.assertTrue(stats["dry_run"])
+        self.assertEqual(stats["assignments_deleted"], 7)
+        self.assertEqual(stats["relocation_cases_deleted"], 7)
+        self.assertEqual(stats["tables"]["employee_answers"], 7)
+        self.assertEqual(stats["tables"]["assignment_invites"], 7)
+        self.assertEqual(stats["tables"]["compliance_reports"], 0)
+        self.assertEqual(self._remaining("SELECT COUNT(*) FROM case_assignments WHERE id = :id", self.assignment_ids), 7)
+
+    def test_bounded_batches_resume_to_completion(self) -> None:
+        progress = []
+        first = self.db.purge_inactive_cases(self.active, batch_size=3, max_batches=2, on_batch=progress.append)
+        self.assertFalse(first["complete"])
+        self.assertEqual((first["batches"], first["assignments_deleted"]), (2, 6))
+        self.assertEqual([p["assignments_deleted"] for p in progress], [3, 6])
+        # Each committed batch took its dependents with it.
+        self.assertEqual(self._remaining("SELECT COUNT(*) FROM case_assignments WHERE id = :id", self.assignment_ids), 1)
+        self.assertEqual(
+            self._remaining("SELECT COUNT(*) FROM employee_answers WHERE assignment_id = :id", self.assignment_ids), 1
+        )
+
+        rest = self.db.purge_inactive_cases(self.active, batch_size=3)
+        self.assertTrue(rest["complete"])
+        self.assertEqual(rest["assignments_deleted"], 1)
+        self.assertEqual(rest["relocation_cases_deleted"], 7)
+        self.assertEqual(rest["tables"]["case_assignments"], 1)
+        self.assertEqual(self._remaining("SELECT COUNT(*) FROM relocation_cases WHERE id = :id", self.case_ids), 0)
+        self.assertEqual(self._remaining("SELECT COUNT(*) FROM assignment_invites WHERE case_id = :id", self.case_ids), 0)
+        self.assertEqual(self.db.purge_inactive_cases(self.active, dry_run=True)["assignments_deleted"], 0)
+
+
+class PurgeInactiveCasesRouteTests(unittest.TestCase):
+    def setUp(self) -> None:
+        main.app.dependency_overrides[main.require_admin] = lambda: {"id": "admin-purge"}
+        self.addCleanup(main.app.dependency_overrides.pop, main.require_admin, None)
+        self.client = TestClient(main.app)
+        purge = mock.patch.object(main.db, "purge_inactive_cases", return_value={"complete": True})
+        self.purge = purge.start()
+        self.addCleanup(purge.stop)
+        audit = mock.patch.object(main.db, "log_audit")
+        audit.start()
+        self.addCleanup(audit.stop)
+
+    def _post(self, payload):
+        return self.client.post("/api/admin/actions/purge-cases", json={"reason": "cleanup", "payload": payload})
+
+    def test_batch_size_is_clamped(self) -> None:
+        for given, used in ((100000, 5000), (0, 1), (-5, 1), ("250", 250), (None, 500)):
+            self.assertEqual(self._post({"batch_size": given}).status_code, 200)
+            self.assertEqual(self.purge.call_args.kwargs["batch_size"], used)
+
+    def test_invalid_batch_size_is_rejected(self) -> None:
+        for bad in ("lots", [5], True):
+            self.assertEqual(self._post({"batch_size": bad}).status_code, 400)
+        self.assertEqual(self._post({"max_batches": "x"}).status_code, 400)
+        self.purge.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Tests for time-aware review queue priority and the incremental priority scheduler.
+Uses mocks for Supabase; tests logic without DB.
+"""
+import json
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from backend.services import review_queue_service as rqs  # noqa: E402
+
+NOW = datetime(2026, 5, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _item(**overrides):
+    row = {
+        "id": "q1",
+        "status": "new",
+        "priority_score": 40,
+        "priority_band": "medium",
+        "base_priority_score": 40,
+        "priority_reasons_json": json.dumps(["Official source changed"]),
+        "created_at": (NOW - timedelta(hours=1)).isoformat(),
+        "due_at": None,
+        "sla_target_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestComputePriorityScore(unittest.TestCase):
+    def test_static_score_unchanged_by_refactor(self):
+        score, band, reasons = rqs.compute_priority_score(
+            queue_item_type="stale_live_resource_review",
+            trust_tier="T0",
+            content_domain="healthcare",
+            is_stale_live=True,
+        )
+        self.assertEqual(score, 35 + 20 + 15 + 10)
+        self.assertEqual(band, "critical")
+        self.assertIn("High-trust source (T0)", reasons)
+
+    def test_sla_proximity_adds_bonus(self):
+        base, _, _ = rqs.compute_priority_score("staged_resource_candidate")
+        soon, _, reasons = rqs.compute_priority_score("staged_resource_candidate", sla_hours_remaining=5)
+        self.assertEqual(soon - base, 10)
+        self.assertIn("SLA target within 24 hours", reasons)
+
+
+class TestTimeAwarePriority(unittest.TestCase):
+    def test_fresh_item_keeps_base_and_checks_at_first_age_step(self):
+        ev = rqs.evaluate_time_aware_priority(_item(), NOW)
+        self.assertEqual(ev["priority_score"], 40)
+        self.assertEqual(ev["next_check_at"], NOW + timedelta(hours=23))
+
+    def test_aging_and_sla_breach_raise_band(self):
+        item = _item(
+            created_at=(NOW - timedelta(hours=80)).isoformat(),
+            sla_target_at=(NOW - timedelta(hours=1)).isoformat(),
+        )
+        ev = rqs.evaluate_time_aware_priority(item, NOW)
+        self.assertEqual(ev["priority_score"], 40 + 15 + 25)
+        self.assertEqual(ev["priority_band"], "critical")
+        self.assertIn("SLA breach", ev["reasons"])
+        self.assertIn("Official source changed", ev["reasons"])
+        self.assertIsNone(ev["next_check_at"])
+
+    def test_stale_time_reasons_are_replaced(self):
+        item = _item(
+            created_at=(NOW - timedelta(hours=80)).isoformat(),
+            priority_reasons_json=json.dumps(["Official source changed", "Item aged 1+ day in queue"]),
+        )
+        ev = rqs.evaluate_time_aware_priority(item, NOW)
+        self.assertNotIn("Item aged 1+ day in queue", ev["reasons"])
+        self.assertIn("Item aged 3+ days in queue", ev["reasons"])
+
+    def test_legacy_item_without_base_uses_stored_score(self):
+        ev = rqs.evaluate_time_aware_priority(_item(base_priority_score=None, priority_score=33), NOW)
+        self.assertEqual(ev["priority_score"], 33)
+
+    def test_new_row_gets_schedule(self):
+        row = rqs._with_priority_schedule({"priority_score": 27})
+        self.assertEqual(row["base_priority_score"], 27)
+        self.assertIsNotNone(row["priority_next_check_at"])
+
+
+class TestRecomputeQueuePriorities(unittest.TestCase):
+    def _supabase(self, items):
+        supabase = MagicMock()
+        table = supabase.table.return_value
+        chain = table.select.return_value.in_.return_value.or_.return_value.order.return_value.limit.return_value
+        chain.execute.return_value.data = items
+        return supabase, table
+
+    def test_only_changed_items_are_rescored(self):
+        aged = _item(id="aged", created_at=(NOW - timedelta(hours=30)).isoformat())
+        same = _item(id="same", created_at=(NOW - timedelta(hours=2)).isoformat())
+        supabase, table = self._supabase([aged, same])
+        with patch.object(rqs, "_get_supabase", return_value=supabase):
+            result = rqs.recompute_queue_priorities(now=NOW)
+
+        self.assertEqual(result, {"evaluated": 2, "rescored": 1, "band_changed": 0})
+        updates = [c.args[0] for c in table.update.call_args_list]
+        self.assertEqual(updates[0]["priority_score"], 48)
+        self.assertNotIn("priority_score", updates[1])
+        self.assertEqual(updates[1]["priority_next_check_at"], (NOW + timedelta(hours=22)).isoformat())
+        or_filter = table.select.return_value.in_.return_value.or_.call_args.args[0]
+        self.assertIn("priority_next_check_at.lte.2026-05-01T12:00:00Z", or_filter)
+
+    def test_settled_item_is_parked_not_nulled(self):
+        settled = _item(
+            id="settled",
+            priority_score=80,
+            priority_band="critical",
+            created_at=(NOW - timedelta(hours=100)).isoformat(),
+            sla_target_at=(NOW - timedelta(hours=1)).isoformat(),
+        )
+        supabase, table = self._supabase([settled])
+        with patch.object(rqs, "_get_supabase", return_value=supabase):
+            rqs.recompute_queue_priorities(now=NOW)
+        updates = table.update.call_args.args[0]
+        self.assertEqual(updates["priority_next_check_at"], rqs._PRIORITY_SETTLED_AT.isoformat())
+        self.assertGreater(rqs._PRIORITY_SETTLED_AT, NOW)
+
+    def test_reopened_settled_item_is_rescored(self):
+        settled = _item(
+            status="resolved",
+            created_at=(NOW - timedelta(hours=100)).isoformat(),
+            sla_target_at=(NOW - timedelta(hours=1)).isoformat(),
+            priority_next_check_at=rqs._PRIORITY_SETTLED_AT.isoformat(),
+        )
+        supabase, table = self._supabase([])
+        with patch.object(rqs, "_get_supabase", return_value=supabase), \
+                patch.object(rqs, "get_review_queue_item", return_value=settled), \
+                patch.object(rqs, "_log_activity"), patch.object(rqs, "_record_rollup_transition"):
+            rqs.reopen_queue_item("q1", "u1")
+            rqs.defer_queue_item("q1", (NOW + timedelta(days=2)).isoformat(), "u1")
+        for call in table.update.call_args_list:
+            scheduled = datetime.fromisoformat(call.args[0]["priority_next_check_at"])
+            self.assertLess(scheduled, rqs._PRIORITY_SETTLED_AT)
+            self.assertLessEqual(scheduled, datetime.now(timezone.utc))
+
+        reopened = {**settled, "status": "new", "priority_next_check_at": NOW.isoformat()}
+        supabase, table = self._supabase([reopened])
+        with patch.object(rqs, "_get_supabase", return_value=supabase), \
+                patch.object(rqs, "get_review_queue_item", return_value=reopened), \
+                patch("backend.services.ops_notification_service.evaluate_queue_notification_rules"):
+            result = rqs.recompute_queue_priorities(now=NOW)
+        self.assertEqual(result["rescored"], 1)
+        self.assertEqual(table.update.call_args.args[0]["priority_band"], "critical")
+
+    def test_band_change_triggers_notification_rules(self):
+        breached = _item(id="b", sla_target_at=(NOW - timedelta(minutes=5)).isoformat())
+        supabase, _ = self._supabase([breached])
+        with patch.object(rqs, "_get_supabase", return_value=supabase), \
+                patch.object(rqs, "get_review_queue_item", return_value=breached), \
+                patch("backend.services.ops_notification_service.evaluate_queue_notification_rules") as rules:
+            result = rqs.recompute_queue_priorities(now=NOW)
+        self.assertEqual(result["band_changed"], 1)
+        rules.assert_called_once_with(breached)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Schema ledger: warm starts skip recorded steps; changed or unverified steps run again."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+from sqlalchemy import create_engine, text
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+import backend.database as dbmod  # noqa: E402
+from backend.db_instrumentation import capture_queries, install_query_instrumentation  # noqa: E402
+
+
+class SchemaLedgerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+        install_query_instrumentation(self.engine)
+        self.db = dbmod.Database.__new__(dbmod.Database)
+        self.db.engine = self.engine
+        self.calls = []
+
+    def _step(self, name: str, table: str):
+        def apply() -> None:
+            self.calls.append(name)
+            with self.engine.begin() as conn:
+                conn.execute(text(f"CREATE TABLE IF NOT EXISTS {table} (id TEXT)"))
+
+        return apply
+
+    def test_warm_start_is_one_ledger_read(self) -> None:
+        steps = [("a", self._step("a", "t_a"), (), ("t_a",)), ("b", self._step("b", "t_b"), (), ("t_b",))]
+        cold = self.db._apply_schema_ledger(steps)
+        self.assertEqual(cold["applied"], ["a", "b"])
+        with capture_queries("warm") as stats:
+            warm = self.db._apply_schema_ledger(steps)
+        self.assertEqual((warm["applied"], warm["skipped"]), ([], 2))
+        self.assertEqual(stats.count, 1)
+        self.assertEqual(self.calls, ["a", "b"])
+        with self.engine.connect() as conn:
+            rows = conn.execute(text("SELECT step, position FROM schema_ledger ORDER BY position")).fetchall()
+        self.assertEqual([tuple(r) for r in rows], [("a", 0), ("b", 1)])
+
+    def test_changed_checksum_reruns_only_that_step(self) -> None:
+        steps = [("a", self._step("a", "t_a"), (), ()), ("b", self._step("b", "t_b"), (), ())]
+        self.db._apply_schema_ledger(steps)
+        real = dbmod._schema_step_checksum
+
+        def edited(apply, helpers):
+            return "edited" if apply is steps[1][1] else real(apply, helpers)
+
+        with mock.patch.object(dbmod, "_schema_step_checksum", side_effect=edited):
+            report = self.db._apply_schema_ledger(steps)
+        self.assertEqual(report["applied"], ["b"])
+        self.assertEqual(self.calls, ["a", "b", "b"])
+
+    def test_checksum_covers_referenced_constants_not_flags(self) -> None:
+        step = dbmod.Database._ensure_resolved_case_id_join_key
+        base = dbmod._schema_step_checksum(step, ())
+        with mock.patch.object(dbmod, "_RESOLVED_CASE_ID_SQL", "COALESCE(canonical_case_id, case_id)"):
+            self.assertNotEqual(dbmod._schema_step_checksum(step, ()), base)
+        # Lower-case module state the step reads (dialect, schema flags) is not part of the checksum.
+        with mock.patch.object(dbmod, "_is_sqlite", not dbmod._is_sqlite):
+            self.assertEqual(dbmod._schema_step_checksum(step, ()), base)
+
+    def test_ledger_not_created_when_disabled(self) -> None:
+        steps = [("a", self._step("a", "t_a"), (), ("t_a",))]
+        report = self.db._apply_schema_ledger(steps, create_ledger=False)
+        self.assertEqual(report["applied"], ["a"])
+        self.assertIsNone(self.db._read_schema_ledger())
+        self.db._apply_schema_ledger(steps, create_ledger=False)
+        self.assertEqual(self.calls, ["a", "a"])
+
+    def test_unverified_step_is_not_recorded(self) -> None:
+        steps = [("a", self._step("a", "t_a"), (), ("t_a.missing_column",))]
+        self.assertEqual(self.db._apply_schema_ledger(steps)["unverified"], ["a"])
+        self.db._apply_schema_ledger(steps)
+        self.assertEqual(self.calls, ["a", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
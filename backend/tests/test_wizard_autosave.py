@@ -0,0 +1,136 @@
+"""Wizard autosave: revision checks, unchanged-draft skips, change-aware + coalesced side effects."""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+import json
+import uuid
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+from backend.app import models  # noqa: E402
+from backend.app.db import SessionLocal  # noqa: E402
+from backend.app.routers import cases as cases_router  # noqa: E402
+from backend.app.services.wizard_autosave import (  # noqa: E402
+    CASE_LOCK_STRIPES,
+    WizardAutosaveCoalescer,
+    draft_revision,
+    revision_matches,
+)
+from backend.main import app  # noqa: E402
+
+
+def _draft(**basics):
+    return {
+        "relocationBasics": basics,
+        "employeeProfile": {},
+        "familyMembers": {},
+        "assignmentContext": {},
+    }
+
+
+class WizardAutosaveHelpersTests(unittest.TestCase):
+    def test_revision_is_key_order_independent(self) -> None:
+        self.assertEqual(draft_revision({"a": 1, "b": {"c": 2}}), draft_revision({"b": {"c": 2}, "a": 1}))
+        self.assertNotEqual(draft_revision({"a": 1}), draft_revision({"a": 2}))
+
+    def test_revision_matches_if_match_forms(self) -> None:
+        rev = draft_revision({"a": 1})
+        self.assertTrue(revision_matches(None, rev))
+        self.assertTrue(revision_matches("*", rev))
+        self.assertTrue(revision_matches(f'"{rev}"', rev))
+        self.assertTrue(revision_matches(f'W/"{rev}"', rev))
+        self.assertFalse(revision_matches('"stale"', rev))
+
+    def test_coalescer_runs_latest_draft_once(self) -> None:
+        calls = []
+        co = WizardAutosaveCoalescer(lambda cid, d, der: calls.append((cid, d["n"])), window_seconds=60)
+        for n in range(5):
+            co.schedule("case-1", {"n": n}, {})
+        self.assertEqual(calls, [])
+        self.assertEqual(co.pending_count(), 1)
+        co.flush()
+        self.assertEqual(calls, [("case-1", 4)])
+        self.assertEqual(co.pending_count(), 0)
+
+    def test_case_locks_are_bounded_and_stable(self) -> None:
+        co = WizardAutosaveCoalescer(lambda *a: None, window_seconds=0)
+        self.assertIs(co.case_lock("case-1"), co.case_lock("case-1"))
+        locks = {id(co.case_lock(f"case-{n}")) for n in range(1000)}
+        self.assertLessEqual(len(locks), CASE_LOCK_STRIPES)
+
+
+class WizardAutosaveRouteTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calls = []
+        self._orig = (cases_router.autosave._apply, cases_router.autosave.window_seconds)
+        cases_router.autosave._apply = lambda cid, d, der: self.calls.append(cid)
+        cases_router.autosave.window_seconds = 0
+        self.client = TestClient(app)
+        self.case_id = f"autosave-{uuid.uuid4()}"
+
+    def tearDown(self) -> None:
+        cases_router.autosave._apply, cases_router.autosave.window_seconds = self._orig
+
+    def test_unchanged_and_non_route_patches_skip_side_effects(self) -> None:
+        url = f"/api/cases/{self.case_id}"
+        r1 = self.client.patch(url, json=_draft(originCountry="FR", destCountry="SG"))
+        self.assertEqual(r1.status_code, 200, r1.text)
+        etag = r1.headers["etag"]
+        self.assertEqual(len(self.calls), 1)
+
+        r2 = self.client.patch(url, json=_draft(originCountry="FR", destCountry="SG"))
+        self.assertEqual(r2.status_code, 200)
+        self.assertEqual(r2.headers["etag"], etag)
+        self.assertEqual(r2.json()["updatedAt"], r1.json()["updatedAt"])
+
+        r3 = self.client.patch(url, json=_draft(originCountry="FR", destCountry="SG", purpose="employment"))
+        self.assertEqual(r3.status_code, 200)
+        self.assertNotEqual(r3.headers["etag"], etag)
+        self.assertEqual(len(self.calls), 1)
+
+        r4 = self.client.patch(url, json=_draft(originCountry="FR", destCountry="NO"))
+        self.assertEqual(r4.status_code, 200)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_stale_if_match_conflicts(self) -> None:
+        url = f"/api/cases/{self.case_id}"
+        r1 = self.client.patch(url, json=_draft(destCountry="SG"))
+        etag = r1.headers["etag"]
+        r2 = self.client.patch(url, json=_draft(destCountry="NO"), headers={"If-Match": etag})
+        self.assertEqual(r2.status_code, 200)
+        r3 = self.client.patch(url, json=_draft(destCountry="DK"), headers={"If-Match": etag})
+        self.assertEqual(r3.status_code, 409)
+        self.assertEqual(f'"{r3.json()["detail"]["revision"]}"', r2.headers["etag"])
+
+    def test_write_racing_another_worker_is_rejected(self) -> None:
+        url = f"/api/cases/{self.case_id}"
+        self.client.patch(url, json=_draft(destCountry="SG"))
+        concurrent = _draft(destCountry="JP")
+        merge = cases_router._deep_merge_case_drafts
+
+        def merge_then_other_writer(base, update):
+            # Another worker (outside this process's lock stripe) saves between read and write.
+            with SessionLocal() as other:
+                other.query(models.Case).filter(models.Case.id == self.case_id).update(
+                    {"draft_json": json.dumps(concurrent)}
+                )
+                other.commit()
+            return merge(base, update)
+
+        with mock.patch.object(cases_router, "_deep_merge_case_drafts", side_effect=merge_then_other_writer):
+            r = self.client.patch(url, json=_draft(destCountry="NO"))
+        self.assertEqual(r.status_code, 412, r.text)
+        with SessionLocal() as db:
+            stored = db.query(models.Case).filter(models.Case.id == self.case_id).one()
+            self.assertEqual(json.loads(stored.draft_json), concurrent)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -643,6 +643,16 @@ export const companyAPI = {
   },
 };
 
+/** Keyset page request for admin indexes; pass the previous response's next_cursor with the same sort. */
+export type AdminIndexPageParams = {
+  limit?: number;
+  cursor?: string;
+  sort?: string;
+};
+
+/** Rows per keyset page on the admin company / people / assignment index pages. */
+export const ADMIN_INDEX_PAGE_SIZE = 100;
+
 /** Compact readiness + evaluation snapshot from GET .../mobility/cases/{id}/inspect */
 export type AdminMobilityOperationalInspect = {
   assignment_id: string | null;
@@ -704,10 +714,13 @@ export const adminAPI = {
     invalidateApiCache('admin:context');
     return response.data;
   },
-  listCompanies: async (q?: string): Promise<{ companies: AdminCompany[] }> => {
-    const key = `admin:companies:${q ?? ''}`;
+  listCompanies: async (
+    q?: string,
+    page?: AdminIndexPageParams
+  ): Promise<{ companies: AdminCompany[]; next_cursor?: string | null }> => {
+    const key = `admin:companies:${q ?? ''}:${page?.limit ?? ''}:${page?.cursor ?? ''}:${page?.sort ?? ''}`;
     return cachedRequest(key, 60_000, async () => {
-      const response = await api.get('/api/admin/companies', { params: { q } });
+      const response = await api.get('/api/admin/companies', { params: { q, ...(page || {}) } });
       return response.data;
     });
   },
@@ -791,7 +804,7 @@ export const adminAPI = {
     const response = await api.get('/api/admin/users', { params: params || {} });
     return response.data;
   },
-  listPeople: async (params?: { company_id?: string; role?: string; q?: string }): Promise<{ people: AdminProfile[]; summary?: { count: number; orphans_without_company?: number } }> => {
+  listPeople: async (params?: { company_id?: string; role?: string; q?: string } & AdminIndexPageParams): Promise<{ people: AdminProfile[]; summary?: { count: number; orphans_without_company?: number; next_cursor?: string | null } }> => {
     const response = await api.get('/api/admin/people', { params: params || {} });
     return response.data;
   },
@@ -833,7 +846,7 @@ export const adminAPI = {
     employee_search?: string;
     status?: string;
     destination_country?: string;
-  }): Promise<{ assignments: AdminAssignment[] }> => {
+  } & AdminIndexPageParams): Promise<{ assignments: AdminAssignment[]; next_cursor?: string | null }> => {
     const response = await api.get('/api/admin/assignments', { params });
     return response.data;
   },
@@ -1,7 +1,7 @@
 import React, { useEffect, useState, useCallback } from 'react';
 import { Card, Button, Badge, Input, Select } from '../../components/antigravity';
 import { AdminLayout } from './AdminLayout';
-import { adminAPI } from '../../api/client';
+import { adminAPI, ADMIN_INDEX_PAGE_SIZE } from '../../api/client';
 import type { AdminAssignment, AdminAssignmentDetail, AdminCompany } from '../../types';
 import { buildRoute } from '../../navigation/routes';
 import { Link, useSearchParams, useLocation } from 'react-router-dom';
@@ -70,6 +70,7 @@ export const AdminAssignments: React.FC = () => {
   const [detailLoading, setDetailLoading] = useState(false);
   const [detailError, setDetailError] = useState(false);
   const [loading, setLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [showAddModal, setShowAddModal] = useState(false);
   const [addForm, setAddForm] = useState({
     company_id: '',
@@ -87,7 +88,8 @@ export const AdminAssignments: React.FC = () => {
   const [selectedIds, setSelectedIds] = useState<Set<string>>(new Set());
   const [deleteFeedback, setDeleteFeedback] = useState<'idle' | 'deleting' | 'done' | 'error'>('idle');
 
-  const loadAssignments = useCallback(async () => {
+  /** First page, or the page after ``cursor`` appended to the assignments already loaded. */
+  const loadAssignments = useCallback(async (cursor?: string) => {
     setLoading(true);
     try {
       const res = await adminAPI.listAssignments({
@@ -95,8 +97,11 @@ export const AdminAssignments: React.FC = () => {
         employee_search: filters.employee_search || undefined,
         status: filters.status || undefined,
         destination_country: filters.destination_country || undefined,
+        limit: ADMIN_INDEX_PAGE_SIZE,
+        cursor,
       });
-      setAssignments(res.assignments);
+      setAssignments((prev) => (cursor ? [...prev, ...res.assignments] : res.assignments));
+      setNextCursor(res.next_cursor ?? null);
     } finally {
       setLoading(false);
     }
@@ -451,6 +456,13 @@ export const AdminAssignments: React.FC = () => {
                 <div className="text-xs mt-1">No assignments for this company. Try another company or create from the HR flow.</div>
               </div>
             )}
+            {nextCursor && (
+              <div className="mt-3 flex justify-center">
+                <Button variant="outline" onClick={() => loadAssignments(nextCursor)} disabled={loading}>
+                  {loading ? 'Loading…' : 'Load more'}
+                </Button>
+              </div>
+            )}
           </>
         )}
       </Card>
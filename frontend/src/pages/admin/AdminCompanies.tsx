@@ -1,7 +1,7 @@
 import React, { useEffect, useMemo, useState } from 'react';
 import { Card, Button } from '../../components/antigravity';
 import { AdminLayout } from './AdminLayout';
-import { adminAPI } from '../../api/client';
+import { adminAPI, ADMIN_INDEX_PAGE_SIZE } from '../../api/client';
 import type { AdminCompany, CompanyPlanTier } from '../../types';
 import { Link } from 'react-router-dom';
 
@@ -27,6 +27,7 @@ export const AdminCompanies: React.FC = () => {
   const [query, setQuery] = useState('');
   const [companies, setCompanies] = useState<AdminCompany[]>([]);
   const [loading, setLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [savingId, setSavingId] = useState<string | null>(null);
   const [addOpen, setAddOpen] = useState(false);
   const [editingId, setEditingId] = useState<string | null>(null);
@@ -43,11 +44,14 @@ export const AdminCompanies: React.FC = () => {
   const [sortKey, setSortKey] = useState<SortKey>(null);
   const [sortDir, setSortDir] = useState<'asc' | 'desc'>('asc');
 
-  const load = async () => {
+  /** First page, or the page after ``cursor`` appended to the rows already loaded. */
+  const load = async (cursor?: string) => {
     setLoading(true);
     try {
-      const res = await adminAPI.listCompanies(query || undefined);
-      setCompanies(res.companies ?? []);
+      const res = await adminAPI.listCompanies(query || undefined, { limit: ADMIN_INDEX_PAGE_SIZE, cursor });
+      const page = res.companies ?? [];
+      setCompanies((prev) => (cursor ? [...prev, ...page] : page));
+      setNextCursor(res.next_cursor ?? null);
     } finally {
       setLoading(false);
     }
@@ -582,6 +586,13 @@ export const AdminCompanies: React.FC = () => {
             </table>
           </div>
         )}
+        {nextCursor && (
+          <div className="mt-3 flex justify-center">
+            <Button variant="outline" onClick={() => load(nextCursor)} disabled={loading}>
+              {loading ? 'Loading…' : 'Load more'}
+            </Button>
+          </div>
+        )}
       </Card>
 
       {addOpen && (
@@ -2,7 +2,7 @@ import React, { useEffect, useState } from 'react';
 import { useSearchParams, useLocation } from 'react-router-dom';
 import { Card, Button, Badge } from '../../components/antigravity';
 import { AdminLayout } from './AdminLayout';
-import { adminAPI } from '../../api/client';
+import { adminAPI, ADMIN_INDEX_PAGE_SIZE } from '../../api/client';
 import type { AdminProfile, AdminCompany } from '../../types';
 
 const ROLE_OPTIONS = [
@@ -23,22 +23,28 @@ export const AdminUsers: React.FC = () => {
   const [people, setPeople] = useState<AdminProfile[]>([]);
   const [companies, setCompanies] = useState<AdminCompany[]>([]);
   const [loading, setLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [editOpen, setEditOpen] = useState<AdminProfile | null>(null);
   const [addOpen, setAddOpen] = useState(false);
   const [selectedIds, setSelectedIds] = useState<Set<string>>(new Set());
   const [selectionMode, setSelectionMode] = useState(false);
   const [deleteFeedback, setDeleteFeedback] = useState<'idle' | 'deleting' | 'done' | 'error'>('idle');
 
-  const loadPeople = async () => {
+  /** First page, or the page after ``cursor`` appended to the people already loaded. */
+  const loadPeople = async (cursor?: string) => {
     setLoading(true);
     try {
       const res = await adminAPI.listPeople({
         q: query || undefined,
         company_id: companyId || undefined,
         role: roleFilter || undefined,
+        limit: ADMIN_INDEX_PAGE_SIZE,
+        cursor,
       });
-      setPeople(res.people ?? []);
-      return res.people ?? [];
+      const page = res.people ?? [];
+      setPeople((prev) => (cursor ? [...prev, ...page] : page));
+      setNextCursor(res.summary?.next_cursor ?? null);
+      return page;
     } finally {
       setLoading(false);
     }
@@ -246,6 +252,13 @@ export const AdminUsers: React.FC = () => {
             </div>
           )}
         </div>
+        {nextCursor && (
+          <div className="mt-3 flex justify-center">
+            <Button variant="outline" onClick={() => loadPeople(nextCursor)} disabled={loading}>
+              {loading ? 'Loading…' : 'Load more'}
+            </Button>
+          </div>
+        )}
       </Card>
 
       {editOpen && (
@@ -3,10 +3,12 @@
 Process due crawl schedules. Run from cron or manually:
 
   python scripts/process_crawl_schedules.py
+  python scripts/process_crawl_schedules.py --loop --concurrency 4 --poll-seconds 60
 
-Calls the scheduler service to process all due schedules.
+Calls the scheduler service to process all due schedules; --loop keeps a worker running.
 Requires DATABASE_URL and Supabase env vars for DB access.
 """
+import argparse
 import logging
 import os
 import sys
@@ -23,9 +25,24 @@ log = logging.getLogger("process_crawl_schedules")
 
 
 def main() -> int:
-    from backend.services.crawl_scheduler_service import process_due_schedules
-
-    results = process_due_schedules(user_id=None)
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--loop", action="store_true", help="Keep running, one batch every --poll-seconds")
+    parser.add_argument("--poll-seconds", type=float, default=60.0)
+    parser.add_argument("--concurrency", type=int, default=None, help="Max crawls in flight (CRAWL_SCHEDULER_CONCURRENCY)")
+    args = parser.parse_args()
+
+    from backend.services.crawl_scheduler_worker import CrawlSchedulerWorker
+
+    worker = CrawlSchedulerWorker(concurrency=args.concurrency)
+    if args.loop:
+        log.info("Crawl scheduler worker %s started (concurrency=%d)", worker.owner, worker.concurrency)
+        try:
+            worker.run_forever(poll_seconds=args.poll_seconds)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    results = worker.run_batch()
     log.info("Processed %d schedules: %s", len(results), results)
     failed = [r for r in results if r.get("status") == "failed"]
     return 1 if failed else 0
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Re-score open review queue items whose time-based priority may have changed.
+Run from cron (e.g. every 15 minutes) or manually:
+
+  python scripts/recompute_review_queue_priorities.py
+
+Requires Supabase env vars for DB access.
+"""
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+log = logging.getLogger("recompute_review_queue_priorities")
+
+
+def main() -> int:
+    from backend.services.review_queue_service import recompute_queue_priorities
+
+    result = recompute_queue_priorities()
+    log.info("Priority recompute: %s", result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
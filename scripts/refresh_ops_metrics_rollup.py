@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Refresh pre-aggregated ops metrics (hour/day SLA buckets and open backlog state)
+used by the ops analytics dashboard. Run from cron (e.g. every 10 minutes):
+
+  python scripts/refresh_ops_metrics_rollup.py [--lookback-hours 48]
+
+Requires Supabase env vars for DB access.
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+log = logging.getLogger("refresh_ops_metrics_rollup")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Refresh ops metrics rollup")
+    parser.add_argument("--lookback-hours", type=int, default=48, help="Recompute buckets from this far back")
+    args = parser.parse_args()
+
+    from backend.services.ops_analytics_service import refresh_ops_metrics_rollup
+
+    result = refresh_ops_metrics_rollup(lookback_hours=args.lookback_hours)
+    log.info("Ops metrics rollup: %s", result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
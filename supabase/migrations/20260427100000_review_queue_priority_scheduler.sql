@@ -0,0 +1,22 @@
+-- Review queue: time-aware priority maintained incrementally by recompute_queue_priorities.
+-- base_priority_score = static part computed at creation; priority_score = base + time bonus.
+-- priority_next_check_at = next moment the time bonus can change (age step, due, SLA window).
+begin;
+
+alter table public.review_queue_items add column if not exists base_priority_score int;
+alter table public.review_queue_items add column if not exists priority_next_check_at timestamptz;
+
+update public.review_queue_items
+  set base_priority_score = priority_score
+  where base_priority_score is null;
+
+-- Reviewer queue page: status filter + priority order (+ created_at tie-break) as one range scan.
+create index if not exists idx_review_queue_status_priority
+  on public.review_queue_items (status, priority_score desc, created_at);
+
+-- Scheduler: open items whose next priority check is due.
+create index if not exists idx_review_queue_next_check
+  on public.review_queue_items (priority_next_check_at)
+  where status in ('new', 'triaged', 'assigned', 'in_progress', 'blocked', 'waiting');
+
+commit;
@@ -0,0 +1,67 @@
+-- Ops metrics rollup: pre-aggregated review queue metrics for the SLA / ops analytics dashboard.
+-- Written by ops_analytics_service.refresh_ops_metrics_rollup (periodic) and, for the open
+-- backlog, by apply_queue_transition_to_rollup on every queue status transition.
+begin;
+
+-- Flow metrics per hour/day bucket. '' in country_code / priority_band = all.
+create table if not exists public.ops_metrics_buckets (
+  id uuid primary key default gen_random_uuid(),
+  granularity text not null, -- hour, day
+  bucket_start timestamptz not null,
+  country_code text not null default '',
+  priority_band text not null default '',
+  created_count int not null default 0,
+  sla_tracked_count int not null default 0,
+  resolved_count int not null default 0,
+  resolved_breached_count int not null default 0,
+  assign_hours_sum numeric not null default 0,
+  assign_count int not null default 0,
+  resolve_hours_sum numeric not null default 0,
+  resolve_count int not null default 0,
+  assign_hist_json jsonb not null default '{}',
+  resolve_hist_json jsonb not null default '{}',
+  updated_at timestamptz not null default now(),
+  unique (granularity, bucket_start, country_code, priority_band)
+);
+
+create index if not exists idx_ops_metrics_buckets_lookup
+  on public.ops_metrics_buckets (granularity, country_code, priority_band, bucket_start desc);
+
+-- Current open backlog, one row per dimension combination. '' = null dimension.
+create table if not exists public.ops_backlog_state (
+  id uuid primary key default gen_random_uuid(),
+  country_code text not null default '',
+  city_name text not null default '',
+  priority_band text not null default '',
+  status text not null,
+  queue_item_type text not null default '',
+  assigned_to_user_id text not null default '',
+  open_count int not null default 0,
+  overdue_count int not null default 0,  -- due_at passed
+  breached_count int not null default 0, -- sla_target_at (or due_at) passed
+  updated_at timestamptz not null default now(),
+  unique (country_code, city_name, priority_band, status, queue_item_type, assigned_to_user_id)
+);
+
+create index if not exists idx_ops_backlog_state_open
+  on public.ops_backlog_state (open_count) where open_count > 0;
+
+create table if not exists public.ops_metrics_rollup_runs (
+  id uuid primary key default gen_random_uuid(),
+  window_start timestamptz not null,
+  items_scanned int not null default 0,
+  buckets_written int not null default 0,
+  completed_at timestamptz not null default now()
+);
+
+create index if not exists idx_ops_metrics_rollup_runs_completed
+  on public.ops_metrics_rollup_runs (completed_at desc);
+
+alter table public.ops_metrics_buckets enable row level security;
+alter table public.ops_backlog_state enable row level security;
+alter table public.ops_metrics_rollup_runs enable row level security;
+create policy "ops_metrics_buckets_admin" on public.ops_metrics_buckets for all using (true) with check (true);
+create policy "ops_backlog_state_admin" on public.ops_backlog_state for all using (true) with check (true);
+create policy "ops_metrics_rollup_runs_admin" on public.ops_metrics_rollup_runs for all using (true) with check (true);
+
+commit;
@@ -0,0 +1,20 @@
+-- Policy assistant retrieval: lexical index over policy_document_chunks.
+-- Database.search_policy_document_chunks ranks one snapshot's chunks against a question with
+-- ts_rank_cd over this column (SQLite dev DBs use an FTS5 table with bm25 instead).
+-- Generated + stored, so chunks written by the import pipeline are indexed in the same transaction.
+begin;
+
+alter table public.policy_document_chunks
+  add column if not exists search_tsv tsvector
+  generated always as (
+    setweight(to_tsvector('english', coalesce(section_title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(text_content, '')), 'B')
+  ) stored;
+
+create index if not exists idx_policy_document_chunks_search_tsv
+  on public.policy_document_chunks using gin (search_tsv);
+
+comment on column public.policy_document_chunks.search_tsv is
+  'Section title (weight A) + body (weight B); queried per snapshot_id for assistant supporting chunks.';
+
+commit;
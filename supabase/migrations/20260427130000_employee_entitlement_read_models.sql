@@ -0,0 +1,26 @@
+-- Employee entitlement read model: materialized employee policy views per (assignment, view).
+-- Written by employee_entitlement_materialization on first read and when HR publishes a version;
+-- rows for a version are dropped when HR edits its rules or overrides. Reads compare policy_version_id
+-- with the policy's current published version, so publish/archive never serve a stale row.
+begin;
+
+create table if not exists public.employee_entitlement_read_models (
+  assignment_id text not null,
+  view_name text not null, -- entitlements, employee_policy
+  company_id text,
+  policy_id uuid not null,
+  policy_version_id uuid not null,
+  context_fingerprint text not null,
+  payload_json jsonb not null,
+  computed_at timestamptz not null default now(),
+  primary key (assignment_id, view_name)
+);
+
+create index if not exists idx_entitlement_read_models_version
+  on public.employee_entitlement_read_models (policy_version_id);
+create index if not exists idx_entitlement_read_models_policy
+  on public.employee_entitlement_read_models (policy_id);
+
+alter table public.employee_entitlement_read_models enable row level security;
+
+commit;
@@ -0,0 +1,33 @@
+-- Admin company index counters: per-company HR user, employee, assignment and policy counts.
+-- Kept current by the Database write paths (assignment, HR user, employee, case company and policy
+-- writes) so the admin company index reads one joined row per company instead of COUNT subqueries.
+begin;
+
+create table if not exists public.company_index_counters (
+  company_id text primary key,
+  hr_users_count int not null default 0,
+  employee_count int not null default 0,
+  assignments_count int not null default 0,
+  policies_count int not null default 0,
+  updated_at timestamptz not null default now()
+);
+
+alter table public.company_index_counters enable row level security;
+
+-- One-time backfill; rows for companies created later are filled on first admin index read.
+insert into public.company_index_counters
+  (company_id, hr_users_count, employee_count, assignments_count, policies_count, updated_at)
+select c.id::text,
+  (select count(*) from public.hr_users hu where hu.company_id::text = c.id::text),
+  (select count(*) from public.employees e where e.company_id::text = c.id::text),
+  (select count(*) from public.case_assignments a
+   left join public.relocation_cases rc
+     on rc.id::text = coalesce(nullif(trim(a.canonical_case_id), ''), a.case_id)::text
+   left join public.hr_users hu on hu.profile_id::text = a.hr_user_id::text
+   where rc.company_id::text = c.id::text or (rc.company_id is null and hu.company_id::text = c.id::text)),
+  (select count(*) from public.company_policies cp where cp.company_id::text = c.id::text),
+  now()
+from public.companies c
+on conflict (company_id) do nothing;
+
+commit;
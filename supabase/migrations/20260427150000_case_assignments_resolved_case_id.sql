@@ -0,0 +1,63 @@
+-- Typed join key for case_assignments -> relocation_cases.
+-- resolved_case_id = coalesce(nullif(trim(canonical_case_id), ''), case_id), stored with the type of
+-- relocation_cases.id (text or uuid depending on the deployment) so the backend joins on
+-- rc.id = a.resolved_case_id instead of CAST(rc.id AS TEXT) = CAST(coalesce(...) AS TEXT).
+-- For uuid ids only canonical lowercase text resolves, matching what the text-cast comparison matched.
+-- The backend test suite runs on SQLite and covers the equivalent SQLite triggers only; this trigger and
+-- its uuid branch are not exercised by automated tests.
+begin;
+
+alter table public.case_assignments add column if not exists canonical_case_id text;
+
+do $$
+declare
+  id_type text;
+begin
+  select format_type(a.atttypid, a.atttypmod) into id_type
+  from pg_attribute a
+  where a.attrelid = 'public.relocation_cases'::regclass and a.attname = 'id' and not a.attisdropped;
+  execute format('alter table public.case_assignments add column if not exists resolved_case_id %s', id_type);
+end $$;
+
+create or replace function public.case_assignments_set_resolved_case_id()
+returns trigger
+language plpgsql
+as $$
+declare
+  v text := coalesce(nullif(trim(new.canonical_case_id), ''), new.case_id);
+begin
+  if pg_typeof(new.resolved_case_id) = 'uuid'::regtype
+     and (v is null or v !~ '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$') then
+    new.resolved_case_id := null;
+  else
+    new.resolved_case_id := v;
+  end if;
+  return new;
+end;
+$$;
+
+drop trigger if exists trg_case_assignments_resolved_case_id on public.case_assignments;
+create trigger trg_case_assignments_resolved_case_id
+  before insert or update of case_id, canonical_case_id on public.case_assignments
+  for each row execute function public.case_assignments_set_resolved_case_id();
+
+-- One-time backfill. It sets only resolved_case_id, so the column-scoped update triggers on
+-- case_assignments (this one on case_id/canonical_case_id, trg_case_assignments_recalc_risk on the
+-- budget columns) are not invoked; any unscoped row trigger on the table would still fire per row.
+do $$
+begin
+  if pg_typeof((select resolved_case_id from public.case_assignments limit 1)) = 'uuid'::regtype then
+    update public.case_assignments
+    set resolved_case_id = coalesce(nullif(trim(canonical_case_id), ''), case_id)::uuid
+    where coalesce(nullif(trim(canonical_case_id), ''), case_id)
+      ~ '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$';
+  else
+    update public.case_assignments
+    set resolved_case_id = coalesce(nullif(trim(canonical_case_id), ''), case_id);
+  end if;
+end $$;
+
+create index if not exists idx_case_assignments_resolved_case_id
+  on public.case_assignments (resolved_case_id);
+
+commit;
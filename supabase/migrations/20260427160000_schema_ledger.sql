@@ -0,0 +1,16 @@
+-- Schema ledger: one row per init_db schema step (Database._schema_steps) with the checksum of its DDL.
+-- Workers compare checksums at startup and apply only missing or changed steps under
+-- pg_advisory_lock, so warm starts do not re-run the idempotent runtime DDL.
+begin;
+
+create table if not exists public.schema_ledger (
+  step text primary key,
+  position int not null,
+  checksum text not null,
+  applied_at text not null,
+  duration_ms real not null
+);
+
+alter table public.schema_ledger enable row level security;
+
+commit;
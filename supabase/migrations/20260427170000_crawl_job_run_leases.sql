@@ -0,0 +1,40 @@
+-- Crawl scheduler worker leases (backend/services/crawl_scheduler_worker.py).
+-- A claim inserts the job run as running with lock_owner/lock_until; the worker renews lock_until
+-- while crawling and reclaims runs whose lease lapsed. At most one queued/running run per schedule.
+begin;
+
+alter table public.crawl_job_runs add column if not exists lock_owner text;
+
+-- Runs that never took their lock (legacy queued rows) or whose lease lapsed can no longer finish.
+update public.crawl_job_runs
+set status = 'failed',
+    finished_at = coalesce(finished_at, now()),
+    lock_until = null,
+    error_summary = coalesce(error_summary, 'lease expired')
+where status in ('queued', 'running')
+  and (lock_until is null or lock_until < now());
+
+-- Keep only the newest live run per schedule so the unique index can be built.
+update public.crawl_job_runs r
+set status = 'cancelled',
+    finished_at = coalesce(r.finished_at, now()),
+    lock_until = null,
+    error_summary = coalesce(r.error_summary, 'superseded by a newer run')
+where r.status in ('queued', 'running')
+  and r.schedule_id is not null
+  and exists (
+    select 1 from public.crawl_job_runs n
+    where n.schedule_id = r.schedule_id
+      and n.status in ('queued', 'running')
+      and (n.created_at, n.id) > (r.created_at, r.id)
+  );
+
+create unique index if not exists uq_crawl_job_runs_active_schedule
+  on public.crawl_job_runs(schedule_id)
+  where schedule_id is not null and status in ('queued', 'running');
+
+create index if not exists idx_crawl_job_runs_lease
+  on public.crawl_job_runs(lock_until)
+  where status in ('queued', 'running');
+
+commit;
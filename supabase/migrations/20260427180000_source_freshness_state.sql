@@ -0,0 +1,175 @@
+-- Incremental per-source freshness state (backend/services/freshness_service.py).
+-- refresh_freshness_metrics used to rescan crawl_runs + every crawled document, count change events
+-- and review candidates, and pull up to 1000 stale resources/events per crawl. The state below is kept
+-- current by triggers on the events that change it, so snapshots sum one row per source:
+--   crawl_runs finishing            -> last_success_at / consecutive_failures per source in the run
+--   document_change_events inserted -> source_change_daily (changed documents per source and day)
+--   staged_*_candidates status      -> needs_review_count per source (insert, review decision, delete)
+begin;
+
+create table if not exists public.source_freshness_state (
+  source_name text primary key,
+  country_code text,
+  city_name text,
+  content_domain text,
+  last_success_at timestamptz,
+  last_crawl_run_id uuid,
+  last_failure_at timestamptz,
+  consecutive_failures int not null default 0,
+  needs_review_count int not null default 0,
+  updated_at timestamptz not null default now()
+);
+
+create table if not exists public.source_change_daily (
+  source_name text not null,
+  day date not null,
+  changed_count int not null default 0,
+  primary key (source_name, day)
+);
+
+create index if not exists idx_source_change_daily_day on public.source_change_daily(day);
+
+alter table public.source_freshness_state enable row level security;
+alter table public.source_change_daily enable row level security;
+
+-- 1. Crawl run finished: per-source last success (max fetched_at) or failure streak.
+create or replace function public.source_freshness_on_crawl_run()
+returns trigger
+language plpgsql
+as $$
+begin
+  if new.status = 'completed' then
+    insert into public.source_freshness_state as s
+      (source_name, country_code, city_name, last_success_at, last_crawl_run_id, consecutive_failures, updated_at)
+    select coalesce(nullif(d.source_name, ''), 'unknown'), max(d.country_code), max(d.city_name),
+           max(coalesce(d.fetched_at, new.finished_at)), new.id, 0, now()
+    from public.crawled_source_documents d
+    where d.crawl_run_id = new.id
+    group by 1
+    on conflict (source_name) do update set
+      country_code = coalesce(excluded.country_code, s.country_code),
+      city_name = coalesce(excluded.city_name, s.city_name),
+      last_success_at = greatest(s.last_success_at, excluded.last_success_at),
+      last_crawl_run_id = excluded.last_crawl_run_id,
+      consecutive_failures = 0,
+      updated_at = now();
+  elsif new.status = 'failed' then
+    insert into public.source_freshness_state as s
+      (source_name, last_failure_at, consecutive_failures, updated_at)
+    select distinct coalesce(nullif(d.source_name, ''), 'unknown'), coalesce(new.finished_at, now()), 1, now()
+    from public.crawled_source_documents d
+    where d.crawl_run_id = new.id
+    on conflict (source_name) do update set
+      last_failure_at = excluded.last_failure_at,
+      consecutive_failures = s.consecutive_failures + 1,
+      updated_at = now();
+  end if;
+  return null;
+end;
+$$;
+
+drop trigger if exists trg_crawl_runs_source_freshness on public.crawl_runs;
+create trigger trg_crawl_runs_source_freshness
+  after update of status on public.crawl_runs
+  for each row
+  when (new.status in ('completed', 'failed') and old.status is distinct from new.status)
+  execute function public.source_freshness_on_crawl_run();
+
+-- 2. Change events: one upsert per (source, day) per insert statement.
+create or replace function public.source_freshness_on_change_events()
+returns trigger
+language plpgsql
+as $$
+begin
+  insert into public.source_change_daily as c (source_name, day, changed_count)
+  select coalesce(nullif(e.source_name, ''), 'unknown'), (e.detected_at at time zone 'utc')::date, count(*)
+  from new_events e
+  where e.change_type <> 'unchanged'
+  group by 1, 2
+  on conflict (source_name, day) do update set changed_count = c.changed_count + excluded.changed_count;
+  delete from public.source_change_daily where day < current_date - 35;
+  return null;
+end;
+$$;
+
+drop trigger if exists trg_document_change_events_source_freshness on public.document_change_events;
+create trigger trg_document_change_events_source_freshness
+  after insert on public.document_change_events
+  referencing new table as new_events
+  for each statement execute function public.source_freshness_on_change_events();
+
+-- 3. Review candidates: +1 entering new/needs_review, -1 leaving it (review decision or delete).
+create or replace function public.source_freshness_on_candidate()
+returns trigger
+language plpgsql
+as $$
+declare
+  old_open boolean := false;
+  new_open boolean := false;
+  old_src text;
+  new_src text;
+begin
+  if tg_op in ('UPDATE', 'DELETE') then
+    old_open := coalesce(old.status in ('new', 'needs_review'), false);
+    old_src := coalesce(nullif(old.source_name, ''), 'unknown');
+  end if;
+  if tg_op in ('INSERT', 'UPDATE') then
+    new_open := coalesce(new.status in ('new', 'needs_review'), false);
+    new_src := coalesce(nullif(new.source_name, ''), 'unknown');
+  end if;
+  if old_open and (not new_open or old_src is distinct from new_src) then
+    update public.source_freshness_state
+    set needs_review_count = greatest(needs_review_count - 1, 0), updated_at = now()
+    where source_name = old_src;
+  end if;
+  if new_open and (not old_open or old_src is distinct from new_src) then
+    insert into public.source_freshness_state as s (source_name, needs_review_count, updated_at)
+    values (new_src, 1, now())
+    on conflict (source_name) do update set needs_review_count = s.needs_review_count + 1, updated_at = now();
+  end if;
+  return null;
+end;
+$$;
+
+drop trigger if exists trg_staged_resource_candidates_source_freshness on public.staged_resource_candidates;
+create trigger trg_staged_resource_candidates_source_freshness
+  after insert or update of status, source_name or delete on public.staged_resource_candidates
+  for each row execute function public.source_freshness_on_candidate();
+
+drop trigger if exists trg_staged_event_candidates_source_freshness on public.staged_event_candidates;
+create trigger trg_staged_event_candidates_source_freshness
+  after insert or update of status, source_name or delete on public.staged_event_candidates
+  for each row execute function public.source_freshness_on_candidate();
+
+-- One-time backfill (the full scan the triggers replace).
+insert into public.source_freshness_state as s
+  (source_name, country_code, city_name, last_success_at, needs_review_count, updated_at)
+select src, max(country_code), max(city_name), max(last_success_at), sum(needs_review)::int, now()
+from (
+  select coalesce(nullif(d.source_name, ''), 'unknown') as src, d.country_code, d.city_name,
+         coalesce(d.fetched_at, r.finished_at) as last_success_at, 0 as needs_review
+  from public.crawled_source_documents d
+  join public.crawl_runs r on r.id = d.crawl_run_id and r.status = 'completed'
+  union all
+  select coalesce(nullif(source_name, ''), 'unknown'), null, null, null, 1
+  from public.staged_resource_candidates where status in ('new', 'needs_review')
+  union all
+  select coalesce(nullif(source_name, ''), 'unknown'), null, null, null, 1
+  from public.staged_event_candidates where status in ('new', 'needs_review')
+) x
+group by src
+on conflict (source_name) do update set
+  country_code = coalesce(excluded.country_code, s.country_code),
+  city_name = coalesce(excluded.city_name, s.city_name),
+  last_success_at = greatest(s.last_success_at, excluded.last_success_at),
+  needs_review_count = excluded.needs_review_count,
+  updated_at = now();
+
+insert into public.source_change_daily as c (source_name, day, changed_count)
+select coalesce(nullif(source_name, ''), 'unknown'), (detected_at at time zone 'utc')::date, count(*)
+from public.document_change_events
+where change_type <> 'unchanged' and detected_at >= now() - interval '35 days'
+group by 1, 2
+on conflict (source_name, day) do update set changed_count = excluded.changed_count;
+
+commit;
@@ -0,0 +1,13 @@
+-- Review queue scheduler: items with no time threshold left are parked at a far-future
+-- priority_next_check_at ('9999-12-31') instead of NULL, which now only means "never scheduled".
+-- Before this, settled items were written back as NULL, re-selected on every run and sorted ahead
+-- of due items, crowding them out of the recompute batch.
+-- Backfill: open rows still NULL become due now; the next recompute run schedules or settles them.
+begin;
+
+update public.review_queue_items
+  set priority_next_check_at = now()
+  where priority_next_check_at is null
+    and status in ('new', 'triaged', 'assigned', 'in_progress', 'blocked', 'waiting');
+
+commit;
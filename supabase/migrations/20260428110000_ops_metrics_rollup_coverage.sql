@@ -0,0 +1,38 @@
+-- Ops metrics rollup fixes (backend/services/ops_analytics_service.py).
+-- covered_since: earliest bucket_start the rollup has contiguous flow buckets for. The first refresh
+--   backfills the longest dashboard window; later runs extend back to the previous run, so coverage
+--   stays contiguous. Readers use the rollup only for ranges inside it (else the raw scan).
+-- ops_backlog_adjust: atomic open_count increment for queue transitions (was select-then-update,
+--   which lost concurrent updates and raced on insert). overdue/breached are owned by the periodic
+--   refresh; transitions only clamp them to the new open_count.
+begin;
+
+alter table public.ops_metrics_rollup_runs add column if not exists covered_since timestamptz;
+
+create or replace function public.ops_backlog_adjust(
+  p_country_code text,
+  p_city_name text,
+  p_priority_band text,
+  p_status text,
+  p_queue_item_type text,
+  p_assigned_to_user_id text,
+  p_delta int
+)
+returns void
+language sql
+as $$
+  insert into public.ops_backlog_state as s
+    (country_code, city_name, priority_band, status, queue_item_type, assigned_to_user_id, open_count, updated_at)
+  values
+    (p_country_code, p_city_name, p_priority_band, p_status, p_queue_item_type, p_assigned_to_user_id,
+     greatest(p_delta, 0), now())
+  on conflict (country_code, city_name, priority_band, status, queue_item_type, assigned_to_user_id) do update set
+    open_count = greatest(s.open_count + p_delta, 0),
+    overdue_count = least(s.overdue_count, greatest(s.open_count + p_delta, 0)),
+    breached_count = least(s.breached_count, greatest(s.open_count + p_delta, 0)),
+    updated_at = now();
+$$;
+
+grant execute on function public.ops_backlog_adjust(text, text, text, text, text, text, int) to service_role;
+
+commit;
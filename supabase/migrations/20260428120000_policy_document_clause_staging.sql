@@ -0,0 +1,33 @@
+-- Staging rows for Database.upsert_policy_document_clauses.
+-- Re-segmenting a document streams its clauses into this table in batch_size chunks (one short
+-- transaction per chunk) under a fresh generation id. A last transaction deletes the live clauses,
+-- copies the generation into policy_document_clauses and drops the staged rows. A failed parse
+-- deletes its generation and never touches the live clauses.
+begin;
+
+create table if not exists public.policy_document_clause_staging (
+  generation uuid not null,
+  id uuid not null,
+  policy_document_id uuid not null references public.policy_documents(id) on delete cascade,
+  section_label text,
+  section_path text,
+  clause_type text not null default 'unknown',
+  title text,
+  raw_text text not null,
+  normalized_hint_json jsonb,
+  source_page_start integer,
+  source_page_end integer,
+  source_anchor text,
+  confidence real default 0.5,
+  created_at timestamptz not null default now(),
+  updated_at timestamptz not null default now(),
+  primary key (generation, id)
+);
+
+create index if not exists idx_policy_document_clause_staging_doc
+  on public.policy_document_clause_staging(policy_document_id);
+
+-- Written by the backend service role only.
+alter table public.policy_document_clause_staging enable row level security;
+
+commit;
@@ -0,0 +1,101 @@
+-- Per-country daily buckets for live content staleness (backend/services/freshness_service.py).
+-- refresh_freshness_metrics used to count stale country_resources and expired rkg_country_events with
+-- PostgREST count="estimated" after every crawl batch. These buckets are kept current by row triggers,
+-- so the snapshot sums the buckets before a cutoff day instead:
+--   kind 'resource': active country_resources by UTC day of updated_at (stale: day before now - 180 days)
+--   kind 'event':    rkg_country_events by UTC day of start_datetime (expired: day before today)
+begin;
+
+create table if not exists public.live_content_expiry_daily (
+  kind text not null check (kind in ('resource', 'event')),
+  country_code text not null,
+  day date not null,
+  item_count int not null default 0,
+  primary key (kind, day, country_code)
+);
+
+alter table public.live_content_expiry_daily enable row level security;
+
+create or replace function public.live_content_expiry_adjust(p_kind text, p_country text, p_day date, p_delta int)
+returns void
+language plpgsql
+as $$
+begin
+  insert into public.live_content_expiry_daily as b (kind, country_code, day, item_count)
+  values (p_kind, coalesce(p_country, 'unknown'), p_day, p_delta)
+  on conflict (kind, day, country_code) do update set item_count = b.item_count + excluded.item_count;
+  delete from public.live_content_expiry_daily
+  where kind = p_kind and day = p_day and country_code = coalesce(p_country, 'unknown') and item_count <= 0;
+end;
+$$;
+
+-- 1. Resources: only active rows count; moving updated_at (or is_active / country) moves the bucket.
+create or replace function public.live_content_expiry_on_resource()
+returns trigger
+language plpgsql
+as $$
+declare
+  old_in boolean := tg_op in ('UPDATE', 'DELETE') and coalesce(old.is_active, false);
+  new_in boolean := tg_op in ('INSERT', 'UPDATE') and coalesce(new.is_active, false);
+begin
+  if old_in and new_in
+     and old.country_code is not distinct from new.country_code
+     and (old.updated_at at time zone 'utc')::date = (new.updated_at at time zone 'utc')::date then
+    return null;
+  end if;
+  if old_in then
+    perform public.live_content_expiry_adjust('resource', old.country_code, (old.updated_at at time zone 'utc')::date, -1);
+  end if;
+  if new_in then
+    perform public.live_content_expiry_adjust('resource', new.country_code, (new.updated_at at time zone 'utc')::date, 1);
+  end if;
+  return null;
+end;
+$$;
+
+drop trigger if exists trg_country_resources_live_expiry on public.country_resources;
+create trigger trg_country_resources_live_expiry
+  after insert or update of is_active, updated_at, country_code or delete on public.country_resources
+  for each row execute function public.live_content_expiry_on_resource();
+
+-- 2. Events: every row counts, bucketed by start day.
+create or replace function public.live_content_expiry_on_event()
+returns trigger
+language plpgsql
+as $$
+begin
+  if tg_op = 'UPDATE'
+     and old.country_code is not distinct from new.country_code
+     and (old.start_datetime at time zone 'utc')::date = (new.start_datetime at time zone 'utc')::date then
+    return null;
+  end if;
+  if tg_op in ('UPDATE', 'DELETE') then
+    perform public.live_content_expiry_adjust('event', old.country_code, (old.start_datetime at time zone 'utc')::date, -1);
+  end if;
+  if tg_op in ('INSERT', 'UPDATE') then
+    perform public.live_content_expiry_adjust('event', new.country_code, (new.start_datetime at time zone 'utc')::date, 1);
+  end if;
+  return null;
+end;
+$$;
+
+drop trigger if exists trg_rkg_country_events_live_expiry on public.rkg_country_events;
+create trigger trg_rkg_country_events_live_expiry
+  after insert or update of start_datetime, country_code or delete on public.rkg_country_events
+  for each row execute function public.live_content_expiry_on_event();
+
+-- One-time backfill (the counts the triggers replace).
+delete from public.live_content_expiry_daily;
+
+insert into public.live_content_expiry_daily (kind, country_code, day, item_count)
+select 'resource', coalesce(country_code, 'unknown'), (updated_at at time zone 'utc')::date, count(*)
+from public.country_resources
+where is_active
+group by 2, 3;
+
+insert into public.live_content_expiry_daily (kind, country_code, day, item_count)
+select 'event', coalesce(country_code, 'unknown'), (start_datetime at time zone 'utc')::date, count(*)
+from public.rkg_country_events
+group by 2, 3;
+
+commit;